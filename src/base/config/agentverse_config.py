@@ -0,0 +1,59 @@
+from typing import Optional
+from pydantic_settings import BaseSettings
+from pydantic import ConfigDict
+
+class AgentverseConfig(BaseSettings):
+    """
+    Agentverse runtime and caching settings.
+    """
+    model_config = ConfigDict(
+        frozen=True,
+        env_file=".env",
+        case_sensitive=False,
+        extra="allow"
+    )
+
+    # Agent blueprint read-through cache
+    blueprint_cache_enabled: bool = True
+    blueprint_cache_max_size: int = 1024
+    blueprint_cache_ttl_seconds: float = 300.0
+    blueprint_cache_change_stream_enabled: bool = True
+    blueprint_cache_change_stream_retry_seconds: float = 5.0
+
+    # Freeze the agent, personality and tool registries after startup
+    registry_freeze_enabled: bool = True
+
+    # Conversation memory (capped Redis list of turns per agent)
+    chat_memory_max_entries: int = 200
+    chat_memory_recent_entries: int = 50
+    chat_memory_ttl_seconds: Optional[int] = None
+
+    # Background rolling summarization of long conversations
+    chat_summary_enabled: bool = True
+    chat_summary_token_threshold: int = 2000
+    chat_summary_keep_entries: int = 20
+    chat_summary_min_interval_seconds: float = 60.0
+    chat_summary_max_tokens: int = 300
+    chat_summary_queue_size: int = 1000
+
+    # Concurrent tool execution per agent
+    tool_max_concurrency: int = 4
+    tool_run_timeout_seconds: Optional[float] = None
+
+    # Background jobs (post-creation self tests)
+    background_jobs_enabled: bool = True
+    background_jobs_workers: int = 2
+    background_jobs_queue_size: int = 100
+
+    # Command room log lines coalesced into batched frames per operation
+    command_room_batching_enabled: bool = True
+    command_room_batch_interval_ms: float = 5.0
+    command_room_batch_max_lines: int = 100
+    command_room_batch_max_buffer: int = 500
+
+    # Per-worker pool of live agent instances
+    agent_pool_enabled: bool = True
+    agent_pool_max_agents: int = 256
+    agent_pool_max_memory_bytes: int = 256 * 1024 * 1024
+    agent_pool_idle_ttl_seconds: float = 900.0
+    agent_pool_max_age_seconds: float = 300.0
@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings
 from pydantic import ConfigDict
+from typing import Dict, List
 
 import logging
 
@@ -27,4 +28,65 @@ class AiModelsConfig(BaseSettings):
     image_model: str = "dall-e-3"
     image_version: str = "2024-02-01"
     whispering_model: str = "whisper-imc"
-    whispering_version: str = "2024-06-01"
\ No newline at end of file
+    whispering_version: str = "2024-06-01"
+
+    # HTTP client behaviour shared by the sync and async OpenAI clients
+    openai_timeout_seconds: float = 60.0
+    openai_connect_timeout_seconds: float = 5.0
+    openai_max_connections: int = 100
+    openai_max_keepalive_connections: int = 20
+    openai_max_concurrency: int = 32
+    openai_max_retries: int = 2
+
+    # Resilience of async provider calls: backoff (Retry-After is honoured up
+    # to the max delay), circuit breaker per model and p95 hedging
+    openai_retry_base_delay_seconds: float = 0.5
+    openai_retry_max_delay_seconds: float = 20.0
+    openai_circuit_failure_threshold: int = 5
+    openai_circuit_recovery_seconds: float = 30.0
+    openai_hedging_enabled: bool = False
+    openai_hedging_percentile: float = 0.95
+    openai_hedging_min_samples: int = 20
+
+    # LLM admission: priority classes, weighted fair share per tenant
+    # ("user:<jwt sub>", else "ip:<client address>"), tokens-per-minute budget
+    # (0 = unlimited) and queueing deadline
+    llm_scheduler_max_concurrency: int = 32
+    llm_scheduler_tokens_per_minute: int = 0
+    llm_scheduler_tenant_weights: Dict[str, float] = {}
+    llm_scheduler_max_tenants: int = 10000
+    llm_scheduler_deadline_seconds: float = 30.0
+
+    # Estimated-cost overrides: model name prefix -> [USD per 1M prompt
+    # tokens, USD per 1M completion tokens]
+    llm_pricing_usd_per_million: Dict[str, List[float]] = {}
+
+    # Prompt token budget for agent conversations; older turns are dropped
+    # (or replaced by their summary) beyond it
+    llm_history_max_prompt_tokens: int = 3000
+
+    # Concurrent embedding calls are coalesced into batches (1 disables)
+    embedding_batch_size: int = 64
+    embedding_batch_wait_ms: float = 5.0
+
+    # Content-addressed embedding cache; the shared tier is Redis, or the
+    # directory below instead of Redis when it is set
+    embedding_cache_enabled: bool = True
+    embedding_cache_dtype: str = "float32"
+    embedding_cache_local_max_size: int = 10000
+    embedding_cache_ttl_seconds: int = 2592000
+    embedding_cache_disk_path: str = ""
+
+    # Exact-match response cache (temperature 0 or opted-in requests only)
+    llm_response_cache_enabled: bool = True
+    llm_response_cache_ttl_seconds: int = 86400
+    llm_response_cache_local_max_size: int = 1024
+    llm_response_cache_local_ttl_seconds: float = 300.0
+
+    # Semantic (paraphrase) cache, used only by requests that opt in.
+    # Embedder: "openai" (embedding_model) or "hashing" (local, deterministic)
+    semantic_cache_enabled: bool = False
+    semantic_cache_embedder: str = "openai"
+    semantic_cache_similarity_threshold: float = 0.92
+    semantic_cache_max_entries: int = 2000
+    semantic_cache_ttl_seconds: float = 3600.0
@@ -11,6 +11,7 @@ from src.base.config.text_config import TextConfig
 from src.base.config.text.config import TextConfigNew
 from src.base.config.chromadb_config import ChromaDBSettings
 from src.base.config.sacred_keys import SacredKeys
+from src.base.config.agentverse_config import AgentverseConfig
 class Settings:
     """
     Aggregated settings for the application.
@@ -29,5 +30,6 @@ class Settings:
         self.textsNew = TextConfigNew()
         self.chromadb: ChromaDBSettings = ChromaDBSettings()
         self.sacred_keys: SacredKeys = SacredKeys()
+        self.agentverse: AgentverseConfig = AgentverseConfig()
 
 settings = Settings()
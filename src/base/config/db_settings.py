@@ -7,4 +7,11 @@ class DatabaseSettings(BaseSettings):
     """
     mongodb_uri: str = "mongodb://localhost:27017"
     mongodb_dbname: str = "mydb"
-    mongodb_enabled: bool = True
\ No newline at end of file
+    mongodb_enabled: bool = True
+    mongodb_command_monitoring_enabled: bool = True
+    mongodb_slow_query_threshold_ms: float = 100.0
+    mongodb_security_events_enabled: bool = False
+    mongodb_security_events_collection: str = "coll_security_events"
+    mongodb_security_events_retention_days: int = 7
+    mongodb_security_events_batch_size: int = 100
+    mongodb_security_events_flush_seconds: float = 2.0
@@ -1,7 +1,7 @@
 import logging
 from dependency_injector import containers, providers
 from src.base.infrastructure.db.chromaDB.utils.create_embedding_function import (
-    create_embedding_function
+    OpenAIEmbeddingFunction
 )
 from src.base.repositories.chromadb_repository import ChromaDBRepository
 from src.base.infrastructure.db.chromaDB.chromadb_client import ChromaDBClient
@@ -10,11 +10,20 @@ from src.base.config.config import settings
 logger = logging.getLogger(__name__)
 
 class ChromaDBContainer(containers.DeclarativeContainer):
+
+    # Provided by the root container, so embeddings share the app's OpenAIClient
+    openai = providers.DependenciesContainer()
+
+    embedding_function = providers.Singleton(
+        OpenAIEmbeddingFunction,
+        openai_client=openai.openai_client,
+        batch_size=settings.ai_models.embedding_batch_size
+    )
     
     chromadb_client = providers.Singleton(
         ChromaDBClient,
         chroma_path=settings.chromadb.chromadb_path,
-        embedding_function=create_embedding_function
+        embedding_function=embedding_function
     )
 
     chromadb_repository = providers.Singleton(
@@ -1,21 +1,41 @@
 from dependency_injector import containers, providers
 from src.base.infrastructure.db.mongoDB.mongo_client import MongoDBClient
+from src.base.infrastructure.db.mongoDB.command_monitor import MongoCommandMonitor
 from src.base.repositories.mongodb_repository import MongoDBRepository
+from src.base.monitors.security_event_store import SecurityEventStore
 from src.base.config.config import settings
 
 class DatabaseContainer(containers.DeclarativeContainer):
     """
     Container for database-related dependencies.
     """
+    # Per-command latency metrics and slow-query log
+    command_monitor = providers.Singleton(
+        MongoCommandMonitor,
+        enabled=settings.database.mongodb_command_monitoring_enabled,
+        slow_query_threshold_ms=settings.database.mongodb_slow_query_threshold_ms,
+    )
+
     # MongoDB client
     mongo_client = providers.Singleton(
         MongoDBClient,
         db_uri=settings.database.mongodb_uri,
         db_name=settings.database.mongodb_dbname,
+        event_listeners=providers.List(command_monitor),
     )
 
     # Generic repository factory
     mongodb_repository = providers.Factory(
         MongoDBRepository,
         client=mongo_client
-    )
\ No newline at end of file
+    )
+
+    # Batched, TTL-bounded persistence of security monitor events
+    security_event_store = providers.Singleton(
+        SecurityEventStore,
+        client=mongo_client,
+        collection_name=settings.database.mongodb_security_events_collection,
+        retention_days=settings.database.mongodb_security_events_retention_days,
+        batch_size=settings.database.mongodb_security_events_batch_size,
+        flush_interval_seconds=settings.database.mongodb_security_events_flush_seconds,
+    )
@@ -2,7 +2,16 @@ import logging
 from dependency_injector import containers, providers
 from src.base.config.config import settings
 from src.base.infrastructure.ai.openai_client import OpenAIClient
+from src.base.infrastructure.ai.embedding_cache import EmbeddingCache
+from src.base.infrastructure.ai.history_packer import HistoryPacker
+from src.base.infrastructure.ai.llm_metrics import configure_llm_metrics
+from src.base.infrastructure.ai.llm_scheduler import LLMScheduler
+from src.base.infrastructure.ai.resilience import LLMResilience
+from src.base.infrastructure.ai.response_cache import LLMResponseCache
+from src.base.infrastructure.ai.semantic_cache import HashingEmbedder, OpenAIEmbedder, SemanticCache
+from src.base.infrastructure.ai.tokenizer import Tokenizer
 from src.base.repositories.openai_repository import OpenAIRepository
+from src.base.utils.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +21,36 @@ class OpenAIContainer(containers.DeclarativeContainer):
     """
     logger.info("Initializing OpenAIContainer")
 
+    embedding_cache = providers.Singleton(
+        EmbeddingCache,
+        enabled=settings.ai_models.embedding_cache_enabled,
+        dtype=settings.ai_models.embedding_cache_dtype,
+        local_max_size=settings.ai_models.embedding_cache_local_max_size,
+        redis_ttl_seconds=settings.ai_models.embedding_cache_ttl_seconds,
+        disk_path=settings.ai_models.embedding_cache_disk_path or None
+    )
+
+    llm_scheduler = providers.Singleton(
+        LLMScheduler,
+        max_concurrency=settings.ai_models.llm_scheduler_max_concurrency,
+        tokens_per_minute=settings.ai_models.llm_scheduler_tokens_per_minute,
+        tenant_weights=settings.ai_models.llm_scheduler_tenant_weights,
+        max_tenants=settings.ai_models.llm_scheduler_max_tenants,
+        default_deadline_seconds=settings.ai_models.llm_scheduler_deadline_seconds
+    )
+
+    llm_resilience = providers.Singleton(
+        LLMResilience,
+        max_retries=settings.ai_models.openai_max_retries,
+        base_delay_seconds=settings.ai_models.openai_retry_base_delay_seconds,
+        max_delay_seconds=settings.ai_models.openai_retry_max_delay_seconds,
+        failure_threshold=settings.ai_models.openai_circuit_failure_threshold,
+        recovery_seconds=settings.ai_models.openai_circuit_recovery_seconds,
+        hedging_enabled=settings.ai_models.openai_hedging_enabled,
+        hedging_percentile=settings.ai_models.openai_hedging_percentile,
+        hedging_min_samples=settings.ai_models.openai_hedging_min_samples
+    )
+
     openai_client = providers.Singleton(
         OpenAIClient,
         url=settings.ai_models.openai_url,
@@ -20,10 +59,64 @@ class OpenAIContainer(containers.DeclarativeContainer):
         whispering_model=settings.ai_models.whispering_model,
         image_model=settings.ai_models.image_model,
         model=settings.ai_models.model,
-        model_mini=settings.ai_models.model_mini
+        model_mini=settings.ai_models.model_mini,
+        timeout_seconds=settings.ai_models.openai_timeout_seconds,
+        connect_timeout_seconds=settings.ai_models.openai_connect_timeout_seconds,
+        max_connections=settings.ai_models.openai_max_connections,
+        max_keepalive_connections=settings.ai_models.openai_max_keepalive_connections,
+        max_concurrency=settings.ai_models.openai_max_concurrency,
+        max_retries=settings.ai_models.openai_max_retries,
+        embedding_batch_size=settings.ai_models.embedding_batch_size,
+        embedding_batch_wait_ms=settings.ai_models.embedding_batch_wait_ms,
+        embedding_cache=embedding_cache,
+        scheduler=llm_scheduler,
+        resilience=llm_resilience
+    )
+
+    response_cache = providers.Singleton(
+        LLMResponseCache,
+        enabled=settings.ai_models.llm_response_cache_enabled,
+        ttl_seconds=settings.ai_models.llm_response_cache_ttl_seconds,
+        local_max_size=settings.ai_models.llm_response_cache_local_max_size,
+        local_ttl_seconds=settings.ai_models.llm_response_cache_local_ttl_seconds
     )
 
+    semantic_cache_embedder = providers.Selector(
+        providers.Object(settings.ai_models.semantic_cache_embedder),
+        openai=providers.Singleton(OpenAIEmbedder, openai_client=openai_client),
+        hashing=providers.Singleton(HashingEmbedder)
+    )
+
+    semantic_cache = providers.Singleton(
+        SemanticCache,
+        embedder=semantic_cache_embedder,
+        enabled=settings.ai_models.semantic_cache_enabled,
+        similarity_threshold=settings.ai_models.semantic_cache_similarity_threshold,
+        max_entries=settings.ai_models.semantic_cache_max_entries,
+        ttl_seconds=settings.ai_models.semantic_cache_ttl_seconds
+    )
+
+    history_packer = providers.Singleton(
+        HistoryPacker,
+        tokenizer=providers.Singleton(Tokenizer, model=settings.ai_models.model),
+        max_prompt_tokens=settings.ai_models.llm_history_max_prompt_tokens
+    )
+
+    # Process-wide collector (registered with Prometheus once)
+    llm_metrics = providers.Singleton(
+        configure_llm_metrics,
+        pricing=settings.ai_models.llm_pricing_usd_per_million
+    )
+
+    # Shared by every repository instance so coalescing spans all callers
+    llm_single_flight = providers.Singleton(SingleFlight, name="llm_chat")
+
     openai_repository = providers.Factory(
         OpenAIRepository,
-        openai_client=openai_client
+        openai_client=openai_client,
+        response_cache=response_cache,
+        semantic_cache=semantic_cache,
+        single_flight=llm_single_flight,
+        history_packer=history_packer,
+        metrics=llm_metrics
     )
@@ -1,5 +1,6 @@
 from dependency_injector import containers, providers
 import aioredis
+from redis import Redis
 from src.base.config.config import settings
 from src.base.repositories.redis_impl import RedisRepositoryImpl
 from src.base.services.ws_redis_bridge_service import SocketRedisBridgeService
@@ -19,6 +20,17 @@ class RedisContainer(containers.DeclarativeContainer):
         decode_responses=True,
     )
 
+    # Blocking client for synchronous callers (embedding cache on the ingestion path)
+    sync_redis_client = providers.Singleton(
+        Redis,
+        host=settings.cache.redis_host,
+        port=settings.cache.redis_port,
+        db=settings.cache.redis_db,
+        password=settings.cache.redis_password,
+        encoding="utf-8",
+        decode_responses=True,
+    )
+
     redis_repository = providers.Resource(
         RedisRepositoryImpl,
         redis_client = redis_client
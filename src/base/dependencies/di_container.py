@@ -36,7 +36,7 @@ class Container(containers.DeclarativeContainer):
     rate_limiter = providers.Container(RateLimiterContainer)
     messaging = providers.Container(MessagingContainer)
     settings_container = providers.Container(SettingsContainer)
-    chromadb = providers.Container(ChromaDBContainer)
+    chromadb = providers.Container(ChromaDBContainer, openai=openai)
     socket = providers.Container(SocketContainer)
     
     domains = providers.Object(DomainsHolder())
@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+from typing import Optional
+
+
+class LLMResponse(BaseModel):
+    """
+    Result of a single LLM call, as returned by ``OpenAIRepository.generate_response``.
+    """
+    content: str
+    model: Optional[str] = None
+    finish_reason: Optional[str] = None
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
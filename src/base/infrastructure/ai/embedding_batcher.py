@@ -0,0 +1,103 @@
+"""
+Async micro-batching of embedding requests.
+
+Embedding endpoints accept many inputs per call, but callers (tools, RAG
+queries, ingestion loops) ask for one text at a time. ``EmbeddingBatcher``
+collects the texts requested by concurrent callers for a few milliseconds,
+or until a maximum batch size is reached, sends them in one request and
+hands every caller its own vector.
+
+A caller that is alone pays at most ``max_wait_ms`` of extra latency; under
+load, N concurrent requests cost one round trip instead of N.
+"""
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from prometheus_client import Histogram
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_BATCH_SIZE = Histogram(
+    "embedding_batch_size",
+    "Number of distinct texts sent per batched embedding request",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 2048)
+)
+
+EmbedMany = Callable[[List[str]], Awaitable[List[List[float]]]]
+
+
+class EmbeddingBatcher:
+    """
+    Coalesces concurrent single-text embedding calls into batched requests.
+
+    Args:
+        embed_many: Coroutine function embedding a list of texts, returning
+            the vectors in the same order.
+        max_batch_size: A batch is sent as soon as it holds this many texts.
+        max_wait_ms: Longest time the first text of a batch waits for others.
+    """
+
+    def __init__(self, embed_many: EmbedMany, max_batch_size: int = 64, max_wait_ms: float = 5.0):
+        if max_batch_size <= 0:
+            raise ValueError("max_batch_size must be a positive integer")
+        self.embed_many = embed_many
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_ms / 1000
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._in_flight: Set[asyncio.Task] = set()
+
+    async def embed(self, text: str) -> List[float]:
+        """Return the embedding of ``text``, batched with concurrent calls."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_seconds, self.flush)
+
+        return await future
+
+    def flush(self) -> None:
+        """Send the pending texts now."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        task = asyncio.get_running_loop().create_task(self._send(batch))
+        # Keep a reference so the task is not garbage collected mid-flight
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _send(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        # Callers that gave up (cancelled) do not need a vector
+        waiting = [(text, future) for text, future in batch if not future.done()]
+        if not waiting:
+            return
+
+        # Identical texts in the same batch are embedded once
+        positions: Dict[str, int] = {}
+        for text, _ in waiting:
+            positions.setdefault(text, len(positions))
+        texts = list(positions)
+        EMBEDDING_BATCH_SIZE.observe(len(texts))
+
+        try:
+            vectors = await self.embed_many(texts)
+            if len(vectors) != len(texts):
+                raise ValueError(f"Expected {len(texts)} embeddings, got {len(vectors)}")
+        except Exception as e:
+            logger.error(f"[EmbeddingBatcher] Batch of {len(texts)} texts failed: {e}")
+            for _, future in waiting:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for text, future in waiting:
+            if not future.done():
+                future.set_result(vectors[positions[text]])
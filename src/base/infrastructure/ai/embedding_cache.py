@@ -0,0 +1,284 @@
+"""
+Content-addressed cache of embedding vectors.
+
+Re-uploading a document or repeating a RAG query embeds the exact same text
+again. Embeddings are a pure function of (model, text), so vectors are cached
+under ``sha256(model + text)`` in two tiers:
+
+* an in-process LRU, shared by the single and batched embedding paths;
+* a shared tier, either Redis (with a TTL) or a directory on disk.
+
+The synchronous path used by document ingestion reaches the same Redis tier
+through a blocking client, so chunks embedded by ingestion are reused by
+queries and by other workers.
+
+Vectors are stored as raw little-endian float32 (or float16, halving the
+size at a negligible precision cost for similarity search) rather than JSON.
+Redis values are base64 encoded because the application's Redis client
+decodes responses as UTF-8.
+"""
+import asyncio
+import base64
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+from prometheus_client import Counter, Gauge
+from redis import Redis
+from src.base.repositories.redis_repository import RedisRepository
+from src.base.utils.ttl_lru_cache import TTLLRUCache
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_CACHE_LOOKUPS = Counter(
+    "embedding_cache_lookups_total",
+    "Embedding cache lookups by result (local_hit, shared_hit, miss)",
+    ["result"]
+)
+EMBEDDING_CACHE_BYTES_STORED = Counter(
+    "embedding_cache_bytes_stored_total",
+    "Bytes of encoded vectors written to the embedding cache, by tier",
+    ["tier"]
+)
+EMBEDDING_CACHE_BYTES_HELD = Gauge(
+    "embedding_cache_bytes",
+    "Bytes of encoded vectors currently held by the embedding cache, by tier (local, disk)",
+    ["tier"]
+)
+
+DTYPES = {"float32": np.dtype("<f4"), "float16": np.dtype("<f2")}
+
+
+class DiskEmbeddingStore:
+    """Stores encoded vectors as one file per key under ``path``."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._bytes_held: Optional[int] = None
+
+    def _file(self, key: str) -> Path:
+        return self.path / key[:2] / f"{key}.bin"
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            return self._file(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def set(self, key: str, data: bytes) -> None:
+        target = self._file(key)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        replaced = target.stat().st_size if target.exists() else 0
+        # Write then rename so concurrent readers never see a partial vector
+        tmp = target.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, target)
+        if self._bytes_held is not None:
+            self._bytes_held += len(data) - replaced
+
+    def bytes_held(self) -> int:
+        """Size of the stored vectors; the directory is scanned once, then kept up to date."""
+        if self._bytes_held is None:
+            self._bytes_held = sum(f.stat().st_size for f in self.path.glob("*/*.bin")) if self.path.exists() else 0
+        return self._bytes_held
+
+
+class EmbeddingCache:
+    """
+    Two-tier content-addressed embedding cache.
+
+    Args:
+        enabled: Turn the cache into a no-op when False.
+        dtype: ``"float32"`` or ``"float16"`` storage precision.
+        local_max_size: Number of vectors kept in process.
+        redis_repository: Optional Redis shared tier (see ``attach_redis``).
+        redis_client: Blocking Redis client giving the synchronous path the
+            same shared tier.
+        redis_ttl_seconds: Lifetime of vectors in Redis.
+        disk_path: Directory of the on-disk shared tier, used when no Redis
+            repository is attached.
+        key_prefix: Prefix of the Redis keys.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        dtype: str = "float32",
+        local_max_size: int = 10000,
+        redis_repository: Optional[RedisRepository] = None,
+        redis_client: Optional[Redis] = None,
+        redis_ttl_seconds: int = 30 * 86400,
+        disk_path: Optional[str] = None,
+        key_prefix: str = "emb:"
+    ):
+        if dtype not in DTYPES:
+            raise ValueError(f"Unsupported embedding cache dtype '{dtype}'")
+        self.enabled = enabled
+        self.dtype = DTYPES[dtype]
+        self.redis_repository = redis_repository
+        self.redis_client = redis_client
+        self.redis_ttl_seconds = redis_ttl_seconds
+        self.disk = DiskEmbeddingStore(disk_path) if disk_path else None
+        self.key_prefix = key_prefix
+        self._local: TTLLRUCache[bytes] = TTLLRUCache(max_size=local_max_size)
+        EMBEDDING_CACHE_BYTES_HELD.labels(tier="local").set_function(self.local_bytes_held)
+        if self.disk is not None:
+            EMBEDDING_CACHE_BYTES_HELD.labels(tier="disk").set_function(self.disk.bytes_held)
+
+    def attach_redis(self, redis_repository: RedisRepository, redis_client: Optional[Redis] = None) -> None:
+        """Use Redis as the shared tier once the connection is available."""
+        self.redis_repository = redis_repository
+        self.redis_client = redis_client
+
+    @staticmethod
+    def make_key(model: str, text: str) -> str:
+        return hashlib.sha256(f"{model}\0{text}".encode("utf-8")).hexdigest()
+
+    def encode(self, vector: Sequence[float]) -> bytes:
+        return np.asarray(vector, dtype=self.dtype).tobytes()
+
+    def decode(self, data: bytes) -> List[float]:
+        return np.frombuffer(data, dtype=self.dtype).astype(np.float32).tolist()
+
+    async def get_many(self, model: str, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """Return cached vectors for ``texts`` (``None`` for misses)."""
+        if not self.enabled:
+            return [None] * len(texts)
+
+        keys = [self.make_key(model, text) for text in texts]
+        found: Dict[int, bytes] = {}
+        for index, key in enumerate(keys):
+            data = self._local.get(key)
+            if data is not None:
+                found[index] = data
+                EMBEDDING_CACHE_LOOKUPS.labels(result="local_hit").inc()
+
+        missing = [index for index in range(len(keys)) if index not in found]
+        if missing:
+            shared = await self._shared_get([keys[index] for index in missing])
+            for index, data in zip(missing, shared):
+                if data is None:
+                    EMBEDDING_CACHE_LOOKUPS.labels(result="miss").inc()
+                    continue
+                found[index] = data
+                self._local.set(keys[index], data)
+                EMBEDDING_CACHE_LOOKUPS.labels(result="shared_hit").inc()
+
+        return [self.decode(found[index]) if index in found else None for index in range(len(keys))]
+
+    async def set_many(self, model: str, texts: Sequence[str], vectors: Sequence[Sequence[float]]) -> None:
+        """Store freshly computed vectors in both tiers."""
+        if not self.enabled or not texts:
+            return
+        encoded = {self.make_key(model, text): self.encode(vector) for text, vector in zip(texts, vectors)}
+        for key, data in encoded.items():
+            self._local.set(key, data)
+            EMBEDDING_CACHE_BYTES_STORED.labels(tier="local").inc(len(data))
+        await self._shared_set(encoded)
+
+    def get_many_sync(self, model: str, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """Synchronous ``get_many`` for blocking callers such as document ingestion."""
+        if not self.enabled:
+            return [None] * len(texts)
+
+        keys = [self.make_key(model, text) for text in texts]
+        found: Dict[int, bytes] = {}
+        for index, key in enumerate(keys):
+            data = self._local.get(key)
+            if data is not None:
+                found[index] = data
+                EMBEDDING_CACHE_LOOKUPS.labels(result="local_hit").inc()
+
+        missing = [index for index in range(len(keys)) if index not in found]
+        if missing:
+            shared = self._shared_get_sync([keys[index] for index in missing])
+            for index, data in zip(missing, shared):
+                if data is None:
+                    EMBEDDING_CACHE_LOOKUPS.labels(result="miss").inc()
+                    continue
+                found[index] = data
+                self._local.set(keys[index], data)
+                EMBEDDING_CACHE_LOOKUPS.labels(result="shared_hit").inc()
+
+        return [self.decode(found[index]) if index in found else None for index in range(len(keys))]
+
+    def set_many_sync(self, model: str, texts: Sequence[str], vectors: Sequence[Sequence[float]]) -> None:
+        """Synchronous ``set_many`` for blocking callers such as document ingestion."""
+        if not self.enabled or not texts:
+            return
+        encoded = {self.make_key(model, text): self.encode(vector) for text, vector in zip(texts, vectors)}
+        for key, data in encoded.items():
+            self._local.set(key, data)
+            EMBEDDING_CACHE_BYTES_STORED.labels(tier="local").inc(len(data))
+        self._shared_set_sync(encoded)
+
+    def local_bytes_held(self) -> int:
+        """Size of the vectors held in process."""
+        return sum(len(data) for data in list(self._local.values()))
+
+    def stats(self):
+        """Return the statistics of the in-process tier."""
+        return self._local.stats()
+
+    async def _shared_get(self, keys: List[str]) -> List[Optional[bytes]]:
+        if self.redis_repository is not None:
+            try:
+                values = await self.redis_repository.mget([self.key_prefix + key for key in keys])
+                return [base64.b64decode(value) if value else None for value in values]
+            except Exception as e:
+                logger.warning(f"Embedding cache read failed: {e}")
+                return [None] * len(keys)
+        if self.disk is not None:
+            return await asyncio.to_thread(lambda: [self.disk.get(key) for key in keys])
+        return [None] * len(keys)
+
+    async def _shared_set(self, encoded: Dict[str, bytes]) -> None:
+        if self.redis_repository is not None:
+            payload = {self.key_prefix + key: base64.b64encode(data).decode("ascii") for key, data in encoded.items()}
+            try:
+                await self.redis_repository.mset(payload, expiration=self.redis_ttl_seconds)
+                EMBEDDING_CACHE_BYTES_STORED.labels(tier="redis").inc(sum(len(value) for value in payload.values()))
+            except Exception as e:
+                logger.warning(f"Embedding cache write failed: {e}")
+        elif self.disk is not None:
+            await asyncio.to_thread(lambda: [self._disk_set(key, data) for key, data in encoded.items()])
+
+    def _shared_get_sync(self, keys: List[str]) -> List[Optional[bytes]]:
+        if self.redis_repository is not None:
+            if self.redis_client is None:
+                return [None] * len(keys)
+            try:
+                values = self.redis_client.mget([self.key_prefix + key for key in keys])
+                return [base64.b64decode(value) if value else None for value in values]
+            except Exception as e:
+                logger.warning(f"Embedding cache read failed: {e}")
+                return [None] * len(keys)
+        if self.disk is not None:
+            return [self.disk.get(key) for key in keys]
+        return [None] * len(keys)
+
+    def _shared_set_sync(self, encoded: Dict[str, bytes]) -> None:
+        if self.redis_repository is not None:
+            if self.redis_client is None:
+                return
+            payload = {self.key_prefix + key: base64.b64encode(data).decode("ascii") for key, data in encoded.items()}
+            try:
+                with self.redis_client.pipeline(transaction=False) as pipe:
+                    for key, value in payload.items():
+                        pipe.set(key, value, ex=self.redis_ttl_seconds)
+                    pipe.execute()
+                EMBEDDING_CACHE_BYTES_STORED.labels(tier="redis").inc(sum(len(value) for value in payload.values()))
+            except Exception as e:
+                logger.warning(f"Embedding cache write failed: {e}")
+        elif self.disk is not None:
+            for key, data in encoded.items():
+                self._disk_set(key, data)
+
+    def _disk_set(self, key: str, data: bytes) -> None:
+        try:
+            self.disk.set(key, data)
+            EMBEDDING_CACHE_BYTES_STORED.labels(tier="disk").inc(len(data))
+        except OSError as e:
+            logger.warning(f"Embedding cache write failed: {e}")
@@ -0,0 +1,130 @@
+"""
+Token-budgeted packing of conversation history into chat messages.
+
+Agents keep their whole conversation in memory, but sending all of it makes
+every turn slower and more expensive until the request exceeds the context
+window. ``HistoryPacker`` builds the message list from:
+
+1. the system prompt (always kept);
+2. a summary of the turns that did not fit, when one is available;
+3. the most recent turns, newest first, while they fit in the budget;
+4. the latest user input (always kept).
+
+History turns use the agent memory format: ``{"user": ...}``,
+``{"agent": ...}`` and ``{"summary": ...}`` entries.
+"""
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+from prometheus_client import Histogram
+from src.base.infrastructure.ai.tokenizer import Tokenizer
+
+logger = logging.getLogger(__name__)
+
+PACKED_PROMPT_TOKENS = Histogram(
+    "llm_packed_prompt_tokens",
+    "Prompt tokens of chat requests built from conversation history",
+    buckets=(128, 256, 512, 1024, 2048, 4096, 8192, 16384, 32768)
+)
+
+SUMMARY_PREFIX = "Summary of the earlier conversation:\n"
+
+
+@dataclass
+class PackedHistory:
+    messages: List[Dict[str, str]]
+    prompt_tokens: int
+    kept_turns: int
+    dropped_turns: int
+    summarized: bool
+
+
+class HistoryPacker:
+    """
+    Keeps chat requests within a prompt token budget.
+
+    Args:
+        tokenizer: Token counter for the target model.
+        max_prompt_tokens: Budget for the whole prompt (system prompt,
+            summary, history and user input).
+    """
+
+    def __init__(self, tokenizer: Tokenizer, max_prompt_tokens: int = 3000):
+        self.tokenizer = tokenizer
+        self.max_prompt_tokens = max_prompt_tokens
+
+    def pack(
+        self,
+        prompt: str,
+        user_input: str,
+        history: List[Dict[str, Any]],
+        summary: Optional[str] = None
+    ) -> PackedHistory:
+        """
+        Build the chat messages for a request.
+
+        Args:
+            prompt: System prompt.
+            user_input: Latest user message.
+            history: Previous turns, oldest first.
+            summary: Summary of the older turns, used only when some turns
+                are dropped. Without it, the newest ``{"summary": ...}`` entry
+                of ``history`` is used; such an entry stands for turns already
+                removed from memory, so it is always included.
+        """
+        turns: List[Dict[str, str]] = []
+        for turn in history:
+            if turn.get("user"):
+                turns.append({"role": "user", "content": str(turn["user"])})
+            if turn.get("agent"):
+                turns.append({"role": "assistant", "content": str(turn["agent"])})
+        always_summarize = False
+        if summary is None:
+            summary = next((str(t["summary"]) for t in reversed(history) if t.get("summary")), None)
+            always_summarize = summary is not None
+
+        head = [{"role": "system", "content": str(prompt)}] if prompt else []
+        tail = [{"role": "user", "content": str(user_input)}]
+        used = self.tokenizer.count_messages(head + tail)
+
+        summary_message = {"role": "system", "content": SUMMARY_PREFIX + summary} if summary else None
+        summary_cost = self.tokenizer.count_message(summary_message) if summary_message else 0
+
+        costs = [self.tokenizer.count_message(message) for message in turns]
+        if used + sum(costs) + (summary_cost if always_summarize else 0) <= self.max_prompt_tokens:
+            kept = turns
+            used += sum(costs)
+        else:
+            # Newest turns first, leaving room for the summary; stop at the
+            # first turn that does not fit so the kept history stays contiguous
+            kept = []
+            for message, cost in zip(reversed(turns), reversed(costs)):
+                if used + cost + summary_cost > self.max_prompt_tokens:
+                    break
+                kept.append(message)
+                used += cost
+            kept.reverse()
+
+        dropped = len(turns) - len(kept)
+        summarized = False
+        if summary_message and (dropped or always_summarize) and used + summary_cost <= self.max_prompt_tokens:
+            head = head + [summary_message]
+            used += summary_cost
+            summarized = True
+
+        if used > self.max_prompt_tokens:
+            logger.warning(
+                f"Prompt uses {used} tokens, over the {self.max_prompt_tokens} budget, "
+                "even without history"
+            )
+        if dropped:
+            logger.debug(f"Packed history: kept {len(kept)} messages, dropped {dropped}, summary={summarized}")
+
+        PACKED_PROMPT_TOKENS.observe(used)
+        return PackedHistory(
+            messages=head + kept + tail,
+            prompt_tokens=used,
+            kept_turns=len(kept),
+            dropped_turns=dropped,
+            summarized=summarized
+        )
@@ -0,0 +1,207 @@
+"""
+Token, cost, latency and time-to-first-token metrics of LLM calls.
+
+Every completed call is attributed to a model, an agent type and a caller
+(the feature issuing it: ``agent_chat``, ``writer_assistant``, ``self_test``
+...). Agent type and caller come from the context (see ``llm_call_labels``)
+so they do not have to be threaded through every call.
+
+Resolving labelled ``prometheus_client`` children on every call costs a
+lock and a dictionary lookup per metric, so ``LLMMetrics`` instead
+aggregates everything in plain dictionaries and is registered as a custom
+collector: the series are only built when Prometheus scrapes. Exported:
+
+* ``llm_requests_total``
+* ``llm_tokens_total{kind="prompt"|"completion"}``
+* ``llm_cost_usd_total`` (estimated from a per-model price table)
+* ``llm_request_latency_seconds`` (histogram)
+* ``llm_time_to_first_token_seconds`` (histogram, streamed calls only)
+
+Usage comes from the response's ``usage`` fields, or from local token
+counting for streamed responses, which do not report it.
+"""
+import bisect
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from prometheus_client import REGISTRY
+from prometheus_client.core import CounterMetricFamily, HistogramMetricFamily
+
+LABELS = ["model", "agent_type", "caller"]
+
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2, 4, 8, 15, 30, 60, 120)
+TTFT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 0.75, 1, 1.5, 2, 4, 8, 15)
+
+# USD per million (prompt, completion) tokens; longest model-name prefix wins
+DEFAULT_PRICING: Dict[str, Tuple[float, float]] = {
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4.1-nano": (0.10, 0.40),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1": (2.00, 8.00),
+    "gpt-3.5-turbo": (0.50, 1.50),
+}
+
+_agent_type: ContextVar[str] = ContextVar("llm_agent_type", default="none")
+_caller: ContextVar[str] = ContextVar("llm_caller", default="unknown")
+
+
+@contextmanager
+def llm_call_labels(agent_type: Optional[str] = None, caller: Optional[str] = None) -> Iterator[None]:
+    """Attribute every LLM call made inside the block to ``agent_type`` and/or ``caller``."""
+    tokens = []
+    if agent_type is not None:
+        tokens.append((_agent_type, _agent_type.set(agent_type)))
+    if caller is not None:
+        tokens.append((_caller, _caller.set(caller)))
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+
+def current_labels() -> Tuple[str, str]:
+    """Agent type and caller of the current context."""
+    return _agent_type.get(), _caller.get()
+
+
+class _Histogram:
+    __slots__ = ("buckets", "counts", "total")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.total += value
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        result, running = [], 0
+        for bound, count in zip(list(self.buckets) + [float("inf")], self.counts):
+            running += count
+            result.append(("+Inf" if bound == float("inf") else str(bound), running))
+        return result
+
+
+class LLMMetrics:
+    """
+    In-process aggregation of LLM call metrics, exported at scrape time.
+
+    Args:
+        pricing: USD per million prompt and completion tokens, by model name
+            prefix; merged over ``DEFAULT_PRICING``.
+    """
+
+    def __init__(self, pricing: Optional[Dict[str, Sequence[float]]] = None):
+        self._lock = threading.Lock()
+        self._pricing: Dict[str, Tuple[float, float]] = dict(DEFAULT_PRICING)
+        self._price_cache: Dict[str, Tuple[float, float]] = {}
+        self.configure(pricing)
+        self._requests: Dict[Tuple[str, str, str], int] = {}
+        self._prompt_tokens: Dict[Tuple[str, str, str], int] = {}
+        self._completion_tokens: Dict[Tuple[str, str, str], int] = {}
+        self._cost: Dict[Tuple[str, str, str], float] = {}
+        self._latency: Dict[Tuple[str, str, str], _Histogram] = {}
+        self._ttft: Dict[Tuple[str, str, str], _Histogram] = {}
+
+    def configure(self, pricing: Optional[Dict[str, Sequence[float]]] = None) -> "LLMMetrics":
+        """Override model prices (USD per million prompt, completion tokens)."""
+        for model, (prompt_price, completion_price) in (pricing or {}).items():
+            self._pricing[model] = (float(prompt_price), float(completion_price))
+        self._price_cache.clear()
+        return self
+
+    def price(self, model: str) -> Tuple[float, float]:
+        """Prices of ``model``, matched on the longest known name prefix (dated snapshots included)."""
+        cached = self._price_cache.get(model)
+        if cached is None:
+            matches = [name for name in self._pricing if model.startswith(name)]
+            cached = self._pricing[max(matches, key=len)] if matches else (0.0, 0.0)
+            self._price_cache[model] = cached
+        return cached
+
+    def record(
+        self,
+        model: str,
+        prompt_tokens: int,
+        completion_tokens: int,
+        latency_seconds: float,
+        ttft_seconds: Optional[float] = None,
+        labels: Optional[Tuple[str, str]] = None
+    ) -> None:
+        """
+        Account one completed call.
+
+        Args:
+            model: Requested model.
+            prompt_tokens: Prompt tokens (reported or counted locally).
+            completion_tokens: Completion tokens (reported or counted locally).
+            latency_seconds: Time until the full response was received.
+            ttft_seconds: Time until the first streamed content, if streamed.
+            labels: Agent type and caller; the current context by default.
+        """
+        key = (model,) + (labels or current_labels())
+        prompt_price, completion_price = self.price(model)
+        cost = (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1_000_000
+        with self._lock:
+            self._requests[key] = self._requests.get(key, 0) + 1
+            self._prompt_tokens[key] = self._prompt_tokens.get(key, 0) + prompt_tokens
+            self._completion_tokens[key] = self._completion_tokens.get(key, 0) + completion_tokens
+            self._cost[key] = self._cost.get(key, 0.0) + cost
+            latency = self._latency.get(key)
+            if latency is None:
+                latency = self._latency[key] = _Histogram(LATENCY_BUCKETS)
+            latency.observe(latency_seconds)
+            if ttft_seconds is not None:
+                ttft = self._ttft.get(key)
+                if ttft is None:
+                    ttft = self._ttft[key] = _Histogram(TTFT_BUCKETS)
+                ttft.observe(ttft_seconds)
+
+    def collect(self):
+        with self._lock:
+            requests = dict(self._requests)
+            prompt_tokens = dict(self._prompt_tokens)
+            completion_tokens = dict(self._completion_tokens)
+            cost = dict(self._cost)
+            latency = {key: (h.cumulative(), h.total) for key, h in self._latency.items()}
+            ttft = {key: (h.cumulative(), h.total) for key, h in self._ttft.items()}
+
+        requests_family = CounterMetricFamily("llm_requests", "Completed LLM calls", labels=LABELS)
+        for key, value in requests.items():
+            requests_family.add_metric(list(key), value)
+        yield requests_family
+
+        tokens_family = CounterMetricFamily("llm_tokens", "LLM tokens by kind", labels=LABELS + ["kind"])
+        for key, value in prompt_tokens.items():
+            tokens_family.add_metric(list(key) + ["prompt"], value)
+        for key, value in completion_tokens.items():
+            tokens_family.add_metric(list(key) + ["completion"], value)
+        yield tokens_family
+
+        cost_family = CounterMetricFamily("llm_cost_usd", "Estimated LLM cost in USD", labels=LABELS)
+        for key, value in cost.items():
+            cost_family.add_metric(list(key), value)
+        yield cost_family
+
+        for name, documentation, series in (
+            ("llm_request_latency_seconds", "Latency of LLM calls until the full response", latency),
+            ("llm_time_to_first_token_seconds", "Time to the first streamed token of LLM calls", ttft),
+        ):
+            family = HistogramMetricFamily(name, documentation, labels=LABELS)
+            for key, (buckets, total) in series.items():
+                family.add_metric(list(key), buckets, sum_value=total)
+            yield family
+
+
+LLM_METRICS = LLMMetrics()
+REGISTRY.register(LLM_METRICS)
+
+
+def configure_llm_metrics(pricing: Optional[Dict[str, Sequence[float]]] = None) -> LLMMetrics:
+    """Return the process-wide collector with ``pricing`` applied."""
+    return LLM_METRICS.configure(pricing)
@@ -0,0 +1,391 @@
+"""
+Priority- and tenant-aware admission control for LLM calls.
+
+Every LLM caller (chat, writer assistant, self-tests, summaries...) shares the
+same provider quota. ``LLMScheduler`` sits in front of the client and decides
+which waiting request is sent next:
+
+* priority classes are served strictly in order (``interactive`` before
+  ``normal`` before ``background``), so background jobs cannot starve chat;
+* within a class, tenants (authenticated users, else client addresses)
+  share capacity by weighted fair queuing on estimated tokens, so one busy
+  tenant cannot starve the others;
+* a global concurrency cap and an optional tokens-per-minute budget bound
+  what is sent to the provider;
+* every request has a deadline. Requests that cannot start in time are
+  rejected with ``LLMCapacityExceededError``, up front when the token budget
+  already makes it impossible, instead of timing out late.
+
+Priority, tenant and deadline are read from the context (see
+``llm_scheduling``) so they do not have to be threaded through every call.
+"""
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
+from prometheus_client import Counter, Gauge, Histogram
+from src.base.infrastructure.exceptions import LLMCapacityExceededError
+
+logger = logging.getLogger(__name__)
+
+PRIORITIES = ("interactive", "normal", "background")
+
+LLM_QUEUE_WAIT = Histogram(
+    "llm_scheduler_queue_wait_seconds",
+    "Time LLM requests wait for the scheduler, by priority",
+    ["priority"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+)
+LLM_QUEUED = Gauge(
+    "llm_scheduler_queued_requests",
+    "LLM requests waiting for the scheduler, by priority",
+    ["priority"]
+)
+LLM_ACTIVE = Gauge(
+    "llm_scheduler_active_requests",
+    "LLM requests currently admitted by the scheduler"
+)
+LLM_REJECTED = Counter(
+    "llm_scheduler_rejected_total",
+    "LLM requests rejected by the scheduler, by priority and reason",
+    ["priority", "reason"]
+)
+
+_priority: ContextVar[str] = ContextVar("llm_priority", default="interactive")
+_tenant: ContextVar[str] = ContextVar("llm_tenant", default="default")
+_deadline: ContextVar[Optional[float]] = ContextVar("llm_deadline_seconds", default=None)
+
+
+@contextmanager
+def llm_scheduling(
+    priority: Optional[str] = None,
+    tenant: Optional[str] = None,
+    deadline_seconds: Optional[float] = None
+) -> Iterator[None]:
+    """Set the priority, tenant and/or deadline of every LLM call made inside the block."""
+    if priority is not None and priority not in PRIORITIES:
+        raise ValueError(f"Unknown LLM priority '{priority}'")
+    tokens = []
+    for var, value in ((_priority, priority), (_tenant, tenant), (_deadline, deadline_seconds)):
+        if value is not None:
+            tokens.append((var, var.set(value)))
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+
+@dataclass(eq=False)
+class SchedulerTicket:
+    """An admitted (or waiting) request. Set ``used_tokens`` to refund the estimate."""
+    priority: str
+    tenant: str
+    tokens: int
+    start_tag: float
+    enqueued_at: float
+    future: asyncio.Future
+    used_tokens: Optional[int] = None
+    granted: bool = False
+    withdrawn: bool = False
+    released: bool = False
+
+
+class LLMScheduler:
+    """
+    Weighted fair, priority-aware scheduler for LLM requests.
+
+    Args:
+        max_concurrency: Requests admitted at the same time.
+        tokens_per_minute: Provider token budget (prompt + completion);
+            0 disables token accounting.
+        tenant_weights: Relative share of each tenant within a priority
+            class; unknown tenants weigh 1.
+        max_tenants: Tenants whose fair queuing position is remembered;
+            beyond it the least recently active ones are forgotten.
+        default_deadline_seconds: Longest a request may wait to be admitted.
+        clock: Monotonic time source, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 32,
+        tokens_per_minute: int = 0,
+        tenant_weights: Optional[Dict[str, float]] = None,
+        max_tenants: int = 10000,
+        default_deadline_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be a positive integer")
+        self.max_concurrency = max_concurrency
+        self.tokens_per_minute = tokens_per_minute
+        self.tenant_weights = tenant_weights or {}
+        self.max_tenants = max_tenants
+        self.default_deadline_seconds = default_deadline_seconds
+        self.clock = clock
+
+        self._active = 0
+        self._seq = itertools.count()
+        # One heap of (start tag, seq, ticket) per priority class
+        self._queues: Dict[str, List[Tuple[float, int, SchedulerTicket]]] = {p: [] for p in PRIORITIES}
+        self._queued_tokens: Dict[str, int] = {p: 0 for p in PRIORITIES}
+        self._virtual_time: Dict[str, float] = {p: 0.0 for p in PRIORITIES}
+        # Least recently active (priority, tenant) first
+        self._finish_tags: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+        self._budget = float(tokens_per_minute)
+        self._refilled_at = clock()
+        self._refill_timer: Optional[asyncio.TimerHandle] = None
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        tokens: int,
+        priority: Optional[str] = None,
+        tenant: Optional[str] = None,
+        deadline_seconds: Optional[float] = None
+    ) -> AsyncIterator[SchedulerTicket]:
+        """Hold an admission for the duration of the block."""
+        ticket = await self.acquire(tokens, priority=priority, tenant=tenant, deadline_seconds=deadline_seconds)
+        try:
+            yield ticket
+        finally:
+            self.release(ticket)
+
+    async def acquire(
+        self,
+        tokens: int,
+        priority: Optional[str] = None,
+        tenant: Optional[str] = None,
+        deadline_seconds: Optional[float] = None
+    ) -> SchedulerTicket:
+        """
+        Wait until the request may be sent.
+
+        Args:
+            tokens: Estimated prompt + completion tokens.
+            priority: Priority class; from ``llm_scheduling`` by default.
+            tenant: Tenant id; from ``llm_scheduling`` by default.
+            deadline_seconds: Longest wait; from ``llm_scheduling`` or the
+                scheduler default.
+
+        Raises:
+            LLMCapacityExceededError: The request cannot be admitted in time.
+        """
+        priority = priority or _priority.get()
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown LLM priority '{priority}'")
+        tenant = tenant or _tenant.get()
+        if deadline_seconds is None:
+            deadline_seconds = _deadline.get() or self.default_deadline_seconds
+        tokens = max(1, int(tokens))
+        self._check_admissible(tokens, priority, deadline_seconds)
+
+        start_tag = self._tag(priority, tenant, tokens)
+
+        loop = asyncio.get_running_loop()
+        ticket = SchedulerTicket(
+            priority=priority,
+            tenant=tenant,
+            tokens=tokens,
+            start_tag=start_tag,
+            enqueued_at=self.clock(),
+            future=loop.create_future()
+        )
+        heapq.heappush(self._queues[priority], (start_tag, next(self._seq), ticket))
+        self._queued_tokens[priority] += tokens
+        LLM_QUEUED.labels(priority=priority).inc()
+        self._dispatch()
+
+        expiry = None
+        if not ticket.future.done():
+            expiry = loop.call_later(deadline_seconds, self._expire, ticket)
+        try:
+            await ticket.future
+        except asyncio.CancelledError:
+            if ticket.granted:
+                self.release(ticket)
+            else:
+                self._withdraw(ticket)
+            raise
+        finally:
+            if expiry is not None:
+                expiry.cancel()
+        return ticket
+
+    def try_acquire(
+        self,
+        tokens: int,
+        priority: Optional[str] = None,
+        tenant: Optional[str] = None
+    ) -> Optional[SchedulerTicket]:
+        """
+        Admit a request only if it can be sent right away without overtaking
+        queued ones, else return None. For optional extra requests such as
+        hedges, which are better skipped than queued.
+        """
+        priority = priority or _priority.get()
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown LLM priority '{priority}'")
+        tenant = tenant or _tenant.get()
+        tokens = max(1, int(tokens))
+        if self._active >= self.max_concurrency or self._head() is not None:
+            return None
+        if self.tokens_per_minute:
+            self._refill()
+            if self._budget < tokens:
+                return None
+            self._budget -= tokens
+
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(None)
+        ticket = SchedulerTicket(
+            priority=priority,
+            tenant=tenant,
+            tokens=tokens,
+            start_tag=self._tag(priority, tenant, tokens),
+            enqueued_at=self.clock(),
+            future=future,
+            granted=True
+        )
+        self._active += 1
+        LLM_ACTIVE.inc()
+        return ticket
+
+    def release(self, ticket: SchedulerTicket) -> None:
+        """Free the admission of ``ticket`` and refund unused estimated tokens."""
+        if not ticket.granted or ticket.released:
+            return
+        ticket.released = True
+        self._active -= 1
+        LLM_ACTIVE.dec()
+        if self.tokens_per_minute and ticket.used_tokens is not None:
+            self._refill()
+            # May go below zero when the estimate was short; the debt is paid by later refills
+            self._budget = min(float(self.tokens_per_minute), self._budget + ticket.tokens - ticket.used_tokens)
+        self._dispatch()
+
+    def stats(self) -> Dict[str, object]:
+        """Return the current admission state."""
+        self._refill()
+        return {
+            "active": self._active,
+            "queued": {p: sum(1 for _, _, t in q if not t.withdrawn) for p, q in self._queues.items()},
+            "budget_tokens": self._budget if self.tokens_per_minute else None
+        }
+
+    def _check_admissible(self, tokens: int, priority: str, deadline_seconds: float) -> None:
+        if not self.tokens_per_minute:
+            return
+        if tokens > self.tokens_per_minute:
+            self._reject(priority, "too_large", None)
+        # Requests of this class and above go first; if the budget cannot
+        # cover them and this one before the deadline, say so now
+        self._refill()
+        ahead = sum(self._queued_tokens[p] for p in PRIORITIES[:PRIORITIES.index(priority) + 1])
+        wait = (ahead + tokens - self._budget) / self._tokens_per_second()
+        if wait > deadline_seconds:
+            self._reject(priority, "deadline", wait)
+
+    def _reject(self, priority: str, reason: str, retry_after: Optional[float]) -> None:
+        LLM_REJECTED.labels(priority=priority, reason=reason).inc()
+        logger.warning(f"LLM request rejected: priority={priority}, reason={reason}")
+        raise LLMCapacityExceededError(reason=reason, priority=priority, retry_after=retry_after)
+
+    def _tokens_per_second(self) -> float:
+        return self.tokens_per_minute / 60.0
+
+    def _refill(self) -> None:
+        now = self.clock()
+        if self.tokens_per_minute:
+            self._budget = min(
+                float(self.tokens_per_minute),
+                self._budget + (now - self._refilled_at) * self._tokens_per_second()
+            )
+        self._refilled_at = now
+
+    def _head(self) -> Optional[SchedulerTicket]:
+        for priority in PRIORITIES:
+            queue = self._queues[priority]
+            while queue and queue[0][2].withdrawn:
+                heapq.heappop(queue)
+            if queue:
+                return queue[0][2]
+        return None
+
+    def _dispatch(self) -> None:
+        while self._active < self.max_concurrency:
+            ticket = self._head()
+            if ticket is None:
+                return
+            if self.tokens_per_minute:
+                self._refill()
+                if self._budget < ticket.tokens:
+                    # The head waits for the budget; skipping it would starve large requests
+                    self._schedule_refill((ticket.tokens - self._budget) / self._tokens_per_second())
+                    return
+                self._budget -= ticket.tokens
+
+            heapq.heappop(self._queues[ticket.priority])
+            self._dequeued(ticket)
+            self._virtual_time[ticket.priority] = ticket.start_tag
+            ticket.granted = True
+            self._active += 1
+            LLM_ACTIVE.inc()
+            LLM_QUEUE_WAIT.labels(priority=ticket.priority).observe(self.clock() - ticket.enqueued_at)
+            ticket.future.set_result(None)
+
+    def _schedule_refill(self, delay: float) -> None:
+        if self._refill_timer is not None:
+            return
+        self._refill_timer = asyncio.get_running_loop().call_later(max(delay, 0.001), self._on_refill)
+
+    def _on_refill(self) -> None:
+        self._refill_timer = None
+        self._dispatch()
+
+    def _tag(self, priority: str, tenant: str, tokens: int) -> float:
+        """Start tag of the tenant's next request; advances its finish tag by the request's weighted cost."""
+        key = (priority, tenant)
+        start_tag = max(self._virtual_time[priority], self._finish_tags.pop(key, 0.0))
+        self._finish_tags[key] = start_tag + tokens / self.tenant_weights.get(tenant, 1.0)
+        if len(self._finish_tags) > self.max_tenants:
+            self._prune_finish_tags()
+        return start_tag
+
+    def _prune_finish_tags(self) -> None:
+        # A tag behind its class's virtual time no longer changes where the
+        # tenant's next request starts, so it can be dropped
+        self._finish_tags = OrderedDict(
+            (key, tag) for key, tag in self._finish_tags.items() if tag > self._virtual_time[key[0]]
+        )
+        # Then forget the least recently active tenants, down to half the bound
+        # so the sweep runs once per max_tenants / 2 new tenants at most
+        while len(self._finish_tags) > self.max_tenants // 2:
+            self._finish_tags.popitem(last=False)
+
+    def _dequeued(self, ticket: SchedulerTicket) -> None:
+        self._queued_tokens[ticket.priority] -= ticket.tokens
+        LLM_QUEUED.labels(priority=ticket.priority).dec()
+
+    def _withdraw(self, ticket: SchedulerTicket) -> None:
+        if ticket.granted or ticket.withdrawn:
+            return
+        ticket.withdrawn = True
+        self._dequeued(ticket)
+        # The withdrawn ticket may have been the head blocking the others
+        self._dispatch()
+
+    def _expire(self, ticket: SchedulerTicket) -> None:
+        if ticket.granted or ticket.withdrawn:
+            return
+        self._withdraw(ticket)
+        LLM_REJECTED.labels(priority=ticket.priority, reason="deadline").inc()
+        logger.warning(f"LLM request rejected after waiting: priority={ticket.priority}, reason=deadline")
+        ticket.future.set_exception(LLMCapacityExceededError(reason="deadline", priority=ticket.priority))
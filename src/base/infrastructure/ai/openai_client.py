@@ -1,13 +1,37 @@
-from openai import OpenAI
-from typing import List, Dict, Optional
+import asyncio
+import httpx
+from openai import AsyncOpenAI, NOT_GIVEN, OpenAI
+from typing import Any, AsyncIterator, Callable, List, Dict, Optional
 import logging
 from pathlib import Path
+from src.base.infrastructure.ai.embedding_batcher import EmbeddingBatcher
+from src.base.infrastructure.ai.embedding_cache import EmbeddingCache
+from src.base.infrastructure.ai.llm_scheduler import LLMScheduler, SchedulerTicket
+from src.base.infrastructure.ai.resilience import HedgeAdmission, LLMResilience
+from src.base.infrastructure.ai.tokenizer import get_tokenizer
 
 logger = logging.getLogger(__name__)
 
 class OpenAIClient:
     """
     Wrapper for OpenAI API operations including chat, completion, embeddings, audio, and image generation.
+
+    Every operation exists in a blocking flavour (for scripts and sync code)
+    and an ``*_async`` flavour built on ``AsyncOpenAI``. Both share the same
+    connection limits and timeouts; async calls are additionally bounded by a
+    semaphore so a burst of requests cannot exhaust the connection pool.
+
+    Single-text ``get_embeddings_async`` calls made concurrently are coalesced
+    into batched requests (see ``EmbeddingBatcher``); set
+    ``embedding_batch_size`` to 1 to disable it. An optional
+    ``EmbeddingCache`` sits in front of every embedding path.
+
+    When an ``LLMScheduler`` is given, chat and completion calls are admitted
+    by it (priority, tenant fairness, token budget) instead of the semaphore.
+
+    Async requests run under an ``LLMResilience`` policy (retries honouring
+    ``Retry-After``, a circuit breaker per model, optional hedging), which
+    replaces the SDK's own retries; blocking calls keep the SDK retries.
     """
 
     def __init__(
@@ -18,12 +42,43 @@ class OpenAIClient:
         model_mini: str,
         embedding_model: str,
         whispering_model: str,
-        image_model: str
+        image_model: str,
+        timeout_seconds: float = 60.0,
+        connect_timeout_seconds: float = 5.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        max_concurrency: int = 32,
+        max_retries: int = 2,
+        embedding_batch_size: int = 64,
+        embedding_batch_wait_ms: float = 5.0,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        scheduler: Optional[LLMScheduler] = None,
+        resilience: Optional[LLMResilience] = None
     ):
         if not api_key.startswith("sk-"):
             raise ValueError("Invalid OpenAI API key")
 
-        self.client = OpenAI(api_key=api_key, base_url=url)
+        timeout = httpx.Timeout(timeout_seconds, connect=connect_timeout_seconds)
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections
+        )
+
+        # An empty URL means "use the SDK default endpoint"
+        base_url = url or None
+        self.client = OpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            max_retries=max_retries,
+            http_client=httpx.Client(timeout=timeout, limits=limits)
+        )
+        # Retries of async calls are handled by the resilience policy
+        self.async_client = AsyncOpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            max_retries=0,
+            http_client=httpx.AsyncClient(timeout=timeout, limits=limits)
+        )
         self.url = url
 
         self.model = model
@@ -32,19 +87,90 @@ class OpenAIClient:
         self.whispering_model = whispering_model
         self.image_model = image_model
 
+        self.max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        self.embedding_batch_size = embedding_batch_size
+        self.embedding_batch_wait_ms = embedding_batch_wait_ms
+        self._embedding_batcher: Optional[EmbeddingBatcher] = None
+        self.embedding_cache = embedding_cache
+        self.scheduler = scheduler
+        self.resilience = resilience or LLMResilience(max_retries=max_retries)
+
         logger.info(f"🔑 OpenAIClient initialized — base_url: {url}, model: {model}")
 
+    def _limiter(self) -> asyncio.Semaphore:
+        # Created lazily so it binds to the running event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    def _generation_slot(
+        self,
+        model: str,
+        max_tokens: int,
+        messages: Optional[List[Dict[str, str]]] = None,
+        prompt: Optional[str] = None
+    ):
+        # Async context manager admitting one chat/completion request
+        if self.scheduler is None:
+            return self._limiter()
+        tokenizer = get_tokenizer(model)
+        prompt_tokens = tokenizer.count_messages(messages) if messages is not None else tokenizer.count(prompt or "")
+        return self.scheduler.slot(prompt_tokens + max_tokens)
+
+    def _hedge_admission(self, ticket: Optional[SchedulerTicket] = None) -> HedgeAdmission:
+        # A hedge is a second provider request: it takes a slot (and the token
+        # estimate of ``ticket``) of its own, and is skipped rather than queued
+        # when none is free
+        async def admit() -> Optional[Callable[[], None]]:
+            if ticket is None:
+                limiter = self._limiter()
+                if limiter.locked():
+                    return None
+                await limiter.acquire()
+                return limiter.release
+            hedge = self.scheduler.try_acquire(ticket.tokens, priority=ticket.priority, tenant=ticket.tenant)
+            if hedge is None:
+                return None
+            return lambda: self.scheduler.release(hedge)
+        return admit
+
+    def _batcher(self) -> EmbeddingBatcher:
+        if self._embedding_batcher is None:
+            self._embedding_batcher = EmbeddingBatcher(
+                self._create_embeddings_async,
+                max_batch_size=self.embedding_batch_size,
+                max_wait_ms=self.embedding_batch_wait_ms
+            )
+        return self._embedding_batcher
+
+    @staticmethod
+    def _optional(value: Any) -> Any:
+        return NOT_GIVEN if value is None else value
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections of both clients."""
+        await self.async_client.close()
+        self.client.close()
+
     def get_chat_completion(
         self,
         messages: List[Dict[str, str]],
-        max_tokens: int = 150
+        max_tokens: int = 150,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        timeout: Optional[float] = None
     ) -> str:
+        model = model or self.model
         try:
-            logger.info(f"[ChatCompletion] Model: {self.model}, Messages: {messages}")
+            logger.info(f"[ChatCompletion] Model: {model}, Messages: {messages}")
             response = self.client.chat.completions.create(
-                model=self.model,
+                model=model,
                 messages=messages,
-                max_tokens=max_tokens
+                max_tokens=max_tokens,
+                temperature=self._optional(temperature),
+                timeout=self._optional(timeout)
             )
             return response.choices[0].message.content
         except Exception as e:
@@ -53,6 +179,99 @@ class OpenAIClient:
             logger.debug(traceback.format_exc())
             raise
 
+    async def create_chat_completion_async(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int = 150,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        timeout: Optional[float] = None
+    ):
+        """
+        Asynchronously create a chat completion and return the raw SDK
+        response (content, finish reason and token usage).
+        """
+        model = model or self.model
+        logger.debug(f"[ChatCompletion] Model: {model}, Messages: {messages}")
+        try:
+            async with self._generation_slot(model, max_tokens, messages=messages) as ticket:
+                response = await self.resilience.call(
+                    model,
+                    lambda: self.async_client.chat.completions.create(
+                        model=model,
+                        messages=messages,
+                        max_tokens=max_tokens,
+                        temperature=self._optional(temperature),
+                        timeout=self._optional(timeout)
+                    ),
+                    hedge=True,
+                    admit_hedge=self._hedge_admission(ticket)
+                )
+                if ticket is not None and response.usage:
+                    ticket.used_tokens = response.usage.total_tokens
+                return response
+        except Exception as e:
+            logger.error(f"[ChatCompletion] Error: {e}")
+            raise
+
+    async def get_chat_completion_async(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int = 150,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        timeout: Optional[float] = None
+    ) -> str:
+        response = await self.create_chat_completion_async(
+            messages,
+            max_tokens=max_tokens,
+            model=model,
+            temperature=temperature,
+            timeout=timeout
+        )
+        return response.choices[0].message.content
+
+    async def stream_chat_completion_async(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int = 150,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        timeout: Optional[float] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat completion, yielding content deltas as they arrive.
+
+        Closing the iterator early (e.g. the downstream client disconnected)
+        closes the HTTP response, which aborts the generation upstream.
+        """
+        model = model or self.model
+        logger.debug(f"[ChatCompletionStream] Model: {model}, Messages: {messages}")
+        async with self._generation_slot(model, max_tokens, messages=messages):
+            try:
+                # Only opening the stream is retried; a stream failing midway is not replayed
+                stream = await self.resilience.call(
+                    model,
+                    lambda: self.async_client.chat.completions.create(
+                        model=model,
+                        messages=messages,
+                        max_tokens=max_tokens,
+                        temperature=self._optional(temperature),
+                        timeout=self._optional(timeout),
+                        stream=True
+                    )
+                )
+            except Exception as e:
+                logger.error(f"[ChatCompletionStream] Error: {e}")
+                raise
+
+            try:
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+            finally:
+                await stream.close()
+
     def get_completion(
         self,
         prompt: str,
@@ -72,15 +291,126 @@ class OpenAIClient:
             logger.error(f"[Completion] Error: {e}")
             raise
 
+    async def get_completion_async(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        max_tokens: int = 150,
+        timeout: Optional[float] = None
+    ) -> str:
+        model = model or self.model_mini
+        logger.debug(f"[Completion] Model: {model}, Prompt: {prompt}")
+        try:
+            async with self._generation_slot(model, max_tokens, prompt=prompt) as ticket:
+                response = await self.resilience.call(
+                    model,
+                    lambda: self.async_client.completions.create(
+                        model=model,
+                        prompt=prompt,
+                        max_tokens=max_tokens,
+                        timeout=self._optional(timeout)
+                    ),
+                    hedge=True,
+                    admit_hedge=self._hedge_admission(ticket)
+                )
+            return response.choices[0].text.strip()
+        except Exception as e:
+            logger.error(f"[Completion] Error: {e}")
+            raise
+
     def get_embeddings(self, text: str, model: Optional[str] = None) -> List[float]:
+        return self.get_embeddings_batch([text], model=model)[0]
+
+    def get_embeddings_batch(self, texts: List[str], model: Optional[str] = None) -> List[List[float]]:
+        """Embed several texts in a single request; vectors are returned in input order."""
         model = model or self.embedding_model
-        logger.debug(f"[Embeddings] Model: {model}, Input: {text}")
+        if self.embedding_cache is None:
+            return self._create_embeddings(texts, model)
+
+        vectors = self.embedding_cache.get_many_sync(model, texts)
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            fresh = self._create_embeddings([texts[i] for i in missing], model)
+            self.embedding_cache.set_many_sync(model, [texts[i] for i in missing], fresh)
+            for i, vector in zip(missing, fresh):
+                vectors[i] = vector
+        return vectors
+
+    def _create_embeddings(self, texts: List[str], model: str) -> List[List[float]]:
+        logger.debug(f"[Embeddings] Model: {model}, Batch: {len(texts)} texts")
         try:
             response = self.client.embeddings.create(
                 model=model,
-                input=text
+                input=texts
             )
-            return response.data[0].embedding
+            return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+        except Exception as e:
+            logger.error(f"[Embeddings] Error: {e}")
+            raise
+
+    async def get_embeddings_async(
+        self,
+        text: str,
+        model: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> List[float]:
+        model = model or self.embedding_model
+        if self.embedding_cache is not None:
+            cached = (await self.embedding_cache.get_many(model, [text]))[0]
+            if cached is not None:
+                return cached
+
+        # Default-model calls without a custom timeout share batched requests
+        if self.embedding_batch_size > 1 and model == self.embedding_model and timeout is None:
+            vector = await self._batcher().embed(text)
+        else:
+            vector = (await self._create_embeddings_async([text], model, timeout))[0]
+
+        if self.embedding_cache is not None:
+            await self.embedding_cache.set_many(model, [text], [vector])
+        return vector
+
+    async def get_embeddings_batch_async(
+        self,
+        texts: List[str],
+        model: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> List[List[float]]:
+        """Embed several texts in a single request; vectors are returned in input order."""
+        model = model or self.embedding_model
+        if self.embedding_cache is None:
+            return await self._create_embeddings_async(texts, model, timeout)
+
+        vectors = await self.embedding_cache.get_many(model, texts)
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            fresh = await self._create_embeddings_async([texts[i] for i in missing], model, timeout)
+            await self.embedding_cache.set_many(model, [texts[i] for i in missing], fresh)
+            for i, vector in zip(missing, fresh):
+                vectors[i] = vector
+        return vectors
+
+    async def _create_embeddings_async(
+        self,
+        texts: List[str],
+        model: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> List[List[float]]:
+        model = model or self.embedding_model
+        logger.debug(f"[Embeddings] Model: {model}, Batch: {len(texts)} texts")
+        try:
+            async with self._limiter():
+                response = await self.resilience.call(
+                    model,
+                    lambda: self.async_client.embeddings.create(
+                        model=model,
+                        input=texts,
+                        timeout=self._optional(timeout)
+                    ),
+                    hedge=True,
+                    admit_hedge=self._hedge_admission()
+                )
+            return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
         except Exception as e:
             logger.error(f"[Embeddings] Error: {e}")
             raise
@@ -108,6 +438,35 @@ class OpenAIClient:
             logger.error(f"[ImageGeneration] Error: {e}")
             raise
 
+    async def generate_image_async(
+        self,
+        prompt: str,
+        n: int = 1,
+        size: str = "1024x1024",
+        model: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> List[str]:
+        model = model or self.image_model
+        logger.debug(f"[ImageGeneration] Model: {model}, Prompt: {prompt}, Count: {n}, Size: {size}")
+        try:
+            async with self._limiter():
+                response = await self.resilience.call(
+                    model,
+                    lambda: self.async_client.images.generate(
+                        model=model,
+                        prompt=prompt,
+                        n=n,
+                        size=size,
+                        timeout=self._optional(timeout)
+                    )
+                )
+            urls = [img.url for img in response.data]
+            logger.debug(f"[ImageGeneration] URLs: {urls}")
+            return urls
+        except Exception as e:
+            logger.error(f"[ImageGeneration] Error: {e}")
+            raise
+
     def transcribe_audio(self, audio_file_path: str, model: Optional[str] = None) -> str:
         model = model or self.whispering_model
         logger.debug(f"[Transcription] Model: {model}, File: {audio_file_path}")
@@ -122,3 +481,30 @@ class OpenAIClient:
         except Exception as e:
             logger.error(f"[Transcription] Error: {e}")
             raise
+
+    async def transcribe_audio_async(
+        self,
+        audio_file_path: str,
+        model: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> str:
+        model = model or self.whispering_model
+        logger.debug(f"[Transcription] Model: {model}, File: {audio_file_path}")
+
+        try:
+            # Read the file off the event loop; audio uploads can be large
+            path = Path(audio_file_path)
+            content = await asyncio.to_thread(path.read_bytes)
+            async with self._limiter():
+                response = await self.resilience.call(
+                    model,
+                    lambda: self.async_client.audio.transcriptions.create(
+                        model=model,
+                        file=(path.name, content),
+                        timeout=self._optional(timeout)
+                    )
+                )
+            return response.text
+        except Exception as e:
+            logger.error(f"[Transcription] Error: {e}")
+            raise
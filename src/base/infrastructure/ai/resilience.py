@@ -0,0 +1,359 @@
+"""
+Resilience policy for calls to the model provider.
+
+``LLMResilience`` wraps an async provider call with:
+
+* retries with exponential backoff and jitter on transient failures (429,
+  5xx, connection errors and timeouts), waiting exactly ``Retry-After`` when
+  the provider sends it and giving up when it asks for longer than
+  ``max_delay_seconds``;
+* a circuit breaker per model: after ``failure_threshold`` consecutive
+  provider failures, calls fail fast with ``LLMCircuitOpenError`` for
+  ``recovery_seconds``, then a single probe decides whether to close it;
+* optional hedging: when a call is still running after the model's recent
+  p95 latency, an identical second request is sent and whichever answers
+  first wins (the other is cancelled). The caller reserves capacity for the
+  hedge (see ``admit_hedge``); when none is free the hedge is skipped.
+
+Client errors (400, 401, 404...) are neither retried nor counted against the
+circuit: sending the same request again would not help.
+"""
+import asyncio
+import email.utils
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+import httpx
+import openai
+from prometheus_client import Counter, Gauge
+from tenacity import AsyncRetrying, RetryCallState, retry_if_exception, stop_after_attempt, wait_exponential, wait_random
+from src.base.infrastructure.exceptions import LLMCircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+LLM_RETRIES = Counter(
+    "llm_retries_total",
+    "Provider calls retried after a transient failure, by model and reason",
+    ["model", "reason"]
+)
+LLM_HEDGES = Counter(
+    "llm_hedged_requests_total",
+    "Hedges due after the p95 latency, by model and winning request (or skipped for lack of capacity)",
+    ["model", "winner"]
+)
+LLM_CIRCUIT_STATE = Gauge(
+    "llm_circuit_breaker_open",
+    "1 while the circuit breaker of a model is open",
+    ["model"]
+)
+LLM_CIRCUIT_REJECTIONS = Counter(
+    "llm_circuit_breaker_rejections_total",
+    "Calls failed fast because the circuit breaker of their model was open",
+    ["model"]
+)
+
+ProviderCall = Callable[[], Awaitable[Any]]
+# Reserves capacity for a hedge request: returns the function releasing it, or None when there is none
+HedgeAdmission = Callable[[], Awaitable[Optional[Callable[[], None]]]]
+
+
+def is_transient(error: BaseException) -> bool:
+    """Whether ``error`` is a provider-side failure worth retrying."""
+    if isinstance(error, (openai.APITimeoutError, openai.APIConnectionError, httpx.TransportError)):
+        return True
+    if isinstance(error, openai.APIStatusError):
+        return error.status_code == 429 or error.status_code == 408 or error.status_code >= 500
+    return False
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """Delay requested by the provider through ``Retry-After`` / ``retry-after-ms``."""
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    headers = response.headers
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        value = headers.get("retry-after")
+        if not value:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            retry_at = email.utils.parsedate_to_datetime(value)
+            return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _reason(error: BaseException) -> str:
+    if isinstance(error, openai.APIStatusError):
+        return str(error.status_code)
+    if isinstance(error, openai.APITimeoutError):
+        return "timeout"
+    return "connection"
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    Args:
+        name: Label of the metrics (the model name).
+        failure_threshold: Consecutive failures that open the circuit.
+        recovery_seconds: Time the circuit stays open before a probe.
+        clock: Monotonic time source, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self.clock = clock
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if self.clock() - self.opened_at >= self.recovery_seconds:
+            return "half_open"
+        return "open"
+
+    def before_call(self) -> None:
+        """Raise ``LLMCircuitOpenError`` unless a call may be attempted now."""
+        state = self.state
+        if state == "closed":
+            return
+        if state == "half_open" and not self._probing:
+            # Let exactly one request find out whether the provider recovered
+            self._probing = True
+            return
+        LLM_CIRCUIT_REJECTIONS.labels(model=self.name).inc()
+        retry_after = max(0.0, self.opened_at + self.recovery_seconds - self.clock())
+        raise LLMCircuitOpenError(model=self.name, retry_after=retry_after)
+
+    def record_success(self) -> None:
+        if self.opened_at is not None:
+            logger.info(f"Circuit breaker for '{self.name}' closed")
+            LLM_CIRCUIT_STATE.labels(model=self.name).set(0)
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.opened_at is not None and not self._probing:
+            # Calls that were in flight when the circuit opened do not extend the open window
+            return
+        if self._probing or self.failures >= self.failure_threshold:
+            logger.warning(f"Circuit breaker for '{self.name}' opened after {self.failures} failures")
+            self.opened_at = self.clock()
+            self._probing = False
+            LLM_CIRCUIT_STATE.labels(model=self.name).set(1)
+
+    def release_probe(self) -> None:
+        """Give the probe back when it ended without a verdict (e.g. cancelled)."""
+        self._probing = False
+
+
+class LatencyTracker:
+    """Recent successful call latencies of one model."""
+
+    def __init__(self, window: int = 200):
+        self._samples: Deque[float] = deque(maxlen=window)
+
+    def observe(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class LLMResilience:
+    """
+    Retry, circuit breaker and hedging policy shared by async provider calls.
+
+    Args:
+        max_retries: Retries after the first attempt (0 disables retrying).
+        base_delay_seconds: First backoff delay, doubled on every retry,
+            plus up to as much random jitter.
+        max_delay_seconds: Longest backoff, and longest ``Retry-After``
+            honoured; a provider asking for more is not retried.
+        failure_threshold: Consecutive failures opening a model's circuit.
+        recovery_seconds: Time a circuit stays open before a probe.
+        hedging_enabled: Send a hedge request after the p95 latency.
+        hedging_percentile: Latency percentile after which to hedge.
+        hedging_min_samples: Latencies observed before hedging starts.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 2,
+        base_delay_seconds: float = 0.5,
+        max_delay_seconds: float = 20.0,
+        failure_threshold: int = 5,
+        recovery_seconds: float = 30.0,
+        hedging_enabled: bool = False,
+        hedging_percentile: float = 0.95,
+        hedging_min_samples: int = 20
+    ):
+        self.max_retries = max_retries
+        self.base_delay_seconds = base_delay_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self.hedging_enabled = hedging_enabled
+        self.hedging_percentile = hedging_percentile
+        self.hedging_min_samples = hedging_min_samples
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._latencies: Dict[str, LatencyTracker] = {}
+        self._backoff = (
+            wait_exponential(multiplier=base_delay_seconds, max=max_delay_seconds)
+            + wait_random(0, base_delay_seconds)
+        )
+
+    def breaker(self, model: str) -> CircuitBreaker:
+        if model not in self._breakers:
+            self._breakers[model] = CircuitBreaker(model, self.failure_threshold, self.recovery_seconds)
+        return self._breakers[model]
+
+    def latencies(self, model: str) -> LatencyTracker:
+        if model not in self._latencies:
+            self._latencies[model] = LatencyTracker()
+        return self._latencies[model]
+
+    def hedge_delay(self, model: str) -> Optional[float]:
+        """Seconds after which a hedge is sent, or ``None`` when not hedging."""
+        tracker = self.latencies(model)
+        if not self.hedging_enabled or len(tracker) < self.hedging_min_samples:
+            return None
+        return tracker.percentile(self.hedging_percentile)
+
+    async def call(
+        self,
+        model: str,
+        fn: ProviderCall,
+        hedge: bool = False,
+        admit_hedge: Optional[HedgeAdmission] = None
+    ) -> Any:
+        """
+        Run ``fn()`` under the policy of ``model``.
+
+        Args:
+            model: Model the request is sent to (one circuit per model).
+            fn: Coroutine function issuing the request; called once per attempt.
+            hedge: Allow hedging this call (idempotent requests only).
+            admit_hedge: Reserves concurrency and token budget for the hedge
+                request. Without it, hedges are not counted against any limit.
+        """
+        retrying = AsyncRetrying(
+            stop=stop_after_attempt(self.max_retries + 1),
+            wait=self._wait,
+            retry=retry_if_exception(self._should_retry),
+            before_sleep=lambda state: self._before_sleep(model, state),
+            reraise=True
+        )
+        async for attempt in retrying:
+            with attempt:
+                return await self._attempt(model, fn, hedge, admit_hedge)
+
+    async def _attempt(
+        self,
+        model: str,
+        fn: ProviderCall,
+        hedge: bool,
+        admit_hedge: Optional[HedgeAdmission] = None
+    ) -> Any:
+        breaker = self.breaker(model)
+        breaker.before_call()
+        started = time.perf_counter()
+        try:
+            delay = self.hedge_delay(model) if hedge else None
+            result = await (self._hedged(model, fn, delay, admit_hedge) if delay is not None else fn())
+        except asyncio.CancelledError:
+            breaker.release_probe()
+            raise
+        except Exception as e:
+            if is_transient(e):
+                breaker.record_failure()
+            else:
+                breaker.release_probe()
+            raise
+        breaker.record_success()
+        self.latencies(model).observe(time.perf_counter() - started)
+        return result
+
+    async def _hedged(
+        self,
+        model: str,
+        fn: ProviderCall,
+        delay: float,
+        admit_hedge: Optional[HedgeAdmission] = None
+    ) -> Any:
+        primary = asyncio.ensure_future(fn())
+        pending = {primary}
+        release = None
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if done:
+                return primary.result()
+
+            if admit_hedge is not None:
+                release = await admit_hedge()
+                if release is None:
+                    # Hedging while at capacity would only add to the load
+                    LLM_HEDGES.labels(model=model, winner="skipped").inc()
+                    return await primary
+
+            hedge = asyncio.ensure_future(fn())
+            pending = {primary, hedge}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # A failed request only loses if the other one can still answer
+                succeeded = [task for task in done if task.exception() is None]
+                if succeeded or not pending:
+                    winner = succeeded[0] if succeeded else done.pop()
+                    LLM_HEDGES.labels(model=model, winner="primary" if winner is primary else "hedge").inc()
+                    return winner.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            if release is not None:
+                release()
+
+    def _should_retry(self, error: BaseException) -> bool:
+        if not is_transient(error):
+            return False
+        retry_after = retry_after_seconds(error)
+        return retry_after is None or retry_after <= self.max_delay_seconds
+
+    def _wait(self, state: RetryCallState) -> float:
+        retry_after = retry_after_seconds(state.outcome.exception())
+        if retry_after is not None:
+            return retry_after
+        return min(self.max_delay_seconds, self._backoff(state))
+
+    def _before_sleep(self, model: str, state: RetryCallState) -> None:
+        error = state.outcome.exception()
+        LLM_RETRIES.labels(model=model, reason=_reason(error)).inc()
+        logger.warning(
+            f"LLM call to '{model}' failed ({error}), retry {state.attempt_number}/{self.max_retries} "
+            f"in {state.next_action.sleep:.2f}s"
+        )
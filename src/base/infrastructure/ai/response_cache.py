@@ -0,0 +1,190 @@
+"""
+Exact-match cache for LLM chat responses.
+
+Deterministic requests (self-test probes, summaries, guardrail checks...)
+are sent to the model over and over with the very same messages. This cache
+keys a response on a hash of the model, temperature, output budget and the
+normalized messages, and keeps it in two tiers:
+
+* an in-process LRU (``TTLLRUCache``) answering repeated calls without I/O;
+* Redis, shared by every worker, with a longer TTL.
+
+Only requests at temperature 0 are cached by default, since any other
+temperature is expected to produce varied output. Callers can opt in
+explicitly, either per call (``cache=True``) or for everything awaited inside
+``with cached_responses():``.
+"""
+import hashlib
+import json
+import logging
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+from prometheus_client import Counter
+from src.base.entities.ai.llm_response import LLMResponse
+from src.base.repositories.redis_repository import RedisRepository
+from src.base.utils.ttl_lru_cache import TTLLRUCache
+
+logger = logging.getLogger(__name__)
+
+LLM_CACHE_LOOKUPS = Counter(
+    "llm_response_cache_lookups_total",
+    "LLM response cache lookups by result (local_hit, redis_hit, miss)",
+    ["result"]
+)
+LLM_CACHE_TOKENS_SAVED = Counter(
+    "llm_response_cache_tokens_saved_total",
+    "Prompt and completion tokens not spent thanks to the LLM response cache",
+    ["model"]
+)
+
+_WHITESPACE = re.compile(r"\s+")
+
+# Set by ``cached_responses()``; lets callers opt in without threading a flag
+_opt_in: ContextVar[bool] = ContextVar("llm_response_cache_opt_in", default=False)
+
+
+@contextmanager
+def cached_responses() -> Iterator[None]:
+    """Opt every LLM call made inside the block into the response cache."""
+    token = _opt_in.set(True)
+    try:
+        yield
+    finally:
+        _opt_in.reset(token)
+
+
+def normalize_messages(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Return a canonical form of chat messages: whitespace runs collapse to a
+    single space and leading/trailing whitespace is dropped, so prompts that
+    only differ by formatting share a cache entry.
+    """
+    def normalize(content: Any) -> Any:
+        if isinstance(content, str):
+            return _WHITESPACE.sub(" ", content).strip()
+        if isinstance(content, list):
+            return [normalize(part) for part in content]
+        if isinstance(content, dict):
+            return {key: normalize(value) for key, value in content.items()}
+        return content
+
+    return [{key: normalize(value) for key, value in message.items()} for message in messages]
+
+
+def is_deterministic(temperature: Optional[float], cache: Optional[bool] = None) -> bool:
+    """
+    Whether a request may be answered with the result of an identical one:
+    forced by ``cache``, otherwise true inside ``cached_responses()`` or at
+    temperature 0.
+    """
+    if cache is not None:
+        return cache
+    return _opt_in.get() or temperature == 0
+
+
+def request_key(
+    messages: List[Dict[str, Any]],
+    model: str,
+    temperature: Optional[float],
+    max_tokens: int
+) -> str:
+    """Hash the request parameters that determine the response."""
+    payload = json.dumps(
+        {
+            "model": model,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "messages": normalize_messages(messages),
+        },
+        sort_keys=True,
+        ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    Two-tier (in-process LRU + Redis) exact-match cache of chat responses.
+
+    Args:
+        redis_repository: Shared tier; ``None`` keeps the cache process-local
+            until one is attached with ``attach_redis``.
+        enabled: Turn the cache into a no-op when False.
+        ttl_seconds: Lifetime of entries in Redis.
+        local_max_size: Number of responses kept in process.
+        local_ttl_seconds: Lifetime of in-process entries.
+        key_prefix: Prefix of the Redis keys.
+    """
+
+    def __init__(
+        self,
+        redis_repository: Optional[RedisRepository] = None,
+        enabled: bool = True,
+        ttl_seconds: int = 86400,
+        local_max_size: int = 1024,
+        local_ttl_seconds: float = 300.0,
+        key_prefix: str = "llm_cache:"
+    ):
+        self.redis_repository = redis_repository
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+        self._local: TTLLRUCache[LLMResponse] = TTLLRUCache(
+            max_size=local_max_size,
+            ttl_seconds=local_ttl_seconds
+        )
+
+    def attach_redis(self, redis_repository: RedisRepository) -> None:
+        """Enable the shared Redis tier once the Redis connection is available."""
+        self.redis_repository = redis_repository
+
+    async def get(self, key: str) -> Optional[LLMResponse]:
+        """Return the cached response for ``key``, checking the local tier first."""
+        response = self._local.get(key)
+        if response is not None:
+            self._record_hit("local_hit", response)
+            return response
+
+        if self.redis_repository is not None:
+            try:
+                raw = await self.redis_repository.get(self.key_prefix + key)
+            except Exception as e:
+                logger.warning(f"LLM response cache read failed: {e}")
+                raw = None
+            if raw:
+                response = LLMResponse.model_validate_json(raw)
+                self._local.set(key, response)
+                self._record_hit("redis_hit", response)
+                return response
+
+        LLM_CACHE_LOOKUPS.labels(result="miss").inc()
+        return None
+
+    async def set(self, key: str, response: LLMResponse) -> None:
+        """Store a response in both tiers. Incomplete responses are not cached."""
+        if response.finish_reason not in (None, "stop") or not response.content:
+            return
+
+        self._local.set(key, response)
+        if self.redis_repository is not None:
+            try:
+                await self.redis_repository.set(
+                    self.key_prefix + key,
+                    response.model_dump_json(),
+                    expiration=self.ttl_seconds
+                )
+            except Exception as e:
+                logger.warning(f"LLM response cache write failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the statistics of the in-process tier."""
+        return self._local.stats()
+
+    @staticmethod
+    def _record_hit(result: str, response: LLMResponse) -> None:
+        LLM_CACHE_LOOKUPS.labels(result=result).inc()
+        LLM_CACHE_TOKENS_SAVED.labels(model=response.model or "").inc(
+            response.prompt_tokens + response.completion_tokens
+        )
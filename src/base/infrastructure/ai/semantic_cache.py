@@ -0,0 +1,269 @@
+"""
+Semantic cache for LLM chat responses.
+
+Many questions are paraphrases of earlier ones ("how do I reset my
+password?" / "how can I change my password?"). The exact-match
+``LLMResponseCache`` cannot help there, so this cache embeds the query text
+and looks for a previous query whose embedding is close enough (cosine
+similarity above a threshold) within the same *scope* (model, system prompt,
+RAG collection...).
+
+The index is an in-process brute-force nearest-neighbour search over a
+bounded matrix of unit vectors; once full, the least recently used entries
+are evicted. With a few thousand entries a lookup is a single matrix-vector
+product, well below the cost of an embedding call.
+
+The cache is opt-in per request: only callers that can tolerate an answer to
+a paraphrased question (FAQ-like assistants, RAG) should use it.
+"""
+import hashlib
+import logging
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Set
+import numpy as np
+from prometheus_client import Counter, Histogram
+from src.base.entities.ai.llm_response import LLMResponse
+from src.base.utils.ttl_lru_cache import TTLLRUCache
+
+logger = logging.getLogger(__name__)
+
+SEMANTIC_CACHE_LOOKUPS = Counter(
+    "llm_semantic_cache_lookups_total",
+    "Semantic LLM cache lookups by result (hit, miss, error)",
+    ["result"]
+)
+SEMANTIC_CACHE_LOOKUP_SECONDS = Histogram(
+    "llm_semantic_cache_lookup_seconds",
+    "Time spent embedding the query and searching the semantic cache",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+)
+SEMANTIC_CACHE_TOKENS_SAVED = Counter(
+    "llm_semantic_cache_tokens_saved_total",
+    "Prompt and completion tokens not spent thanks to the semantic cache",
+    ["model"]
+)
+SEMANTIC_CACHE_LATENCY_SAVED = Counter(
+    "llm_semantic_cache_latency_saved_seconds_total",
+    "Generation time of the cached responses served by the semantic cache"
+)
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+class HashingEmbedder:
+    """
+    Deterministic local embedding: hashed bag of words and word bigrams.
+
+    It has no notion of synonyms, but paraphrases sharing most of their words
+    land close to each other. Used in tests and in environments without an
+    embedding model.
+    """
+
+    def __init__(self, dimensions: int = 512):
+        self.dimensions = dimensions
+
+    async def embed(self, text: str) -> List[float]:
+        words = _TOKEN.findall(text.lower())
+        features = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        for feature in features:
+            digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+            bucket = int.from_bytes(digest[:4], "little") % self.dimensions
+            sign = 1.0 if digest[4] & 1 else -1.0
+            vector[bucket] += sign
+        return vector.tolist()
+
+
+class OpenAIEmbedder:
+    """Embeds queries with the configured OpenAI embedding model."""
+
+    def __init__(self, openai_client):
+        self.openai_client = openai_client
+
+    async def embed(self, text: str) -> List[float]:
+        return await self.openai_client.get_embeddings_async(text)
+
+
+@dataclass
+class _Entry:
+    scope: str
+    query: str
+    response: LLMResponse
+    generation_seconds: float
+    expires_at: Optional[float]
+
+
+class SemanticCache:
+    """
+    Nearest-neighbour cache of LLM responses keyed by query embeddings.
+
+    Args:
+        embedder: Object with an ``async embed(text) -> List[float]`` method.
+        enabled: Turn the cache into a no-op when False.
+        similarity_threshold: Minimum cosine similarity for a hit.
+        max_entries: Size of the index; least recently used entries are evicted.
+        ttl_seconds: Lifetime of an entry. ``None`` disables expiry.
+        clock: Monotonic clock used for expiry (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        embedder,
+        enabled: bool = True,
+        similarity_threshold: float = 0.92,
+        max_entries: int = 2000,
+        ttl_seconds: Optional[float] = 3600.0,
+        clock=time.monotonic
+    ):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be a positive integer")
+        self.embedder = embedder
+        self.enabled = enabled
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+
+        self._vectors: Optional[np.ndarray] = None
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()
+        self._scopes: Dict[str, Set[int]] = {}
+        self._free: List[int] = list(range(max_entries - 1, -1, -1))
+        # A missed lookup is followed by a store of the same query; embed it once
+        self._recent_vectors: TTLLRUCache[np.ndarray] = TTLLRUCache(max_size=256, ttl_seconds=300)
+
+    async def embed(self, text: str) -> np.ndarray:
+        """Embed ``text`` as a unit vector."""
+        vector = self._recent_vectors.get(text)
+        if vector is None:
+            vector = np.asarray(await self.embedder.embed(text), dtype=np.float32)
+            norm = np.linalg.norm(vector)
+            vector = vector / norm if norm else vector
+            self._recent_vectors.set(text, vector)
+        return vector
+
+    async def lookup(self, query: str, scope: str = "") -> Optional[LLMResponse]:
+        """
+        Return the response of the most similar cached query in ``scope``, or
+        ``None`` if nothing is above the similarity threshold.
+        """
+        started = time.perf_counter()
+        try:
+            vector = await self.embed(query)
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup skipped, embedding failed: {e}")
+            SEMANTIC_CACHE_LOOKUPS.labels(result="error").inc()
+            return None
+
+        match = self.search(vector, scope)
+        SEMANTIC_CACHE_LOOKUP_SECONDS.observe(time.perf_counter() - started)
+        if match is None:
+            SEMANTIC_CACHE_LOOKUPS.labels(result="miss").inc()
+            return None
+
+        slot, similarity = match
+        entry = self._entries[slot]
+        self._entries.move_to_end(slot)
+        logger.debug(f"Semantic cache hit ({similarity:.3f}): {query!r} ~ {entry.query!r}")
+        SEMANTIC_CACHE_LOOKUPS.labels(result="hit").inc()
+        SEMANTIC_CACHE_TOKENS_SAVED.labels(model=entry.response.model or "").inc(
+            entry.response.prompt_tokens + entry.response.completion_tokens
+        )
+        SEMANTIC_CACHE_LATENCY_SAVED.inc(entry.generation_seconds)
+        return entry.response
+
+    def search(self, vector: np.ndarray, scope: str = ""):
+        """Return ``(slot, similarity)`` of the best live match above the threshold."""
+        slots = self._scopes.get(scope)
+        if not slots or self._vectors is None:
+            return None
+
+        now = self._clock()
+        for slot in [s for s in slots if self._is_expired(self._entries[s], now)]:
+            self._remove(slot)
+        if not slots:
+            return None
+
+        candidates = np.fromiter(slots, dtype=np.int64, count=len(slots))
+        similarities = self._vectors[candidates] @ vector
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.similarity_threshold:
+            return None
+        return int(candidates[best]), float(similarities[best])
+
+    async def store(
+        self,
+        query: str,
+        response: LLMResponse,
+        scope: str = "",
+        generation_seconds: float = 0.0
+    ) -> None:
+        """Add a query and its response to the index. Incomplete responses are skipped."""
+        if response.finish_reason not in (None, "stop") or not response.content:
+            return
+        try:
+            vector = await self.embed(query)
+        except Exception as e:
+            logger.warning(f"Semantic cache store skipped, embedding failed: {e}")
+            return
+
+        if self._vectors is None:
+            self._vectors = np.zeros((self.max_entries, vector.shape[0]), dtype=np.float32)
+        if not self._free:
+            self._remove(next(iter(self._entries)))
+
+        slot = self._free.pop()
+        self._vectors[slot] = vector
+        self._entries[slot] = _Entry(
+            scope=scope,
+            query=query,
+            response=response,
+            generation_seconds=generation_seconds,
+            expires_at=None if self.ttl_seconds is None else self._clock() + self.ttl_seconds
+        )
+        self._scopes.setdefault(scope, set()).add(slot)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        for slot in list(self._entries):
+            self._remove(slot)
+
+    def _remove(self, slot: int) -> None:
+        entry = self._entries.pop(slot)
+        scope_slots = self._scopes[entry.scope]
+        scope_slots.discard(slot)
+        if not scope_slots:
+            del self._scopes[entry.scope]
+        self._free.append(slot)
+
+    @staticmethod
+    def _is_expired(entry: _Entry, now: float) -> bool:
+        return entry.expires_at is not None and now >= entry.expires_at
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def default_scope(model: str, messages: Sequence[Dict]) -> str:
+    """
+    Default scope of a chat request: the model and every message before the
+    final user turn, so that answers are only reused under the same
+    instructions.
+    """
+    digest = hashlib.sha256(model.encode("utf-8"))
+    for message in messages[:-1]:
+        digest.update(repr(sorted(message.items())).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def final_user_text(messages: Sequence[Dict]) -> str:
+    """Return the text of the last user message (joining multi-part content)."""
+    for message in reversed(messages):
+        if message.get("role") == "user":
+            content = message.get("content")
+            if isinstance(content, list):
+                return "\n".join(part.get("text", "") for part in content if isinstance(part, dict))
+            return str(content or "")
+    return ""
@@ -0,0 +1,82 @@
+"""
+Local token counting for prompt budgeting.
+
+Uses ``tiktoken`` (in requirements.txt) for exact counts for OpenAI models.
+When it is missing or its encoding files cannot be loaded (tiktoken
+downloads them on first use, which fails offline), a character-based
+heuristic is used instead. The heuristic slightly overestimates English
+text, which is the safe direction for staying under a budget.
+"""
+import logging
+import math
+import re
+from functools import lru_cache
+from typing import Any, Dict, List
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - depends on the environment
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+# Chat format overhead, see OpenAI's "counting tokens" guide
+TOKENS_PER_MESSAGE = 3
+TOKENS_PER_REPLY = 3
+
+_WORD_OR_SYMBOL = re.compile(r"\w+|[^\w\s]", re.UNICODE)
+
+
+class Tokenizer:
+    """
+    Counts tokens of texts and chat messages for a model.
+
+    Args:
+        model: Model name used to pick the tiktoken encoding.
+    """
+
+    def __init__(self, model: str = "gpt-4o"):
+        self.model = model
+        self._encoding = None
+        if tiktoken is None:
+            logger.warning("tiktoken not installed, using heuristic token counts")
+            return
+        try:
+            try:
+                self._encoding = tiktoken.encoding_for_model(model)
+            except KeyError:
+                self._encoding = tiktoken.get_encoding("cl100k_base")
+        except Exception as e:
+            # Loading the encoding may download its BPE file; never fail callers over it
+            logger.warning(f"Could not load the tiktoken encoding for '{model}', using heuristic token counts: {e}")
+
+    @property
+    def exact(self) -> bool:
+        """Whether counts come from the model's real tokenizer."""
+        return self._encoding is not None
+
+    def count(self, text: str) -> int:
+        """Number of tokens in ``text``."""
+        if not text:
+            return 0
+        if self._encoding is not None:
+            return len(self._encoding.encode(text, disallowed_special=()))
+        # ~4 characters per token, but never fewer tokens than words/symbols
+        return max(math.ceil(len(text) / 4), len(_WORD_OR_SYMBOL.findall(text)))
+
+    def count_message(self, message: Dict[str, Any]) -> int:
+        """Tokens of one chat message including its framing."""
+        content = message.get("content") or ""
+        if isinstance(content, list):
+            content = "\n".join(part.get("text", "") for part in content if isinstance(part, dict))
+        return TOKENS_PER_MESSAGE + self.count(str(content)) + self.count(message.get("role", ""))
+
+    def count_messages(self, messages: List[Dict[str, Any]]) -> int:
+        """Tokens of a full chat request."""
+        return sum(self.count_message(message) for message in messages) + TOKENS_PER_REPLY
+
+
+@lru_cache(maxsize=16)
+def get_tokenizer(model: str = "gpt-4o") -> Tokenizer:
+    """Return a shared tokenizer for ``model``."""
+    return Tokenizer(model)
@@ -1,17 +1,30 @@
 from typing import List
 from src.base.infrastructure.ai.openai_client import OpenAIClient
 
-def create_embedding_function() -> callable:
+
+class OpenAIEmbeddingFunction:
     """
-    Returns a callable embedding function that accepts a string input and returns its embedding vector.
+    Embedding function for the vector store.
+
+    Callable on a single text, and implements the ``embed_documents`` /
+    ``embed_query`` interface expected by LangChain's Chroma so that document
+    ingestion embeds chunks in batches instead of one request per chunk.
     """
-    # Retrieve the OpenAIClient instance from your DI container.
-    from src.base.dependencies.di_container import Container  # Your DI container
-    container = Container()
-    openai_client: OpenAIClient = container.openai.openai_client()
-    
-    def embedding_function(text: str) -> List[float]:
+
+    def __init__(self, openai_client: OpenAIClient, batch_size: int = 64):
+        self.openai_client = openai_client
+        self.batch_size = max(1, batch_size)
+
+    def __call__(self, text: str) -> List[float]:
+        return self.embed_query(text)
+
+    def embed_query(self, text: str) -> List[float]:
         # Use the synchronous get_embeddings method.
-        return openai_client.get_embeddings(text)
-    
-    return embedding_function
+        return self.openai_client.get_embeddings(text)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        vectors: List[List[float]] = []
+        for start in range(0, len(texts), self.batch_size):
+            vectors.extend(self.openai_client.get_embeddings_batch(texts[start:start + self.batch_size]))
+        return vectors
+
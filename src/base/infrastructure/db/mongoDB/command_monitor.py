@@ -0,0 +1,138 @@
+"""
+MongoDB command monitoring.
+
+A pymongo ``CommandListener`` that times every command sent by the driver,
+exports the durations as a Prometheus histogram (served by the existing
+``/internal/metrics`` endpoint and the instrumentator) and logs commands that
+exceed a latency threshold together with the *shape* of their filter.
+
+The shape keeps field names and operators but replaces every value with
+``"?"``, so slow-query logs can be used to spot missing indexes without
+leaking user data.
+"""
+import logging
+from typing import Any, Dict, Optional, Tuple
+from prometheus_client import Histogram
+from pymongo import monitoring
+
+db_logger = logging.getLogger("database")
+
+MONGODB_COMMAND_DURATION = Histogram(
+    "mongodb_command_duration_seconds",
+    "Duration of MongoDB commands by command, collection and outcome",
+    ["command", "collection", "outcome"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+)
+
+# Handshake / topology chatter, not interesting for latency analysis
+IGNORED_COMMANDS = frozenset({
+    "hello", "ismaster", "isMaster", "ping", "buildinfo", "buildInfo",
+    "saslStart", "saslContinue", "getnonce", "authenticate", "endSessions",
+})
+
+REDACTED = "?"
+
+
+def redact_shape(value: Any) -> Any:
+    """
+    Return the shape of a query document: keys and operators are kept,
+    scalar values are replaced with ``"?"``.
+
+    Lists of scalars (e.g. ``$in`` operands) collapse to ``["?"]`` so that
+    queries differing only by list length share the same shape.
+    """
+    if isinstance(value, dict):
+        return {key: redact_shape(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        shapes = [redact_shape(item) for item in value if isinstance(item, (dict, list, tuple))]
+        return shapes if shapes else [REDACTED]
+    return REDACTED
+
+
+def extract_filter(command_name: str, command: Dict[str, Any]) -> Optional[Any]:
+    """Pick the part of a command that determines which index is used."""
+    if command_name == "find":
+        return command.get("filter")
+    if command_name in ("count", "distinct", "findAndModify", "findandmodify"):
+        return command.get("query")
+    if command_name == "aggregate":
+        return [stage for stage in command.get("pipeline", []) if "$match" in stage] or None
+    if command_name == "update":
+        updates = command.get("updates") or []
+        return updates[0].get("q") if updates else None
+    if command_name == "delete":
+        deletes = command.get("deletes") or []
+        return deletes[0].get("q") if deletes else None
+    return None
+
+
+def extract_collection(command_name: str, command: Dict[str, Any]) -> str:
+    """Return the collection a command targets, or ``""`` for database commands."""
+    if command_name == "getMore":
+        return str(command.get("collection", ""))
+    target = command.get(command_name)
+    return target if isinstance(target, str) else ""
+
+
+class MongoCommandMonitor(monitoring.CommandListener):
+    """
+    Records per-command latency and logs slow commands.
+
+    Register it on the driver through ``AsyncIOMotorClient(event_listeners=[...])``.
+    Callbacks may run on motor's executor threads; they only touch a dict with
+    per-request keys and thread-safe Prometheus metrics.
+
+    Args:
+        enabled: Turn the listener into a no-op when False.
+        slow_query_threshold_ms: Commands slower than this are logged.
+    """
+
+    def __init__(self, enabled: bool = True, slow_query_threshold_ms: float = 100.0):
+        self.enabled = enabled
+        self.slow_query_threshold_ms = slow_query_threshold_ms
+        self._pending: Dict[Tuple[Any, int], Tuple[str, Dict[str, Any], str]] = {}
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        if not self.enabled or event.command_name in IGNORED_COMMANDS:
+            return
+        collection = extract_collection(event.command_name, event.command)
+        self._pending[(event.connection_id, event.request_id)] = (
+            collection,
+            event.command,
+            event.database_name
+        )
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._finish(event, outcome="success")
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._finish(event, outcome="failure")
+
+    def _finish(self, event, outcome: str) -> None:
+        pending = self._pending.pop((event.connection_id, event.request_id), None)
+        if pending is None:
+            return
+        collection, command, database_name = pending
+
+        duration_ms = event.duration_micros / 1000
+        MONGODB_COMMAND_DURATION.labels(
+            command=event.command_name,
+            collection=collection,
+            outcome=outcome
+        ).observe(duration_ms / 1000)
+
+        if duration_ms >= self.slow_query_threshold_ms:
+            query = extract_filter(event.command_name, command)
+            shape = redact_shape(query) if query is not None else None
+            db_logger.warning(
+                f"Slow MongoDB command: {event.command_name} on {database_name}.{collection} "
+                f"took {duration_ms:.1f}ms (filter shape: {shape})",
+                extra={
+                    "operation": event.command_name,
+                    "collection": collection,
+                    "database": database_name,
+                    "duration_ms": duration_ms,
+                    "filter_shape": shape,
+                    "success": outcome == "success"
+                }
+            )
@@ -6,19 +6,22 @@ from src.base.infrastructure.exceptions import MongoDBConnectionError
 logger = logging.getLogger("mongodb client")
 
 class MongoDBClient:
-    def __init__(self, db_uri: str, db_name: str):
+    def __init__(self, db_uri: str, db_name: str, event_listeners: Optional[List[Any]] = None):
         """
         Initialize the MongoDB client.
 
         Args:
             db_uri (str): MongoDB URI.
             db_name (str): Database name.
+            event_listeners (list, optional): pymongo monitoring listeners
+                registered on the driver (e.g. command monitoring).
         """
         self.client = None  # Initialize as None to avoid connection during initialization
         self.db = None
         self.db_uri = db_uri
         self.db_name = db_name
         self.collection = None
+        self.event_listeners = event_listeners or []
 
     async def connect(self) -> None:
         """
@@ -30,7 +33,10 @@ class MongoDBClient:
         try:
             if self.client is None:
                 # Create a new MongoDB client and connect to the database
-                self.client = AsyncIOMotorClient(self.db_uri)
+                self.client = AsyncIOMotorClient(
+                    self.db_uri,
+                    event_listeners=self.event_listeners
+                )
                 # Force a connection to test it's working
                 await self.client.admin.command('ping')
                 self.db = self.client[self.db_name]
@@ -115,19 +121,25 @@ class MongoDBClient:
             logger.error(f"Error finding documents: {str(e)}")
             raise
 
-    async def find_one(self, query: Dict[str, Any], collection: AsyncIOMotorCollection) -> Optional[Dict[str, Any]]:
+    async def find_one(
+        self,
+        query: Dict[str, Any],
+        collection: AsyncIOMotorCollection,
+        projection: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Find a single document in the specified collection that matches the query.
         
         Args:
             query (Dict[str, Any]): The query criteria
             collection (AsyncIOMotorCollection): The collection object
+            projection (Optional[Dict[str, Any]]): Fields to include or exclude
             
         Returns:
             Dict[str, Any]: The matching document or None
         """
         try:
-            document = await collection.find_one(query)
+            document = await collection.find_one(query, projection)
             if (document):
                 document = self.sanitize_document(document)
             return document
@@ -73,4 +73,56 @@ class RedisConnectionError(DatabaseConnectionError):
             error_details=error_details,
             message=message
         )
-        self.error_code = "REDIS_CONNECTION_ERROR" 
\ No newline at end of file
+        self.error_code = "REDIS_CONNECTION_ERROR" 
+class LLMCapacityExceededError(InfrastructureException):
+    """Exception raised when the LLM scheduler rejects a request."""
+
+    def __init__(self, reason: str, priority: str, retry_after: float = None, message: str = None):
+        """
+        Initialize the exception.
+
+        Args:
+            reason: Why the request was rejected ('deadline', 'too_large')
+            priority: Priority class of the rejected request
+            retry_after: Suggested delay in seconds before retrying
+            message: Optional custom message
+        """
+        if message is None:
+            message = f"LLM capacity exceeded ({reason})"
+
+        super().__init__(
+            message=message,
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            error_code="LLM_CAPACITY_EXCEEDED",
+            data={
+                "reason": reason,
+                "priority": priority,
+                "retry_after": retry_after
+            }
+        )
+        self.reason = reason
+
+class LLMCircuitOpenError(InfrastructureException):
+    """Exception raised while the circuit breaker of a model is open."""
+
+    def __init__(self, model: str, retry_after: float = None, message: str = None):
+        """
+        Initialize the exception.
+
+        Args:
+            model: The model whose circuit is open
+            retry_after: Seconds until the circuit lets a probe through
+            message: Optional custom message
+        """
+        if message is None:
+            message = f"LLM provider unavailable for model '{model}'"
+
+        super().__init__(
+            message=message,
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            error_code="LLM_CIRCUIT_OPEN",
+            data={
+                "model": model,
+                "retry_after": retry_after
+            }
+        )
@@ -1,12 +1,14 @@
 """
 Lifespan context manager for FastAPI application.
 """
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi_limiter import FastAPILimiter
 from src.base.config.config import settings
 from src.base.lifespan.utils import process_message_callback, start_consumer
 from src.domains.agentverse.events.message_events import register_message_events
+from src.domains.agentverse.registries import freeze_registries
 from src.base.security.signature_verificator import verify_signature
 import logging
 
@@ -39,6 +41,10 @@ async def lifespan(app: FastAPI):
         callback=process_message_callback
     )
     event_router = container.socket.event_router()
+    blueprint_watcher = None
+    conversation_summarizer = None
+    background_jobs = None
+    security_event_store = None
 
     try:
         # Test Redis connection
@@ -49,14 +55,45 @@ async def lifespan(app: FastAPI):
         await mongo_client.connect()
         logger.info("MongoDB connection established successfully")
 
+        # Persist security monitor events to MongoDB instead of process memory
+        if settings.database.mongodb_security_events_enabled:
+            from src.base.scripts.security_monitor import monitor as security_monitor
+            security_event_store = container.database.security_event_store()
+            await security_event_store.start()
+            security_monitor.attach_event_store(security_event_store)
+
+        # Invalidate cached agent blueprints from the agents change stream
+        if hasattr(container, "blueprint_cache"):
+            blueprint_watcher = asyncio.create_task(
+                container.blueprint_cache().watch(mongo_client.get_collection("coll_agents"))
+            )
+
+        # Fold the oldest turns of long conversations into summaries, off the request path
+        if hasattr(container, "conversation_summarizer"):
+            conversation_summarizer = asyncio.create_task(container.conversation_summarizer().run())
+
+        # Post-creation self tests and other work kept off the request path
+        if hasattr(container, "background_jobs"):
+            background_jobs = asyncio.create_task(container.background_jobs().run())
+
         app.state.settings = settings
         app.state.mongodb = mongo_client
         app.state.redis_repository=container.redis.redis_repository()
         app.state.openai_repository = container.openai.openai_repository()
+        container.openai.response_cache().attach_redis(app.state.redis_repository)
+        if not settings.ai_models.embedding_cache_disk_path:
+            container.openai.embedding_cache().attach_redis(
+                app.state.redis_repository,
+                container.redis.sync_redis_client()
+            )
         app.state.signature_verificator = verify_signature
         app.state.event_router = event_router
         register_message_events(event_router)
 
+        # Every agent, personality and tool is registered at import time; seal the registries
+        if settings.agentverse.registry_freeze_enabled:
+            freeze_registries()
+
         app.state.JOSHU_A = {
             "id": "joshu-a",
             "role": "system_consciousness",
@@ -95,10 +132,26 @@ async def lifespan(app: FastAPI):
         raise
         
     finally:
+        if blueprint_watcher is not None:
+            blueprint_watcher.cancel()
+
+        if conversation_summarizer is not None:
+            conversation_summarizer.cancel()
+
+        if background_jobs is not None:
+            background_jobs.cancel()
+
+        if security_event_store is not None:
+            await security_event_store.stop()
+
         # Close Redis connection
         await redis_instance.close()
         logger.info("Rate limiter connection closed")
-        
+        container.redis.sync_redis_client().close()
+
+        # Release pooled connections to the model provider
+        await container.openai.openai_client().aclose()
+
         # Close MongoDB connection
         await mongo_client.disconnect()
         logger.info("MongoDB connection closed")
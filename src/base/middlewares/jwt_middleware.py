@@ -10,6 +10,7 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 from dependency_injector.wiring import inject
 from src.base.services.jwt_service import JWTService
+from src.base.infrastructure.ai.llm_scheduler import llm_scheduling
 from src.base.logging.security_logger import log_unauthorized_access
 from src.base.config.config import settings
 import logging
@@ -198,6 +199,12 @@ class JWTVerificationMiddleware(BaseHTTPMiddleware):
                 headers={"WWW-Authenticate": "Bearer"}
             )
             
+        # LLM calls made for this request share capacity per authenticated user
+        user_id = await self.jwt_service.get_user_id_from_token(auth_header[len("Bearer "):])
+        if user_id is None:
+            return await call_next(request)
+
         # Continue processing the request
-        return await call_next(request)
+        with llm_scheduling(tenant=f"user:{user_id}"):
+            return await call_next(request)
             
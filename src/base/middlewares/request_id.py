@@ -4,6 +4,7 @@ from starlette.responses import Response
 import uuid
 import logging
 from contextvars import ContextVar
+from src.base.infrastructure.ai.llm_scheduler import llm_scheduling
 
 # Create a context variable for request ID that can be accessed from anywhere
 request_id_var: ContextVar[str] = ContextVar("request_id", default="")
@@ -39,10 +40,16 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
         
         # Store in the context variable so it can be accessed from anywhere
         token = request_id_var.set(request_id)
+
+        # LLM calls share capacity fairly per client; JWTVerificationMiddleware
+        # narrows this to the authenticated user. Client-supplied headers are
+        # not trusted here, or a new value per request would get a new share
+        tenant = f"ip:{request.client.host}" if request.client else None
         
         try:
             # Continue processing the request and get the response
-            response = await call_next(request)
+            with llm_scheduling(tenant=tenant):
+                response = await call_next(request)
             
             # Add the request ID to response headers
             response.headers["X-Request-ID"] = request_id
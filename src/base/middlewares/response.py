@@ -40,6 +40,21 @@ class ResponseFormatMiddleware(BaseHTTPMiddleware):
         """
         return any(request.url.path.startswith(path) for path in self.skip_paths)
 
+    def _is_event_stream(self, response: Response) -> bool:
+        """
+        Check if the response is a Server-Sent Events stream.
+
+        Event streams must reach the client chunk by chunk, so they can be
+        neither buffered nor wrapped in the standard envelope.
+
+        Args:
+            response: The response returned by the route
+
+        Returns:
+            bool: True if the response is an event stream
+        """
+        return response.headers.get("content-type", "").startswith("text/event-stream")
+
     def _is_authenticated(self, request: Request) -> bool:
         """
         Check if the request is authenticated.
@@ -112,7 +127,7 @@ class ResponseFormatMiddleware(BaseHTTPMiddleware):
             response = await call_next(request)
 
             # Skip formatting for documentation endpoints
-            if self._should_skip_formatting(request):
+            if self._should_skip_formatting(request) or self._is_event_stream(response):
                 return response
 
             print(f"Response: {response}")
@@ -0,0 +1,220 @@
+"""
+MongoDB persistence for security monitor events.
+
+Events are buffered in memory and written in batches to a time-series
+collection whose documents expire after a retention period. Windowed
+statistics (failures per IP, violations per endpoint, errors per module...)
+are computed by MongoDB aggregations, so the monitor no longer keeps its
+event history in process memory nor re-parses log files at startup.
+
+Timestamps are naive UTC datetimes, which is how pymongo stores and returns
+them; ``utc_naive`` converts event times to that form.
+
+Document layout::
+
+    {
+        "timestamp": <naive UTC datetime>,
+        "meta": {"log_type", "event_type", "client_ip", "path", "module"},
+        "event": <original event payload>
+    }
+"""
+import asyncio
+import logging
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Any, Deque, Dict, Optional, Tuple
+from pymongo.errors import OperationFailure, PyMongoError
+from src.base.infrastructure.db.mongoDB.mongo_client import MongoDBClient
+
+logger = logging.getLogger("security_monitor")
+
+META_FIELDS = ("log_type", "event_type", "client_ip", "path", "module")
+
+def utc_naive(value: datetime) -> datetime:
+    """
+    ``value`` as a naive UTC datetime. Naive values are taken as local time,
+    which is what the app's loggers write.
+    """
+    if value.tzinfo is None:
+        value = value.astimezone()
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+# A facet is a name mapped to (window start, {meta field: value})
+WindowFacets = Dict[str, Tuple[datetime, Dict[str, Any]]]
+
+
+class SecurityEventStore:
+    """
+    Batched writer and windowed query helper for security events.
+
+    Args:
+        client: MongoDB client; connected lazily on first use.
+        collection_name: Name of the time-series collection.
+        retention_days: Events older than this are expired by MongoDB.
+        batch_size: Number of buffered events that triggers a flush.
+        flush_interval_seconds: Maximum time an event stays in the buffer.
+        max_buffered: Upper bound of the in-memory buffer while MongoDB is
+            unreachable; the oldest events are dropped beyond it.
+    """
+
+    def __init__(
+        self,
+        client: MongoDBClient,
+        collection_name: str = "coll_security_events",
+        retention_days: int = 7,
+        batch_size: int = 100,
+        flush_interval_seconds: float = 2.0,
+        max_buffered: int = 10000
+    ):
+        self.client = client
+        self.collection_name = collection_name
+        self.retention_seconds = int(timedelta(days=retention_days).total_seconds())
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self._buffer: Deque[Dict[str, Any]] = deque(maxlen=max_buffered)
+        self._collection = None
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        # Flush started by record() once a batch is full
+        self._batch_flush: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Create the collection if needed and start the periodic flush."""
+        await self.ensure_collection()
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_periodically())
+        logger.info(
+            f"Security event store started on '{self.collection_name}' "
+            f"(retention {self.retention_seconds}s, batch size {self.batch_size})"
+        )
+
+    async def stop(self) -> None:
+        """Stop the periodic flush and write any buffered events."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        if self._batch_flush is not None:
+            await asyncio.gather(self._batch_flush, return_exceptions=True)
+            self._batch_flush = None
+        await self.flush()
+
+    async def ensure_collection(self):
+        """
+        Return the events collection, creating it as a time-series collection
+        with TTL expiry. Servers without time-series support (MongoDB < 5.0)
+        get a regular collection with a TTL index instead.
+        """
+        if self._collection is not None:
+            return self._collection
+
+        if self.client.db is None:
+            await self.client.connect()
+        db = self.client.db
+
+        if self.collection_name not in await db.list_collection_names():
+            try:
+                await db.create_collection(
+                    self.collection_name,
+                    timeseries={"timeField": "timestamp", "metaField": "meta", "granularity": "seconds"},
+                    expireAfterSeconds=self.retention_seconds
+                )
+            except OperationFailure as e:
+                logger.warning(f"Time-series collections unavailable, using a TTL-indexed collection: {e}")
+                await db[self.collection_name].create_index("timestamp", expireAfterSeconds=self.retention_seconds)
+
+        self._collection = self.client.get_collection(self.collection_name)
+        return self._collection
+
+    def record(self, event: Dict[str, Any], timestamp: Optional[datetime] = None) -> None:
+        """Buffer an event for the next batch write; ``timestamp`` is naive UTC (now by default)."""
+        self._buffer.append({
+            "timestamp": timestamp or datetime.utcnow(),
+            "meta": {field: event.get(field) for field in META_FIELDS if event.get(field) is not None},
+            "event": event,
+        })
+        if len(self._buffer) >= self.batch_size and not self._flush_lock.locked():
+            if self._batch_flush is None or self._batch_flush.done():
+                self._batch_flush = asyncio.create_task(self.flush())
+                self._batch_flush.add_done_callback(self._batch_flush_done)
+
+    @staticmethod
+    def _batch_flush_done(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Security event batch flush failed: {task.exception()}")
+
+    async def flush(self) -> int:
+        """Write buffered events to MongoDB. Returns the number of events written."""
+        async with self._flush_lock:
+            if not self._buffer:
+                return 0
+            batch = list(self._buffer)
+            self._buffer.clear()
+            try:
+                collection = await self.ensure_collection()
+                await collection.insert_many(batch, ordered=False)
+                return len(batch)
+            except PyMongoError as e:
+                logger.warning(f"Could not persist {len(batch)} security events, keeping them buffered: {e}")
+                # Put the batch back in front of events recorded meanwhile
+                self._buffer.extendleft(reversed(batch))
+                return 0
+
+    async def count_windows(self, facets: WindowFacets) -> Dict[str, int]:
+        """
+        Count events for several windows in a single aggregation.
+
+        Args:
+            facets: Mapping of result name to ``(since, meta_filters)``.
+
+        Returns:
+            Mapping of result name to the number of matching events, including
+            events still waiting in the buffer.
+        """
+        if not facets:
+            return {}
+        earliest = min(since for since, _ in facets.values())
+        pipeline = [
+            {"$match": {"timestamp": {"$gte": earliest}}},
+            {"$facet": {
+                name: [
+                    {"$match": {"timestamp": {"$gte": since}, **self._meta_match(filters)}},
+                    {"$count": "count"}
+                ]
+                for name, (since, filters) in facets.items()
+            }}
+        ]
+
+        counts = {name: 0 for name in facets}
+        try:
+            collection = await self.ensure_collection()
+            results = await collection.aggregate(pipeline).to_list(length=1)
+            if results:
+                for name, rows in results[0].items():
+                    counts[name] = rows[0]["count"] if rows else 0
+        except PyMongoError as e:
+            logger.warning(f"Security event window query failed: {e}")
+
+        for name, (since, filters) in facets.items():
+            counts[name] += sum(1 for doc in self._buffer if self._matches(doc, since, filters))
+        return counts
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval_seconds)
+            await self.flush()
+
+    @staticmethod
+    def _meta_match(filters: Dict[str, Any]) -> Dict[str, Any]:
+        return {f"meta.{field}": value for field, value in filters.items()}
+
+    @staticmethod
+    def _matches(doc: Dict[str, Any], since: datetime, filters: Dict[str, Any]) -> bool:
+        return doc["timestamp"] >= since and all(doc["meta"].get(field) == value for field, value in filters.items())
+
+    def __len__(self) -> int:
+        return len(self._buffer)
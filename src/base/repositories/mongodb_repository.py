@@ -106,12 +106,18 @@ class MongoDBRepository(Generic[T]):
             
         return await self.client.find(query, collection)
         
-    async def find_one(self, query: Dict[str, Any], collection_name: str) -> Optional[T]:
+    async def find_one(
+        self,
+        query: Dict[str, Any],
+        collection_name: str,
+        projection: Optional[Dict[str, Any]] = None
+    ) -> Optional[T]:
         """
         Find a single document matching the query.
         
         Args:
             query: A dictionary representing the query to be executed
+            projection: Optional fields to include or exclude from the result
             
         Returns:
             Optional[T]: The matching document or None if not found
@@ -119,7 +125,7 @@ class MongoDBRepository(Generic[T]):
         # Ensure we have a valid collection
         collection = await self.ensure_connected(collection_name)
             
-        return await self.client.find_one(query, collection)
+        return await self.client.find_one(query, collection, projection)
 
     async def update(self, doc_id: str, data: Dict[str, Any], collection_name: str) -> bool:
         """
@@ -155,6 +161,24 @@ class MongoDBRepository(Generic[T]):
         # Check if anything was updated
         return result.matched_count > 0
 
+    async def update_one(self, query: Dict[str, Any], update: Dict[str, Any], collection_name: str) -> bool:
+        """
+        Apply an update document to the first document matching the query.
+
+        Args:
+            query: A dictionary representing the query to be executed
+            update: The update operations (e.g. {"$set": {...}})
+
+        Returns:
+            bool: True if a document matched the query, False otherwise
+        """
+        # Ensure we have a valid collection
+        collection = await self.ensure_connected(collection_name)
+
+        result = await self.client.update_one(query, update, collection)
+
+        return result.matched_count > 0
+
     async def delete(self, doc_id: str, collection_name: str) -> bool:
         """
         Delete a document by ID.
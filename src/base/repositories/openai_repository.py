@@ -1,6 +1,15 @@
-from typing import Dict, List
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+import json
 import logging
+import time
+from src.base.entities.ai.llm_response import LLMResponse
+from src.base.infrastructure.ai.history_packer import HistoryPacker
+from src.base.infrastructure.ai.llm_metrics import LLM_METRICS, LLMMetrics, current_labels
 from src.base.infrastructure.ai.openai_client import OpenAIClient  # Your OpenAIClient implementation
+from src.base.infrastructure.ai.response_cache import LLMResponseCache, is_deterministic, request_key
+from src.base.infrastructure.ai.semantic_cache import SemanticCache, default_scope, final_user_text
+from src.base.infrastructure.ai.tokenizer import get_tokenizer
+from src.base.utils.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -11,14 +20,35 @@ class OpenAIRepository:
     can use OpenAI API functionality without directly coupling to the client.
     """
 
-    def __init__(self, openai_client: OpenAIClient):
+    def __init__(
+        self,
+        openai_client: OpenAIClient,
+        response_cache: Optional[LLMResponseCache] = None,
+        semantic_cache: Optional[SemanticCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        history_packer: Optional[HistoryPacker] = None,
+        metrics: Optional[LLMMetrics] = None
+    ):
         """
         Initialize the repository with an instance of OpenAIClient.
 
         Args:
             openai_client: An instance of OpenAIClient (with sync and async methods).
+            response_cache: Optional exact-match cache for deterministic chat requests.
+            semantic_cache: Optional similarity cache, used by requests that opt in.
+            single_flight: Coalesces concurrent identical deterministic requests;
+                share one instance between repositories.
+            history_packer: Keeps ``generate*`` prompts within a token budget;
+                without it the full history is sent.
+            metrics: Token, cost and latency accounting; the process-wide
+                collector by default.
         """
         self.client = openai_client
+        self.response_cache = response_cache
+        self.semantic_cache = semantic_cache
+        self.single_flight = single_flight or SingleFlight("llm_chat")
+        self.history_packer = history_packer
+        self.metrics = metrics or LLM_METRICS
 
     def get_embeddings(self, text: str) -> List[float]:
         """
@@ -52,6 +82,22 @@ class OpenAIRepository:
             logger.error(f"Error retrieving embeddings asynchronously: {e}")
             raise
 
+    async def get_embeddings_batch_async(self, texts: List[str]) -> List[List[float]]:
+        """
+        Asynchronously retrieve the embedding vectors of several texts in one request.
+
+        Args:
+            texts (List[str]): The input texts.
+
+        Returns:
+            List[List[float]]: One embedding vector per text, in input order.
+        """
+        try:
+            return await self.client.get_embeddings_batch_async(texts)
+        except Exception as e:
+            logger.error(f"Error retrieving batched embeddings asynchronously: {e}")
+            raise
+
     def get_completion(self, prompt: str, max_tokens: int = 150) -> str:
         """
         Synchronously get a text completion for the given prompt.
@@ -64,19 +110,22 @@ class OpenAIRepository:
             str: The generated text completion.
         """
         try:
-            return self.client.get_completion(prompt, max_tokens)
+            return self.client.get_completion(prompt, max_tokens=max_tokens)
         except Exception:
             import traceback
             logger.error("Full OpenAI error: %s", traceback.format_exc())
             raise
     
-    def generate(
-        self,
+    @staticmethod
+    def build_messages(
         prompt: str,
         user_input: str,
-        history: List[Dict[str, str]],
-        max_tokens: int = 150
-    ) -> str:
+        history: List[Dict[str, str]]
+    ) -> List[Dict[str, str]]:
+        """
+        Build the chat messages for a system prompt, the conversation
+        history (``{"user": ...}`` / ``{"agent": ...}`` turns) and the latest user input.
+        """
         messages: List[Dict[str, str]] = []
 
         # ✅ Add prompt as system message
@@ -109,12 +158,252 @@ class OpenAIRepository:
             assert isinstance(m["role"], str) and isinstance(m["content"], str), "role/content must be strings"
 
         # 🔍 Log sanitized payload
-        import json
         logger.debug("[OpenAI Payload] %s", json.dumps(messages, indent=2))
 
+        return messages
+
+    def pack_messages(
+        self,
+        prompt: str,
+        user_input: str,
+        history: List[Dict[str, str]],
+        summary: Optional[str] = None
+    ) -> List[Dict[str, str]]:
+        """
+        Build the chat messages for ``generate*``: the system prompt, as much
+        recent history as fits the token budget (older turns replaced by
+        ``summary`` when given) and the latest user input.
+        """
+        # Agents store the current input in memory before calling us; don't send it twice
+        if history and history[-1].get("user") == user_input and not history[-1].get("agent"):
+            history = history[:-1]
+
+        if self.history_packer is None:
+            return self.build_messages(prompt, user_input, history)
+        return self.history_packer.pack(prompt, user_input, history, summary=summary).messages
+
+    def generate(
+        self,
+        prompt: str,
+        user_input: str,
+        history: List[Dict[str, str]],
+        max_tokens: int = 150,
+        summary: Optional[str] = None
+    ) -> str:
+        messages = self.pack_messages(prompt, user_input, history, summary=summary)
+
         # 🎯 Forward to the low-level OpenAI client
         return self.get_chat_completion(messages=messages, max_tokens=max_tokens)
 
+    async def generate_async(
+        self,
+        prompt: str,
+        user_input: str,
+        history: List[Dict[str, str]],
+        max_tokens: int = 150,
+        temperature: Optional[float] = None,
+        cache: Optional[bool] = None,
+        summary: Optional[str] = None
+    ) -> str:
+        """
+        Asynchronous counterpart of ``generate``; does not block the event loop.
+        """
+        messages = self.pack_messages(prompt, user_input, history, summary=summary)
+
+        # 🎯 Forward to the low-level OpenAI client
+        return await self.get_chat_completion_async(
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            cache=cache
+        )
+
+    def generate_stream(
+        self,
+        prompt: str,
+        user_input: str,
+        history: List[Dict[str, str]],
+        max_tokens: int = 150,
+        summary: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Streaming counterpart of ``generate``: returns an async iterator of
+        content deltas. Call ``aclose()`` on it to abort the generation early.
+        """
+        messages = self.pack_messages(prompt, user_input, history, summary=summary)
+
+        return self.stream_chat_completion_async(messages=messages, max_tokens=max_tokens)
+
+    async def generate_response(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: int = 150,
+        system_prompt: Optional[str] = None,
+        timeout: Optional[float] = None,
+        cache: Optional[bool] = None,
+        semantic_cache: bool = False,
+        semantic_query: Optional[str] = None,
+        semantic_scope: Optional[str] = None
+    ) -> LLMResponse:
+        """
+        Asynchronously answer a single prompt (used by tools).
+
+        Args:
+            prompt (str): The user prompt.
+            model (str, optional): Model override; the client's default otherwise.
+            temperature (float, optional): Sampling temperature.
+            max_tokens (int): Maximum tokens for the output message.
+            system_prompt (str, optional): Optional system message.
+            timeout (float, optional): Per-call timeout in seconds.
+            cache (bool, optional): Force the response cache on or off;
+                by default only temperature 0 requests are cached.
+            semantic_cache (bool): Allow answering from a similar previous query.
+            semantic_query (str, optional): Text compared for similarity; the prompt by default.
+            semantic_scope (str, optional): Only queries of the same scope are compared;
+                model and system prompt by default.
+
+        Returns:
+            LLMResponse: The generated content and token usage.
+        """
+        messages: List[Dict[str, str]] = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+
+        return await self.get_chat_response_async(
+            messages,
+            max_tokens=max_tokens,
+            model=model,
+            temperature=temperature,
+            timeout=timeout,
+            cache=cache,
+            semantic_cache=semantic_cache,
+            semantic_query=semantic_query,
+            semantic_scope=semantic_scope
+        )
+
+    async def get_chat_response_async(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int = 150,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        timeout: Optional[float] = None,
+        cache: Optional[bool] = None,
+        semantic_cache: bool = False,
+        semantic_query: Optional[str] = None,
+        semantic_scope: Optional[str] = None
+    ) -> LLMResponse:
+        """
+        Asynchronously get a chat-style completion together with its finish
+        reason and token usage.
+
+        Args:
+            messages (List[Dict[str, str]]): A list of messages that represent the chat context.
+            max_tokens (int): Maximum tokens for the output message.
+            model (str, optional): Model override.
+            temperature (float, optional): Sampling temperature.
+            timeout (float, optional): Per-call timeout in seconds.
+            cache (bool, optional): Force the response cache on or off.
+            semantic_cache (bool): Allow answering from a similar previous query.
+            semantic_query (str, optional): Text compared for similarity; the final user turn by default.
+            semantic_scope (str, optional): Only queries of the same scope are compared;
+                model and preceding messages by default.
+
+        Returns:
+            LLMResponse: The generated content and token usage.
+        """
+        # Deterministic requests are keyed so identical ones can share a result
+        request_hash = None
+        if is_deterministic(temperature, cache):
+            request_hash = request_key(messages, model or self.client.model, temperature, max_tokens)
+            if self.response_cache is not None and self.response_cache.enabled:
+                cached = await self.response_cache.get(request_hash)
+                if cached is not None:
+                    return cached
+
+        use_semantic = semantic_cache and self.semantic_cache is not None and self.semantic_cache.enabled
+        if use_semantic:
+            semantic_query = semantic_query or final_user_text(messages)
+            semantic_scope = semantic_scope or default_scope(model or self.client.model, messages)
+            cached = await self.semantic_cache.lookup(semantic_query, scope=semantic_scope)
+            if cached is not None:
+                return cached
+
+        async def complete() -> LLMResponse:
+            return await self._complete_and_store(
+                messages,
+                max_tokens=max_tokens,
+                model=model,
+                temperature=temperature,
+                timeout=timeout,
+                request_hash=request_hash,
+                semantic_query=semantic_query if use_semantic else None,
+                semantic_scope=semantic_scope
+            )
+
+        if request_hash is None:
+            return await complete()
+        # Concurrent identical requests share one in-flight completion
+        return await self.single_flight.do(request_hash, complete)
+
+    async def _complete_and_store(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int,
+        model: Optional[str],
+        temperature: Optional[float],
+        timeout: Optional[float],
+        request_hash: Optional[str],
+        semantic_query: Optional[str],
+        semantic_scope: Optional[str]
+    ) -> LLMResponse:
+        started = time.perf_counter()
+        try:
+            response = await self.client.create_chat_completion_async(
+                messages,
+                max_tokens=max_tokens,
+                model=model,
+                temperature=temperature,
+                timeout=timeout
+            )
+        except Exception as e:
+            logger.error(f"Error generating response: {e}")
+            raise
+
+        choice = response.choices[0]
+        usage = response.usage
+        result = LLMResponse(
+            content=choice.message.content or "",
+            model=response.model,
+            finish_reason=choice.finish_reason,
+            prompt_tokens=usage.prompt_tokens if usage else 0,
+            completion_tokens=usage.completion_tokens if usage else 0
+        )
+        requested_model = model or self.client.model
+        if usage:
+            self.metrics.record(
+                requested_model,
+                usage.prompt_tokens,
+                usage.completion_tokens,
+                time.perf_counter() - started
+            )
+        else:
+            self._record_counted(requested_model, messages, result.content, time.perf_counter() - started)
+
+        if request_hash is not None and self.response_cache is not None and self.response_cache.enabled:
+            await self.response_cache.set(request_hash, result)
+        if semantic_query is not None:
+            await self.semantic_cache.store(
+                semantic_query,
+                result,
+                scope=semantic_scope,
+                generation_seconds=time.perf_counter() - started
+            )
+        return result
+
     def get_chat_completion(self, messages: List[Dict[str, str]], max_tokens: int = 150) -> str:
         """
         Synchronously get a chat-style completion for the given messages.
@@ -126,28 +415,118 @@ class OpenAIRepository:
         Returns:
             str: The generated chat response.
         """
+        started = time.perf_counter()
         try:
-            return self.client.get_chat_completion(messages, max_tokens)
+            content = self.client.get_chat_completion(messages, max_tokens)
         except Exception as e:
             logger.error(f"Error retrieving chat completion: {e}")
             raise
+        self._record_counted(self.client.model, messages, content or "", time.perf_counter() - started)
+        return content
 
-    async def get_chat_completion_async(self, messages: List[Dict[str, str]], max_tokens: int = 150) -> str:
+    async def get_chat_completion_async(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int = 150,
+        temperature: Optional[float] = None,
+        cache: Optional[bool] = None
+    ) -> str:
         """
         Asynchronously get a chat-style completion for the given messages.
 
         Args:
             messages (List[Dict[str, str]]): A list of messages that represent the chat context.
             max_tokens (int): Maximum tokens for the output message.
+            temperature (float, optional): Sampling temperature.
+            cache (bool, optional): Force the response cache on or off.
             
         Returns:
             str: The generated chat response.
         """
+        # Caching, coalescing and usage accounting all happen there
+        response = await self.get_chat_response_async(
+            messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            cache=cache
+        )
+        return response.content
+
+    def stream_chat_completion_async(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int = 150,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat-style completion for the given messages.
+
+        Args:
+            messages (List[Dict[str, str]]): A list of messages that represent the chat context.
+            max_tokens (int): Maximum tokens for the output message.
+            model (str, optional): Model override.
+            temperature (float, optional): Sampling temperature.
+
+        Returns:
+            AsyncIterator[str]: The generated content, delta by delta.
+        """
+        stream = self.client.stream_chat_completion_async(
+            messages,
+            max_tokens=max_tokens,
+            model=model,
+            temperature=temperature
+        )
+        # Labels are taken now: the stream may be consumed from another context
+        return self._measured_stream(stream, model or self.client.model, messages, current_labels())
+
+    async def _measured_stream(
+        self,
+        stream: AsyncIterator[str],
+        model: str,
+        messages: List[Dict[str, str]],
+        labels: Tuple[str, str]
+    ) -> AsyncIterator[str]:
+        # Streams report no usage: count tokens locally once the stream ends
+        started = time.perf_counter()
+        first_token_seconds = None
+        parts: List[str] = []
         try:
-            return await self.client.get_chat_completion_async(messages, max_tokens)
-        except Exception as e:
-            logger.error(f"Error retrieving async chat completion: {e}")
-            raise
+            async for delta in stream:
+                if first_token_seconds is None:
+                    first_token_seconds = time.perf_counter() - started
+                parts.append(delta)
+                yield delta
+        finally:
+            await stream.aclose()
+            if first_token_seconds is not None:
+                self._record_counted(
+                    model,
+                    messages,
+                    "".join(parts),
+                    time.perf_counter() - started,
+                    ttft_seconds=first_token_seconds,
+                    labels=labels
+                )
+
+    def _record_counted(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        completion: str,
+        latency_seconds: float,
+        ttft_seconds: Optional[float] = None,
+        labels: Optional[Tuple[str, str]] = None
+    ) -> None:
+        tokenizer = get_tokenizer(model)
+        self.metrics.record(
+            model,
+            tokenizer.count_messages(messages),
+            tokenizer.count(completion),
+            latency_seconds,
+            ttft_seconds=ttft_seconds,
+            labels=labels
+        )
 
     def transcribe_audio(self, audio_file_path:str):
         """
@@ -177,7 +556,7 @@ class OpenAIRepository:
 
         """
         try:
-            return self.client.transcribe_audio_async(audio_file_path)
+            return await self.client.transcribe_audio_async(audio_file_path)
         except Exception as e:
             logger.error("Failed to transcribe audio (asymc): %s", e)
     
@@ -216,6 +595,6 @@ class OpenAIRepository:
 
         """
         try:
-            return self.client.generate_image_async(prompt, n, size)
+            return await self.client.generate_image_async(prompt, n, size)
         except Exception as e:
             logger.error("Failed to generate image (async): %s", e)
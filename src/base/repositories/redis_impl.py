@@ -4,10 +4,24 @@ Redis Repository Implementation.
 This module provides a concrete implementation of the RedisRepository interface
 using aioredis for asynchronous Redis operations.
 """
-from typing import List, Optional, AsyncIterator
+from typing import Dict, List, Optional, AsyncIterator
 import aioredis
 from src.base.repositories.redis_repository import RedisRepository
 
+# KEYS: list, key to set; ARGV: expected head, value, trim start, expiration (0 = none)
+_COMPACT_LIST_SCRIPT = """
+if redis.call('LINDEX', KEYS[1], 0) ~= ARGV[1] then
+    return 0
+end
+if tonumber(ARGV[4]) > 0 then
+    redis.call('SET', KEYS[2], ARGV[2], 'EX', ARGV[4])
+else
+    redis.call('SET', KEYS[2], ARGV[2])
+end
+redis.call('LTRIM', KEYS[1], ARGV[3], -1)
+return 1
+"""
+
 class RedisRepositoryImpl(RedisRepository):
     """
     Implementation of the RedisRepository interface.
@@ -54,6 +68,53 @@ class RedisRepositoryImpl(RedisRepository):
             return await self.redis.set(key, value, ex=expiration)
         return await self.redis.set(key, value)
     
+    async def setnx(self, key: str, value: str, expiration: Optional[int] = None) -> bool:
+        """
+        Set a key-value pair in Redis only if the key does not exist yet.
+        
+        Args:
+            key: The Redis key
+            value: The value to store
+            expiration: Optional expiration time in seconds
+            
+        Returns:
+            True if the key was set, False if it already existed
+        """
+        return bool(await self.redis.set(key, value, ex=expiration, nx=True))
+    
+    async def mget(self, keys: List[str]) -> List[Optional[str]]:
+        """
+        Get several values from Redis in one round trip.
+        
+        Args:
+            keys: The Redis keys to retrieve
+            
+        Returns:
+            The values in key order, None for missing keys
+        """
+        if not keys:
+            return []
+        return await self.redis.mget(keys)
+    
+    async def mset(self, mapping: Dict[str, str], expiration: Optional[int] = None) -> bool:
+        """
+        Set several key-value pairs in one pipelined round trip.
+        
+        Args:
+            mapping: Keys and values to store
+            expiration: Optional expiration time in seconds, applied to every key
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if not mapping:
+            return True
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key, value in mapping.items():
+                pipe.set(key, value, ex=expiration)
+            results = await pipe.execute()
+        return all(results)
+    
     async def subscribe_channel(self, channel: str) -> AsyncIterator[str]:
         pubsub = self.redis.pubsub()
         await pubsub.subscribe(channel)
@@ -79,6 +140,70 @@ class RedisRepositoryImpl(RedisRepository):
         """
         return await self.redis.lpush(key, value)
     
+    async def rpush(
+        self,
+        key: str,
+        values: List[str],
+        max_length: Optional[int] = None,
+        expiration: Optional[int] = None
+    ) -> int:
+        """
+        Append values to the right of a Redis list, capping its length.
+        
+        RPUSH, LTRIM and EXPIRE are sent as one MULTI/EXEC pipeline, so the
+        list is never observed over its cap and concurrent appends are
+        never lost.
+        
+        Args:
+            key: The Redis list key
+            values: The values to append, in order
+            max_length: Keep only the newest max_length elements
+            expiration: Optional expiration time in seconds, refreshed on every append
+            
+        Returns:
+            The length of the list after the push (before trimming)
+        """
+        if not values:
+            return 0
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.rpush(key, *values)
+            if max_length:
+                pipe.ltrim(key, -max_length, -1)
+            if expiration:
+                pipe.expire(key, expiration)
+            results = await pipe.execute()
+        return results[0]
+    
+    async def compact_list(
+        self,
+        key: str,
+        head: str,
+        start: int,
+        set_key: str,
+        set_value: str,
+        expiration: Optional[int] = None
+    ) -> bool:
+        """
+        Replace the start of a Redis list with a value stored under another key.
+        
+        The head check, SET and LTRIM run as one Lua script, so an append
+        that caps the list cannot shift it between the check and the trim.
+        
+        Args:
+            key: The Redis list key
+            head: The value the list is expected to start with
+            start: Index of the first element to keep
+            set_key: The key to store set_value under
+            set_value: The value to store
+            expiration: Optional expiration time in seconds for set_key
+            
+        Returns:
+            True if the list was trimmed, False if it no longer starts with head
+        """
+        return bool(await self.redis.eval(
+            _COMPACT_LIST_SCRIPT, 2, key, set_key, head, set_value, start, expiration or 0
+        ))
+    
     async def ltrim(self, key: str, start: int, end: int) -> bool:
         """
         Trim a Redis list to the specified range.
@@ -1,6 +1,6 @@
 # src/base/repositories/redis_repository.py
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 class RedisRepository(ABC):
     """Abstract interface for Redis operations"""
@@ -15,11 +15,50 @@ class RedisRepository(ABC):
         """Set a key-value pair with optional expiration"""
         pass
     
+    @abstractmethod
+    async def setnx(self, key: str, value: str, expiration: Optional[int] = None) -> bool:
+        """Set a key-value pair only if the key does not exist, with optional expiration"""
+        pass
+
+    @abstractmethod
+    async def mget(self, keys: List[str]) -> List[Optional[str]]:
+        """Get several values in one round trip (None for missing keys)"""
+        pass
+
+    @abstractmethod
+    async def mset(self, mapping: Dict[str, str], expiration: Optional[int] = None) -> bool:
+        """Set several key-value pairs in one round trip with optional expiration"""
+        pass
+    
     @abstractmethod
     async def lpush(self, key: str, value: str) -> int:
         """Push a value to the left of a list"""
         pass
     
+    @abstractmethod
+    async def rpush(
+        self,
+        key: str,
+        values: List[str],
+        max_length: Optional[int] = None,
+        expiration: Optional[int] = None
+    ) -> int:
+        """Append values to the right of a list, keeping only the last max_length, in one round trip"""
+        pass
+
+    @abstractmethod
+    async def compact_list(
+        self,
+        key: str,
+        head: str,
+        start: int,
+        set_key: str,
+        set_value: str,
+        expiration: Optional[int] = None
+    ) -> bool:
+        """Atomically, if the list still starts with head, store set_value under set_key and trim the list to start..-1"""
+        pass
+
     @abstractmethod
     async def ltrim(self, key: str, start: int, end: int) -> bool:
         """Trim a list to specified range"""
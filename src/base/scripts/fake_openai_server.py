@@ -0,0 +1,339 @@
+#!/usr/bin/env python
+"""
+Local OpenAI-compatible fake server for load and latency testing.
+
+Implements the endpoints the application uses, without provider spend:
+
+* ``POST /v1/chat/completions`` (streaming and non-streaming)
+* ``POST /v1/completions``
+* ``POST /v1/embeddings``
+* ``POST /v1/audio/transcriptions``
+* ``POST /v1/images/generations``
+* ``GET /v1/models`` and ``GET /health``
+
+Outputs are deterministic: the same request always gets the same text,
+vectors and token usage. Latency is drawn from a configurable distribution
+and a configurable fraction of requests fail with 429 (with ``Retry-After``)
+or 5xx errors, so the app's resilience paths can be exercised too.
+
+Point the application at it through the settings:
+
+    OPENAI_URL=http://127.0.0.1:8090/v1 OPENAI_API_KEY=sk-fake
+
+Usage:
+    python src/base/scripts/fake_openai_server.py --port 8090 \\
+        --latency lognormal:0.4,0.5 --ttft fixed:0.2 --token-latency fixed:0.01 \\
+        --error-rate 0.02 --error-statuses 429,500,503
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from aiohttp import web
+
+# Add the project root to the path for imports
+sys.path.append(str(Path(__file__).parent.parent.parent.parent))
+
+from src.base.infrastructure.ai.tokenizer import Tokenizer
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s [%(levelname)s] %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+logger = logging.getLogger("fake_openai_server")
+
+VOCABULARY = (
+    "the a kitchen sofa table lamp shelf storage light wood oak birch white black small large "
+    "room space design plan idea option price delivery assembly colour fabric drawer wardrobe "
+    "bed desk chair cosy modern simple practical affordable sustainable home living and with for"
+).split()
+
+
+class LatencyDistribution:
+    """
+    Latency in seconds drawn from a named distribution.
+
+    Specs: ``fixed:S``, ``uniform:LOW,HIGH``, ``normal:MEAN,STDDEV``,
+    ``lognormal:MEDIAN,SIGMA`` and ``exponential:MEAN``.
+    """
+
+    KINDS = ("fixed", "uniform", "normal", "lognormal", "exponential")
+
+    def __init__(self, kind: str = "fixed", params: Tuple[float, ...] = (0.0,)):
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown latency distribution '{kind}'")
+        self.kind = kind
+        self.params = params
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyDistribution":
+        kind, _, args = spec.partition(":")
+        params = tuple(float(value) for value in args.split(",") if value) or (0.0,)
+        return cls(kind, params)
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "fixed":
+            value = self.params[0]
+        elif self.kind == "uniform":
+            value = rng.uniform(self.params[0], self.params[1])
+        elif self.kind == "normal":
+            value = rng.gauss(self.params[0], self.params[1])
+        elif self.kind == "lognormal":
+            value = self.params[0] * math.exp(rng.gauss(0.0, self.params[1]))
+        else:
+            value = rng.expovariate(1.0 / self.params[0]) if self.params[0] > 0 else 0.0
+        return max(0.0, value)
+
+
+@dataclass
+class FakeOpenAIConfig:
+    """Behaviour of the fake server."""
+    latency: LatencyDistribution = field(default_factory=LatencyDistribution)
+    time_to_first_token: LatencyDistribution = field(default_factory=LatencyDistribution)
+    token_latency: LatencyDistribution = field(default_factory=LatencyDistribution)
+    error_rate: float = 0.0
+    error_statuses: Tuple[int, ...] = (429, 500, 503)
+    retry_after_seconds: float = 1.0
+    embedding_dimensions: int = 1536
+    seed: Optional[int] = None
+
+
+def _digest(*parts: Any) -> int:
+    payload = json.dumps(parts, sort_keys=True, default=str).encode("utf-8")
+    return int.from_bytes(hashlib.sha256(payload).digest()[:8], "big")
+
+
+def deterministic_text(max_tokens: int, *request: Any) -> str:
+    """Words picked from a fixed vocabulary, seeded by the request."""
+    rng = random.Random(_digest(*request))
+    length = max(1, min(max_tokens or 16, rng.randint(8, 48)))
+    return " ".join(rng.choice(VOCABULARY) for _ in range(length)).capitalize() + "."
+
+
+def deterministic_embedding(model: str, text: str, dimensions: int) -> List[float]:
+    """Unit vector seeded by the text, so identical texts embed identically."""
+    rng = random.Random(_digest(model, text))
+    vector = [rng.gauss(0.0, 1.0) for _ in range(dimensions)]
+    norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+    return [value / norm for value in vector]
+
+
+class FakeOpenAIServer:
+    """Request handlers of the fake API."""
+
+    def __init__(self, config: FakeOpenAIConfig):
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.tokenizer = Tokenizer()
+        self.requests = 0
+
+    def create_app(self) -> web.Application:
+        app = web.Application(client_max_size=64 * 1024 * 1024)
+        app.router.add_post("/v1/chat/completions", self.chat_completions)
+        app.router.add_post("/v1/completions", self.completions)
+        app.router.add_post("/v1/embeddings", self.embeddings)
+        app.router.add_post("/v1/audio/transcriptions", self.transcriptions)
+        app.router.add_post("/v1/images/generations", self.images)
+        app.router.add_get("/v1/models", self.models)
+        app.router.add_get("/health", self.health)
+        return app
+
+    async def _delay_or_fail(self) -> Optional[web.Response]:
+        """Apply the latency distribution; return an error response for injected faults."""
+        self.requests += 1
+        await asyncio.sleep(self.config.latency.sample(self.rng))
+        if self.config.error_rate and self.rng.random() < self.config.error_rate:
+            status = self.rng.choice(self.config.error_statuses)
+            headers = {"Retry-After": str(self.config.retry_after_seconds)} if status == 429 else {}
+            error_type = "rate_limit_error" if status == 429 else "server_error"
+            return web.json_response(
+                {"error": {"message": f"Injected {status} error", "type": error_type, "code": None}},
+                status=status,
+                headers=headers
+            )
+        return None
+
+    def _usage(self, prompt_tokens: int, completion: str) -> Dict[str, int]:
+        completion_tokens = self.tokenizer.count(completion)
+        return {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens
+        }
+
+    async def chat_completions(self, request: web.Request) -> web.StreamResponse:
+        body = await request.json()
+        failure = await self._delay_or_fail()
+        if failure is not None:
+            return failure
+
+        model = body.get("model", "gpt-4o")
+        messages = body.get("messages", [])
+        content = deterministic_text(body.get("max_tokens"), model, messages, body.get("temperature"))
+        if body.get("stream"):
+            return await self._stream_chat(request, model, content)
+
+        return web.json_response({
+            "id": f"chatcmpl-fake-{self.requests}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop"
+            }],
+            "usage": self._usage(self.tokenizer.count_messages(messages), content)
+        })
+
+    async def _stream_chat(self, request: web.Request, model: str, content: str) -> web.StreamResponse:
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"})
+        await response.prepare(request)
+        created = int(time.time())
+
+        async def send(delta: Dict[str, str], finish_reason: Optional[str] = None) -> None:
+            chunk = {
+                "id": f"chatcmpl-fake-{self.requests}",
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]
+            }
+            await response.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+
+        try:
+            await asyncio.sleep(self.config.time_to_first_token.sample(self.rng))
+            await send({"role": "assistant", "content": ""})
+            words = content.split(" ")
+            for index, word in enumerate(words):
+                await send({"content": word if index == 0 else f" {word}"})
+                await asyncio.sleep(self.config.token_latency.sample(self.rng))
+            await send({}, finish_reason="stop")
+            await response.write(b"data: [DONE]\n\n")
+        except (ConnectionResetError, asyncio.CancelledError):
+            logger.debug("Streaming client disconnected")
+            raise
+        return response
+
+    async def completions(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        failure = await self._delay_or_fail()
+        if failure is not None:
+            return failure
+
+        model = body.get("model", "gpt-4o-mini")
+        prompt = body.get("prompt", "")
+        text = deterministic_text(body.get("max_tokens"), model, prompt)
+        return web.json_response({
+            "id": f"cmpl-fake-{self.requests}",
+            "object": "text_completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{"index": 0, "text": text, "logprobs": None, "finish_reason": "stop"}],
+            "usage": self._usage(self.tokenizer.count(str(prompt)), text)
+        })
+
+    async def embeddings(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        failure = await self._delay_or_fail()
+        if failure is not None:
+            return failure
+
+        model = body.get("model", "text-embedding-ada-002")
+        texts = body.get("input", [])
+        if isinstance(texts, str):
+            texts = [texts]
+        dimensions = body.get("dimensions") or self.config.embedding_dimensions
+        prompt_tokens = sum(self.tokenizer.count(str(text)) for text in texts)
+        return web.json_response({
+            "object": "list",
+            "model": model,
+            "data": [
+                {"object": "embedding", "index": index, "embedding": deterministic_embedding(model, str(text), dimensions)}
+                for index, text in enumerate(texts)
+            ],
+            "usage": {"prompt_tokens": prompt_tokens, "total_tokens": prompt_tokens}
+        })
+
+    async def transcriptions(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        failure = await self._delay_or_fail()
+        if failure is not None:
+            return failure
+
+        upload = form.get("file")
+        audio = upload.file.read() if hasattr(upload, "file") else b""
+        text = deterministic_text(64, form.get("model", "whisper-1"), hashlib.sha256(audio).hexdigest())
+        return web.json_response({"text": text})
+
+    async def images(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        failure = await self._delay_or_fail()
+        if failure is not None:
+            return failure
+
+        digest = _digest(body.get("model"), body.get("prompt"), body.get("size"))
+        return web.json_response({
+            "created": int(time.time()),
+            "data": [
+                {"url": f"https://fake-openai.local/images/{digest:016x}-{index}.png"}
+                for index in range(body.get("n") or 1)
+            ]
+        })
+
+    async def models(self, request: web.Request) -> web.Response:
+        names = ("gpt-4o", "gpt-4o-mini", "text-embedding-ada-002", "whisper-1", "dall-e-3")
+        return web.json_response({
+            "object": "list",
+            "data": [{"id": name, "object": "model", "created": 0, "owned_by": "fake"} for name in names]
+        })
+
+    async def health(self, request: web.Request) -> web.Response:
+        return web.json_response({"status": "ok", "requests": self.requests})
+
+
+def create_app(config: Optional[FakeOpenAIConfig] = None) -> web.Application:
+    """Build the fake API application (also usable from tests with ``AppRunner``)."""
+    return FakeOpenAIServer(config or FakeOpenAIConfig()).create_app()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local OpenAI-compatible fake server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--latency", default="fixed:0", help="Response latency, e.g. lognormal:0.4,0.5")
+    parser.add_argument("--ttft", default="fixed:0", help="Extra time to first streamed token")
+    parser.add_argument("--token-latency", default="fixed:0", help="Delay between streamed tokens")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests that fail")
+    parser.add_argument("--error-statuses", default="429,500,503", help="Statuses of injected failures")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After of injected 429s")
+    parser.add_argument("--embedding-dimensions", type=int, default=1536)
+    parser.add_argument("--seed", type=int, default=None, help="Seed of latency and error sampling")
+    args = parser.parse_args()
+
+    config = FakeOpenAIConfig(
+        latency=LatencyDistribution.parse(args.latency),
+        time_to_first_token=LatencyDistribution.parse(args.ttft),
+        token_latency=LatencyDistribution.parse(args.token_latency),
+        error_rate=args.error_rate,
+        error_statuses=tuple(int(status) for status in args.error_statuses.split(",") if status),
+        retry_after_seconds=args.retry_after,
+        embedding_dimensions=args.embedding_dimensions,
+        seed=args.seed
+    )
+    logger.info(f"Fake OpenAI server on http://{args.host}:{args.port}/v1")
+    web.run_app(create_app(config), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
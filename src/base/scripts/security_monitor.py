@@ -15,12 +15,12 @@ import json
 import argparse
 import logging
 from collections import defaultdict
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import sys
 from pathlib import Path
 import asyncio
 import traceback
-from typing import Dict, Any, Set
+from typing import Dict, Any, Optional, Set
 
 # Add the project root to the path for imports
 sys.path.append(str(Path(__file__).parent.parent.parent.parent))
@@ -28,6 +28,7 @@ sys.path.append(str(Path(__file__).parent.parent.parent.parent))
 from src.base.config.config import settings
 from src.base.config.alert_config import AlertConfig
 from src.base.utils.email_utils import send_email_alert, send_error_alert
+from src.base.monitors.security_event_store import SecurityEventStore, utc_naive
 from src.base.logging.security_monitor_logger import (
     log_email_attempt,
     log_email_success,
@@ -57,9 +58,16 @@ class SecurityMonitor:
             alert_config: AlertConfig = None,
             security_log_path: str = None,
             rate_limit_log_path: str = None,
-            error_log_path: str = None
+            error_log_path: str = None,
+            event_store: Optional[SecurityEventStore] = None,
+            load_history: bool = True
         ):
-        """Initialize the security monitor with configurable paths."""
+        """
+        Initialize the security monitor with configurable paths.
+
+        When an ``event_store`` is given, events are persisted to MongoDB and
+        windowed counts are queried from it instead of being kept in memory.
+        """
         # Initialize logger
         self.logger = logging.getLogger(__name__)
         
@@ -91,9 +99,11 @@ class SecurityMonitor:
         
         # Initialize monitoring state
         self.is_running = False
+        self.event_store = event_store
         
-        # Load historical events from enabled log files
-        self._load_historical_events()
+        # Load historical events from enabled log files (the event store already has them)
+        if self.event_store is None and load_history:
+            self._load_historical_events()
         
         # Clean up old events periodically
         self._cleanup_old_events()
@@ -107,6 +117,37 @@ class SecurityMonitor:
         self.logger.info("  Alert cooldown: %s", self.alert_cooldown)
         self.logger.info("  Time window: %d minutes", self.alert_config.time_window_minutes)
     
+    def attach_event_store(self, event_store: SecurityEventStore) -> None:
+        """Persist events to ``event_store`` from now on and drop the in-memory history."""
+        self.event_store = event_store
+        self._historical_events = []
+        self.logger.info(f"Security events are now persisted to '{event_store.collection_name}'")
+
+    async def _get_window_counts(self, event: Dict[str, Any]) -> Optional[Dict[str, int]]:
+        """
+        Count recent events related to ``event`` from the event store, in a
+        single aggregation. Returns None when no event store is attached.
+        """
+        if self.event_store is None:
+            return None
+
+        now = datetime.utcnow()
+        window_start = now - timedelta(minutes=self.alert_config.time_window_minutes)
+        error_window_start = now - timedelta(minutes=settings.security.error_window_minutes)
+        endpoint = event.get("path", "unknown")
+
+        return await self.event_store.count_windows({
+            "total_events": (window_start, {}),
+            "ip_failures": (window_start, {
+                "event_type": "unauthorized_access",
+                "client_ip": event.get("client_ip", "unknown")
+            }),
+            "rate_limit_violations": (window_start, {"event_type": "rate_limit_violation", "path": endpoint}),
+            "endpoint_attempts": (window_start, {"path": endpoint}),
+            "recent_errors": (error_window_start, {"log_type": "error"}),
+            "module_errors": (error_window_start, {"log_type": "error", "module": event.get("module", "unknown")}),
+        })
+
     def _initialize_email_settings(self) -> None:
         """Initialize email settings with validation."""
         try:
@@ -137,7 +178,7 @@ class SecurityMonitor:
     
     def _cleanup_old_events(self) -> None:
         """Remove events older than the time window."""
-        current_time = datetime.now()
+        current_time = datetime.utcnow()
         cutoff_time = current_time - timedelta(minutes=self.alert_config.time_window_minutes)
         
         cleaned_events = []
@@ -165,15 +206,15 @@ class SecurityMonitor:
                 
         self._historical_events = cleaned_events
 
-    def _analyze_attack_pattern(self, event: Dict[str, Any]) -> str:
+    def _analyze_attack_pattern(self, event: Dict[str, Any], events_same_endpoint: Optional[int] = None) -> str:
         """Analyze the pattern of attacks based on recent events."""
-        self._cleanup_old_events()
-        
         endpoint = event.get('path', 'unknown')
-        events_same_endpoint = sum(
-            1 for e in self._historical_events
-            if e.get('path') == endpoint
-        )
+        if events_same_endpoint is None:
+            self._cleanup_old_events()
+            events_same_endpoint = sum(
+                1 for e in self._historical_events
+                if e.get('path') == endpoint
+            )
         
         if events_same_endpoint > 10:
             return f"Persistent attacks on endpoint {endpoint}"
@@ -186,7 +227,7 @@ class SecurityMonitor:
         """Load recent events from log files for historical analysis."""
         try:
             # Calculate cutoff time based on time window from config
-            cutoff_time = datetime.now() - timedelta(minutes=self.alert_config.time_window_minutes)
+            cutoff_time = datetime.utcnow() - timedelta(minutes=self.alert_config.time_window_minutes)
             self._historical_events = []  # Reset historical events
             
             for log_type in self.alert_config.enabled_logs:
@@ -289,23 +330,12 @@ class SecurityMonitor:
                                     event = json.loads(json_str)
                                     event['log_type'] = 'security'
                                     
-                                    # Handle different timestamp formats
                                     try:
-                                        # First try ISO format
-                                        event_time = datetime.fromisoformat(event['timestamp'].replace('Z', ''))
+                                        event_time = self._get_timestamp_naive(event['timestamp'])
                                     except ValueError:
-                                        try:
-                                            # Try format with comma in milliseconds
-                                            event_time = datetime.strptime(event['timestamp'], '%Y-%m-%d %H:%M:%S,%f')
-                                        except ValueError:
-                                            try:
-                                                # Try format with space instead of T
-                                                timestamp = event['timestamp'].replace(' ', 'T')
-                                                event_time = datetime.fromisoformat(timestamp.replace('Z', ''))
-                                            except ValueError:
-                                                # If all else fails, use current time
-                                                self.logger.warning(f"Could not parse timestamp: {event['timestamp']}")
-                                                event_time = datetime.utcnow()
+                                        # If all else fails, use current time
+                                        self.logger.warning(f"Could not parse timestamp: {event['timestamp']}")
+                                        event_time = datetime.utcnow()
                                     
                                     if event_time > cutoff_time:
                                         self._historical_events.append(event)
@@ -322,23 +352,12 @@ class SecurityMonitor:
                                     event = json.loads(json_str)
                                     event['log_type'] = 'rate_limit'
                                     
-                                    # Handle different timestamp formats
                                     try:
-                                        # First try ISO format
-                                        event_time = datetime.fromisoformat(event['timestamp'].replace('Z', ''))
+                                        event_time = self._get_timestamp_naive(event['timestamp'])
                                     except ValueError:
-                                        try:
-                                            # Try format with comma in milliseconds
-                                            event_time = datetime.strptime(event['timestamp'], '%Y-%m-%d %H:%M:%S,%f')
-                                        except ValueError:
-                                            try:
-                                                # Try format with space instead of T
-                                                timestamp = event['timestamp'].replace(' ', 'T')
-                                                event_time = datetime.fromisoformat(timestamp.replace('Z', ''))
-                                            except ValueError:
-                                                # If all else fails, use current time
-                                                self.logger.warning(f"Could not parse timestamp: {event['timestamp']}")
-                                                event_time = datetime.utcnow()
+                                        # If all else fails, use current time
+                                        self.logger.warning(f"Could not parse timestamp: {event['timestamp']}")
+                                        event_time = datetime.utcnow()
                                     
                                     if event_time > cutoff_time:
                                         self._historical_events.append(event)
@@ -358,7 +377,11 @@ class SecurityMonitor:
         except Exception as e:
             self.logger.error(f"Error loading historical events: {str(e)}")
 
-    def _prepare_error_alert_data(self, event: Dict[str, Any]) -> Dict[str, Any]:
+    def _prepare_error_alert_data(
+            self,
+            event: Dict[str, Any],
+            window_counts: Optional[Dict[str, int]] = None
+        ) -> Dict[str, Any]:
         """Prepare data for error alert email."""
         try:
             # Extract basic error information
@@ -374,20 +397,24 @@ class SecurityMonitor:
             current_time = datetime.utcnow()
             error_cutoff_time = current_time - timedelta(minutes=error_window_minutes)
             
-            recent_errors = [
-                e for e in self._historical_events
-                if e.get('log_type') == 'error' and
-                self._get_timestamp_naive(e.get('timestamp')).replace(tzinfo=None) > error_cutoff_time
-            ]
-            
-            error_count_hour = len(recent_errors)
-            
-            # Count similar errors (same type/module)
-            similar_errors = 0
-            for err in recent_errors:
-                err_msg = err.get('message', '')
-                if error_type in err_msg or (event.get('module') and event.get('module') == err.get('module')):
-                    similar_errors += 1
+            if window_counts is not None:
+                error_count_hour = window_counts["recent_errors"]
+                similar_errors = window_counts["module_errors"]
+            else:
+                recent_errors = [
+                    e for e in self._historical_events
+                    if e.get('log_type') == 'error' and
+                    self._get_timestamp_naive(e.get('timestamp')).replace(tzinfo=None) > error_cutoff_time
+                ]
+                
+                error_count_hour = len(recent_errors)
+                
+                # Count similar errors (same type/module)
+                similar_errors = 0
+                for err in recent_errors:
+                    err_msg = err.get('message', '')
+                    if error_type in err_msg or (event.get('module') and event.get('module') == err.get('module')):
+                        similar_errors += 1
             
             # Calculate total errors
             total_errors = 0
@@ -450,17 +477,20 @@ class SecurityMonitor:
 
     def _get_timestamp_naive(self, timestamp_str: str) -> datetime:
         """
-        Parse a timestamp string to a naive datetime object for comparison.
+        Parse a timestamp string to a naive UTC datetime object for comparison.
         Handles multiple timestamp formats:
-        - ISO format with T (2023-03-17T10:15:23.456)
+        - ISO format with T (2023-03-17T10:15:23.456), with or without Z/offset
         - ISO format with space (2023-03-17 10:15:23.456)
         - Format with comma for milliseconds (2023-03-17 10:15:23,456)
+
+        Timestamps without an offset are local time, as written by the app's
+        loggers, and are converted to UTC.
         
         Args:
             timestamp_str: Timestamp string to parse
             
         Returns:
-            Naive datetime object
+            Naive UTC datetime object
             
         Raises:
             ValueError: If timestamp cannot be parsed
@@ -472,19 +502,13 @@ class SecurityMonitor:
         for formatter in [
             # Try format with comma in milliseconds first
             lambda ts: datetime.strptime(ts, '%Y-%m-%d %H:%M:%S,%f'),
-            # Try ISO format with Z
-            lambda ts: datetime.fromisoformat(ts.replace('Z', '')),
+            # Try ISO format, with Z as a UTC offset
+            lambda ts: datetime.fromisoformat(ts.replace('Z', '+00:00')),
             # Try format with space instead of T
-            lambda ts: datetime.fromisoformat(ts.replace(' ', 'T').replace('Z', '')),
-            # Try standard ISO format
-            lambda ts: datetime.fromisoformat(ts),
+            lambda ts: datetime.fromisoformat(ts.replace(' ', 'T').replace('Z', '+00:00')),
         ]:
             try:
-                event_time = formatter(timestamp_str)
-                # Make sure it's naive for comparison
-                if event_time.tzinfo is not None:
-                    event_time = event_time.replace(tzinfo=None)
-                return event_time
+                return utc_naive(formatter(timestamp_str))
             except (ValueError, TypeError):
                 continue
                 
@@ -506,37 +530,27 @@ class SecurityMonitor:
                 self.logger.debug(f"Skipping event from disabled log type: {log_type}")
                 return
             
-            # Ensure timestamp is in proper format
+            # Event times are kept as naive UTC, like the event store and window cutoffs
             if "timestamp" in event:
                 try:
-                    # First try ISO format
-                    event_time = datetime.fromisoformat(event['timestamp'].replace('Z', ''))
+                    event_time = self._get_timestamp_naive(event['timestamp'])
                 except ValueError:
-                    try:
-                        # Try format with comma in milliseconds
-                        event_time = datetime.strptime(event['timestamp'], '%Y-%m-%d %H:%M:%S,%f')
-                        # Convert to ISO format for consistency
-                        event['timestamp'] = event_time.isoformat()
-                    except ValueError:
-                        try:
-                            # Try format with space instead of T
-                            timestamp = event['timestamp'].replace(' ', 'T')
-                            event_time = datetime.fromisoformat(timestamp.replace('Z', ''))
-                            # Convert to ISO format for consistency
-                            event['timestamp'] = event_time.isoformat()
-                        except ValueError:
-                            # If all else fails, use current time
-                            self.logger.warning(f"Could not parse timestamp: {event['timestamp']}")
-                            event_time = datetime.utcnow()
-                            event['timestamp'] = event_time.isoformat()
+                    # If all else fails, use current time
+                    self.logger.warning(f"Could not parse timestamp: {event['timestamp']}")
+                    event_time = datetime.utcnow()
             else:
                 # Add timestamp if not present
                 event_time = datetime.utcnow()
-                event['timestamp'] = event_time.isoformat()
+            # Rewrite as ISO with an explicit UTC offset so it is not re-read as local time
+            event['timestamp'] = event_time.replace(tzinfo=timezone.utc).isoformat()
             
             # Store event for historical analysis
-            self._historical_events.append(event)
-            self._cleanup_old_events()
+            if self.event_store is not None:
+                self.event_store.record(event, event_time)
+            else:
+                self._historical_events.append(event)
+                self._cleanup_old_events()
+            window_counts = await self._get_window_counts(event)
             
             # Special processing for error log types
             if log_type == 'error':
@@ -559,13 +573,13 @@ class SecurityMonitor:
                 self.logger.info(f"Error pattern detected in module {error_module}: {error_message[:100]}...")
                 
                 # Check if we should send error alerts
-                should_alert = self._should_send_alert(event)
+                should_alert = self._should_send_alert(event, window_counts)
                 
                 if should_alert:
                     self.logger.info(f"Alert condition met for error in module {error_module}. Sending error alert...")
                     
                     # Prepare error alert data
-                    error_data = self._prepare_error_alert_data(event)
+                    error_data = self._prepare_error_alert_data(event, window_counts)
                     
                     # Send error alert with the dedicated function
                     await self._send_error_alert(error_data)
@@ -576,13 +590,16 @@ class SecurityMonitor:
             
             # Process regular security events (not errors)
             # Update class-level counters based on event type
+            # (per-IP counts come from the event store when one is attached)
             if event_type == "unauthorized_access" and 'security' in self.alert_config.enabled_logs:
-                SecurityMonitor._ip_failure_counts[client_ip] += 1
+                if window_counts is None:
+                    SecurityMonitor._ip_failure_counts[client_ip] += 1
                 SecurityMonitor._error_count += 1
                 SecurityMonitor._endpoint_attempts[endpoint] += 1
                 
                 # Log the updated counts
-                self.logger.info(f"Updated counters for {client_ip}: {SecurityMonitor._ip_failure_counts[client_ip]} failures")
+                ip_failures = window_counts["ip_failures"] if window_counts is not None else SecurityMonitor._ip_failure_counts[client_ip]
+                self.logger.info(f"Updated counters for {client_ip}: {ip_failures} failures")
                 
             elif event_type == "rate_limit_violation" and 'rate_limit' in self.alert_config.enabled_logs:
                 SecurityMonitor._rate_limit_violations[endpoint] += 1
@@ -591,13 +608,13 @@ class SecurityMonitor:
                 self.logger.info(f"Updated rate limit violations for {endpoint}: {SecurityMonitor._rate_limit_violations[endpoint]}")
             
             # Check if we should send alerts
-            should_alert = self._should_send_alert(event)
+            should_alert = self._should_send_alert(event, window_counts)
             
             if should_alert:
                 self.logger.info(f"Alert condition met for {event_type} from {client_ip}. Sending email alert...")
                 
                 # Prepare alert data with additional context
-                alert_data = self._prepare_alert_data(event)
+                alert_data = self._prepare_alert_data(event, window_counts)
                 
                 # Send the alert
                 await self.send_alerts(alert_data)
@@ -682,7 +699,7 @@ class SecurityMonitor:
                                 alert_type=f"error_{error_data.get('error_type', 'unknown').lower().replace(' ', '_')}"
                             )
                         
-                        self.last_alert_time = datetime.now()
+                        self.last_alert_time = datetime.utcnow()
                         self.logger.info(f"Setting last_alert_time to {self.last_alert_time}")
                         return
                     else:
@@ -720,9 +737,14 @@ class SecurityMonitor:
             self.logger.error(f"Error in _send_error_alert: {str(e)}")
             self.logger.error(traceback.format_exc())
 
-    def _prepare_alert_data(self, event: Dict[str, Any]) -> Dict[str, Any]:
+    def _prepare_alert_data(
+            self,
+            event: Dict[str, Any],
+            window_counts: Optional[Dict[str, int]] = None
+        ) -> Dict[str, Any]:
         """Prepare comprehensive alert data including historical analysis."""
-        self._cleanup_old_events()
+        if window_counts is None:
+            self._cleanup_old_events()
         
         # Start with the original event
         alert_data = dict(event)
@@ -730,25 +752,34 @@ class SecurityMonitor:
         # Add current time
         alert_data["alert_time"] = datetime.utcnow().isoformat()
         
-        # Count total attempts in the time window
-        total_attempts = len(self._historical_events)
-        
         # Get endpoint statistics
         endpoint_stats = dict(self._endpoint_attempts)
-        
-        # Analyze attack pattern
-        attack_pattern = self._analyze_attack_pattern(event)
-        
-        # Get the current endpoint's attempt count
         current_endpoint = event.get('path', 'unknown')
-        endpoint_attempt_count = self._endpoint_attempts.get(current_endpoint, 0)
-        
-        # Get IP failure count
         client_ip = event.get('client_ip', 'unknown')
-        ip_failure_count = SecurityMonitor._ip_failure_counts.get(client_ip, 0)
         
-        # Get rate limit violations for the endpoint
-        rate_limit_violations = SecurityMonitor._rate_limit_violations.get(current_endpoint, 0)
+        if window_counts is not None:
+            total_attempts = window_counts["total_events"]
+            endpoint_attempt_count = window_counts["endpoint_attempts"]
+            ip_failure_count = window_counts["ip_failures"]
+            rate_limit_violations = window_counts["rate_limit_violations"]
+        else:
+            # Count total attempts in the time window
+            total_attempts = len(self._historical_events)
+            
+            # Get the current endpoint's attempt count
+            endpoint_attempt_count = self._endpoint_attempts.get(current_endpoint, 0)
+            
+            # Get IP failure count
+            ip_failure_count = SecurityMonitor._ip_failure_counts.get(client_ip, 0)
+            
+            # Get rate limit violations for the endpoint
+            rate_limit_violations = SecurityMonitor._rate_limit_violations.get(current_endpoint, 0)
+        
+        # Analyze attack pattern
+        attack_pattern = self._analyze_attack_pattern(
+            event,
+            endpoint_attempt_count if window_counts is not None else None
+        )
         
         # Add statistics
         alert_data["total_unauthorized_attempts"] = total_attempts
@@ -779,7 +810,9 @@ class SecurityMonitor:
                 self._get_timestamp_naive(e.get('timestamp')).replace(tzinfo=None) > error_cutoff_time
             ]
             
-            alert_data["recent_error_count"] = len(recent_errors)
+            alert_data["recent_error_count"] = (
+                window_counts["recent_errors"] if window_counts is not None else len(recent_errors)
+            )
             alert_data["error_window_minutes"] = error_window_minutes
             
             # Include most common error types
@@ -793,11 +826,15 @@ class SecurityMonitor:
         
         return alert_data
 
-    def _should_send_alert(self, event: Dict[str, Any]) -> bool:
-        """Determine if an alert should be sent based on the event and cooldown."""
+    def _should_send_alert(self, event: Dict[str, Any], window_counts: Optional[Dict[str, int]] = None) -> bool:
+        """
+        Determine if an alert should be sent based on the event and cooldown.
+
+        ``window_counts`` (from the event store) replace the in-memory counters when given.
+        """
         try:
             # Check if we're in cooldown period
-            if datetime.now() - self.last_alert_time < self.alert_cooldown:
+            if datetime.utcnow() - self.last_alert_time < self.alert_cooldown:
                 self.logger.debug("Still in cooldown period, not sending alert")
                 return False
             
@@ -811,20 +848,25 @@ class SecurityMonitor:
                 self.logger.debug(f"Log type {log_type} not enabled for alerts")
                 return False
             
+            if window_counts is not None:
+                ip_count = window_counts["ip_failures"]
+                violations = window_counts["rate_limit_violations"]
+            else:
+                ip_count = SecurityMonitor._ip_failure_counts[client_ip]
+                violations = SecurityMonitor._rate_limit_violations[endpoint]
+            
             # Log more debug information to help track the issue
             self.logger.info(f"Checking alert conditions for {event_type} from {client_ip}")
-            self.logger.info(f"IP failure count: {SecurityMonitor._ip_failure_counts[client_ip]}, threshold: {self.alert_config.unauthorized_access_threshold}")
-            self.logger.info(f"Rate limit violations for {endpoint}: {SecurityMonitor._rate_limit_violations[endpoint]}, threshold: {self.alert_config.rate_limit_threshold}")
+            self.logger.info(f"IP failure count: {ip_count}, threshold: {self.alert_config.unauthorized_access_threshold}")
+            self.logger.info(f"Rate limit violations for {endpoint}: {violations}, threshold: {self.alert_config.rate_limit_threshold}")
             
             # Check specific conditions based on event type
             if event_type == "unauthorized_access" and 'security' in self.alert_config.enabled_logs:
-                ip_count = SecurityMonitor._ip_failure_counts[client_ip]
                 if ip_count >= self.alert_config.unauthorized_access_threshold:
                     self.logger.info(f"Alert condition met: IP {client_ip} has {ip_count} failures")
                     return True
                 
             elif event_type == "rate_limit_violation" and 'rate_limit' in self.alert_config.enabled_logs:
-                violations = SecurityMonitor._rate_limit_violations[endpoint]
                 if violations >= self.alert_config.rate_limit_threshold:
                     self.logger.info(f"Alert condition met: Endpoint {endpoint} has {violations} rate limit violations")
                     return True
@@ -839,11 +881,14 @@ class SecurityMonitor:
                 error_cutoff_time = current_time - timedelta(minutes=error_window_minutes)
                 
                 # Count recent errors within the time window
-                recent_error_count = sum(
-                    1 for event in self._historical_events
-                    if event.get('log_type') == 'error' and
-                    self._get_timestamp_naive(event.get('timestamp', '')) > error_cutoff_time
-                )
+                if window_counts is not None:
+                    recent_error_count = window_counts["recent_errors"]
+                else:
+                    recent_error_count = sum(
+                        1 for event in self._historical_events
+                        if event.get('log_type') == 'error' and
+                        self._get_timestamp_naive(event.get('timestamp', '')) > error_cutoff_time
+                    )
                 
                 self.logger.info(f"Recent error count: {recent_error_count}, threshold: {error_threshold}")
                 
@@ -954,7 +999,7 @@ class SecurityMonitor:
                                 alert_type=event_data['event_type']
                             )
                         
-                        self.last_alert_time = datetime.now()
+                        self.last_alert_time = datetime.utcnow()
                         self.logger.info(f"Setting last_alert_time to {self.last_alert_time}")
                         return
                     else:
@@ -1013,8 +1058,9 @@ class SecurityMonitor:
             self.logger.error(f"Error stopping security monitor: {str(e)}")
             raise
 
-# Create a global instance with default configuration
-monitor = SecurityMonitor()
+# Create a global instance with default configuration. When events are persisted
+# to MongoDB the store is attached at startup and log files are not re-read.
+monitor = SecurityMonitor(load_history=not settings.database.mongodb_security_events_enabled)
 
 async def main_async():
     """Async main entry point for the script."""
@@ -0,0 +1,102 @@
+"""
+Bounded in-process queue of background jobs.
+
+Request handlers submit coroutine factories that should not delay their
+response (diagnostics, warm-ups, notifications); a fixed number of worker
+tasks run them in submission order for the lifetime of the app. Submitting
+never blocks: it fails when the queue is full or not running, and the
+caller decides whether to run the job inline instead.
+"""
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, List, Optional
+from prometheus_client import Counter, Gauge, Histogram
+
+logger = logging.getLogger("background_jobs")
+
+Job = Callable[[], Awaitable[object]]
+
+BACKGROUND_JOBS = Counter(
+    "background_jobs_total",
+    "Background jobs by name and outcome (queued, rejected, succeeded, failed)",
+    ["job", "outcome"]
+)
+BACKGROUND_JOB_SECONDS = Histogram(
+    "background_job_seconds",
+    "Time from submission to completion of background jobs",
+    ["job"],
+    buckets=(0.1, 0.25, 0.5, 1, 2, 5, 10, 30, 60, 120, 300)
+)
+BACKGROUND_JOBS_QUEUED = Gauge(
+    "background_jobs_queued",
+    "Background jobs waiting for a worker"
+)
+
+
+class BackgroundJobQueue:
+    """
+    Args:
+        enabled: When False, ``submit`` always refuses and ``run`` returns immediately.
+        workers: Number of jobs run concurrently.
+        max_size: Jobs allowed to wait for a worker.
+    """
+
+    def __init__(self, enabled: bool = True, workers: int = 2, max_size: int = 100):
+        self.enabled = enabled
+        self.workers = workers
+        self.max_size = max_size
+        self._queue: Optional[asyncio.Queue] = None
+
+    @property
+    def running(self) -> bool:
+        return self._queue is not None
+
+    def submit(self, name: str, job: Job) -> bool:
+        """Queue ``job`` under ``name`` (used for logs and metrics). Returns False if it was not queued."""
+        if not (self.enabled and self.running):
+            return False
+        try:
+            self._queue.put_nowait((name, job, time.perf_counter()))
+        except asyncio.QueueFull:
+            BACKGROUND_JOBS.labels(job=name, outcome="rejected").inc()
+            logger.warning(f"Background job queue full, rejected '{name}'")
+            return False
+        BACKGROUND_JOBS.labels(job=name, outcome="queued").inc()
+        BACKGROUND_JOBS_QUEUED.set(self._queue.qsize())
+        return True
+
+    async def run(self) -> None:
+        """Run the workers. Meant to run as a background task for the lifetime of the app."""
+        if not self.enabled:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        tasks: List[asyncio.Task] = [asyncio.ensure_future(self._work()) for _ in range(self.workers)]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            self._queue = None
+            BACKGROUND_JOBS_QUEUED.set(0)
+
+    async def join(self) -> None:
+        """Wait until every queued job has finished."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def _work(self) -> None:
+        while True:
+            name, job, submitted = await self._queue.get()
+            BACKGROUND_JOBS_QUEUED.set(self._queue.qsize())
+            try:
+                await job()
+                BACKGROUND_JOBS.labels(job=name, outcome="succeeded").inc()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                BACKGROUND_JOBS.labels(job=name, outcome="failed").inc()
+                logger.error(f"Background job '{name}' failed: {e}")
+            finally:
+                BACKGROUND_JOB_SECONDS.labels(job=name).observe(time.perf_counter() - submitted)
+                self._queue.task_done()
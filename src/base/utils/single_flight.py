@@ -0,0 +1,72 @@
+"""
+Duplicate call suppression ("singleflight").
+
+When several coroutines ask for the same key at the same time, only the first
+one runs the underlying call; the others wait for it and receive the same
+result (or exception). Once the call finishes the key is forgotten, so this
+is not a cache: it only coalesces calls that overlap in time.
+
+The shared call runs in its own task. A waiter being cancelled does not
+cancel it for the others; it is only cancelled when every waiter has gone.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+from prometheus_client import Counter
+
+SINGLE_FLIGHT_COALESCED = Counter(
+    "single_flight_coalesced_total",
+    "Calls that joined an identical in-flight call instead of issuing their own",
+    ["name"]
+)
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls sharing a key into one execution.
+
+    Args:
+        name: Label of the coalesced-calls counter.
+    """
+
+    def __init__(self, name: str = "default"):
+        self.name = name
+        # key -> (shared task, number of waiters)
+        self._calls: Dict[Hashable, Tuple[asyncio.Task, int]] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``fn()`` unless a call for ``key`` is already in flight, then await its result."""
+        call = self._calls.get(key)
+        if call is None:
+            task = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda _: self._forget(key, task))
+            self._calls[key] = (task, 1)
+        else:
+            task, waiters = call
+            self._calls[key] = (task, waiters + 1)
+            SINGLE_FLIGHT_COALESCED.labels(name=self.name).inc()
+
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            self._leave(key, task)
+            raise
+
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running."""
+        return len(self._calls)
+
+    def _leave(self, key: Hashable, task: asyncio.Task) -> None:
+        call = self._calls.get(key)
+        if call is None or call[0] is not task:
+            return
+        waiters = call[1] - 1
+        if waiters > 0:
+            self._calls[key] = (task, waiters)
+        else:
+            del self._calls[key]
+            task.cancel()
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        call = self._calls.get(key)
+        if call is not None and call[0] is task:
+            del self._calls[key]
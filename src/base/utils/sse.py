@@ -0,0 +1,21 @@
+"""Server-Sent Events helpers."""
+
+import json
+from typing import Any, Optional
+
+
+def format_sse(data: Any, event: Optional[str] = None) -> str:
+    """
+    Format a single Server-Sent Events frame.
+
+    Args:
+        data: Payload, serialized as JSON on a single ``data:`` line.
+        event: Optional event name; clients receive unnamed frames as "message".
+
+    Returns:
+        str: The frame, terminated by the blank line that delimits events.
+    """
+    frame = f"data: {json.dumps(data)}\n\n"
+    if event:
+        frame = f"event: {event}\n{frame}"
+    return frame
@@ -0,0 +1,135 @@
+"""
+Bounded in-process LRU cache with per-entry time-to-live.
+
+This module provides a small, dependency-free cache used by the application
+for hot, per-worker data (agent blueprints, personality contexts, LLM
+responses, ...). Entries are evicted in least-recently-used order once the
+cache is full and are treated as misses once their TTL has elapsed.
+
+Expired entries are not dropped eagerly: they stay available through
+``peek_stale`` until they are overwritten or evicted, which lets callers
+revalidate a stale value cheaply instead of reloading it from scratch.
+
+The cache is not thread-safe; it is meant to be used from the event loop.
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, Iterator, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class TTLLRUCache(Generic[V]):
+    """
+    LRU cache with an optional time-to-live per entry.
+
+    Args:
+        max_size: Maximum number of entries kept in the cache.
+        ttl_seconds: Default lifetime of an entry. ``None`` disables expiry.
+        clock: Monotonic clock used for expiry (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        if max_size <= 0:
+            raise ValueError("max_size must be a positive integer")
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[V, Optional[float]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Optional[V] = None) -> Optional[V]:
+        """
+        Return a fresh value for ``key`` and mark it as recently used.
+
+        Expired entries count as misses but are kept for ``peek_stale``.
+        """
+        entry = self._entries.get(key, _MISSING)
+        if entry is _MISSING or self._is_expired(entry[1]):
+            self.misses += 1
+            return default
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def peek_stale(self, key: Hashable, default: Optional[V] = None) -> Optional[V]:
+        """
+        Return the stored value for ``key`` even if it has expired.
+
+        Does not update recency or hit/miss statistics.
+        """
+        entry = self._entries.get(key, _MISSING)
+        if entry is _MISSING:
+            return default
+        return entry[0]
+
+    def set(self, key: Hashable, value: V, ttl_seconds: Optional[float] = None) -> None:
+        """Store ``value`` under ``key``, evicting the oldest entries if needed."""
+        self._entries[key] = (value, self._expiry(ttl_seconds))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def touch(self, key: Hashable, ttl_seconds: Optional[float] = None) -> bool:
+        """Restart the lifetime of an existing entry. Returns False if absent."""
+        entry = self._entries.get(key, _MISSING)
+        if entry is _MISSING:
+            return False
+        self._entries[key] = (entry[0], self._expiry(ttl_seconds))
+        self._entries.move_to_end(key)
+        return True
+
+    def pop(self, key: Hashable, default: Optional[V] = None) -> Optional[V]:
+        """Remove ``key`` and return its value (expired or not)."""
+        entry = self._entries.pop(key, _MISSING)
+        if entry is _MISSING:
+            return default
+        return entry[0]
+
+    def values(self) -> Iterator[V]:
+        """Iterate over the stored values, expired or not."""
+        return (entry[0] for entry in self._entries.values())
+
+    def clear(self) -> None:
+        """Remove every entry. Statistics are kept."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the current fill level."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": (self.hits / lookups) if lookups else 0.0,
+        }
+
+    def _expiry(self, ttl_seconds: Optional[float]) -> Optional[float]:
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        return None if ttl is None else self._clock() + ttl
+
+    def _is_expired(self, expires_at: Optional[float]) -> bool:
+        return expires_at is not None and self._clock() >= expires_at
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key, _MISSING)
+        return entry is not _MISSING and not self._is_expired(entry[1])
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(size={len(self)}, max_size={self.max_size}, ttl={self.ttl_seconds})"
@@ -1,12 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, List
+from typing import Any, AsyncIterator, Dict, Optional, List
 from src.domains.agentverse.tools.base import ToolExecutionError
-from src.domains.agentverse.agents.personalities.utils.generate_personality_context import (
-    generate_personality_context,
+from src.domains.agentverse.caches.personality_context_cache import (
+    get_personality_context,
 )
+from src.base.config.config import settings
+from src.domains.agentverse.agents.utils.chat_memory import ChatMemory
+from src.domains.agentverse.agents.utils.conversation_summarizer import CONVERSATION_SUMMARIZER
 from src.domains.agentverse.entities.tools.tool_spec import ToolSpec
 from src.domains.agentverse.logging.logger import log_existencial_index
-from src.domains.agentverse.tools.base import BaseTool
+from src.domains.agentverse.tools.base import BaseTool, ToolResult
+from src.domains.agentverse.tools.executor import ToolCall, ToolExecutor
 import asyncio
 import logging
 
@@ -62,9 +66,23 @@ class BaseAgent(ABC):
         self.whitelist_users = whitelist_users
         self.blacklist_users = blacklist_users
         self.dna_sequence = dna_sequence
-        self.personality_context = generate_personality_context(personality)
+        # Identical for every agent with the same DNA and personality; generated once per worker
+        self.personality_context = get_personality_context(personality, dna_sequence)
+        self.memory: Optional[ChatMemory] = ChatMemory(
+            cache,
+            id,
+            max_entries=settings.agentverse.chat_memory_max_entries,
+            recent_entries=settings.agentverse.chat_memory_recent_entries,
+            ttl_seconds=settings.agentverse.chat_memory_ttl_seconds
+        ) if cache else None
         self.tool_specs: List[ToolSpec] = tools or []
         self.tools: Dict[str, BaseTool] = {}
+        # Shared by every run of this agent, so the concurrency cap is per agent
+        self.tool_executor = ToolExecutor(
+            self.tools,
+            max_concurrency=settings.agentverse.tool_max_concurrency,
+            timeout=settings.agentverse.tool_run_timeout_seconds
+        )
 
         # self.wallets = wallets  # ← attribute name matches below
         log_existencial_index(
@@ -76,6 +94,13 @@ class BaseAgent(ABC):
         """Process an input and return a response."""
         pass
 
+    async def respond_stream(self, user_input: str) -> AsyncIterator[str]:
+        """
+        Process an input and stream the response as text deltas.
+        Agents without a streaming implementation yield their full response once.
+        """
+        yield await self.respond(user_input)
+
     async def mark_spawned(self):
         self.spawned = True
         if self.cache:
@@ -86,6 +111,23 @@ class BaseAgent(ABC):
         if self.cache:
             await self.cache.delete(f"agent:{self.id}:spawned")
 
+    async def record_exchange(self, user_input: str, response: str) -> None:
+        """
+        Append an exchange to the conversation memory and let the background
+        summarizer fold older turns once the conversation grows long.
+        """
+        if self.memory:
+            length = await self.memory.append({"user": user_input}, {"agent": response})
+            CONVERSATION_SUMMARIZER.submit(self, length)
+
+    async def run_tools(self, calls: List[ToolCall], timeout: Optional[float] = None) -> Dict[str, ToolResult]:
+        """
+        Run tool calls concurrently, each as soon as the calls it depends on
+        have finished. Returns every call's result keyed by call id, including
+        the failed, skipped and timed out ones.
+        """
+        return await self.tool_executor.run(calls, timeout=timeout)
+
     async def remember(self, key: str, value: Any):
         if self.cache:
             await self.cache.set(f"agent:{self.id}:{key}", value)
@@ -2,7 +2,7 @@
 
 from src.domains.agentverse.agents.base import BaseAgent
 from src.domains.agentverse.registries.registries import agent_registry_instance
-import json
+from typing import AsyncIterator
 @agent_registry_instance.register(
     name="chat",
     description="Conversational agent that responds with a friendly tone and stores short-term memory.",
@@ -14,48 +14,52 @@ import json
 )
 class ChatAgent(BaseAgent):
     async def respond(self, user_input: str) -> str:
-        memory_key = f"{self.id}_memory"
-        history = []
+        history = await self._load_history(user_input)
+
+        response = await self.llm.generate_async(
+            prompt=self._composed_prompt(),
+            user_input=user_input,
+            history=history
+        )
 
-        # 🔒 Safely load history from Redis
-        if self.cache:
-            raw = await self.cache.get(memory_key)
-            try:
-                history = json.loads(raw) if raw else []
-            except json.JSONDecodeError:
-                history = []
+        await self._save_history(user_input, response)
 
-            history.append({"user": user_input})
+        return response
 
-        # 🧠 Compose prompt with personality context
-        composed_prompt = f"{self.personality_context.strip()}\n\n{self.prompt.strip()}"
+    async def respond_stream(self, user_input: str) -> AsyncIterator[str]:
+        history = await self._load_history(user_input)
 
-        response = self.llm.generate(
-            prompt=composed_prompt,
+        parts = []
+        stream = self.llm.generate_stream(
+            prompt=self._composed_prompt(),
             user_input=user_input,
             history=history
         )
+        try:
+            async for delta in stream:
+                parts.append(delta)
+                yield delta
+        finally:
+            # Aborts the upstream generation if our consumer went away mid-stream
+            await stream.aclose()
 
-        # 🔐 Safely save updated history
-        if self.cache:
-            history.append({"agent": response})
-            await self.cache.set(memory_key, json.dumps(history))
+        # 🧩 Only complete replies are stored in memory
+        await self._save_history(user_input, "".join(parts))
 
-        return response
-    
-    
-    async def _update_memory(self, memory_key, entry):
-        MAX_RAW_TURNS = 10
-
-        history = await self.cache.get(memory_key) or []
-        history.append(entry)
-        # If too long, compress the oldest turns
-        if len(history) > MAX_RAW_TURNS * 2:
-            # Summarize the first half, keep the second half raw
-            raw_to_summarize = history[:MAX_RAW_TURNS]
-            summary = await self.tools["summarize"].execute(
-                text="\\n".join(f"{m['user'] if 'user' in m else m['agent']}" for m in raw_to_summarize),
-                style="bullets"
-            )
-            history = [{"summary": summary.result}] + history[MAX_RAW_TURNS:]
-        await self.cache.set(memory_key, history)
+    async def _load_history(self, user_input: str) -> list:
+        history = []
+
+        # 🔒 Recent turns only, from the capped Redis list
+        if self.memory:
+            history = await self.memory.recent()
+            history.append({"user": user_input})
+
+        return history
+
+    def _composed_prompt(self) -> str:
+        # 🧠 Compose prompt with personality context
+        return f"{self.personality_context.strip()}\n\n{self.prompt.strip()}"
+
+    async def _save_history(self, user_input: str, response: str) -> None:
+        # 🔐 Append this exchange; older turns are summarized in the background
+        await self.record_exchange(user_input, response)
@@ -1,10 +1,7 @@
 import uuid
-import inspect
 from typing import Any, Callable, List
 from dataclasses import dataclass
 from fastapi import Request
-import re
-import unicodedata
 from src.domains.agentverse.entities.agent import (
     Agent,
     AgentConfig,
@@ -14,9 +11,11 @@ from src.domains.agentverse.entities.db import (
     DBAgentPost
 )
 from src.domains.agentverse.agents.base import BaseAgent
+from src.domains.agentverse.caches.personality_context_cache import PERSONALITY_CONTEXTS
 from src.domains.agentverse.logging.logger import log_evangelion_bay
 from src.domains.agentverse.registries import tool_registry_instance as tool_registry
 from src.domains.agentverse.entities.tools.tool_spec import ToolSpec
+from src.domains.agentverse.utils.to_system_name import to_system_name
 
 import logging
 
@@ -112,6 +111,13 @@ class AgentFactory:
         agent_cognitive_resources = self._resolve_components(request, db_agent)
         log_evangelion_bay(f"[⚙️ EVA CONSTRUCTION] Core assembly in progress for '{db_agent.agent_name}'")
         agent_class = self.get_agent_class(db_agent.agent_type)
+        # Reuse the context stored with the blueprint instead of regenerating it
+        PERSONALITY_CONTEXTS.seed(
+            db_agent.agent_personality,
+            db_agent.agent_dna_sequence,
+            db_agent.agent_personality_context,
+            db_agent.agent_personality_fingerprint
+        )
 
         agent_config = BaseAgentConfig(
             id=db_agent.agent_id,
@@ -186,60 +192,28 @@ class AgentFactory:
         Given a freshly created agent and its list of ToolSpec,
         instantiate each BaseTool with exactly the deps it needs,
         then shove it into agent.tools[name].
+
+        The deps and config class of each tool come from the plan compiled
+        when the tool was registered (see ToolPlan).
         """
+        # common names you want available:
+        candidates = {
+            "llm":        agent.llm,
+            "vectordb":   agent.vectordb,
+            "cache":      agent.cache,
+            "db":         agent.db,
+            "commbridge": agent.commbridge,
+            "messaging":  agent.messaging,
+        }
         for spec in specs:
-            # 1) Lookup the tool class
-            tool_cls = tool_registry.get(spec.name)
-
-            # 2) Merge default config with any overrides
-            default_cfg = tool_cls.Config()
-            merged_cfg  = default_cfg.copy(update=spec.config or {})
-
-            # 3) Figure out which of the agent’s attributes to pass in:
-            sig = inspect.signature(tool_cls.__init__)
-            init_args = {}
-            # common names you want available:
-            candidates = {
-                "llm":        agent.llm,
-                "vectordb":   agent.vectordb,
-                "cache":      agent.cache,
-                "db":         agent.db,
-                "commbridge": agent.commbridge,
-                "messaging":  agent.messaging,
-            }
-            for name, dep in candidates.items():
-                if name in sig.parameters:
-                    init_args[name] = dep
-
-            # always include the merged config
-            init_args["config"] = merged_cfg
-
-            # 4) instantiate and register
-            tool = tool_cls(**init_args)
-            agent.tools[spec.name] = tool
+            plan = tool_registry.plan(spec.name)
+            # default config merged with any overrides
+            config = plan.config(spec.config)
+            agent.tools[spec.name] = plan.build(candidates, config=config)
 
     def to_system_name(self, name: str) -> str:
         """
         Normalize and convert a human-readable agent name to a clean, system-friendly identifier.
-
-        Steps:
-        - Normalize Unicode characters to ASCII (NFKD)
-        - Remove non-alphanumeric characters except spaces
-        - Replace spaces with underscores
-        - Lowercase everything
-
-        Example:
-            "Ingvar Kamprád!" → "ingvar_kamprad"
-            "  Customized EVA  " → "customized_eva"
+        See ``src.domains.agentverse.utils.to_system_name``.
         """
-        # Normalize to NFKD form and strip diacritics
-        normalized = unicodedata.normalize("NFKD", name)
-        ascii_str = normalized.encode("ascii", "ignore").decode("ascii")
-
-        # Remove unwanted symbols (keep letters, numbers, and spaces)
-        cleaned = re.sub(r"[^a-zA-Z0-9 ]+", "", ascii_str)
-
-        # Replace spaces with underscores and lower the case
-        system_name = cleaned.strip().lower().replace(" ", "_")
-        
-        return system_name
\ No newline at end of file
+        return to_system_name(name)
@@ -1,7 +1,6 @@
 from src.domains.agentverse.agents.base import BaseAgent
 from src.domains.agentverse.registries.registries import agent_registry_instance
 import logging
-import json
 logger = logging.getLogger("agentverse.ingvar")
 
 @agent_registry_instance.register(
@@ -21,32 +20,24 @@ class IngvarKampradAgent(BaseAgent):
         self.memory_key = f"{self.id}_summary_memory"
 
     async def respond(self, user_input: str) -> str:
-        memory_key = f"{self.id}_memory"
         history = []
 
-        # 🔒 Safely load history from Redis
-        if self.cache:
-            raw = await self.cache.get(memory_key)
-            try:
-                history = json.loads(raw) if raw else []
-            except json.JSONDecodeError:
-                history = []
-
+        # 🔒 Recent turns only, from the capped Redis list
+        if self.memory:
+            history = await self.memory.recent()
             history.append({"user": user_input})
 
         # 🧠 Compose prompt with personality context
         composed_prompt = f"{self.personality_context.strip()}\n\n{self.prompt.strip()}"
 
-        response = self.llm.generate(
+        response = await self.llm.generate_async(
             prompt=composed_prompt,
             user_input=user_input,
             history=history
         )
 
-        # 🔐 Safely save updated history
-        if self.cache:
-            history.append({"agent": response})
-            await self.cache.set(memory_key, json.dumps(history))
+        # 🔐 Append this exchange; earlier turns are never rewritten
+        await self.record_exchange(user_input, response)
 
         return response
 
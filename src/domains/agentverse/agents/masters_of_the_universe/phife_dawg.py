@@ -1,7 +1,6 @@
 from src.domains.agentverse.agents.base import BaseAgent
 from src.domains.agentverse.registries.registries import agent_registry_instance
 import logging
-import json
 logger = logging.getLogger("agentverse.phife")
 
 @agent_registry_instance.register(
@@ -23,30 +22,25 @@ class PhifeDawgAgent(BaseAgent):
 
     async def respond(self, user_input: str) -> str:
         """
-        Responds with a lyrical style and stores a rolling history of recent bars.
+        Responds with a lyrical style and keeps a rolling history of recent bars.
         """
-        history_key = f"{self.id}_memory"
         history = []
 
-        if self.cache:
-            raw_history = await self.cache.get(history_key)
-            if raw_history:
-                history = json.loads(raw_history)
+        # 🔒 Recent turns only, from the capped Redis list
+        if self.memory:
+            history = await self.memory.recent()
             history.append({"user": user_input})
 
         # Combine the personality context with the existing prompt
         composed_prompt = f"{self.personality_context.strip()}\n\n{self.prompt.strip()}"
 
-        response = self.llm.generate(
+        response = await self.llm.generate_async(
             prompt=composed_prompt,
             user_input=user_input,
             history=history
         )
 
-        if self.cache:
-            history.append({"phife": response})
-            # ✅ Serialize before saving
-            await self.cache.set(history_key, json.dumps(history))
+        # 🔐 Append this exchange; earlier turns are never rewritten
+        await self.record_exchange(user_input, response)
 
         return response
-
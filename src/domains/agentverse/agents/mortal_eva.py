@@ -14,26 +14,22 @@ from src.domains.agentverse.registries.registries import agent_registry_instance
 )
 class ChatAgent(BaseAgent):
     async def respond(self, user_input: str) -> str:
-        memory_key = f"{self.id}_memory"
         history = []
 
-        if self.cache:
-            history = await self.cache.get(memory_key) or []
+        if self.memory:
+            history = await self.memory.recent()
             history.append({"user": user_input})
-            self.cache.set(memory_key, history)
 
         # Combine personality context with the existing prompt
         combined_prompt = f"{self.personality_context}\n{self.prompt}" if self.personality_context else self.prompt
 
         # Generate response using the combined prompt
-        response = self.llm.generate(
+        response = await self.llm.generate_async(
             prompt=combined_prompt,
             user_input=user_input,
             history=history
         )
 
-        if self.cache:
-            history.append({"agent": response})
-            self.cache.set(memory_key, history)
+        await self.record_exchange(user_input, response)
 
         return response
@@ -0,0 +1,127 @@
+import asyncio
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger("agentverse.chat_memory")
+
+
+class ChatMemory:
+    """
+    Conversation memory of an agent, stored as a capped Redis list with one
+    JSON entry per turn (``{"user": ...}``, ``{"agent": ...}`` or
+    ``{"summary": ...}``).
+
+    Appending a turn is a single pipelined RPUSH + LTRIM, so it costs the
+    size of the turn rather than of the whole conversation, the list never
+    grows past ``max_entries`` and concurrent messages cannot overwrite each
+    other's turns. Recent history is read with one LRANGE.
+
+    Older turns are folded by the conversation summarizer into a summary kept
+    under its own key; ``recent`` returns it as a leading ``{"summary": ...}``
+    entry, ahead of the turns that were not summarized yet.
+
+    Conversations stored by earlier versions as a single JSON blob under
+    ``<agent_id>_memory`` are moved into the list the first time they are
+    read.
+    """
+
+    def __init__(
+        self,
+        cache: Any,
+        agent_id: str,
+        max_entries: int = 200,
+        recent_entries: int = 50,
+        ttl_seconds: Optional[int] = None
+    ):
+        self.cache = cache
+        self.key = f"agent:{agent_id}:turns"
+        self.summary_key = f"agent:{agent_id}:summary"
+        self.legacy_key = f"{agent_id}_memory"
+        self.max_entries = max_entries
+        self.recent_entries = recent_entries
+        self.ttl_seconds = ttl_seconds
+
+    async def recent(self, count: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Return the newest ``count`` entries (``recent_entries`` by default),
+        oldest first, preceded by the summary of earlier turns if there is one.
+        """
+        count = count or self.recent_entries
+        raw, summary = await asyncio.gather(
+            self.cache.lrange(self.key, -count, -1),
+            self.cache.get(self.summary_key)
+        )
+        if raw:
+            history = [entry for entry in map(self._decode, raw) if entry is not None]
+        else:
+            history = (await self._migrate_legacy())[-count:]
+        return [{"summary": summary}] + history if summary else history
+
+    async def turns(self) -> List[Dict[str, Any]]:
+        """Every stored entry, oldest first, without the summary."""
+        raw = await self.cache.lrange(self.key, 0, -1)
+        return [entry for entry in map(self._decode, raw) if entry is not None]
+
+    async def summary(self) -> Optional[str]:
+        return await self.cache.get(self.summary_key)
+
+    async def append(self, *entries: Dict[str, Any]) -> int:
+        """
+        Append turns, in order, trimming the oldest beyond ``max_entries``.
+        Returns the length of the list after the append.
+        """
+        return await self.cache.rpush(
+            self.key,
+            [json.dumps(entry) for entry in entries],
+            max_length=self.max_entries,
+            expiration=self.ttl_seconds
+        )
+
+    async def compact(self, summary: str, count: int, head: Dict[str, Any]) -> bool:
+        """
+        Replace the ``count`` oldest entries, the first of which was ``head``,
+        with ``summary``.
+
+        Turns appended meanwhile are kept, since only the left of the list is
+        trimmed. Nothing is changed if the list was capped in the meantime and
+        no longer starts with ``head``; the check, the summary and the trim
+        are applied atomically, so an append cannot slip in between.
+        """
+        # Entries are stored as json.dumps of the decoded dicts, so re-encoding gives the stored value
+        return await self.cache.compact_list(
+            self.key,
+            json.dumps(head),
+            count,
+            self.summary_key,
+            summary,
+            expiration=self.ttl_seconds
+        )
+
+    async def clear(self) -> None:
+        await self.cache.delete(self.key)
+        await self.cache.delete(self.summary_key)
+
+    async def _migrate_legacy(self) -> List[Dict[str, Any]]:
+        raw = await self.cache.get(self.legacy_key)
+        if not raw:
+            return []
+        try:
+            history = json.loads(raw)
+        except (TypeError, ValueError):
+            history = []
+        history = [entry for entry in history if isinstance(entry, dict)] if isinstance(history, list) else []
+
+        # Only the request that deletes the blob moves it, so turns are not duplicated
+        if await self.cache.delete(self.legacy_key) and history:
+            await self.append(*history)
+            logger.info(f"Migrated {len(history)} memory entries from '{self.legacy_key}' to '{self.key}'")
+        return history
+
+    @staticmethod
+    def _decode(raw: Any) -> Optional[Dict[str, Any]]:
+        try:
+            entry = json.loads(raw)
+        except (TypeError, ValueError):
+            return None
+        return entry if isinstance(entry, dict) else None
@@ -0,0 +1,211 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Set
+from prometheus_client import Counter
+from src.base.infrastructure.ai.llm_metrics import llm_call_labels
+from src.base.infrastructure.ai.llm_scheduler import llm_scheduling
+from src.base.infrastructure.ai.tokenizer import Tokenizer, get_tokenizer
+
+logger = logging.getLogger("agentverse.conversation_summarizer")
+
+CONVERSATION_SUMMARIES = Counter(
+    "agentverse_conversation_summaries_total",
+    "Background conversation summarization passes by outcome "
+    "(summarized, under_threshold, locked, changed, failed)",
+    ["outcome"]
+)
+CONVERSATION_SUMMARY_SUBMISSIONS = Counter(
+    "agentverse_conversation_summary_submissions_total",
+    "Conversations offered to the summarizer by result (queued, rate_limited, pending, dropped)",
+    ["result"]
+)
+
+SUMMARY_PROMPT = (
+    "You maintain the long-term memory of a conversation between a user and an agent. "
+    "Merge the previous summary (if any) with the conversation excerpt into a single, "
+    "concise summary written in the third person. Keep names, facts, decisions, "
+    "preferences and open questions; drop greetings and repetition. "
+    "Reply with the summary only."
+)
+
+
+def _entry_text(entry: Dict[str, Any]) -> str:
+    return " ".join(str(value) for value in entry.values())
+
+
+def render_transcript(summary: Optional[str], entries: List[Dict[str, Any]]) -> str:
+    """The text handed to the model: the previous summary, then the turns to fold into it."""
+    lines = []
+    for entry in entries:
+        if "user" in entry:
+            lines.append(f"User: {entry['user']}")
+        elif "agent" in entry:
+            lines.append(f"Agent: {entry['agent']}")
+        elif "summary" in entry:
+            lines.append(f"Earlier summary: {entry['summary']}")
+    previous = summary or "(none)"
+    return f"Previous summary:\n{previous}\n\nConversation excerpt:\n" + "\n".join(lines)
+
+
+class ConversationSummarizer:
+    """
+    Folds the oldest turns of long conversations into a rolling summary,
+    off the request path.
+
+    Agents submit themselves after storing an exchange; the call only queues
+    the agent. A background task then checks whether the turns stored for
+    it exceed ``token_threshold`` and, if so, asks the agent's model (at
+    ``background`` priority) to merge everything but the newest
+    ``keep_entries`` into the existing summary, which ``ChatMemory``
+    returns ahead of the remaining turns.
+
+    Each agent is considered at most once every ``min_interval_seconds``:
+    in-process, and across workers through a Redis lock with the same
+    lifetime.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        token_threshold: int = 2000,
+        keep_entries: int = 20,
+        min_interval_seconds: float = 60.0,
+        max_summary_tokens: int = 300,
+        queue_size: int = 1000,
+        tokenizer: Optional[Tokenizer] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.enabled = enabled
+        self.token_threshold = token_threshold
+        self.keep_entries = keep_entries
+        self.min_interval_seconds = min_interval_seconds
+        self.max_summary_tokens = max_summary_tokens
+        self.queue_size = queue_size
+        self.tokenizer = tokenizer or get_tokenizer()
+        self.clock = clock
+        self._queue: Optional[asyncio.Queue] = None
+        self._pending: Set[str] = set()
+        # agent_id -> last time it was considered, oldest first
+        self._last_run: "OrderedDict[str, float]" = OrderedDict()
+
+    def configure(self, **settings: Any) -> "ConversationSummarizer":
+        for name, value in settings.items():
+            if not hasattr(self, name):
+                raise AttributeError(f"Unknown summarizer setting '{name}'")
+            if name == "tokenizer" and value is None:
+                continue
+            setattr(self, name, value)
+        return self
+
+    @property
+    def running(self) -> bool:
+        return self._queue is not None
+
+    def submit(self, agent: Any, length: Optional[int] = None) -> bool:
+        """
+        Queue ``agent`` for a summarization check, never blocking. ``length``
+        is the size of its turn list, when known; conversations that are too
+        short to trim are not queued. Returns True if the agent was queued.
+        """
+        if not (self.enabled and self.running and getattr(agent, "memory", None)):
+            return False
+        if length is not None and length <= self.keep_entries:
+            return False
+        if agent.id in self._pending:
+            CONVERSATION_SUMMARY_SUBMISSIONS.labels(result="pending").inc()
+            return False
+        if self._rate_limited(agent.id):
+            CONVERSATION_SUMMARY_SUBMISSIONS.labels(result="rate_limited").inc()
+            return False
+        try:
+            self._queue.put_nowait(agent)
+        except asyncio.QueueFull:
+            CONVERSATION_SUMMARY_SUBMISSIONS.labels(result="dropped").inc()
+            return False
+        self._pending.add(agent.id)
+        CONVERSATION_SUMMARY_SUBMISSIONS.labels(result="queued").inc()
+        return True
+
+    async def run(self) -> None:
+        """Consume submitted agents. Meant to run as a background task for the lifetime of the app."""
+        if not self.enabled:
+            return
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        try:
+            while True:
+                agent = await self._queue.get()
+                try:
+                    await self.summarize(agent)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    CONVERSATION_SUMMARIES.labels(outcome="failed").inc()
+                    logger.warning(f"Summarizing the conversation of '{agent.id}' failed: {e}")
+                finally:
+                    self._pending.discard(agent.id)
+                    self._queue.task_done()
+        finally:
+            self._queue = None
+            self._pending.clear()
+
+    async def summarize(self, agent: Any) -> bool:
+        """
+        Run one summarization pass for ``agent``. Returns True if older turns
+        were replaced by a new summary.
+        """
+        memory = agent.memory
+        self._mark_run(agent.id)
+
+        entries = await memory.turns()
+        older = entries[:-self.keep_entries] if self.keep_entries else entries
+        tokens = sum(self.tokenizer.count(_entry_text(entry)) for entry in entries)
+        if not older or tokens < self.token_threshold:
+            CONVERSATION_SUMMARIES.labels(outcome="under_threshold").inc()
+            return False
+
+        lock_seconds = max(1, int(self.min_interval_seconds))
+        if not await memory.cache.setnx(f"agent:{agent.id}:summarizing", "1", expiration=lock_seconds):
+            CONVERSATION_SUMMARIES.labels(outcome="locked").inc()
+            return False
+
+        transcript = render_transcript(await memory.summary(), older)
+        with llm_scheduling(priority="background"), llm_call_labels(agent_type=agent.type, caller="conversation_summary"):
+            summary = await agent.llm.generate_async(
+                prompt=SUMMARY_PROMPT,
+                user_input=transcript,
+                history=[],
+                max_tokens=self.max_summary_tokens,
+                cache=False
+            )
+
+        if not summary or not await memory.compact(summary.strip(), len(older), older[0]):
+            CONVERSATION_SUMMARIES.labels(outcome="changed").inc()
+            return False
+        CONVERSATION_SUMMARIES.labels(outcome="summarized").inc()
+        logger.info(f"Summarized {len(older)} entries ({tokens} tokens) of the conversation of '{agent.id}'")
+        return True
+
+    def _rate_limited(self, agent_id: str) -> bool:
+        last = self._last_run.get(agent_id)
+        return last is not None and self.clock() - last < self.min_interval_seconds
+
+    def _mark_run(self, agent_id: str) -> None:
+        now = self.clock()
+        self._last_run[agent_id] = now
+        self._last_run.move_to_end(agent_id)
+        # Entries past the interval no longer limit anything
+        while self._last_run:
+            oldest_id, last = next(iter(self._last_run.items()))
+            if now - last < self.min_interval_seconds:
+                break
+            self._last_run.popitem(last=False)
+
+
+CONVERSATION_SUMMARIZER = ConversationSummarizer()
+
+
+def configure_conversation_summarizer(**settings: Any) -> ConversationSummarizer:
+    """Return the process-wide summarizer with ``settings`` applied."""
+    return CONVERSATION_SUMMARIZER.configure(**settings)
@@ -1,4 +1,5 @@
 from typing import Optional
+from src.domains.agentverse.caches.agent_pool import AgentPool
 from src.domains.agentverse.entities.db import DBAgentPost
 import logging
 logger = logging.getLogger(__name__)
@@ -8,27 +9,23 @@ async def get_or_spawn_agent(
     agent_id: str,
     db_service,
     agent_service,
-    cache,
-    agent_registry: Optional[dict] = None
+    agent_pool: Optional[AgentPool] = None
 ):
-    agent_key = f"agent:{agent_id}:spawned"
+    """
+    Return the live agent for ``agent_id``: from the worker's agent pool when
+    it holds one, otherwise built from its blueprint (and pooled).
+    """
+    async def build():
+        agent_data = await db_service.find_chat_agent(request, agent_id)
+        db_agent = DBAgentPost(**agent_data)
+        # The factory marks the agent as spawned
+        return await agent_service.build_agent(request=request, db_agent=db_agent)
 
-    # Check if agent is already marked as spawned in Redis
-    spawned_val = await cache.get(agent_key)
-    is_spawned = spawned_val == "true"
-
-    # Optional: check in local memory agent registry
-    if is_spawned and agent_registry and agent_id in agent_registry:
-        return agent_registry[agent_id]
-
-    # If not found or not spawned, build from DB
-    agent_data = await db_service.find_chat_agent(request, agent_id)
-    db_agent = DBAgentPost(**agent_data)
-    agent = await agent_service.build_agent(request=request, db_agent=db_agent)
-
-    # Mark as spawned in Redis and optionally store in memory
-    await agent.mark_spawned()
-    if agent_registry is not None:
-        agent_registry[agent_id] = agent
+    if agent_pool is None:
+        return await build()
 
+    agent = await agent_pool.get_or_build(agent_id, build)
+    if not agent.spawned:
+        # Put to sleep after its self test; wake it up rather than rebuilding it
+        await agent.mark_spawned()
     return agent
@@ -0,0 +1,226 @@
+import asyncio
+import logging
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from prometheus_client import Counter, Gauge
+
+logger = logging.getLogger("agentverse.agent_pool")
+
+AGENT_POOL_LOOKUPS = Counter(
+    "agentverse_agent_pool_lookups_total",
+    "Live agent pool lookups by result (hit, miss, joined)",
+    ["result"]
+)
+AGENT_POOL_EVICTIONS = Counter(
+    "agentverse_agent_pool_evictions_total",
+    "Live agents dropped from the pool by reason",
+    ["reason"]
+)
+AGENT_POOL_SIZE = Gauge(
+    "agentverse_agent_pool_agents",
+    "Number of live agents held in the pool"
+)
+AGENT_POOL_BYTES = Gauge(
+    "agentverse_agent_pool_bytes",
+    "Estimated memory held by the live agents in the pool"
+)
+
+AgentBuilder = Callable[[], Awaitable[Any]]
+
+# Clients and connections injected into every agent; shared, so not counted per agent
+SHARED_ATTRIBUTES = frozenset({"llm", "db", "cache", "vectordb", "commbridge", "messaging", "app"})
+
+
+def estimate_size(obj: Any, max_depth: int = 6) -> int:
+    """
+    Rough deep size of an agent in bytes: its own attributes, containers and
+    strings, without the shared clients listed in ``SHARED_ATTRIBUTES``.
+    """
+    seen = set()
+
+    def walk(value: Any, depth: int) -> int:
+        if id(value) in seen or depth > max_depth:
+            return 0
+        seen.add(id(value))
+        size = sys.getsizeof(value, 0)
+        if isinstance(value, (str, bytes, int, float, bool, type(None))):
+            return size
+        if isinstance(value, dict):
+            return size + sum(walk(k, depth + 1) + walk(v, depth + 1) for k, v in value.items())
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return size + sum(walk(item, depth + 1) for item in value)
+        attributes = getattr(value, "__dict__", None)
+        if isinstance(attributes, dict):
+            size += sum(
+                walk(v, depth + 1) for k, v in attributes.items() if k not in SHARED_ATTRIBUTES
+            )
+        return size
+
+    return walk(obj, 0)
+
+
+@dataclass
+class _PooledAgent:
+    agent: Any
+    size: int
+    created_at: float
+    last_used: float
+
+
+class AgentPool:
+    """
+    Bounded, per-worker LRU of live agent instances keyed by ``agent_id``.
+
+    Building an agent goes through the factory, the registries, tool
+    attachment and personality context generation; chat messages reuse the
+    live instance instead. Agents are dropped when idle for longer than
+    ``idle_ttl_seconds``, once older than ``max_age_seconds`` (so blueprint
+    edits made through another worker are picked up without change streams),
+    when their blueprint is invalidated, and in LRU order beyond
+    ``max_agents`` or ``max_memory_bytes``. A per-key lock ensures concurrent
+    messages for the same agent build it once.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        max_agents: int = 256,
+        max_memory_bytes: int = 256 * 1024 * 1024,
+        idle_ttl_seconds: float = 900.0,
+        max_age_seconds: float = 300.0,
+        blueprint_cache: Any = None,
+        sizeof: Callable[[Any], int] = estimate_size,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        if max_agents <= 0:
+            raise ValueError("max_agents must be a positive integer")
+        self.enabled = enabled
+        self.max_agents = max_agents
+        self.max_memory_bytes = max_memory_bytes
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self.max_age_seconds = max_age_seconds
+        self.sizeof = sizeof
+        self.clock = clock
+        self._entries: "OrderedDict[str, _PooledAgent]" = OrderedDict()
+        self._locks: Dict[str, List[Any]] = {}
+        self.total_bytes = 0
+        if blueprint_cache is not None:
+            blueprint_cache.add_invalidation_listener(self._on_blueprint_invalidated)
+
+    def get(self, agent_id: str) -> Optional[Any]:
+        """Return the live agent for ``agent_id`` if it is pooled and still fresh."""
+        entry = self._entries.get(agent_id)
+        if entry is None:
+            return None
+        now = self.clock()
+        if now - entry.last_used > self.idle_ttl_seconds:
+            self.evict(agent_id, reason="idle")
+            return None
+        if now - entry.created_at > self.max_age_seconds:
+            self.evict(agent_id, reason="max_age")
+            return None
+        entry.last_used = now
+        self._entries.move_to_end(agent_id)
+        return entry.agent
+
+    async def get_or_build(self, agent_id: str, build: AgentBuilder) -> Any:
+        """
+        Return the live agent for ``agent_id``, building it on a miss.
+
+        Args:
+            agent_id: The EVA's unique ID.
+            build: Coroutine function returning a ready agent.
+        """
+        if not self.enabled:
+            return await build()
+
+        agent = self.get(agent_id)
+        if agent is not None:
+            AGENT_POOL_LOOKUPS.labels(result="hit").inc()
+            return agent
+
+        # key -> [lock, number of coroutines using it]
+        slot = self._locks.get(agent_id)
+        if slot is None:
+            slot = self._locks[agent_id] = [asyncio.Lock(), 0]
+        slot[1] += 1
+        try:
+            async with slot[0]:
+                # Another message may have built it while we waited for the lock
+                agent = self.get(agent_id)
+                if agent is not None:
+                    AGENT_POOL_LOOKUPS.labels(result="joined").inc()
+                    return agent
+                AGENT_POOL_LOOKUPS.labels(result="miss").inc()
+                agent = await build()
+                self.put(agent_id, agent)
+                return agent
+        finally:
+            slot[1] -= 1
+            if slot[1] == 0:
+                del self._locks[agent_id]
+
+    def put(self, agent_id: str, agent: Any) -> None:
+        """Pool ``agent`` under ``agent_id``, evicting the least recently used agents if needed."""
+        if agent_id in self._entries:
+            self.evict(agent_id, reason="replaced")
+        now = self.clock()
+        entry = _PooledAgent(agent=agent, size=self.sizeof(agent), created_at=now, last_used=now)
+        self._entries[agent_id] = entry
+        self.total_bytes += entry.size
+        self._sweep_idle(now)
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_agents or self.total_bytes > self.max_memory_bytes
+        ):
+            oldest = next(iter(self._entries))
+            self.evict(oldest, reason="memory" if self.total_bytes > self.max_memory_bytes else "size")
+        self._update_gauges()
+
+    def evict(self, agent_id: str, reason: str = "invalidated") -> None:
+        """Drop the live agent for ``agent_id``, if any."""
+        entry = self._entries.pop(agent_id, None)
+        if entry is None:
+            return
+        self.total_bytes -= entry.size
+        AGENT_POOL_EVICTIONS.labels(reason=reason).inc()
+        self._update_gauges()
+
+    def clear(self, reason: str = "invalidated") -> None:
+        """Drop every live agent."""
+        for agent_id in list(self._entries):
+            self.evict(agent_id, reason=reason)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self._entries),
+            "max_agents": self.max_agents,
+            "bytes": self.total_bytes,
+            "max_memory_bytes": self.max_memory_bytes,
+        }
+
+    def _sweep_idle(self, now: float) -> None:
+        # Least recently used first: stop at the first agent still in use
+        while self._entries:
+            agent_id, entry = next(iter(self._entries.items()))
+            if now - entry.last_used <= self.idle_ttl_seconds:
+                return
+            self.evict(agent_id, reason="idle")
+
+    def _on_blueprint_invalidated(self, agent_id: Optional[str]) -> None:
+        if agent_id is None:
+            self.clear(reason="blueprint")
+        else:
+            self.evict(agent_id, reason="blueprint")
+
+    def _update_gauges(self) -> None:
+        AGENT_POOL_SIZE.set(len(self._entries))
+        AGENT_POOL_BYTES.set(self.total_bytes)
+
+    def __contains__(self, agent_id: str) -> bool:
+        return agent_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
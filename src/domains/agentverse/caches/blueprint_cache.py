@@ -0,0 +1,225 @@
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from prometheus_client import Counter, Gauge
+from pymongo.errors import PyMongoError
+from src.base.utils.ttl_lru_cache import TTLLRUCache
+from src.domains.agentverse.logging.logger import log_existencial_index
+
+logger = logging.getLogger("agentverse.blueprint_cache")
+
+BLUEPRINT_CACHE_LOOKUPS = Counter(
+    "agentverse_blueprint_cache_lookups_total",
+    "Agent blueprint cache lookups by result (hit, revalidated, miss)",
+    ["result"]
+)
+BLUEPRINT_CACHE_INVALIDATIONS = Counter(
+    "agentverse_blueprint_cache_invalidations_total",
+    "Agent blueprint cache invalidations by source",
+    ["source"]
+)
+BLUEPRINT_CACHE_SIZE = Gauge(
+    "agentverse_blueprint_cache_entries",
+    "Number of agent blueprints held in the in-process cache"
+)
+
+BlueprintLoader = Callable[[str], Awaitable[Optional[Dict[str, Any]]]]
+VersionLoader = Callable[[str], Awaitable[Optional[Any]]]
+# Called with the invalidated agent_id, or None when every blueprint is dropped
+InvalidationListener = Callable[[Optional[str]], None]
+
+
+async def supports_change_streams(motor_client) -> bool:
+    """
+    Change streams need a replica set (or a sharded cluster); a standalone
+    mongod rejects ``watch()``. Ask the server which topology it is part of.
+    """
+    try:
+        hello = await motor_client.admin.command("hello")
+    except PyMongoError as e:
+        logger.warning(f"Could not determine MongoDB topology, change streams disabled: {e}")
+        return False
+    return bool(hello.get("setName")) or hello.get("msg") == "isdbgrid"
+
+
+class AgentBlueprintCache:
+    """
+    Bounded, per-worker read-through cache of agent blueprints.
+
+    Blueprints are the raw ``coll_agents`` documents, keyed by ``agent_id``.
+    Entries are invalidated by a MongoDB change stream when one is available.
+    Otherwise, once an entry outlives its TTL, only its version field is
+    re-read; the full document is reloaded only when the version changed.
+    """
+
+    VERSION_FIELD = "modified"
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        max_size: int = 1024,
+        ttl_seconds: float = 300.0,
+        change_stream_enabled: bool = True,
+        change_stream_retry_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self._entries: TTLLRUCache[Dict[str, Any]] = TTLLRUCache(
+            max_size=max_size,
+            ttl_seconds=ttl_seconds,
+            clock=clock
+        )
+        # Mongo `_id` -> `agent_id`, needed because delete events only carry the `_id`
+        self._agent_ids_by_doc_id: Dict[str, str] = {}
+        self.enabled = enabled
+        self.change_stream_enabled = change_stream_enabled
+        self.change_stream_retry_seconds = change_stream_retry_seconds
+        self.change_stream_active = False
+        self._listeners: List[InvalidationListener] = []
+
+    def add_invalidation_listener(self, listener: InvalidationListener) -> None:
+        """Get notified when blueprints are invalidated, e.g. to drop objects built from them."""
+        self._listeners.append(listener)
+
+    async def get_or_load(
+        self,
+        agent_id: str,
+        load: BlueprintLoader,
+        load_version: VersionLoader
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return the blueprint for ``agent_id``, loading it on a miss.
+
+        Args:
+            agent_id: The EVA's unique ID.
+            load: Coroutine returning the full blueprint document (or None).
+            load_version: Coroutine returning only the blueprint's version value.
+
+        Returns:
+            A shallow copy of the cached blueprint, or None if it does not exist.
+        """
+        if not self.enabled:
+            return await load(agent_id)
+
+        blueprint = self._entries.get(agent_id)
+        if blueprint is not None:
+            BLUEPRINT_CACHE_LOOKUPS.labels(result="hit").inc()
+            return dict(blueprint)
+
+        stale = self._entries.peek_stale(agent_id)
+        if stale is not None and stale.get(self.VERSION_FIELD) is not None:
+            version = await load_version(agent_id)
+            if version is not None and version == stale.get(self.VERSION_FIELD):
+                self._entries.touch(agent_id)
+                BLUEPRINT_CACHE_LOOKUPS.labels(result="revalidated").inc()
+                return dict(stale)
+
+        BLUEPRINT_CACHE_LOOKUPS.labels(result="miss").inc()
+        blueprint = await load(agent_id)
+        if blueprint is None:
+            self.invalidate(agent_id, source="missing")
+            return None
+
+        self.put(agent_id, blueprint)
+        return dict(blueprint)
+
+    def put(self, agent_id: str, blueprint: Dict[str, Any]) -> None:
+        """Store a blueprint document under its ``agent_id``."""
+        self._entries.set(agent_id, blueprint)
+        if blueprint.get("_id") is not None:
+            self._agent_ids_by_doc_id[str(blueprint["_id"])] = agent_id
+        self._prune_doc_ids()
+        BLUEPRINT_CACHE_SIZE.set(len(self._entries))
+
+    def invalidate(self, agent_id: str, source: str = "local") -> None:
+        """Drop the cached blueprint for ``agent_id``, if any."""
+        blueprint = self._entries.pop(agent_id)
+        if blueprint is not None:
+            self._agent_ids_by_doc_id.pop(str(blueprint.get("_id")), None)
+            BLUEPRINT_CACHE_INVALIDATIONS.labels(source=source).inc()
+        BLUEPRINT_CACHE_SIZE.set(len(self._entries))
+        self._notify(agent_id)
+
+    def clear(self, source: str = "local") -> None:
+        """Drop every cached blueprint."""
+        self._entries.clear()
+        self._agent_ids_by_doc_id.clear()
+        BLUEPRINT_CACHE_INVALIDATIONS.labels(source=source).inc()
+        BLUEPRINT_CACHE_SIZE.set(0)
+        self._notify(None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss statistics of the underlying LRU, plus change stream state."""
+        return {
+            **self._entries.stats(),
+            "change_stream_active": self.change_stream_active,
+        }
+
+    async def watch(self, collection) -> None:
+        """
+        Consume the change stream of ``collection`` and invalidate entries as
+        blueprints are updated, replaced or deleted.
+
+        Returns immediately when change streams are disabled or unsupported,
+        leaving TTL + version checks as the only invalidation mechanism.
+        Meant to run as a background task for the lifetime of the app.
+        """
+        if not (self.enabled and self.change_stream_enabled):
+            return
+        if not await supports_change_streams(collection.database.client):
+            log_existencial_index("[🧠 BLUEPRINT CACHE] No replica set detected — falling back to TTL and version checks")
+            return
+
+        pipeline = [{"$match": {"operationType": {"$in": ["insert", "update", "replace", "delete", "drop", "invalidate"]}}}]
+        while True:
+            try:
+                async with collection.watch(pipeline, full_document="updateLookup") as stream:
+                    self.change_stream_active = True
+                    log_existencial_index(f"[🧠 BLUEPRINT CACHE] Watching '{collection.name}' for blueprint changes")
+                    async for change in stream:
+                        self.apply_change(change)
+            except asyncio.CancelledError:
+                raise
+            except PyMongoError as e:
+                logger.warning(f"Blueprint change stream interrupted, retrying in {self.change_stream_retry_seconds}s: {e}")
+                # Events may have been missed while the stream was down
+                self.clear(source="change_stream_reset")
+                await asyncio.sleep(self.change_stream_retry_seconds)
+            finally:
+                self.change_stream_active = False
+
+    def apply_change(self, change: Dict[str, Any]) -> None:
+        """Apply a single change stream event to the cache."""
+        operation = change.get("operationType")
+
+        if operation in ("drop", "invalidate"):
+            self.clear(source="change_stream")
+            return
+
+        full_document = change.get("fullDocument") or {}
+        agent_id = full_document.get("agent_id")
+        if agent_id is None:
+            doc_id = (change.get("documentKey") or {}).get("_id")
+            agent_id = self._agent_ids_by_doc_id.get(str(doc_id))
+
+        if agent_id is not None:
+            self.invalidate(agent_id, source="change_stream")
+
+    def _notify(self, agent_id: Optional[str]) -> None:
+        for listener in self._listeners:
+            try:
+                listener(agent_id)
+            except Exception as e:
+                logger.warning(f"Blueprint invalidation listener failed: {e}")
+
+    def _prune_doc_ids(self) -> None:
+        # Keep the reverse index bounded by the entries still held in the LRU
+        if len(self._agent_ids_by_doc_id) > 2 * self._entries.max_size:
+            self._agent_ids_by_doc_id = {
+                doc_id: agent_id
+                for doc_id, agent_id in self._agent_ids_by_doc_id.items()
+                if self._entries.peek_stale(agent_id) is not None
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
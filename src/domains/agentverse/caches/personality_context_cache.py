@@ -0,0 +1,100 @@
+import hashlib
+import json
+import logging
+from typing import Any, Dict, Hashable, Optional, Tuple
+from pydantic import BaseModel
+from prometheus_client import Counter
+from src.base.utils.ttl_lru_cache import TTLLRUCache
+from src.domains.agentverse.agents.personalities.utils.generate_personality_context import (
+    generate_personality_context
+)
+
+logger = logging.getLogger("agentverse.personality_context_cache")
+
+PERSONALITY_CONTEXT_LOOKUPS = Counter(
+    "agentverse_personality_context_lookups_total",
+    "Personality context lookups by result (hit, seeded, miss)",
+    ["result"]
+)
+
+
+def personality_fingerprint(personality: Any) -> str:
+    """
+    Content hash of a personality. The DNA sequence only covers the agent's
+    name, type and creator, so edited traits must change the cache key too.
+    """
+    if isinstance(personality, BaseModel):
+        payload = personality.model_dump_json()
+    else:
+        payload = json.dumps(personality, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class PersonalityContextCache:
+    """
+    Bounded, per-worker cache of generated personality contexts.
+
+    Generating a context walks every field of ``AgentSoulProtocol`` and
+    builds a prompt of several kilobytes; agents sharing a DNA sequence and
+    personality get the same text. Entries are keyed by DNA sequence and
+    personality fingerprint, and can be seeded from the context persisted
+    alongside the agent blueprint.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self._entries: TTLLRUCache[str] = TTLLRUCache(max_size=max_size)
+
+    def get(self, personality: Any, dna_sequence: Optional[str] = None) -> str:
+        """Return the personality context, generating it on a miss."""
+        key = self._key(personality, dna_sequence)
+        context = self._entries.get(key)
+        if context is not None:
+            PERSONALITY_CONTEXT_LOOKUPS.labels(result="hit").inc()
+            return context
+
+        PERSONALITY_CONTEXT_LOOKUPS.labels(result="miss").inc()
+        context = generate_personality_context(personality)
+        self._entries.set(key, context)
+        return context
+
+    def seed(
+        self,
+        personality: Any,
+        dna_sequence: Optional[str],
+        context: Optional[str],
+        fingerprint: Optional[str]
+    ) -> bool:
+        """
+        Reuse a persisted context, provided it was generated from the same
+        personality. Returns whether it was accepted.
+        """
+        if not context or not fingerprint:
+            return False
+        key = self._key(personality, dna_sequence)
+        if key[1] != fingerprint:
+            return False
+        if self._entries.get(key) is None:
+            self._entries.set(key, context)
+            PERSONALITY_CONTEXT_LOOKUPS.labels(result="seeded").inc()
+        return True
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return self._entries.stats()
+
+    @staticmethod
+    def _key(personality: Any, dna_sequence: Optional[str]) -> Tuple[Hashable, str]:
+        return dna_sequence, personality_fingerprint(personality)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+PERSONALITY_CONTEXTS = PersonalityContextCache()
+
+
+def get_personality_context(personality: Any, dna_sequence: Optional[str] = None) -> str:
+    """Personality context of ``personality``, from the worker's cache."""
+    return PERSONALITY_CONTEXTS.get(personality, dna_sequence)
@@ -0,0 +1,165 @@
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Deque, Optional
+from prometheus_client import Counter
+from src.base.config.config import settings
+from src.domains.agentverse.logging.logger import log_command_room as system_logger
+
+logger = logging.getLogger("agentverse.command_room")
+
+COMMAND_ROOM_LOG_LINES = Counter(
+    "agentverse_command_room_log_lines_total",
+    "Command room log lines emitted through batching, by result (sent, dropped)",
+    ["result"]
+)
+COMMAND_ROOM_FRAMES = Counter(
+    "agentverse_command_room_log_frames_total",
+    "Frames sent to sockets carrying batched command room log lines"
+)
+
+_emitter: ContextVar[Optional["BatchedEmitter"]] = ContextVar("command_room_emitter", default=None)
+
+
+def current_emitter(socket_id: str) -> Optional["BatchedEmitter"]:
+    """The emitter batching log lines for ``socket_id`` in the current operation, if any."""
+    emitter = _emitter.get()
+    if emitter is None or emitter.closed or emitter.socket_id != socket_id:
+        return None
+    return emitter
+
+
+class BatchedEmitter:
+    """
+    Coalesces the command room log lines of one operation into batched
+    frames for a single socket.
+
+    Lines are buffered and sent together ``flush_interval`` seconds after the
+    first one or as soon as ``max_batch`` are waiting, before any other
+    message to the same socket (so events never overtake the logs that
+    precede them) and when the operation ends. A
+    frame holding a single line is sent as the usual ``log`` message; larger
+    ones as ``{"type": "log_batch", "messages": [...]}``.
+
+    The buffer holds at most ``max_buffer`` lines: while a slow consumer
+    holds up a send, the oldest lines are dropped and the next frame reports
+    how many in ``dropped``.
+    """
+
+    def __init__(
+        self,
+        commandroom,
+        socket_id: str,
+        flush_interval: float = 0.005,
+        max_batch: int = 100,
+        max_buffer: int = 500
+    ):
+        self.commandroom = commandroom
+        self.socket_id = socket_id
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._buffer: Deque[str] = deque(maxlen=max_buffer)
+        self._dropped = 0
+        self._lock = asyncio.Lock()
+        self._flusher: Optional[asyncio.Task] = None
+        self._urgent = False
+        self._sending = False
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def log(self, message: str) -> None:
+        """Buffer a log line; never waits for the socket."""
+        system_logger(f"[🧠 Command Room → socket:{self.socket_id}] {message}")
+        if len(self._buffer) == self._buffer.maxlen:
+            self._dropped += 1
+            COMMAND_ROOM_LOG_LINES.labels(result="dropped").inc()
+        self._buffer.append(message)
+        if self._flusher is None:
+            self._schedule_flush()
+        elif len(self._buffer) >= self.max_batch and not (self._urgent or self._sending):
+            # A full batch goes out without waiting for the interval
+            self._flusher.cancel()
+            self._schedule_flush()
+
+    async def flush(self) -> None:
+        """Send every buffered line now."""
+        async with self._lock:
+            if not self._buffer:
+                return
+            messages, dropped = list(self._buffer), self._dropped
+            self._buffer.clear()
+            self._dropped = 0
+
+            if len(messages) == 1 and not dropped:
+                frame = {"type": "log", "message": messages[0]}
+            else:
+                frame = {"type": "log_batch", "messages": messages, "dropped": dropped}
+            try:
+                await self.commandroom.deliver(self.socket_id, frame, log=False)
+            except Exception as e:
+                COMMAND_ROOM_LOG_LINES.labels(result="dropped").inc(len(messages))
+                logger.warning(f"Could not deliver {len(messages)} log lines to socket {self.socket_id}: {e}")
+                return
+            COMMAND_ROOM_FRAMES.inc()
+            COMMAND_ROOM_LOG_LINES.labels(result="sent").inc(len(messages))
+
+    async def close(self) -> None:
+        """Flush what is left and stop batching."""
+        self._closed = True
+        flusher = self._flusher
+        if flusher is not None:
+            # A send in progress is awaited rather than cut short
+            if not self._sending:
+                flusher.cancel()
+            await flusher
+            self._flusher = None
+        await self.flush()
+
+    def _schedule_flush(self) -> None:
+        """Start the flusher; at most one is in flight, so a slow send never piles up tasks."""
+        self._urgent = len(self._buffer) >= self.max_batch
+        delay = 0 if self._urgent else self.flush_interval
+        self._flusher = asyncio.ensure_future(self._flush_later(delay))
+
+    async def _flush_later(self, delay: float) -> None:
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            # Replaced by an urgent flusher or stopped by close()
+            return
+        self._sending = True
+        try:
+            await self.flush()
+        finally:
+            self._sending = False
+            self._urgent = False
+            self._flusher = None
+        if self._buffer and not self._closed:
+            # Lines logged while the send was in progress
+            self._schedule_flush()
+
+
+@asynccontextmanager
+async def batched_logs(commandroom, socket_id: str) -> AsyncIterator[Optional[BatchedEmitter]]:
+    """Batch the command room log lines sent to ``socket_id`` inside the block."""
+    if not settings.agentverse.command_room_batching_enabled:
+        yield None
+        return
+    emitter = BatchedEmitter(
+        commandroom,
+        socket_id,
+        flush_interval=settings.agentverse.command_room_batch_interval_ms / 1000,
+        max_batch=settings.agentverse.command_room_batch_max_lines,
+        max_buffer=settings.agentverse.command_room_batch_max_buffer
+    )
+    token = _emitter.set(emitter)
+    try:
+        yield emitter
+    finally:
+        _emitter.reset(token)
+        await emitter.close()
@@ -1,4 +1,5 @@
 from src.domains.agentverse.logging.logger import log_command_room as system_logger
+from src.domains.agentverse.command_room.batched_emitter import current_emitter
 from typing import Union
 import json
 
@@ -21,10 +22,21 @@ class CommandRoomTransmitter:
         """
         Sends a Command Room message directly to a socket.
         """
+        emitter = current_emitter(socket_id)
+        if emitter is not None:
+            # Batched log lines logged before this message go out first
+            await emitter.flush()
+        await self.deliver(socket_id, message)
+
+    async def deliver(self, socket_id: str, message: Union[str, dict], log: bool = True):
+        """
+        Serializes and sends one frame to a socket, bypassing log batching.
+        """
         if isinstance(message, dict):
             message = json.dumps(message, default=str)
         
-        system_logger(f"[🧠 Command Room → socket:{socket_id}] {message}")
+        if log:
+            system_logger(f"[🧠 Command Room → socket:{socket_id}] {message}")
         await self.commbridge.send_to_socket(socket_id, f"[💠 Command Room] {message}")
 
     async def broadcast(self, message: str):
@@ -1,6 +1,12 @@
 from src.domains.agentverse.command_room.command_room import CommandRoomTransmitter
+from src.domains.agentverse.command_room.batched_emitter import current_emitter
 
 async def emit_log(socket_id: str, message: str, commandroom: CommandRoomTransmitter):
+    emitter = current_emitter(socket_id)
+    if emitter is not None:
+        # Inside batched_logs(): coalesced with the other lines of the operation
+        emitter.log(message)
+        return
     payload = {
         "type": "log",
         "message": message
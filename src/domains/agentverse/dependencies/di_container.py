@@ -1,4 +1,5 @@
 from dependency_injector import containers, providers
+from src.base.config.config import settings
 from src.base.dependencies.di_container import Container as BaseContainer
 from src.domains.agentverse.utils.safe_get_agent_class import safe_get_agent_class
 from src.domains.agentverse.agents.utils.get_agent_class import get_agent_class
@@ -27,14 +28,63 @@ from src.domains.agentverse.services.db_service import (
 from src.domains.agentverse.services.divine_orchestration_service import (
     DivineOrchestrationService
 )
+from src.domains.agentverse.caches.blueprint_cache import (
+    AgentBlueprintCache
+)
+from src.domains.agentverse.caches.agent_pool import (
+    AgentPool
+)
+from src.domains.agentverse.agents.utils.conversation_summarizer import (
+    configure_conversation_summarizer
+)
+from src.base.infrastructure.ai.tokenizer import get_tokenizer
+from src.base.utils.background_jobs import BackgroundJobQueue
 
 class AgentverseContainer(containers.DeclarativeContainer):
     """
     Dependency injection container for the Writer Assistant domain.
     """
 
+    blueprint_cache = providers.Singleton(
+        AgentBlueprintCache,
+        enabled = settings.agentverse.blueprint_cache_enabled,
+        max_size = settings.agentverse.blueprint_cache_max_size,
+        ttl_seconds = settings.agentverse.blueprint_cache_ttl_seconds,
+        change_stream_enabled = settings.agentverse.blueprint_cache_change_stream_enabled,
+        change_stream_retry_seconds = settings.agentverse.blueprint_cache_change_stream_retry_seconds
+    )
+
+    agent_pool = providers.Singleton(
+        AgentPool,
+        enabled = settings.agentverse.agent_pool_enabled,
+        max_agents = settings.agentverse.agent_pool_max_agents,
+        max_memory_bytes = settings.agentverse.agent_pool_max_memory_bytes,
+        idle_ttl_seconds = settings.agentverse.agent_pool_idle_ttl_seconds,
+        max_age_seconds = settings.agentverse.agent_pool_max_age_seconds,
+        blueprint_cache = blueprint_cache
+    )
+
+    conversation_summarizer = providers.Singleton(
+        configure_conversation_summarizer,
+        enabled = settings.agentverse.chat_summary_enabled,
+        token_threshold = settings.agentverse.chat_summary_token_threshold,
+        keep_entries = settings.agentverse.chat_summary_keep_entries,
+        min_interval_seconds = settings.agentverse.chat_summary_min_interval_seconds,
+        max_summary_tokens = settings.agentverse.chat_summary_max_tokens,
+        queue_size = settings.agentverse.chat_summary_queue_size,
+        tokenizer = providers.Callable(get_tokenizer, settings.ai_models.model)
+    )
+
+    background_jobs = providers.Singleton(
+        BackgroundJobQueue,
+        enabled = settings.agentverse.background_jobs_enabled,
+        workers = settings.agentverse.background_jobs_workers,
+        max_size = settings.agentverse.background_jobs_queue_size
+    )
+
     db_service = providers.Factory(
-        DBService
+        DBService,
+        blueprint_cache = blueprint_cache
     )
 
     agent_factory = providers.Factory(
@@ -60,7 +110,9 @@ class AgentverseContainer(containers.DeclarativeContainer):
     divine_orchestration_service = providers.Factory(
         DivineOrchestrationService,
         agent_service = agent_service,
-        db_service = db_service
+        db_service = db_service,
+        agent_pool = agent_pool,
+        background_jobs = background_jobs
     )
 
 def extend_container(base_container: BaseContainer) -> BaseContainer:
@@ -69,6 +121,7 @@ def extend_container(base_container: BaseContainer) -> BaseContainer:
     agentverse_container.wire(modules=[
         "src.domains.agentverse.dependencies.get_db_service",
         "src.domains.agentverse.dependencies.get_agent_service",
+        "src.domains.agentverse.dependencies.get_agent_pool",
         "src.domains.agentverse.interfaces.api.v1.interface",
         "src.domains.agentverse.dependencies.get_divine_orchestration_service",
         "src.domains.agentverse.services.divine_orchestration_service",
@@ -76,5 +129,9 @@ def extend_container(base_container: BaseContainer) -> BaseContainer:
     ])
 
     base_container.agent_service = agentverse_container.agent_service
+    base_container.blueprint_cache = agentverse_container.blueprint_cache
+    base_container.agent_pool = agentverse_container.agent_pool
+    base_container.conversation_summarizer = agentverse_container.conversation_summarizer
+    base_container.background_jobs = agentverse_container.background_jobs
 
     return base_container
\ No newline at end of file
@@ -0,0 +1,10 @@
+from fastapi import Depends
+from dependency_injector.wiring import Provide, inject
+from src.domains.agentverse.dependencies.di_container import AgentverseContainer
+from src.domains.agentverse.caches.agent_pool import AgentPool
+
+@inject
+async def get_agent_pool(
+        agent_pool: AgentPool = Depends(Provide[AgentverseContainer.agent_pool])
+):
+    return agent_pool
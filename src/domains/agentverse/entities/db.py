@@ -3,6 +3,11 @@ from typing import Optional, List
 from src.domains.agentverse.entities.agent_soul_protocol import AgentSoulProtocol
 from src.domains.agentverse.entities.tools.tool_spec import ToolSpec
 
+# Lifecycle of a stored EVA: created, then self-tested in the background
+AGENT_STATUS_PENDING_SELFTEST = "pending_selftest"
+AGENT_STATUS_ACTIVE = "active"
+AGENT_STATUS_SELFTEST_FAILED = "selftest_failed"
+
 class DBAgentPost(BaseModel):
     creator: str
     agent_id: str
@@ -25,4 +30,7 @@ class DBAgentPost(BaseModel):
     agent_tools: List[ToolSpec]
     agent_dna_sequence: str
     agent_chat_url: str
+    agent_personality_context: Optional[str] = None  # generated from agent_personality
+    agent_personality_fingerprint: Optional[str] = None  # personality the context was generated from
+    agent_status: Optional[str] = None  # pending_selftest, active or selftest_failed
     tools: Optional[List[str]] = None  # List of tool names
\ No newline at end of file
@@ -1,6 +1,7 @@
-from fastapi import WebSocket
+from fastapi import WebSocket, WebSocketDisconnect
 from typing import Optional
 from src.domains.agentverse.command_room.command_room import CommandRoomTransmitter
+from src.domains.agentverse.command_room.batched_emitter import batched_logs
 from src.base.websockets.event_router import EventRouter
 from src.domains.agentverse.dependencies.get_divine_orchestration_service import (
     get_divine_orchestration_service
@@ -30,13 +31,15 @@ def register_message_events(
         @event_router.on("joshu-a.create")
         async def handle_create_message(data):
             divine_service = await get_divine_orchestration_service()
-            await divine_service.create_agent(
-                websocket=websocket,
-                event_router=event_router,
-                socket_id=socket_id,
-                commandroom=commandroom,
-                **data
-            )
+            # Creation narrates every stage; send its log lines as batched frames
+            async with batched_logs(commandroom, socket_id):
+                await divine_service.create_agent(
+                    websocket=websocket,
+                    event_router=event_router,
+                    socket_id=socket_id,
+                    commandroom=commandroom,
+                    **data
+                )
 
     # 💬 Skip dynamic agent handler if name is missing
     if not agent_system_name:
@@ -72,6 +75,8 @@ def register_message_events(
                 clean_response = json.loads(json.dumps(result, default=serialize_datetime))
                 await commandroom.to_socket(socket_id, clean_response)
                 return {"status": "✅ Message sent", "message": clean_response}
+            except WebSocketDisconnect:
+                raise
             except Exception as e:
                 logger.exception("❌ Error handling agent message")
                 await commandroom.to_socket(socket_id, {"error": str(e)})
@@ -6,12 +6,14 @@ from src.domains.agentverse.entities.agent import (
 )
 from src.domains.agentverse.dependencies.get_agent_service import get_agent_service
 from src.domains.agentverse.dependencies.get_db_service import get_db_service
+from src.domains.agentverse.dependencies.get_agent_pool import get_agent_pool
 from src.domains.agentverse.dependencies.get_registry_service import get_registry_service
 from src.domains.agentverse.services.agent_service import AgentService
 from src.domains.agentverse.services.registry_service import RegistryService
 from src.domains.agentverse.services.db_service import DBService
+from src.domains.agentverse.caches.agent_pool import AgentPool
+from src.domains.agentverse.agents.utils.get_or_spawn_agent import get_or_spawn_agent
 from src.domains.agentverse.logging.logger import log_command_room
-from src.domains.agentverse.entities.db import DBAgentPost
 from src.domains.agentverse.exceptions import (
     BlueprintConflictError
 )
@@ -137,23 +139,24 @@ async def chat_with_agent(
     request: Request,
     chat_request: ChatRequest,
     db_service: DBService = Depends(get_db_service),
-    agent_service: AgentService = Depends(get_agent_service)
+    agent_service: AgentService = Depends(get_agent_service),
+    agent_pool: AgentPool = Depends(get_agent_pool)
 ):
     log_command_room(f"[🕶️ INIT] Activation directive received for prototype '{id}' — sequence authorized.")
-    
-    agent_data = await db_service.find_chat_agent(request, id)
 
-    db_agent = DBAgentPost(**agent_data)
-    
-    log_command_room(f"[🔎 DNA] Retrieval of genetic memory core for '{id}' — confirmed.")
-    
-    log_command_room("[⚙️ SYNC] Cognitive matrix reconstruction initiated.")
-    built_agent = await agent_service.build_agent(request=request, db_agent=db_agent)
+    # Reuses the worker's live agent; only a pool miss reads the blueprint and rebuilds it
+    agent = await get_or_spawn_agent(
+        request=request,
+        agent_id=id,
+        db_service=db_service,
+        agent_service=agent_service,
+        agent_pool=agent_pool
+    )
 
     log_command_room(f"[🌌 DIV-OPS] '{id}' synchronized. Soul-link established. Operational awareness initiated.")
     
     log_command_room("[🎯 EXEC] Operational phase initiated — task payload loading...")
-    response = agent_service.execute_task(message=chat_request.message, agent=built_agent)
+    response = await agent_service.execute_task(message=chat_request.message, agent=agent)
     
     log_command_room(f"[✔️ EXEC] Task execution completed — prototype '{id}' stable.")
     
@@ -32,10 +32,11 @@ from src.domains.agentverse.registries.registries import (
     personality_registry_instance,
     tool_registry_instance
 )
-from src.domains.agentverse.registries.utils.utils import get_registry, reset_registries
+from src.domains.agentverse.registries.utils.utils import freeze_registries, get_registry, reset_registries
 
 __all__ = [
     "agent_registry_instance",
+    "freeze_registries",
     "get_registry",
     "personality_registry_instance",
     "tool_registry_instance",
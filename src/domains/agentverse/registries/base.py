@@ -22,6 +22,10 @@ class Registry(Generic[T]):
     NERV-HQ Themed Registry System for the AgentVerse.
 
     Manages registration, instantiation, and metrics for EVA-compatible components.
+
+    Once every component is registered (at startup), ``freeze()`` turns the
+    registry into a read-only snapshot: lookups become a single dict access,
+    without logging, and further registrations are rejected.
     """
 
     name: ClassVar[str] = "base_registry"
@@ -35,6 +39,7 @@ class Registry(Generic[T]):
         self.validate_components = validate_components
         self.track_metrics = track_metrics
         self.registration_count = 0
+        self._frozen: Optional[Dict[str, Type[T]]] = None
         log_nerv_hq(f"[⚙️ SYSTEM ONLINE] Registry '{self._name}' v{self.version} initialized.")
 
     def register(
@@ -47,6 +52,9 @@ class Registry(Generic[T]):
     ) -> Callable[[Type[T]], Type[T]]:
         def decorator(comp: Type[T]) -> Type[T]:
             try:
+                if self._frozen is not None:
+                    raise RuntimeError(f"registry '{self._name}' is frozen")
+
                 if self.validate_components:
                     self._validate_component(comp)
 
@@ -61,6 +69,7 @@ class Registry(Generic[T]):
                     metadata=metadata or {},
                 )
                 self.registration_count += 1
+                self._compile(name, comp)
 
                 log_nerv_hq(f"[🧠 REGISTERED] '{name}' v{version} committed to registry '{self._name}'")
                 return comp
@@ -79,6 +88,12 @@ class Registry(Generic[T]):
         return decorator(component) if component else decorator
 
     def get(self, name: str, version: Optional[str] = None) -> Type[T]:
+        if self._frozen is not None and version is None:
+            try:
+                return self._frozen[name]
+            except KeyError:
+                pass  # logged and raised below
+
         if name not in self._registry:
             log_nerv_hq(f"[❌ LOOKUP FAILURE] Requested component '{name}' not found in registry '{self._name}'")
             raise KeyError(f"Component '{name}' not found in {self._name} registry")
@@ -120,6 +135,15 @@ class Registry(Generic[T]):
         return component_names
 
 
+    def freeze(self) -> None:
+        """Snapshot the registered components for fast, log-free lookups."""
+        self._frozen = dict(self._registry)
+        log_nerv_hq(f"[🧊 FROZEN] Registry '{self._name}' sealed with {len(self._frozen)} components")
+
+    @property
+    def frozen(self) -> bool:
+        return self._frozen is not None
+
     def get_info(self, name: str) -> Optional[RegistryItem]:
         return self._items.get(name)
 
@@ -135,6 +159,11 @@ class Registry(Generic[T]):
         return metrics
 
     def unregister(self, name: str) -> None:
+        if self._frozen is not None:
+            raise RegistrationError(
+                message=f"Cannot unregister '{name}': registry '{self._name}' is frozen",
+                details={"name": name},
+            )
         self._registry.pop(name, None)
         self._items.pop(name, None)
         log_nerv_hq(f"[🗑️ UNREGISTERED] Component '{name}' purged from registry '{self._name}'")
@@ -143,11 +172,15 @@ class Registry(Generic[T]):
         self._registry.clear()
         self._items.clear()
         self.registration_count = 0
+        self._frozen = None
         log_nerv_hq(f"[♻️ RESET] Registry '{self._name}' reset to empty state")
 
     def _validate_component(self, component: Type[T]) -> None:
         pass  # You can extend this in subclass
 
+    def _compile(self, name: str, component: Type[T]) -> None:
+        pass  # Precompute per-component data once at registration; extend in subclass
+
     def __contains__(self, name: str) -> bool:
         return name in self._registry
 
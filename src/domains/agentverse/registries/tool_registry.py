@@ -1,7 +1,9 @@
 # src/domains/agentverse/registries/tool_registry.py
 from src.domains.agentverse.registries.base import Registry
 from src.domains.agentverse.registries.utils.register_registry import register_registry
+from typing import Dict
 from src.domains.agentverse.tools.base import BaseTool
+from src.domains.agentverse.tools.plan import ToolPlan
 from src.domains.agentverse.exceptions import RegistrationError
 
 @register_registry(name="Tool Registry", icon="🧰")
@@ -10,8 +12,26 @@ class ToolRegistry(Registry[BaseTool]):
     description = "Registry for EVA tools"
 
     def __init__(self):
+        self._plans: Dict[str, ToolPlan] = {}
         super().__init__(name=self.name)
 
+    def plan(self, name: str) -> ToolPlan:
+        """Construction plan of the tool registered as ``name``."""
+        if name not in self._plans:
+            self.get(name)  # raises the registry's KeyError
+        return self._plans[name]
+
+    def unregister(self, name: str) -> None:
+        super().unregister(name)
+        self._plans.pop(name, None)
+
+    def reset(self) -> None:
+        self._plans.clear()
+        super().reset()
+
+    def _compile(self, name: str, component: type) -> None:
+        self._plans[name] = ToolPlan.compile(component)
+
     def _validate_component(self, component: type) -> None:
         if not issubclass(component, BaseTool):
             raise TypeError(f"Component `{component.__name__}` must inherit from BaseTool")
@@ -19,4 +19,10 @@ def reset_registries() -> None:
         else:
             logger.warning(f"Registry '{name}' does not implement reset")
 
-__all__ = ["get_registry", "reset_registries"]
+def freeze_registries() -> None:
+    """Freeze every registry once startup registrations are done."""
+    for name, registry in registries.items():
+        registry.freeze()
+        logger.info(f"Froze registry: {name}")
+
+__all__ = ["freeze_registries", "get_registry", "reset_registries"]
@@ -1,5 +1,6 @@
 from typing import Callable, Optional
 from fastapi import Request
+from src.base.infrastructure.ai.llm_metrics import llm_call_labels
 from src.domains.agentverse.agents.factory import (
     AgentFactory
 )
@@ -152,4 +153,5 @@ class AgentService:
         if agent is None:
             raise RuntimeError("Agent task execution failed — factory returned None.")
     
-        return await agent.respond(message)
\ No newline at end of file
+        with llm_call_labels(agent_type=agent.type):
+            return await agent.respond(message)
\ No newline at end of file
@@ -1,11 +1,18 @@
 
 from fastapi import Request
+from datetime import datetime
 from typing import Dict, List, Optional, Any, TypeVar
 from src.domains.agentverse.entities.agent import (
     AgentConfig,
     DBAgent
 )
-from src.domains.agentverse.entities.db import DBAgentPost
+from src.domains.agentverse.entities.db import DBAgentPost, AGENT_STATUS_PENDING_SELFTEST
+from src.domains.agentverse.entities.agent_soul_protocol import AgentSoulProtocol
+from src.domains.agentverse.caches.blueprint_cache import AgentBlueprintCache
+from src.domains.agentverse.caches.personality_context_cache import (
+    get_personality_context,
+    personality_fingerprint
+)
 from src.domains.agentverse.exceptions import (
     BlueprintConflictError
 )
@@ -18,6 +25,9 @@ T = TypeVar('T', bound=Dict[str, Any])
 
 class DBService:
 
+    def __init__(self, blueprint_cache: Optional[AgentBlueprintCache] = None):
+        self.blueprint_cache = blueprint_cache
+
     async def check_for_duplicates(self, request: Request, agent_config: AgentConfig):
         log_existencial_index("[🔬 EVA VALIDATION] Starting the scanning for presens of EVA DNA string in Agentverse Exitense Index [AEI]")
         query = {
@@ -50,6 +60,8 @@ class DBService:
 
             # 🌱 No assumptions — just dump the meaningful traits
             personality_dump = db_agent.agent.personality.model_dump(exclude_none=True)
+            # Context of the personality as it will be read back, so agent builds can reuse it
+            stored_personality = AgentSoulProtocol(**personality_dump)
             
             data = {
                 "creator": db_agent.user_id,
@@ -73,6 +85,9 @@ class DBService:
                 "agent_personality": personality_dump,
                 "agent_personality_profile": db_agent.agent.personality_profile,
                 "agent_dna_sequence": db_agent.agent.dna_sequence,
+                "agent_personality_context": get_personality_context(stored_personality, db_agent.agent.dna_sequence),
+                "agent_personality_fingerprint": personality_fingerprint(stored_personality),
+                "agent_status": AGENT_STATUS_PENDING_SELFTEST,
             }
 
             log_existencial_index(f"{data}")
@@ -96,7 +111,29 @@ class DBService:
         return await db_repository.find_one(query, collection_name)
     
     async def find_chat_agent(self, request: Request, id: str) -> DBAgentPost:
-        return await self.find_one(request, {"agent_id": id} )
+        if self.blueprint_cache is None:
+            return await self.find_one(request, {"agent_id": id})
+
+        return await self.blueprint_cache.get_or_load(
+            id,
+            load=lambda agent_id: self.find_one(request, {"agent_id": agent_id}),
+            load_version=lambda agent_id: self.find_blueprint_version(request, agent_id)
+        )
+
+    async def find_blueprint_version(self, request: Request, agent_id: str) -> Optional[Any]:
+        """
+        Read only the version field of an EVA's blueprint, used to revalidate
+        cached blueprints without transferring the whole document.
+        """
+        db_repository = request.app.state.cognitive_modules["db"]["mongodb"]
+        collection_name = 'coll_agents'
+        version_field = AgentBlueprintCache.VERSION_FIELD
+        document = await db_repository.find_one(
+            {"agent_id": agent_id},
+            collection_name,
+            projection={version_field: 1, "_id": 0}
+        )
+        return document.get(version_field) if document else None
         
     async def find_all(self, request: Request) -> List[Dict]:
         db_repository = request.app.state.cognitive_modules["db"]["mongodb"]  # or dynamic
@@ -134,7 +171,34 @@ class DBService:
             f"[🧬 MUTATION PHASE] Applying permitted modifications to EVA '{existing_agent['agent_name']}'"
         )
 
+        # Bump the version so cached blueprints in other workers are revalidated
+        update_data["modified"] = datetime.now()
+
         update_payload = {"$set": update_data}
         await db_repository.update_one({"agent_id": agent_id}, update_payload, collection_name)
 
+        if self.blueprint_cache is not None:
+            self.blueprint_cache.invalidate(agent_id)
+
         return await self.find_one(request, {"agent_id": agent_id})
+
+    async def update_agent_status(self, request: Request, agent_id: str, status: str) -> bool:
+        """
+        Record the lifecycle status of an EVA (see ``entities.db``).
+
+        The status is part of the blueprint served by the API, so the version
+        is bumped like any other update and cached copies are revalidated.
+        """
+        db_repository = request.app.state.cognitive_modules["db"]["mongodb"]
+        collection_name = 'coll_agents'
+        log_existencial_index(f"[🧬 STATUS] EVA '{agent_id}' is now '{status}'")
+        updated = await db_repository.update_one(
+            {"agent_id": agent_id},
+            {"$set": {"agent_status": status, "modified": datetime.now()}},
+            collection_name
+        )
+
+        if self.blueprint_cache is not None:
+            self.blueprint_cache.invalidate(agent_id)
+
+        return updated
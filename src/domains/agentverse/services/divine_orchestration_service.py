@@ -1,13 +1,24 @@
-from fastapi import WebSocket
+from fastapi import WebSocket, WebSocketDisconnect
 import traceback
 import json
 from types import SimpleNamespace
 from src.domains.agentverse.services.db_service import DBService
 from src.domains.agentverse.services.agent_service import AgentService
 from src.domains.agentverse.entities.agent import AgentRequest, DBAgent
+from src.domains.agentverse.entities.db import (
+    AGENT_STATUS_ACTIVE,
+    AGENT_STATUS_PENDING_SELFTEST,
+    AGENT_STATUS_SELFTEST_FAILED
+)
 from src.domains.agentverse.command_room.command_room import CommandRoomTransmitter
 from src.domains.agentverse.logging.logger import log_command_room
 from src.domains.agentverse.agents.utils.get_or_spawn_agent import get_or_spawn_agent
+from src.domains.agentverse.caches.agent_pool import AgentPool
+from src.base.utils.background_jobs import BackgroundJobQueue
+from src.domains.agentverse.websockets.utils.stream_to_websocket import stream_to_websocket
+from src.base.infrastructure.ai.llm_metrics import llm_call_labels
+from src.base.infrastructure.ai.llm_scheduler import llm_scheduling
+from src.base.infrastructure.ai.response_cache import cached_responses
 from src.domains.agentverse.command_room.utils.emit import (
     emit_log,
     emit_event
@@ -22,10 +33,18 @@ class DivineOrchestrationService:
     creating, building, spawning and executing EVAs.
     """
 
-    def __init__(self, agent_service: AgentService, db_service: DBService):
+    def __init__(
+        self,
+        agent_service: AgentService,
+        db_service: DBService,
+        agent_pool: AgentPool = None,
+        background_jobs: BackgroundJobQueue = None
+    ):
         self.agents = []
         self.agent_service = agent_service
         self.db_service = db_service
+        self.agent_pool = agent_pool
+        self.background_jobs = background_jobs
 
     async def create_agent(
         self,
@@ -104,13 +123,10 @@ class DivineOrchestrationService:
             agent_id=stored_agent_id,
             db_service=self.db_service,
             agent_service=self.agent_service,
-            cache=websocket.app.state.cognitive_modules["cache"]["redis"],
-            agent_registry=getattr(self, "active_agents", None)
-)
-        await self.self_test_and_sleep(spawned_agent, commandroom, socket_id)
-
+            agent_pool=self.agent_pool
+        )
         await emit_log(socket_id=socket_id, message=f"[NERV] ⚡ A.T. Field deployed. '{stored_agent_name}' is now operational.", commandroom=commandroom)
-        log_command_room(f"[🧬 COMPLETE] EVA '{stored_agent_name}' fully deployed, tested, and archived.")
+        log_command_room(f"[🧬 COMPLETE] EVA '{stored_agent_name}' deployed and archived, self test pending.")
         
         await emit_event(
             socket_id=socket_id,
@@ -119,10 +135,18 @@ class DivineOrchestrationService:
             payload={
                 "status": "✅ EVA created",
                 "agent": json.dumps(agent_response),
+                "agent_status": AGENT_STATUS_PENDING_SELFTEST,
                 "response": "EVA successfully created and ready."
             }
         )
 
+        # 🧪 The self test is an LLM round trip; it runs after the reply and reports on the command room
+        async def self_test():
+            await self.run_self_test(fake_request, spawned_agent, agent_response, commandroom, socket_id)
+
+        if self.background_jobs is None or not self.background_jobs.submit("agent_self_test", self_test):
+            await self_test()
+
     async def chat_w_agent(
         self,
         websocket: WebSocket,
@@ -157,12 +181,20 @@ class DivineOrchestrationService:
                 agent_id=agent_id,
                 db_service=self.db_service,
                 agent_service=self.agent_service,
-                cache=websocket.app.state.cognitive_modules["cache"]["redis"],
-                agent_registry=getattr(self, "active_agents", None)
+                agent_pool=self.agent_pool
             )
 
-            # 🧬 Process the message
-            response = await agent.respond(payload)
+            # 🧬 Process the message (token by token when the client asked for a stream)
+            with llm_call_labels(agent_type=agent.type, caller="agent_chat"):
+                if data.get("stream"):
+                    response = await stream_to_websocket(
+                        websocket,
+                        f"{agent_system_name}.comm",
+                        agent.respond_stream(payload),
+                        agent_id=agent_id
+                    )
+                else:
+                    response = await agent.respond(payload)
             
             await emit_event(
                 socket_id=socket_id,
@@ -176,7 +208,10 @@ class DivineOrchestrationService:
             )
 
             return {"status": "✅ Message sent", "message": response}
-    
+
+        except WebSocketDisconnect:
+            # Client left mid-stream; let the socket loop clean up
+            raise
         except Exception as e:
             await emit_event(
                 socket_id=socket_id,
@@ -186,6 +221,29 @@ class DivineOrchestrationService:
             return {"error": str(e)}
 
 
+    async def run_self_test(self, request, agent, agent_response: dict, commandroom, socket_id: str):
+        """
+        [🧪 BACKGROUND SELF TEST]
+        Self-tests a freshly created EVA, records the outcome as its status
+        and reports it to the command room.
+        """
+        result = await self.self_test_and_sleep(agent, commandroom, socket_id)
+        failed = result.get("status") == "error"
+        status = AGENT_STATUS_SELFTEST_FAILED if failed else AGENT_STATUS_ACTIVE
+        await self.db_service.update_agent_status(request, agent.id, status)
+
+        await emit_event(
+            socket_id=socket_id,
+            commandroom=commandroom,
+            event='joshu-a.selftest',
+            payload={
+                "status": "❌ EVA self test failed" if failed else "✅ EVA self test passed",
+                "agent": json.dumps(agent_response),
+                "agent_status": status,
+                "response": result.get("message")
+            }
+        )
+
     async def self_test_and_sleep(self, agent, commandroom, socket_id: str):
         """
         [🧪 POST-CREATION SELF TEST]
@@ -205,8 +263,11 @@ class DivineOrchestrationService:
                 message=f"[💠 Joshu-A][NERV][DOS][🧪 SELF TEST] This is Joshu-A contacting EVA '{agent.system_name}'. Can you hear me?",
               
             )
-            # 🧬 Process the message
-            response = await self.agent_service.execute_task(message=test_message, agent=agent)
+            # 🧬 Process the message (the probe is identical for every EVA of a blueprint, so cache it).
+            # It is background work: it must not delay interactive chat
+            with cached_responses(), llm_scheduling(priority="background", deadline_seconds=300), \
+                    llm_call_labels(caller="self_test"):
+                response = await self.agent_service.execute_task(message=test_message, agent=agent)
             
             # 🔍 Normalize response for logging
             if isinstance(response, dict):
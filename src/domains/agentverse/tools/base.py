@@ -1,7 +1,31 @@
-from typing import Dict, Any, List, Optional, ClassVar
+from typing import Dict, Any, List, Optional, ClassVar, Tuple
 from pydantic import BaseModel, Field
 from datetime import datetime
+from prometheus_client import Counter, Histogram
+from src.base.utils.ttl_lru_cache import TTLLRUCache
 import asyncio
+import hashlib
+import json
+import random
+import time
+
+TOOL_EXECUTION_SECONDS = Histogram(
+    "agentverse_tool_execution_seconds",
+    "Tool execution time, including retries, by tool and outcome "
+    "(success, failure, timeout, error, cached)",
+    ["tool", "outcome"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+)
+TOOL_RETRIES = Counter(
+    "agentverse_tool_retries_total",
+    "Tool executions retried after a transient failure",
+    ["tool"]
+)
+TOOL_CACHE_LOOKUPS = Counter(
+    "agentverse_tool_cache_lookups_total",
+    "Tool result cache lookups by tool and result (hit, miss)",
+    ["tool", "result"]
+)
 
 class ToolResult(BaseModel):
     """Result from a tool execution"""
@@ -20,6 +44,10 @@ class ToolConfig(BaseModel):
     timeout: float = Field(30.0, description="Seconds before cancelling execute()")
     retries: int = Field(0, description="How many times to retry on transient errors")
     retry_backoff: float = Field(0.5, description="Base backoff (seconds) for retries")
+    retry_max_backoff: float = Field(10.0, description="Upper bound (seconds) of a single backoff")
+    cache_ttl: float = Field(0.0, description="Seconds to reuse results for identical arguments (0 disables)")
+    cache_max_size: int = Field(256, description="Results kept per tool when caching is enabled")
+    max_concurrency: Optional[int] = Field(None, description="Executions of this tool allowed at once per worker")
     extra: Dict[str, Any] = Field(default_factory=dict, description="Tool-specific settings")
 
 # Tool-related exceptions
@@ -49,6 +77,54 @@ class ToolDependencyError(ToolError):
     """Raised when tool dependencies are missing or invalid"""
     pass
 
+# Failures that would fail again with the same input; everything else is retried
+NON_RETRYABLE_ERRORS: Tuple[type, ...] = (
+    ToolValidationError,
+    ToolPermissionError,
+    ToolAuthenticationError,
+    ToolDependencyError,
+)
+
+# Per-worker state shared by every instance of a tool
+_RESULT_CACHES: Dict[str, TTLLRUCache] = {}
+_LIMITS: Dict[Tuple[str, int], Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = {}
+
+
+def _cache_key(tool: "BaseTool", params: Dict[str, Any]) -> str:
+    """The tool's config and arguments, normalized, so equivalent calls share an entry."""
+    payload = json.dumps(
+        {"config": tool.config.model_dump(mode="json"), "params": params},
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _result_cache(tool: "BaseTool") -> TTLLRUCache:
+    cache = _RESULT_CACHES.get(tool.name)
+    if cache is None:
+        cache = _RESULT_CACHES[tool.name] = TTLLRUCache(max_size=tool.config.cache_max_size)
+    return cache
+
+
+def _limit(tool: "BaseTool") -> Optional[asyncio.Semaphore]:
+    limit = tool.config.max_concurrency
+    if not limit:
+        return None
+    loop = asyncio.get_running_loop()
+    entry = _LIMITS.get((tool.name, limit))
+    # A semaphore only works on the loop it was created on
+    if entry is None or entry[0] is not loop:
+        entry = _LIMITS[(tool.name, limit)] = (loop, asyncio.Semaphore(limit))
+    return entry[1]
+
+
+def clear_tool_caches() -> None:
+    """Drop every cached tool result."""
+    for cache in _RESULT_CACHES.values():
+        cache.clear()
+
+
 class BaseTool:
     name: ClassVar[str] = "base_tool"
     parameters: ClassVar[Dict[str, Any]] = {}
@@ -72,22 +148,70 @@ class BaseTool:
         pass
 
     async def execute(self, **params) -> ToolResult:
+        """
+        Run the tool with ``params``: served from the result cache when
+        ``cache_ttl`` is set, otherwise under the tool's concurrency limit,
+        with up to ``retries`` retries (jittered exponential backoff) on
+        transient failures and timeouts. Every execution is timed per tool.
+        """
         if not self.config.enabled:
             raise ToolExecutionError("Tool disabled")
         self._validate_params(params)
         # permissions check here...
+        started = time.perf_counter()
+        cache = _result_cache(self) if self.config.cache_ttl > 0 else None
+        key = _cache_key(self, params) if cache is not None else None
+        if cache is not None:
+            cached = cache.get(key)
+            TOOL_CACHE_LOOKUPS.labels(tool=self.name, result="miss" if cached is None else "hit").inc()
+            if cached is not None:
+                TOOL_EXECUTION_SECONDS.labels(tool=self.name, outcome="cached").observe(time.perf_counter() - started)
+                return cached.model_copy(update={"metadata": {**cached.metadata, "cached": True}})
+
+        outcome = "error"
         try:
-            # enforce timeout
-            result = await asyncio.wait_for(self._run(**params),
-                                            timeout=self.config.timeout)
-            return ToolResult(success=True, result=result)
-        except ToolError as te:
-            return ToolResult(success=False, error=str(te))
-        except asyncio.TimeoutError:
-            return ToolResult(success=False, error="Execution timed out")
-        except Exception as e:
-            raise ToolExecutionError("Execution failed", e)
+            limit = _limit(self)
+            if limit is not None:
+                async with limit:
+                    result, outcome = await self._execute_with_retries(params)
+            else:
+                result, outcome = await self._execute_with_retries(params)
+        finally:
+            TOOL_EXECUTION_SECONDS.labels(tool=self.name, outcome=outcome).observe(time.perf_counter() - started)
+
+        if cache is not None and result.success:
+            cache.set(key, result, ttl_seconds=self.config.cache_ttl)
+        return result
+
+    async def _execute_with_retries(self, params: Dict[str, Any]) -> Tuple[ToolResult, str]:
+        """The result of the first attempt that succeeds or must not be retried, and its outcome."""
+        attempt = 0
+        while True:
+            try:
+                # enforce timeout
+                result = await asyncio.wait_for(self._run(**params),
+                                                timeout=self.config.timeout)
+                if not isinstance(result, ToolResult):
+                    result = ToolResult(success=True, result=result)
+                return result, "success" if result.success else "failure"
+            except NON_RETRYABLE_ERRORS as te:
+                return ToolResult(success=False, result=None, error=str(te)), "failure"
+            except Exception as e:
+                if attempt >= self.config.retries:
+                    if isinstance(e, asyncio.TimeoutError):
+                        return ToolResult(success=False, result=None, error="Execution timed out"), "timeout"
+                    if isinstance(e, ToolError):
+                        return ToolResult(success=False, result=None, error=str(e)), "failure"
+                    raise ToolExecutionError("Execution failed", e)
+            TOOL_RETRIES.labels(tool=self.name).inc()
+            await asyncio.sleep(self._backoff(attempt))
+            attempt += 1
+
+    def _backoff(self, attempt: int) -> float:
+        """Full jitter: a random delay up to the exponential backoff for ``attempt``."""
+        ceiling = min(self.config.retry_max_backoff, self.config.retry_backoff * (2 ** attempt))
+        return random.uniform(0, ceiling)
 
     async def _run(self, **params) -> Any:
-        """Override in subclasses."""
+        """Override in subclasses; may return a ToolResult or the bare result."""
         raise NotImplementedError
@@ -60,7 +60,7 @@ class DateTimeTool(BaseTool):
             logger.warning(f"Invalid datetime format '{fmt}', using default '{self.config.default_format}'")
             return self.config.default_format
 
-    async def execute(self, format: str = None) -> ToolResult:
+    async def _run(self, format: str = None) -> ToolResult:
         fmt = self._validate_format(format or self.config.default_format)
         try:
             now = datetime.now(pytz.timezone(self.config.default_timezone))
@@ -0,0 +1,179 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple
+from src.domains.agentverse.tools.base import BaseTool, ToolError, ToolResult, ToolValidationError
+
+logger = logging.getLogger("agentverse.tool_executor")
+
+# Builds the parameters of a call from the results of the calls it depends on
+ParamsResolver = Callable[[Dict[str, ToolResult]], Dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class ToolCall:
+    """
+    One invocation in a tool run. ``id`` names the call (defaults to the tool
+    name) so later calls can list it in ``depends_on``; ``resolve``, when
+    given, receives the results of those dependencies and returns extra
+    parameters merged over ``params``.
+    """
+    tool: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    id: Optional[str] = None
+    depends_on: Tuple[str, ...] = ()
+    resolve: Optional[ParamsResolver] = None
+    timeout: Optional[float] = None
+
+    @property
+    def key(self) -> str:
+        return self.id or self.tool
+
+
+def _failed(error: str, **metadata: Any) -> ToolResult:
+    return ToolResult(success=False, result=None, error=error, metadata=metadata)
+
+
+def validate_calls(calls: Sequence[ToolCall]) -> None:
+    """Reject duplicate ids, unknown dependencies and dependency cycles."""
+    by_key: Dict[str, ToolCall] = {}
+    for call in calls:
+        if call.key in by_key:
+            raise ToolValidationError(f"Duplicate tool call id '{call.key}'")
+        by_key[call.key] = call
+    for call in calls:
+        for dependency in call.depends_on:
+            if dependency not in by_key:
+                raise ToolValidationError(f"Tool call '{call.key}' depends on unknown call '{dependency}'")
+
+    # Kahn's algorithm: whatever cannot be ordered sits on a cycle
+    remaining = {key: set(call.depends_on) for key, call in by_key.items()}
+    ready = [key for key, deps in remaining.items() if not deps]
+    while ready:
+        done = ready.pop()
+        del remaining[done]
+        for key, deps in remaining.items():
+            if done in deps:
+                deps.discard(done)
+                if not deps:
+                    ready.append(key)
+    if remaining:
+        raise ToolValidationError(f"Tool calls form a dependency cycle: {sorted(remaining)}")
+
+
+class ToolExecutor:
+    """
+    Runs an agent's tool calls as a small DAG: every call starts as soon as
+    the calls it depends on have finished, so independent tools run
+    concurrently and a run takes about as long as its slowest chain instead
+    of the sum of every tool.
+
+    At most ``max_concurrency`` tools of the agent execute at once, across
+    all runs sharing the executor. Failures never abort the run: a call that
+    fails, raises or times out gets an unsuccessful ``ToolResult``, calls
+    depending on it are skipped, and when the run's ``timeout`` elapses the
+    results gathered so far are returned with the unfinished calls marked
+    as timed out.
+    """
+
+    def __init__(
+        self,
+        tools: Mapping[str, BaseTool],
+        max_concurrency: int = 4,
+        timeout: Optional[float] = None
+    ):
+        self.tools = tools
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def run(self, calls: Sequence[ToolCall], timeout: Optional[float] = None) -> Dict[str, ToolResult]:
+        """Execute ``calls`` and return their results keyed by call id, in call order."""
+        validate_calls(calls)
+        if not calls:
+            return {}
+        if self._semaphore is None:
+            # Created on first use so it binds to the running loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        tasks: Dict[str, asyncio.Task] = {}
+        for call in self._ordered(calls):
+            tasks[call.key] = asyncio.ensure_future(self._run_call(call, tasks))
+
+        timeout = timeout if timeout is not None else self.timeout
+        try:
+            _, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+        finally:
+            # Also when the caller is cancelled, so no call outlives the run
+            unfinished = [task for task in tasks.values() if not task.done()]
+            for task in unfinished:
+                task.cancel()
+            if unfinished:
+                await asyncio.gather(*unfinished, return_exceptions=True)
+        if pending:
+            logger.warning(f"Tool run timed out after {timeout}s with {len(pending)} call(s) unfinished")
+
+        results = {}
+        for call in calls:
+            task = tasks[call.key]
+            results[call.key] = task.result() if not task.cancelled() else _failed("Execution timed out")
+        return results
+
+    async def _run_call(self, call: ToolCall, tasks: Dict[str, asyncio.Task]) -> ToolResult:
+        dependencies = {key: await asyncio.shield(tasks[key]) for key in call.depends_on}
+        failed = [key for key, result in dependencies.items() if not result.success]
+        if failed:
+            return _failed(f"Skipped: dependency '{failed[0]}' failed", skipped=True)
+
+        tool = self.tools.get(call.tool)
+        if tool is None:
+            return _failed(f"Unknown tool '{call.tool}'")
+
+        params = dict(call.params)
+        try:
+            if call.resolve is not None:
+                params.update(call.resolve(dependencies))
+        except Exception as e:
+            return _failed(f"Could not resolve parameters: {e}")
+
+        async with self._semaphore:
+            started = time.perf_counter()
+            try:
+                if call.timeout is not None:
+                    result = await asyncio.wait_for(tool.execute(**params), timeout=call.timeout)
+                else:
+                    result = await tool.execute(**params)
+                if not isinstance(result, ToolResult):
+                    result = ToolResult(success=True, result=result)
+            except asyncio.TimeoutError:
+                result = _failed("Execution timed out")
+            except ToolError as e:
+                original = getattr(e, "original_error", None)
+                result = _failed(f"{e}: {original}" if original else str(e))
+            except Exception as e:
+                logger.warning(f"Tool call '{call.key}' raised: {e}")
+                result = _failed(f"Execution failed: {e}")
+            if "elapsed_seconds" not in result.metadata:
+                # A copy, since the result may be the one held by the tool's result cache
+                elapsed = time.perf_counter() - started
+                result = result.model_copy(update={"metadata": {**result.metadata, "elapsed_seconds": elapsed}})
+        return result
+
+    @staticmethod
+    def _ordered(calls: Sequence[ToolCall]) -> Sequence[ToolCall]:
+        """Dependencies before dependents, so every task can look up the tasks it awaits."""
+        by_key = {call.key: call for call in calls}
+        ordered, seen = [], set()
+
+        def visit(call: ToolCall) -> None:
+            if call.key in seen:
+                return
+            seen.add(call.key)
+            for dependency in call.depends_on:
+                visit(by_key[dependency])
+            ordered.append(call)
+
+        for call in calls:
+            visit(call)
+        return ordered
@@ -35,7 +35,7 @@ class GuardrailTool(BaseTool):
     def __init__(self, config: GuardrailToolConfig = None):
         super().__init__(config=config or GuardrailToolConfig())
 
-    async def execute(self, content: str) -> ToolResult:
+    async def _run(self, content: str) -> ToolResult:
         cfg = self.config
         # 1) Reject if any banned phrase is present
         lower = content.lower()
@@ -0,0 +1,52 @@
+import inspect
+import typing
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional, Tuple, Type
+from src.domains.agentverse.tools.base import BaseTool, ToolConfig
+
+
+def _config_class(tool_cls: Type[BaseTool]) -> Type[ToolConfig]:
+    """The ToolConfig subclass a tool expects, read from its ``config`` annotation."""
+    try:
+        annotation = typing.get_type_hints(tool_cls.__init__).get("config")
+    except Exception:
+        annotation = None
+    candidates = typing.get_args(annotation) or (annotation,)
+    for candidate in candidates:
+        if inspect.isclass(candidate) and issubclass(candidate, ToolConfig):
+            return candidate
+    return getattr(tool_cls, "Config", ToolConfig)
+
+
+@dataclass(frozen=True)
+class ToolPlan:
+    """
+    How to construct a tool class, compiled once when the tool is registered:
+    which named dependencies its constructor takes and which config class it
+    expects. Building a tool is then a plain constructor call, without
+    signature inspection.
+    """
+    tool_cls: Type[BaseTool]
+    config_cls: Type[ToolConfig]
+    dependencies: Tuple[str, ...]
+
+    @classmethod
+    def compile(cls, tool_cls: Type[BaseTool]) -> "ToolPlan":
+        parameters = inspect.signature(tool_cls.__init__).parameters.values()
+        dependencies = tuple(
+            p.name for p in parameters
+            if p.name not in ("self", "config") and p.kind not in (p.VAR_POSITIONAL, p.VAR_KEYWORD)
+        )
+        return cls(tool_cls=tool_cls, config_cls=_config_class(tool_cls), dependencies=dependencies)
+
+    def config(self, overrides: Optional[Dict[str, Any]] = None) -> ToolConfig:
+        """Default config of the tool with ``overrides`` applied."""
+        config = self.config_cls()
+        return config.model_copy(update=overrides) if overrides else config
+
+    def build(self, deps: Mapping[str, Any], config: Optional[ToolConfig] = None) -> BaseTool:
+        """Instantiate the tool with the dependencies of ``deps`` it takes."""
+        kwargs = {name: deps[name] for name in self.dependencies if name in deps}
+        if config is not None:
+            kwargs["config"] = config
+        return self.tool_cls(**kwargs)
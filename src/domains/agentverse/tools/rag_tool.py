@@ -62,7 +62,13 @@ class RAGTool(BaseTool):
             f"\n\nContext:\n{context}\n\nQuestion: {query}\nAnswer:"
         )
         try:
-            response = await self.llm.generate_response(prompt=prompt)
+            # Paraphrased questions on the same collection can reuse an answer
+            response = await self.llm.generate_response(
+                prompt=prompt,
+                semantic_cache=True,
+                semantic_query=query,
+                semantic_scope=f"rag:{collection}:{top_k}"
+            )
             return {
                 "answer": response.content,
                 "sources": [doc.metadata for doc in docs]
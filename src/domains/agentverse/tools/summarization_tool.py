@@ -12,6 +12,7 @@ class SummarizationToolConfig(ToolConfig):
     temperature: float = 0.0
     max_tokens: int = 256
     style: str = "bullets"  # default style for summary
+    cache_ttl: float = 300.0  # same text, style and settings give the same summary at temperature 0
 
 @tool_registry.register(
     name="summarize",
@@ -38,7 +39,7 @@ class SummarizationTool(BaseTool):
         if not self.llm:
             raise ToolExecutionError("LLM client not provided for SummarizationTool")
 
-    async def execute(self, text: str, style: Optional[str] = None) -> ToolResult:
+    async def _run(self, text: str, style: Optional[str] = None) -> ToolResult:
         # Choose style
         style = style or self.config.style
         if style not in ("bullets", "paragraph"):
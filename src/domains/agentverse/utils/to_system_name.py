@@ -0,0 +1,33 @@
+import re
+import unicodedata
+from functools import lru_cache
+
+_UNWANTED = re.compile(r"[^a-zA-Z0-9 ]+")
+
+
+@lru_cache(maxsize=4096)
+def to_system_name(name: str) -> str:
+    """
+    Normalize and convert a human-readable agent name to a clean, system-friendly identifier.
+
+    Steps:
+    - Normalize Unicode characters to ASCII (NFKD)
+    - Remove non-alphanumeric characters except spaces
+    - Replace spaces with underscores
+    - Lowercase everything
+
+    Memoized: the same few names are converted on every agent creation.
+
+    Example:
+        "Ingvar Kamprád!" → "ingvar_kamprad"
+        "  Customized EVA  " → "customized_eva"
+    """
+    # Normalize to NFKD form and strip diacritics
+    normalized = unicodedata.normalize("NFKD", name)
+    ascii_str = normalized.encode("ascii", "ignore").decode("ascii")
+
+    # Remove unwanted symbols (keep letters, numbers, and spaces)
+    cleaned = _UNWANTED.sub("", ascii_str)
+
+    # Replace spaces with underscores and lower the case
+    return cleaned.strip().lower().replace(" ", "_")
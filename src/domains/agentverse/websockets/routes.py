@@ -132,8 +132,12 @@ async def ws_chat_handler(websocket: WebSocket, agent_system_name: str):
 
             if handler:
                 try:
+                    # With {"data": {"stream": true}} the handler first sends
+                    # "<event>.delta" frames; this final frame ends the stream
                     response = await handler(msg_data)
                     await websocket.send_json({"event": msg_event, "response": response})
+                except WebSocketDisconnect:
+                    raise
                 except Exception as e:
                     logger.exception(f"❌ Handler for event '{msg_event}' failed")
                     await websocket.send_json({"event": msg_event, "error": str(e)})
@@ -0,0 +1,26 @@
+from fastapi import WebSocket
+from typing import Any, AsyncIterator
+
+
+async def stream_to_websocket(
+    websocket: WebSocket,
+    event: str,
+    chunks: AsyncIterator[str],
+    **frame: Any
+) -> str:
+    """
+    Forward text deltas to a websocket as ``{"event": "<event>.delta", "delta": ...}``
+    frames and return the assembled text.
+
+    The final ``{"event": <event>, "response": ...}`` frame sent by the socket
+    loop marks the end of the stream. If the socket goes away mid-stream the
+    send fails, and closing ``chunks`` cancels the upstream generation.
+    """
+    parts = []
+    try:
+        async for delta in chunks:
+            parts.append(delta)
+            await websocket.send_json({"event": f"{event}.delta", "delta": delta, **frame})
+    finally:
+        await chunks.aclose()
+    return "".join(parts)
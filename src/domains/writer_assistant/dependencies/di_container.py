@@ -31,6 +31,7 @@ class WriterAssistantContainer(containers.DeclarativeContainer):
     chat_service = providers.Singleton(
         ChatService,
         chat_handler=chat_handler,
+        chat_history_service=chat_history_service,
         generate_prompts=generate_prompts,
     )
 
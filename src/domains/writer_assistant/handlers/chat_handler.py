@@ -1,4 +1,8 @@
+from typing import AsyncIterator
+import hashlib
+import json
 import logging
+from src.base.infrastructure.ai.llm_metrics import llm_call_labels
 logger = logging.getLogger(__name__)
 
 class ChatHandler:
@@ -18,18 +22,15 @@ class ChatHandler:
 
         return max_tokens
     
-    async def send_prompt_to_llm(
+    def build_messages(
             self,
-            request,
             Default_system_prompt,
             content_prompt,
-            max_tokens,
-            chat_history,
-            model
-    )-> dict:
-        openai_client = request.app.state.ai_model_client
-
-        logger.info("generating llm response using model: {model}".format(model=model))
+            chat_history
+    ) -> list:
+        """
+        Builds the LLM messages from the system prompt, the chat history and the content prompt.
+        """
         latest_chat_history = chat_history
         if latest_chat_history == []:
             chat_history_string = ""
@@ -37,26 +38,77 @@ class ChatHandler:
             latest_chat_history = [f"USER: {msg['prompt']}\nLLM: {msg['generated_text']}" for msg in chat_history]
             chat_history_string = "\n".join(latest_chat_history)
 
-        llm_messages= [
+        return [
                 {"role": "system", "content": Default_system_prompt},
                 {"role": "user", "content": [
                     {"type": "text", "text": chat_history_string},
                     {"type": "text", "text": content_prompt}
                 ]}
-        ],
-        response = openai_client.chat.completions.create(
-            model=model,
-            messages=llm_messages,
-            temperature=0.1,
-            max_tokens=max_tokens,
-        )
-        if response.choices[0].finish_reason == "stop":
-            text = response.choices[0].message.content
+        ]
 
-            return text
+    def semantic_scope(self, model, Default_system_prompt, chat_history) -> str:
+        """
+        Semantic cache scope of a prompt: answers are only reused for the same
+        model, system prompt and chat history, since the history is sent along
+        with the prompt but is not part of the compared text.
+        """
+        digest = hashlib.sha256(f"{model}\n{Default_system_prompt}".encode("utf-8"))
+        digest.update(json.dumps(chat_history, sort_keys=True, default=str).encode("utf-8"))
+        return f"writer_assistant:{digest.hexdigest()}"
+
+    async def send_prompt_to_llm(
+            self,
+            request,
+            Default_system_prompt,
+            content_prompt,
+            max_tokens,
+            chat_history,
+            model
+    )-> str:
+        openai_repository = request.app.state.openai_repository
+
+        logger.info("generating llm response using model: {model}".format(model=model))
+        llm_messages = self.build_messages(Default_system_prompt, content_prompt, chat_history)
+        with llm_call_labels(caller="writer_assistant"):
+            response = await openai_repository.get_chat_response_async(
+                llm_messages,
+                model=model,
+                temperature=0.1,
+                max_tokens=max_tokens,
+                semantic_cache=True,
+                semantic_query=content_prompt,
+                semantic_scope=self.semantic_scope(model, Default_system_prompt, chat_history),
+            )
+        if response.finish_reason == "stop":
+            return response.content
         else:
-            print("error code: ", response.choices[0].finish_reason)
-            return f"The response was not completed due to {response.choices[0].finish_reason} issues. Try again, please."
+            logger.warning(f"error code: {response.finish_reason}")
+            return f"The response was not completed due to {response.finish_reason} issues. Try again, please."
+
+    def stream_prompt_to_llm(
+            self,
+            request,
+            Default_system_prompt,
+            content_prompt,
+            max_tokens,
+            chat_history,
+            model
+    ) -> AsyncIterator[str]:
+        """
+        Streams the LLM response as text deltas. Closing the returned iterator
+        cancels the generation upstream.
+        """
+        openai_repository = request.app.state.openai_repository
+
+        logger.info("streaming llm response using model: {model}".format(model=model))
+        llm_messages = self.build_messages(Default_system_prompt, content_prompt, chat_history)
+        with llm_call_labels(caller="writer_assistant"):
+            return openai_repository.stream_chat_completion_async(
+                llm_messages,
+                model=model,
+                temperature=0.1,
+                max_tokens=max_tokens,
+            )
         
     def add_chat_to_history(self, latest_response, chat_history):
         """
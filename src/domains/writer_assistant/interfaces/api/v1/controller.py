@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Request, Depends
+from fastapi.responses import StreamingResponse
 from src.base.decorators.middleware.session_based import session_based
 from src.domains.writer_assistant.entities.metadata import RequestData
 from src.domains.writer_assistant.services.chat_service import ChatService
@@ -7,6 +8,7 @@ from src.domains.writer_assistant.dependencies.get_chat_history_service import (
     get_chat_history_service
 )
 from src.domains.writer_assistant.dependencies.get_chat_service import get_chat_service
+from src.base.utils.sse import format_sse
 import logging
 
 logger = logging.getLogger(__name__)
@@ -38,6 +40,42 @@ async def send_message(
     
     return response
 
+@router.post("/api/v1/writer_assistant/stream")
+@session_based
+async def stream_message(
+    request: Request,
+    messageRequest: RequestData,
+    chat_service: ChatService = Depends(get_chat_service),
+    chat_history_service: ChatHistoryService = Depends(get_chat_history_service)
+):
+    """
+    Server-Sent Events variant of send_message.
+
+    Each generated chunk is sent as ``data: {"delta": "..."}``, followed by a
+    final ``event: done`` carrying the full text. When the client disconnects
+    the generator is cancelled, which also cancels the upstream LLM request.
+    """
+    logger.info("stream_message endpoint called")
+
+    chat_history = await chat_history_service.get_chat_history(request)
+
+    async def event_stream():
+        parts = []
+        chunks = chat_service.stream_message(request, messageRequest, chat_history)
+        try:
+            async for delta in chunks:
+                parts.append(delta)
+                yield format_sse({"delta": delta})
+            yield format_sse({"text": "".join(parts)}, event="done")
+        finally:
+            await chunks.aclose()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.get("/api/v1/writer_assistant/download_history")
 @session_based
 async def download_history(
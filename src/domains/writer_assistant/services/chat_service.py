@@ -1,7 +1,8 @@
 from fastapi import Request
-from typing import List
+from typing import AsyncIterator, List
 from src.domains.writer_assistant.entities.metadata import Metadata, RequestData
 from src.domains.writer_assistant.handlers.chat_handler import ChatHandler
+from src.domains.writer_assistant.services.chat_history_service import ChatHistoryService
 import logging
 
 logger = logging.getLogger(__name__)
@@ -14,15 +15,19 @@ class ChatService:
     def __init__(
             self,
             chat_handler: ChatHandler,
+            chat_history_service: ChatHistoryService,
             generate_prompts: callable
         ):
         """
         Initialize the ChatService.
 
         Args:
+            chat_handler (ChatHandler): Handler for the LLM calls.
             chat_history_service (ChatHistoryService): Service for managing chat history.
+            generate_prompts (callable): Builds the system and content prompts from the metadata.
         """
         self.chat_handler = chat_handler
+        self.chat_history_service = chat_history_service
         self.generate_prompts = generate_prompts
 
     async def send_message(self, request: Request, messageRequest: RequestData, chat_history: List[dict]) -> str:
@@ -59,8 +64,57 @@ class ChatService:
             "char_length": len(response)
         }
 
-        self.chat_history_service.add_message(request, history_message)
-        return response[0]
+        await self.chat_history_service.append_message(request, history_message)
+        return response
+
+    async def stream_message(
+            self,
+            request: Request,
+            messageRequest: RequestData,
+            chat_history: List[dict]
+    ) -> AsyncIterator[str]:
+        """
+        Streams the response from the OpenAI API as text deltas.
+
+        The chat history is only updated once the full response has been
+        received; if the client goes away mid-stream the upstream generation
+        is cancelled and nothing is saved.
+
+        Args:
+            request (Request): The FastAPI request object.
+            messageRequest (RequestData): The writing request.
+            chat_history (List[dict]): The previous messages of the session.
+
+        Yields:
+            str: The response text as it is generated.
+        """
+        metadata = self.generate_metadata(messageRequest)
+        default_system_prompt, content_prompt = self.generate_prompts(metadata)
+        max_tokens = self.chat_handler.max_tokens(metadata.max_char_length)
+        model = request.app.state.settings.ai_models.model
+
+        chunks = self.chat_handler.stream_prompt_to_llm(
+            request,
+            default_system_prompt,
+            content_prompt,
+            max_tokens,
+            chat_history,
+            model
+        )
+        parts = []
+        try:
+            async for delta in chunks:
+                parts.append(delta)
+                yield delta
+        finally:
+            await chunks.aclose()
+
+        response = "".join(parts)
+        await self.chat_history_service.append_message(request, {
+            "prompt": metadata.prompt_text,
+            "generated_text": response,
+            "char_length": len(response)
+        })
     
     def generate_metadata(self, messageRequest: RequestData) -> Metadata:
         return Metadata(
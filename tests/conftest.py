@@ -0,0 +1,49 @@
+import pytest
+import pytest_asyncio
+from src.base.infrastructure.ai.openai_client import OpenAIClient
+
+
+class FakeClock:
+    """Monotonic clock that only moves when a test sets ``now``."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def fake_clock():
+    """Clock to inject into caches and pools whose expiry a test drives."""
+    return FakeClock()
+
+
+@pytest_asyncio.fixture
+async def openai_client(request):
+    """
+    Factory of test OpenAIClients, closed at teardown.
+
+    Keyword arguments, or an indirect parameter dict, override the defaults
+    (an unreachable URL and no retries).
+    """
+    defaults = {
+        "url": "http://127.0.0.1:9/v1",
+        "api_key": "sk-test",
+        "model": "gpt-4o",
+        "model_mini": "gpt-4o-mini",
+        "embedding_model": "text-embedding-ada-002",
+        "whispering_model": "whisper-1",
+        "image_model": "dall-e-3",
+        "max_retries": 0,
+        **getattr(request, "param", {})
+    }
+    clients = []
+
+    def make(**overrides) -> OpenAIClient:
+        clients.append(OpenAIClient(**{**defaults, **overrides}))
+        return clients[-1]
+
+    yield make
+    for client in clients:
+        await client.aclose()
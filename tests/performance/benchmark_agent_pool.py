@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+"""
+Cold vs. warm per-message overhead of getting a live agent from the pool.
+
+A cold message reads the blueprint and builds the agent (factory, registry
+lookups, tool attachment, personality context); both are simulated with a
+fixed sleep so the numbers only reflect what the pool saves per message.
+Run from the project root:
+
+    python tests/performance/benchmark_agent_pool.py --agents 100 --build-ms 15
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.domains.agentverse.caches.agent_pool import AgentPool
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(label, samples):
+    print(
+        f"{label:<6} n={len(samples):<5} "
+        f"mean={statistics.mean(samples) * 1000:8.3f}ms "
+        f"p50={percentile(samples, 50) * 1000:8.3f}ms "
+        f"p99={percentile(samples, 99) * 1000:8.3f}ms"
+    )
+
+
+async def run(agents: int, rounds: int, latency: float, build_cost: float):
+    pool = AgentPool(max_agents=agents, idle_ttl_seconds=3600, max_age_seconds=3600)
+    agent_ids = [f"eva-{i:04d}" for i in range(agents)]
+
+    def builder(agent_id):
+        async def build():
+            await asyncio.sleep(latency)
+            await asyncio.sleep(build_cost)
+            return SimpleNamespace(id=agent_id, spawned=True, prompt="You are an EVA. " * 50)
+        return build
+
+    async def message(agent_id):
+        start = time.perf_counter()
+        await pool.get_or_build(agent_id, builder(agent_id))
+        return time.perf_counter() - start
+
+    cold = [await message(agent_id) for agent_id in agent_ids]
+    warm = [await message(agent_id) for _ in range(rounds) for agent_id in agent_ids]
+
+    summarize("cold", cold)
+    summarize("warm", warm)
+    print(f"stats  {pool.stats()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--agents", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="Simulated blueprint read")
+    parser.add_argument("--build-ms", type=float, default=15.0, help="Simulated agent build")
+    args = parser.parse_args()
+    asyncio.run(run(args.agents, args.rounds, args.latency_ms / 1000, args.build_ms / 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+"""
+Cold vs. warm latency benchmark for the agent blueprint cache.
+
+The Mongo round-trip is simulated with a fixed sleep so the numbers only
+reflect what the cache saves per lookup. Run from the project root:
+
+    python tests/performance/benchmark_blueprint_cache.py --agents 200 --latency-ms 2
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.domains.agentverse.caches.blueprint_cache import AgentBlueprintCache
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(label, samples):
+    print(
+        f"{label:<6} n={len(samples):<5} "
+        f"mean={statistics.mean(samples) * 1000:8.3f}ms "
+        f"p50={percentile(samples, 50) * 1000:8.3f}ms "
+        f"p99={percentile(samples, 99) * 1000:8.3f}ms"
+    )
+
+
+async def run(agents: int, rounds: int, latency: float):
+    cache = AgentBlueprintCache(max_size=agents, ttl_seconds=300)
+    modified = datetime.now()
+
+    async def load(agent_id):
+        await asyncio.sleep(latency)
+        return {"_id": agent_id, "agent_id": agent_id, "agent_name": agent_id, "modified": modified}
+
+    async def load_version(agent_id):
+        await asyncio.sleep(latency)
+        return modified
+
+    agent_ids = [f"eva-{i:04d}" for i in range(agents)]
+
+    cold = []
+    for agent_id in agent_ids:
+        start = time.perf_counter()
+        await cache.get_or_load(agent_id, load, load_version)
+        cold.append(time.perf_counter() - start)
+
+    warm = []
+    for _ in range(rounds):
+        for agent_id in agent_ids:
+            start = time.perf_counter()
+            await cache.get_or_load(agent_id, load, load_version)
+            warm.append(time.perf_counter() - start)
+
+    summarize("cold", cold)
+    summarize("warm", warm)
+    print(f"stats  {cache.stats()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--agents", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="Simulated Mongo round-trip")
+    args = parser.parse_args()
+    asyncio.run(run(args.agents, args.rounds, args.latency_ms / 1000))
+
+
+if __name__ == "__main__":
+    main()
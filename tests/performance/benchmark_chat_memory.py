@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+"""
+Per-turn cost of conversation memory: JSON blob vs. capped Redis list.
+
+Replays a long conversation through the previous blob scheme (GET the whole
+history, append, SET it back) and through ``ChatMemory`` (LRANGE of the
+recent turns, pipelined RPUSH + LTRIM), and reports bytes moved and time per
+turn as the conversation grows. Uses an in-process store by default, or a
+real server with ``--redis-url``. Run from the project root:
+
+    python tests/performance/benchmark_chat_memory.py --turns 2000
+    python tests/performance/benchmark_chat_memory.py --turns 2000 --redis-url redis://localhost:6379/15
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.domains.agentverse.agents.utils.chat_memory import ChatMemory
+
+CHECKPOINTS = (10, 100, 500, 1000, 2000, 5000)
+
+
+class InProcessRedis:
+    """The subset of RedisRepository used here, with Redis list semantics."""
+
+    def __init__(self):
+        self.values = {}
+        self.lists = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, expiration=None):
+        self.values[key] = value
+        return True
+
+    async def delete(self, key):
+        existed = key in self.values or key in self.lists
+        self.values.pop(key, None)
+        self.lists.pop(key, None)
+        return existed
+
+    async def rpush(self, key, values, max_length=None, expiration=None):
+        items = self.lists.setdefault(key, [])
+        items.extend(values)
+        length = len(items)
+        if max_length:
+            del items[:-max_length]
+        return length
+
+    async def lrange(self, key, start, end):
+        items = self.lists.get(key, [])
+        start = max(len(items) + start, 0) if start < 0 else start
+        end = len(items) + end if end < 0 else end
+        return items[start:end + 1]
+
+
+class ByteCounter:
+    """Counts the payload bytes exchanged with the wrapped repository."""
+
+    def __init__(self, repository):
+        self.repository = repository
+        self.bytes = 0
+
+    def _count(self, value):
+        if isinstance(value, (list, tuple)):
+            for item in value:
+                self._count(item)
+        elif isinstance(value, (str, bytes)):
+            self.bytes += len(value)
+
+    async def get(self, key):
+        value = await self.repository.get(key)
+        self._count(value)
+        return value
+
+    async def set(self, key, value, expiration=None):
+        self._count(value)
+        return await self.repository.set(key, value, expiration)
+
+    async def delete(self, key):
+        return await self.repository.delete(key)
+
+    async def rpush(self, key, values, max_length=None, expiration=None):
+        self._count(values)
+        return await self.repository.rpush(key, values, max_length=max_length, expiration=expiration)
+
+    async def lrange(self, key, start, end):
+        values = await self.repository.lrange(key, start, end)
+        self._count(values)
+        return values
+
+
+def turn(i: int):
+    user = f"Question {i}: how do the shelves in aisle {i % 40} fit a 60cm alcove?"
+    agent = f"Answer {i}: " + "The BILLY unit is 40cm wide and 28cm deep, so two fit with room to spare. " * 3
+    return user, agent
+
+
+async def blob_turn(cache, key, i):
+    user, agent = turn(i)
+    raw = await cache.get(key)
+    history = json.loads(raw) if raw else []
+    history.append({"user": user})
+    history.append({"agent": agent})
+    await cache.set(key, json.dumps(history))
+
+
+async def list_turn(memory, i):
+    user, agent = turn(i)
+    history = await memory.recent()
+    history.append({"user": user})
+    await memory.append({"user": user}, {"agent": agent})
+
+
+async def replay(label, cache, run_turn, turns):
+    print(f"{label}")
+    window_bytes, window_time, last = cache.bytes, 0.0, 0
+    for i in range(1, turns + 1):
+        start = time.perf_counter()
+        await run_turn(i)
+        window_time += time.perf_counter() - start
+        if i in CHECKPOINTS or i == turns:
+            count = i - last
+            print(
+                f"  turns {last + 1:>5}-{i:<5} "
+                f"bytes/turn={(cache.bytes - window_bytes) / count:10.0f} "
+                f"time/turn={window_time / count * 1000:8.3f}ms"
+            )
+            window_bytes, window_time, last = cache.bytes, 0.0, i
+
+
+async def run(turns: int, max_entries: int, recent_entries: int, redis_url: str = None):
+    if redis_url:
+        import aioredis
+        from src.base.repositories.redis_impl import RedisRepositoryImpl
+        client = aioredis.from_url(redis_url, decode_responses=True)
+        repository = RedisRepositoryImpl(client)
+    else:
+        client, repository = None, InProcessRedis()
+
+    blob_key = "benchmark:eva-00_memory"
+    memory = ChatMemory(repository, "benchmark:eva-01", max_entries=max_entries, recent_entries=recent_entries)
+    await repository.delete(blob_key)
+    await memory.clear()
+    try:
+        blob_cache = ByteCounter(repository)
+        await replay("json blob", blob_cache, lambda i: blob_turn(blob_cache, blob_key, i), turns)
+
+        list_cache = ByteCounter(repository)
+        memory.cache = list_cache
+        await replay(
+            f"capped list (max {max_entries}, recent {recent_entries})",
+            list_cache,
+            lambda i: list_turn(memory, i),
+            turns
+        )
+    finally:
+        await repository.delete(blob_key)
+        await repository.delete(memory.key)
+        if client is not None:
+            await client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--turns", type=int, default=2000)
+    parser.add_argument("--max-entries", type=int, default=200)
+    parser.add_argument("--recent-entries", type=int, default=50)
+    parser.add_argument("--redis-url", default=None, help="Benchmark against a real Redis instead of in-process")
+    args = parser.parse_args()
+    asyncio.run(run(args.turns, args.max_entries, args.recent_entries, args.redis_url))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+"""
+Command room log throughput: one frame per line vs. batched frames.
+
+Emits ``--lines`` log lines for one socket through ``emit_log``, first
+sending each line as its own frame and then inside ``batched_logs``, over
+a socket bridge that yields to the event loop per frame, plus
+``--send-ms`` to simulate a slow consumer. Reports lines per second,
+frames sent and lines dropped by the bounded buffer. Run from the project
+root:
+
+    python tests/performance/benchmark_command_room_emitter.py --lines 20000
+    python tests/performance/benchmark_command_room_emitter.py --lines 2000 --send-ms 2
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.domains.agentverse.command_room.batched_emitter import BatchedEmitter, _emitter
+from src.domains.agentverse.command_room.command_room import CommandRoomTransmitter
+from src.domains.agentverse.command_room.utils.emit import emit_log
+
+
+class SimulatedBridge:
+    def __init__(self, send_seconds: float):
+        self.send_seconds = send_seconds
+        self.frames = 0
+
+    async def send_to_socket(self, socket_id, message):
+        self.frames += 1
+        # A socket write yields to the loop even when the client keeps up
+        await asyncio.sleep(self.send_seconds)
+
+
+async def emit_all(commandroom, lines):
+    for i in range(lines):
+        await emit_log("socket-1", f"[💠 Joshu-A][NERV][DOS] stage {i} completed", commandroom)
+        if i % 50 == 0:
+            # Orchestration awaits other I/O between stages
+            await asyncio.sleep(0)
+
+
+async def run(lines: int, send_seconds: float, interval_ms: float, max_batch: int, max_buffer: int):
+    bridge = SimulatedBridge(send_seconds)
+    commandroom = CommandRoomTransmitter(bridge)
+    start = time.perf_counter()
+    await emit_all(commandroom, lines)
+    elapsed = time.perf_counter() - start
+    print(f"per line  lines/s={lines / elapsed:10.0f} frames={bridge.frames:<7} dropped=0")
+
+    bridge = SimulatedBridge(send_seconds)
+    commandroom = CommandRoomTransmitter(bridge)
+    emitter = BatchedEmitter(
+        commandroom, "socket-1", flush_interval=interval_ms / 1000, max_batch=max_batch, max_buffer=max_buffer
+    )
+    dropped = []
+    deliver = commandroom.deliver
+
+    async def counting_deliver(socket_id, frame, log=True):
+        dropped.append(frame.get("dropped", 0) if isinstance(frame, dict) else 0)
+        await deliver(socket_id, frame, log=log)
+
+    commandroom.deliver = counting_deliver
+    token = _emitter.set(emitter)
+    start = time.perf_counter()
+    try:
+        await emit_all(commandroom, lines)
+    finally:
+        _emitter.reset(token)
+        await emitter.close()
+    elapsed = time.perf_counter() - start
+    print(f"batched   lines/s={lines / elapsed:10.0f} frames={bridge.frames:<7} dropped={sum(dropped)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lines", type=int, default=20000)
+    parser.add_argument("--send-ms", type=float, default=0.0, help="Simulated delay of a slow consumer per frame")
+    parser.add_argument("--interval-ms", type=float, default=5.0)
+    parser.add_argument("--max-batch", type=int, default=100)
+    parser.add_argument("--max-buffer", type=int, default=500)
+    args = parser.parse_args()
+    # Every line is also written to the command room logger; keep it out of the timings
+    logging.disable(logging.CRITICAL)
+    asyncio.run(run(args.lines, args.send_ms / 1000, args.interval_ms, args.max_batch, args.max_buffer))
+
+
+if __name__ == "__main__":
+    main()
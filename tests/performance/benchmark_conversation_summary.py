@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+"""
+History tokens sent per turn with and without rolling summarization.
+
+Replays a long conversation through ``ChatMemory`` twice: once reading the
+recent turns only, as agents did before, and once with the conversation
+summarizer folding the oldest turns into a summary between turns (with a
+stand-in model that returns a fixed-size summary). Reports the tokens of
+the history each turn would send, and the time to read it. Run from the
+project root:
+
+    python tests/performance/benchmark_conversation_summary.py --turns 500
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.base.infrastructure.ai.tokenizer import get_tokenizer
+from src.domains.agentverse.agents.utils.chat_memory import ChatMemory
+from src.domains.agentverse.agents.utils.conversation_summarizer import ConversationSummarizer
+
+CHECKPOINTS = (10, 50, 100, 250, 500, 1000)
+
+
+class InProcessRedis:
+    """The subset of RedisRepository used here, with Redis list semantics."""
+
+    def __init__(self):
+        self.values = {}
+        self.lists = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, expiration=None):
+        self.values[key] = value
+        return True
+
+    async def setnx(self, key, value, expiration=None):
+        # Locks never outlive a pass here; the summarizer's own interval is the limit
+        return True
+
+    async def delete(self, key):
+        existed = key in self.values or key in self.lists
+        self.values.pop(key, None)
+        self.lists.pop(key, None)
+        return existed
+
+    async def rpush(self, key, values, max_length=None, expiration=None):
+        items = self.lists.setdefault(key, [])
+        items.extend(values)
+        length = len(items)
+        if max_length:
+            del items[:-max_length]
+        return length
+
+    async def ltrim(self, key, start, end):
+        self.lists[key] = await self.lrange(key, start, end)
+        return True
+
+    async def lrange(self, key, start, end):
+        items = self.lists.get(key, [])
+        start = max(len(items) + start, 0) if start < 0 else start
+        end = len(items) + end if end < 0 else end
+        return items[start:end + 1]
+
+
+class FixedSummaryLLM:
+    async def generate_async(self, prompt, user_input, history, max_tokens=150, **kwargs):
+        return "The user is planning shelving for a narrow alcove. " * (max_tokens // 12)
+
+
+def turn(i: int):
+    user = f"Question {i}: how do the shelves in aisle {i % 40} fit a 60cm alcove?"
+    agent = f"Answer {i}: " + "The BILLY unit is 40cm wide and 28cm deep, so two fit with room to spare. " * 3
+    return user, agent
+
+
+async def replay(label, memory, turns, summarizer=None):
+    tokenizer = get_tokenizer()
+    agent = SimpleNamespace(id="benchmark", type="chat", llm=FixedSummaryLLM(), memory=memory)
+    print(label)
+    window_tokens, window_time, last = 0, 0.0, 0
+    for i in range(1, turns + 1):
+        start = time.perf_counter()
+        history = await memory.recent()
+        window_time += time.perf_counter() - start
+        window_tokens += sum(tokenizer.count(" ".join(entry.values())) for entry in history)
+
+        user, response = turn(i)
+        await memory.append({"user": user}, {"agent": response})
+        if summarizer is not None:
+            # Stands in for the background worker, which would run between turns
+            await summarizer.summarize(agent)
+
+        if i in CHECKPOINTS or i == turns:
+            count = i - last
+            print(
+                f"  turns {last + 1:>5}-{i:<5} "
+                f"history_tokens/turn={window_tokens / count:8.0f} "
+                f"read/turn={window_time / count * 1e6:8.1f}us"
+            )
+            window_tokens, window_time, last = 0, 0.0, i
+
+
+async def run(turns: int, recent_entries: int, threshold: int, keep_entries: int):
+    before = ChatMemory(InProcessRedis(), "benchmark", recent_entries=recent_entries)
+    await replay(f"recent turns only (recent {recent_entries})", before, turns)
+
+    after = ChatMemory(InProcessRedis(), "benchmark", recent_entries=recent_entries)
+    summarizer = ConversationSummarizer(token_threshold=threshold, keep_entries=keep_entries, min_interval_seconds=0)
+    await replay(f"rolling summary (threshold {threshold} tokens, keep {keep_entries})", after, turns, summarizer)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--turns", type=int, default=500)
+    parser.add_argument("--recent-entries", type=int, default=50)
+    parser.add_argument("--threshold", type=int, default=2000)
+    parser.add_argument("--keep-entries", type=int, default=20)
+    args = parser.parse_args()
+    # Summarization passes log through the agentverse loggers; keep them out of the timings
+    logging.disable(logging.CRITICAL)
+    asyncio.run(run(args.turns, args.recent_entries, args.threshold, args.keep_entries))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+"""
+Embedding throughput with and without micro-batching.
+
+Starts a fake local embeddings endpoint (fixed latency per request, any
+number of inputs) and embeds N texts from concurrent callers through
+OpenAIClient, once with batching disabled and once enabled. Run from the
+project root:
+
+    python tests/performance/benchmark_embedding_batcher.py --texts 500 --latency-ms 40
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+from aiohttp import web
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.base.infrastructure.ai.openai_client import OpenAIClient
+
+
+async def start_fake_server(latency: float, stats: dict):
+    async def embeddings(request: web.Request) -> web.Response:
+        body = await request.json()
+        inputs = body["input"] if isinstance(body["input"], list) else [body["input"]]
+        stats["requests"] += 1
+        await asyncio.sleep(latency)
+        return web.json_response({
+            "object": "list",
+            "model": body["model"],
+            "data": [
+                {"object": "embedding", "index": i, "embedding": [float(len(text)), 1.0, 0.0]}
+                for i, text in enumerate(inputs)
+            ],
+            "usage": {"prompt_tokens": len(inputs), "total_tokens": len(inputs)}
+        })
+
+    app = web.Application()
+    app.router.add_post("/v1/embeddings", embeddings)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/v1"
+
+
+async def embed_all(url: str, texts, batch_size: int, concurrency: int, stats: dict):
+    client = OpenAIClient(
+        url=url,
+        api_key="sk-benchmark",
+        model="gpt-4o",
+        model_mini="gpt-4o-mini",
+        embedding_model="text-embedding-ada-002",
+        whispering_model="whisper-1",
+        image_model="dall-e-3",
+        max_concurrency=concurrency,
+        max_retries=0,
+        embedding_batch_size=batch_size
+    )
+    stats["requests"] = 0
+    start = time.perf_counter()
+    await asyncio.gather(*(client.get_embeddings_async(text) for text in texts))
+    elapsed = time.perf_counter() - start
+    await client.aclose()
+    return elapsed
+
+
+async def run(n: int, latency: float, batch_size: int, concurrency: int):
+    stats = {"requests": 0}
+    runner, url = await start_fake_server(latency, stats)
+    texts = [f"chunk number {i} of the document" for i in range(n)]
+    try:
+        for label, size in (("unbatched", 1), ("batched", batch_size)):
+            elapsed = await embed_all(url, texts, size, concurrency, stats)
+            print(
+                f"{label:<10} texts={n:<5} requests={stats['requests']:<5} "
+                f"elapsed={elapsed:7.3f}s throughput={n / elapsed:9.1f} texts/s"
+            )
+    finally:
+        await runner.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--texts", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=40.0, help="Simulated embeddings round-trip")
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, default=32, help="Client-side in-flight request limit")
+    args = parser.parse_args()
+    asyncio.run(run(args.texts, args.latency_ms / 1000, args.batch_size, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+"""
+Prompt size and latency over a long conversation, with and without packing.
+
+Replays a multi-hundred-turn conversation through OpenAIRepository.generate_async
+against a fake model whose latency grows with the prompt token count, the
+way real prefill time does. Run from the project root:
+
+    python tests/performance/benchmark_history_packing.py --turns 500 --budget 3000
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.base.infrastructure.ai.history_packer import HistoryPacker
+from src.base.infrastructure.ai.tokenizer import Tokenizer
+from src.base.repositories.openai_repository import OpenAIRepository
+
+
+class FakeModelClient:
+    """Answers instantly apart from a per-prompt-token delay."""
+
+    model = "gpt-4o"
+
+    def __init__(self, tokenizer: Tokenizer, seconds_per_token: float):
+        self.tokenizer = tokenizer
+        self.seconds_per_token = seconds_per_token
+        self.last_prompt_tokens = 0
+
+    async def create_chat_completion_async(self, messages, max_tokens=150, model=None, temperature=None, timeout=None):
+        self.last_prompt_tokens = self.tokenizer.count_messages(messages)
+        await asyncio.sleep(self.last_prompt_tokens * self.seconds_per_token)
+        content = "Sure, here is a short answer about that topic, with a little detail."
+        return SimpleNamespace(
+            model=self.model,
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content), finish_reason="stop")],
+            usage=SimpleNamespace(prompt_tokens=self.last_prompt_tokens, completion_tokens=self.tokenizer.count(content))
+        )
+
+
+async def replay(repository: OpenAIRepository, client: FakeModelClient, turns: int, checkpoints):
+    history = []
+    rows = []
+    for turn in range(1, turns + 1):
+        user_input = f"Turn {turn}: can you tell me more about option {turn % 7} for the living room?"
+        start = time.perf_counter()
+        answer = await repository.generate_async("You are EVA, a helpful interior designer.", user_input, history)
+        elapsed = time.perf_counter() - start
+        history += [{"user": user_input}, {"agent": answer}]
+        if turn in checkpoints:
+            rows.append((turn, client.last_prompt_tokens, elapsed))
+    return rows
+
+
+async def run(turns: int, budget: int, seconds_per_token: float):
+    tokenizer = Tokenizer()
+    checkpoints = {1, 10, 50, 100, 250, turns}
+    print(f"tokenizer: {'tiktoken' if tokenizer.exact else 'heuristic'}")
+    for label, packer in (("full", None), ("packed", HistoryPacker(tokenizer, max_prompt_tokens=budget))):
+        client = FakeModelClient(tokenizer, seconds_per_token)
+        repository = OpenAIRepository(client, history_packer=packer)
+        for turn, tokens, elapsed in await replay(repository, client, turns, checkpoints):
+            print(f"{label:<7} turn={turn:<5} prompt_tokens={tokens:<7} latency={elapsed * 1000:8.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--turns", type=int, default=500)
+    parser.add_argument("--budget", type=int, default=3000, help="Prompt token budget of the packer")
+    parser.add_argument("--us-per-token", type=float, default=20.0, help="Simulated prefill time per prompt token")
+    args = parser.parse_args()
+    asyncio.run(run(args.turns, args.budget, args.us_per_token / 1_000_000))
+
+
+if __name__ == "__main__":
+    main()
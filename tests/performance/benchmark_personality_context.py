@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""
+Agent construction time with and without the personality context cache.
+
+"before" clears the cache ahead of every construction, which is what every
+build used to cost; "after" reuses the context generated for the same DNA
+sequence and personality. Run from the project root:
+
+    python tests/performance/benchmark_personality_context.py --builds 2000
+"""
+import argparse
+import logging
+import os
+import statistics
+import sys
+import time
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.domains.agentverse.agents.mortal_eva import ChatAgent
+from src.domains.agentverse.agents.personalities.masters_of_the_universe.ingvar_kamprad import IngvarKamprad
+from src.domains.agentverse.caches.personality_context_cache import PERSONALITY_CONTEXTS
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(label, samples):
+    print(
+        f"{label:<6} n={len(samples):<5} "
+        f"mean={statistics.mean(samples) * 1e6:9.1f}us "
+        f"p50={percentile(samples, 50) * 1e6:9.1f}us "
+        f"p99={percentile(samples, 99) * 1e6:9.1f}us"
+    )
+
+
+def build(personality):
+    start = time.perf_counter()
+    ChatAgent(
+        id="eva-01",
+        creator="benchmark",
+        name="Unit 01",
+        system_name="unit_01",
+        type="mortal_eva",
+        prompt="You are an EVA.",
+        llm=None,
+        personality=personality,
+        dna_sequence="b" * 64
+    )
+    return time.perf_counter() - start
+
+
+def run(builds: int):
+    personality = IngvarKamprad()
+
+    before = []
+    for _ in range(builds):
+        PERSONALITY_CONTEXTS.clear()
+        before.append(build(personality))
+
+    PERSONALITY_CONTEXTS.clear()
+    after = [build(personality) for _ in range(builds)]
+
+    summarize("before", before)
+    summarize("after", after)
+    print(f"stats  {PERSONALITY_CONTEXTS.stats()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--builds", type=int, default=2000)
+    args = parser.parse_args()
+    # Construction logs through the agentverse loggers; keep them out of the timings
+    logging.disable(logging.CRITICAL)
+    run(args.builds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""
+Registry lookup throughput before and after ``freeze()``.
+
+Registers ``--components`` classes, then times ``--lookups`` ``get`` calls
+on the live registry (logged lookups) and on the frozen snapshot. Logging
+is left at its configured level, as in the app. Run from the project root:
+
+    python tests/performance/benchmark_registry_lookup.py --lookups 1000000
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.domains.agentverse.registries.base import Registry
+
+
+def timed(registry: Registry, names, lookups: int) -> float:
+    get = registry.get
+    count = len(names)
+    start = time.perf_counter()
+    for i in range(lookups):
+        get(names[i % count])
+    return time.perf_counter() - start
+
+
+def run(components: int, lookups: int):
+    registry = Registry(name="benchmark")
+    names = [f"component_{i}" for i in range(components)]
+    for name in names:
+        registry.register(name=name, component=type(name, (), {}))
+
+    live = timed(registry, names, lookups)
+    registry.freeze()
+    frozen = timed(registry, names, lookups)
+
+    for label, elapsed in (("live", live), ("frozen", frozen)):
+        print(
+            f"{label:<6} lookups={lookups:<8} total={elapsed:8.3f}s "
+            f"per_lookup={elapsed / lookups * 1e9:8.1f}ns"
+        )
+    print(f"speedup {live / frozen:.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--components", type=int, default=50)
+    parser.add_argument("--lookups", type=int, default=1_000_000)
+    args = parser.parse_args()
+    run(args.components, args.lookups)
+
+
+if __name__ == "__main__":
+    main()
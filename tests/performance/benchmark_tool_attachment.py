@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+"""
+Tool attachment time per agent build: per-build signature inspection vs.
+construction plans compiled at registration.
+
+Registers ``--tools`` synthetic tools (with the dependency mix of the real
+ones) in a private registry, then attaches all of them to an agent the way
+the factory used to and the way it does now. Run from the project root:
+
+    python tests/performance/benchmark_tool_attachment.py --tools 12 --builds 2000
+"""
+import argparse
+import inspect
+import logging
+import os
+import statistics
+import sys
+import time
+import warnings
+from types import SimpleNamespace
+from typing import Any, ClassVar, Dict, Optional
+from unittest.mock import patch
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.domains.agentverse.agents import factory as factory_module
+from src.domains.agentverse.agents.factory import AgentFactory
+from src.domains.agentverse.entities.tools.tool_spec import ToolSpec
+from src.domains.agentverse.registries.tool_registry import ToolRegistry
+from src.domains.agentverse.tools.base import BaseTool, ToolConfig
+
+DEPENDENCY_MIX = [(), ("llm",), ("llm", "vectordb"), ("vectordb",)]
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(label, samples):
+    print(
+        f"{label:<6} n={len(samples):<5} "
+        f"mean={statistics.mean(samples) * 1e6:9.1f}us "
+        f"p50={percentile(samples, 50) * 1e6:9.1f}us "
+        f"p99={percentile(samples, 99) * 1e6:9.1f}us"
+    )
+
+
+def make_tool(index: int):
+    class SyntheticToolConfig(ToolConfig):
+        top_k: int = 5
+
+    class SyntheticTool(BaseTool):
+        name: ClassVar[str] = f"tool_{index}"
+        version: ClassVar[str] = "1.0.0"
+        parameters: ClassVar[Dict[str, Any]] = {}
+
+        def __init__(self, config: Optional[SyntheticToolConfig] = None, llm: Any = None, vectordb: Any = None):
+            deps = {"llm": llm, "vectordb": vectordb}
+            super().__init__(config=config or SyntheticToolConfig(), **{
+                name: deps[name] for name in DEPENDENCY_MIX[index % len(DEPENDENCY_MIX)]
+            })
+
+    SyntheticTool.Config = SyntheticToolConfig
+    return SyntheticTool
+
+
+def attach_with_inspection(registry, agent, specs):
+    """The factory's previous implementation."""
+    for spec in specs:
+        tool_cls = registry.get(spec.name)
+        merged_cfg = tool_cls.Config().copy(update=spec.config or {})
+        sig = inspect.signature(tool_cls.__init__)
+        candidates = {
+            "llm": agent.llm, "vectordb": agent.vectordb, "cache": agent.cache,
+            "db": agent.db, "commbridge": agent.commbridge, "messaging": agent.messaging,
+        }
+        init_args = {name: dep for name, dep in candidates.items() if name in sig.parameters}
+        init_args["config"] = merged_cfg
+        agent.tools[spec.name] = tool_cls(**init_args)
+
+
+def run(tools: int, builds: int):
+    registry = ToolRegistry()
+    for index in range(tools):
+        registry.register(name=f"tool_{index}", component=make_tool(index))
+    specs = [ToolSpec(name=f"tool_{index}", config={"top_k": index}) for index in range(tools)]
+    factory = AgentFactory(None, None, None, None)
+
+    def new_agent():
+        return SimpleNamespace(llm=object(), vectordb=object(), cache=None, db=None, commbridge=None, messaging=None, tools={})
+
+    before, after = [], []
+    with patch.object(factory_module, "tool_registry", registry):
+        for _ in range(builds):
+            agent = new_agent()
+            start = time.perf_counter()
+            attach_with_inspection(registry, agent, specs)
+            before.append(time.perf_counter() - start)
+
+            agent = new_agent()
+            start = time.perf_counter()
+            factory._attach_tools(agent, specs)
+            after.append(time.perf_counter() - start)
+
+    print(f"{tools} tools per agent")
+    summarize("before", before)
+    summarize("after", after)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tools", type=int, default=12)
+    parser.add_argument("--builds", type=int, default=2000)
+    args = parser.parse_args()
+    # Registry lookups log through the agentverse loggers; keep them out of the timings
+    logging.disable(logging.CRITICAL)
+    # The previous implementation used pydantic's deprecated ``copy``
+    warnings.simplefilter("ignore", DeprecationWarning)
+    run(args.tools, args.builds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+"""
+Tool run latency: one tool after another vs. the concurrent ToolExecutor.
+
+Simulates the agent tools with the latencies given by ``--latencies``
+(milliseconds, one per tool), plus an optional tool that depends on the
+first one, and runs them sequentially, as agents did, and through the
+executor. Concurrent runs should take about as long as the slowest chain
+of tools. Run from the project root:
+
+    python tests/performance/benchmark_tool_executor.py --latencies 5,120,80,40 --runs 50
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.domains.agentverse.tools.base import BaseTool, ToolResult
+from src.domains.agentverse.tools.executor import ToolCall, ToolExecutor
+
+
+class SimulatedTool(BaseTool):
+    def __init__(self, latency: float):
+        super().__init__()
+        self.latency = latency
+
+    async def execute(self, **params) -> ToolResult:
+        await asyncio.sleep(self.latency)
+        return ToolResult(success=True, result=params)
+
+
+def summarize(label, samples):
+    print(
+        f"{label:<10} n={len(samples):<4} "
+        f"mean={statistics.mean(samples) * 1000:8.1f}ms "
+        f"max={max(samples) * 1000:8.1f}ms"
+    )
+
+
+async def sequential(tools, calls):
+    results = {}
+    for call in calls:
+        results[call.key] = await tools[call.tool].execute(**call.params)
+    return results
+
+
+async def run(latencies, dependent_ms, runs, max_concurrency):
+    tools = {f"tool_{i}": SimulatedTool(ms / 1000) for i, ms in enumerate(latencies)}
+    calls = [ToolCall(tool=name, params={"query": "alcove shelving"}) for name in tools]
+    if dependent_ms:
+        tools["dependent"] = SimulatedTool(dependent_ms / 1000)
+        calls.append(ToolCall(tool="dependent", depends_on=("tool_0",)))
+    executor = ToolExecutor(tools, max_concurrency=max_concurrency)
+
+    before, after = [], []
+    for _ in range(runs):
+        start = time.perf_counter()
+        await sequential(tools, calls)
+        before.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await executor.run(calls)
+        after.append(time.perf_counter() - start)
+
+    slowest_chain = max(latencies + ([latencies[0] + dependent_ms] if dependent_ms else []))
+    print(f"{len(calls)} tools, sum={sum(latencies) + dependent_ms}ms, slowest chain={slowest_chain}ms, cap={max_concurrency}")
+    summarize("sequential", before)
+    summarize("executor", after)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latencies", default="5,120,80,40", help="Comma-separated tool latencies in ms")
+    parser.add_argument("--dependent", type=int, default=30, help="Latency (ms) of a tool that needs the first one; 0 to omit")
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--max-concurrency", type=int, default=4)
+    args = parser.parse_args()
+    latencies = [int(value) for value in args.latencies.split(",")]
+    asyncio.run(run(latencies, args.dependent, args.runs, args.max_concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import asyncio
+import pytest
+from types import SimpleNamespace
+from src.domains.agentverse.caches.agent_pool import AgentPool, estimate_size
+from src.domains.agentverse.caches.blueprint_cache import AgentBlueprintCache
+
+
+def make_pool(clock, **kwargs) -> AgentPool:
+    kwargs.setdefault("sizeof", lambda agent: 100)
+    return AgentPool(clock=clock, **kwargs)
+
+
+def builder(calls: list, delay: float = 0.0):
+    async def build():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return SimpleNamespace(id=len(calls))
+    return build
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_build_once(fake_clock):
+    """Messages arriving together for a cold agent share a single build."""
+    pool = make_pool(fake_clock)
+    calls = []
+
+    agents = await asyncio.gather(*(pool.get_or_build("eva-01", builder(calls, 0.01)) for _ in range(5)))
+
+    assert len(calls) == 1
+    assert all(agent is agents[0] for agent in agents)
+    assert pool._locks == {}
+
+
+@pytest.mark.asyncio
+async def test_idle_and_old_agents_are_rebuilt(fake_clock):
+    """Agents are dropped once idle for too long or older than max_age_seconds."""
+    pool = make_pool(fake_clock, idle_ttl_seconds=10, max_age_seconds=25)
+    calls = []
+
+    first = await pool.get_or_build("eva-01", builder(calls))
+    fake_clock.now = 8
+    assert await pool.get_or_build("eva-01", builder(calls)) is first
+    fake_clock.now = 19
+    second = await pool.get_or_build("eva-01", builder(calls))
+    assert second is not first
+
+    for now in (26, 34, 42):
+        fake_clock.now = now
+        assert pool.get("eva-01") is second
+    fake_clock.now = 46
+    assert pool.get("eva-01") is None
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_memory_cap_evicts_least_recently_used(fake_clock):
+    """Beyond max_memory_bytes the least recently used agents are evicted."""
+    pool = make_pool(fake_clock, max_memory_bytes=250)
+    calls = []
+
+    await pool.get_or_build("eva-01", builder(calls))
+    await pool.get_or_build("eva-02", builder(calls))
+    pool.get("eva-01")
+    await pool.get_or_build("eva-03", builder(calls))
+
+    assert "eva-01" in pool and "eva-03" in pool
+    assert "eva-02" not in pool
+    assert pool.total_bytes == 200
+
+
+def test_blueprint_invalidation_evicts_agent(fake_clock):
+    """Editing a blueprint drops the live agent built from it."""
+    blueprints = AgentBlueprintCache()
+    pool = make_pool(fake_clock, blueprint_cache=blueprints)
+    pool.put("eva-01", SimpleNamespace())
+    pool.put("eva-02", SimpleNamespace())
+
+    blueprints.invalidate("eva-01", source="change_stream")
+    assert "eva-01" not in pool and "eva-02" in pool
+
+    blueprints.clear(source="change_stream_reset")
+    assert len(pool) == 0
+
+
+def test_estimate_size_skips_shared_clients():
+    """Injected clients are shared between agents and not charged to each of them."""
+    shared = SimpleNamespace(payload="x" * 100_000)
+    agent = SimpleNamespace(name="Unit 01", llm=shared, tools={"search": object()})
+
+    assert estimate_size(agent) < 10_000
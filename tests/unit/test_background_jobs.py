@@ -0,0 +1,116 @@
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+import pytest
+from src.base.utils.background_jobs import BackgroundJobQueue
+from src.domains.agentverse.caches.blueprint_cache import AgentBlueprintCache
+from src.domains.agentverse.entities.db import (
+    AGENT_STATUS_ACTIVE,
+    AGENT_STATUS_PENDING_SELFTEST,
+    AGENT_STATUS_SELFTEST_FAILED
+)
+from src.domains.agentverse.services.db_service import DBService
+from src.domains.agentverse.services.divine_orchestration_service import DivineOrchestrationService
+
+
+@pytest.mark.asyncio
+async def test_jobs_run_off_the_caller_and_failures_are_contained():
+    """Submitting returns at once; a failing job does not stop the workers."""
+    queue = BackgroundJobQueue(workers=1, max_size=3)
+    assert not queue.submit("early", AsyncMock())
+
+    runner = asyncio.create_task(queue.run())
+    await asyncio.sleep(0)
+    done = []
+
+    async def slow():
+        await asyncio.sleep(0.05)
+        done.append("slow")
+
+    async def broken():
+        raise RuntimeError("LLM unavailable")
+
+    try:
+        assert queue.submit("slow", slow)
+        assert done == []
+        assert queue.submit("broken", broken)
+        assert queue.submit("after", AsyncMock(side_effect=lambda: done.append("after")))
+        assert not queue.submit("overflow", AsyncMock())
+
+        await queue.join()
+        assert done == ["slow", "after"]
+    finally:
+        runner.cancel()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("outcome, status", [
+    ({"message": "EVA 'unit_01' successfully self-tested and deactivated."}, AGENT_STATUS_ACTIVE),
+    ({"status": "error", "message": "timeout"}, AGENT_STATUS_SELFTEST_FAILED),
+])
+async def test_self_test_result_updates_status_and_command_room(outcome, status):
+    db_service = SimpleNamespace(update_agent_status=AsyncMock(return_value=True))
+    commandroom = SimpleNamespace(to_socket=AsyncMock())
+    service = DivineOrchestrationService(agent_service=None, db_service=db_service)
+    service.self_test_and_sleep = AsyncMock(return_value=outcome)
+    agent = SimpleNamespace(id="eva-01", system_name="unit_01")
+
+    await service.run_self_test("request", agent, {"agent_id": "eva-01"}, commandroom, "socket-1")
+
+    db_service.update_agent_status.assert_awaited_once_with("request", "eva-01", status)
+    event = commandroom.to_socket.await_args.kwargs["message"]
+    assert event["event"] == "joshu-a.selftest" and event["agent_status"] == status
+
+
+class InMemoryAgents:
+    """Stands in for the MongoDB repository behind ``coll_agents``."""
+
+    def __init__(self, *documents):
+        self.documents = [dict(document) for document in documents]
+
+    async def find_one(self, query, collection_name, projection=None):
+        for document in self.documents:
+            if all(document.get(key) == value for key, value in query.items()):
+                if projection:
+                    return {key: document[key] for key in projection if projection[key] and key in document}
+                return dict(document)
+        return None
+
+    async def update_one(self, query, update, collection_name):
+        for document in self.documents:
+            if all(document.get(key) == value for key, value in query.items()):
+                document.update(update["$set"])
+                return True
+        return False
+
+
+@pytest.mark.asyncio
+async def test_status_from_self_test_is_read_back_through_blueprint_caches():
+    """Neither this worker's warm entry nor another worker's revalidation serves the old status."""
+    agents = InMemoryAgents({
+        "agent_id": "eva-01",
+        "agent_status": AGENT_STATUS_PENDING_SELFTEST,
+        "modified": datetime(2025, 1, 1)
+    })
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(
+        cognitive_modules={"db": {"mongodb": agents}}
+    )))
+    db_service = DBService(blueprint_cache=AgentBlueprintCache(change_stream_enabled=False))
+    # Another worker whose entry has expired and is revalidated by version
+    other_worker = DBService(blueprint_cache=AgentBlueprintCache(ttl_seconds=0, change_stream_enabled=False))
+    for service in (db_service, other_worker):
+        assert (await service.find_chat_agent(request, "eva-01"))["agent_status"] == AGENT_STATUS_PENDING_SELFTEST
+
+    orchestration = DivineOrchestrationService(agent_service=None, db_service=db_service)
+    orchestration.self_test_and_sleep = AsyncMock(return_value={"message": "ok"})
+    await orchestration.run_self_test(
+        request,
+        SimpleNamespace(id="eva-01", system_name="unit_01"),
+        {"agent_id": "eva-01"},
+        SimpleNamespace(to_socket=AsyncMock()),
+        "socket-1"
+    )
+
+    for service in (db_service, other_worker):
+        assert (await service.find_chat_agent(request, "eva-01"))["agent_status"] == AGENT_STATUS_ACTIVE
@@ -0,0 +1,72 @@
+import asyncio
+import json
+import pytest
+from src.domains.agentverse.command_room.batched_emitter import BatchedEmitter, batched_logs
+from src.domains.agentverse.command_room.command_room import CommandRoomTransmitter
+from src.domains.agentverse.command_room.utils.emit import emit_event, emit_log
+
+
+class RecordingBridge:
+    """Stands in for the socket bridge; ``delay`` simulates a slow consumer."""
+
+    def __init__(self, delay: float = 0):
+        self.delay = delay
+        self.frames = []
+
+    async def send_to_socket(self, socket_id, message):
+        await asyncio.sleep(self.delay)
+        self.frames.append(json.loads(message.split("] ", 1)[1]))
+
+
+@pytest.mark.asyncio
+async def test_operation_logs_are_coalesced_and_events_keep_their_place():
+    """Log lines go out as one frame, flushed ahead of the event that follows them."""
+    bridge = RecordingBridge()
+    commandroom = CommandRoomTransmitter(bridge)
+
+    await emit_log("socket-1", "before", commandroom)
+    async with batched_logs(commandroom, "socket-1"):
+        for stage in range(3):
+            await emit_log("socket-1", f"stage {stage}", commandroom)
+        await emit_event("socket-1", "joshu-a.create", {"status": "created"}, commandroom)
+        await emit_log("socket-1", "after", commandroom)
+
+    assert [frame["type"] for frame in bridge.frames] == ["log", "log_batch", "event", "log"]
+    assert bridge.frames[1]["messages"] == ["stage 0", "stage 1", "stage 2"]
+    assert bridge.frames[3]["message"] == "after"
+
+
+@pytest.mark.asyncio
+async def test_slow_consumers_lose_the_oldest_lines():
+    """While a send is held up the buffer stays bounded, dropping its oldest lines."""
+    bridge = RecordingBridge(delay=0.05)
+    emitter = BatchedEmitter(CommandRoomTransmitter(bridge), "socket-1", flush_interval=0, max_buffer=3)
+
+    emitter.log("first")
+    await asyncio.sleep(0.01)  # the first frame is now stuck in the slow send
+    for i in range(5):
+        emitter.log(f"line {i}")
+    await emitter.close()
+
+    assert bridge.frames[0] == {"type": "log", "message": "first"}
+    assert bridge.frames[1]["messages"] == ["line 2", "line 3", "line 4"]
+    assert bridge.frames[1]["dropped"] == 2
+
+
+@pytest.mark.asyncio
+async def test_slow_consumers_do_not_pile_up_flushers():
+    """One flusher at a time however many full batches wait, none left after close."""
+    bridge = RecordingBridge(delay=0.05)
+    emitter = BatchedEmitter(CommandRoomTransmitter(bridge), "socket-1", max_batch=10, max_buffer=50)
+    baseline = len(asyncio.all_tasks())
+
+    for i in range(1000):
+        emitter.log(f"line {i}")
+        if i % 10 == 0:
+            await asyncio.sleep(0)
+            assert len(asyncio.all_tasks()) - baseline <= 1
+    await emitter.close()
+
+    assert len(asyncio.all_tasks()) == baseline
+    sent = sum(len(frame.get("messages", [frame.get("message")])) for frame in bridge.frames)
+    assert sent + sum(frame.get("dropped", 0) for frame in bridge.frames) == 1000
@@ -0,0 +1,93 @@
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock
+from src.domains.agentverse.caches.blueprint_cache import AgentBlueprintCache
+
+
+def make_blueprint(agent_id: str, modified: datetime, doc_id: str = "doc-1") -> dict:
+    return {"_id": doc_id, "agent_id": agent_id, "agent_name": "Unit 01", "modified": modified}
+
+
+def make_cache(clock, ttl_seconds: float = 60.0) -> AgentBlueprintCache:
+    return AgentBlueprintCache(max_size=2, ttl_seconds=ttl_seconds, clock=clock)
+
+
+@pytest.mark.asyncio
+async def test_miss_then_hit_loads_once(fake_clock):
+    """The blueprint is read from the database only on the first lookup."""
+    cache = make_cache(fake_clock)
+    blueprint = make_blueprint("eva-01", datetime(2025, 1, 1))
+    load = AsyncMock(return_value=blueprint)
+    load_version = AsyncMock()
+
+    first = await cache.get_or_load("eva-01", load, load_version)
+    second = await cache.get_or_load("eva-01", load, load_version)
+
+    assert first == blueprint and second == blueprint
+    load.assert_awaited_once_with("eva-01")
+    load_version.assert_not_awaited()
+    assert cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_is_revalidated_by_version(fake_clock):
+    """An expired entry with an unchanged version is reused without a full reload."""
+    cache = make_cache(fake_clock, ttl_seconds=10)
+    modified = datetime(2025, 1, 1)
+    load = AsyncMock(return_value=make_blueprint("eva-01", modified))
+    load_version = AsyncMock(return_value=modified)
+
+    await cache.get_or_load("eva-01", load, load_version)
+    fake_clock.now = 11
+    await cache.get_or_load("eva-01", load, load_version)
+
+    load.assert_awaited_once()
+    load_version.assert_awaited_once_with("eva-01")
+    assert "eva-01" in cache._entries
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_with_new_version_is_reloaded(fake_clock):
+    """A version change forces a reload of the full blueprint."""
+    cache = make_cache(fake_clock, ttl_seconds=10)
+    old = make_blueprint("eva-01", datetime(2025, 1, 1))
+    new = dict(old, agent_name="Unit 01 (refit)", modified=datetime(2025, 2, 1))
+    load = AsyncMock(side_effect=[old, new])
+    load_version = AsyncMock(return_value=new["modified"])
+
+    await cache.get_or_load("eva-01", load, load_version)
+    fake_clock.now = 11
+    result = await cache.get_or_load("eva-01", load, load_version)
+
+    assert result["agent_name"] == "Unit 01 (refit)"
+    assert load.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_change_stream_events_invalidate_entries(fake_clock):
+    """Update events match on agent_id, delete events on the Mongo _id."""
+    cache = make_cache(fake_clock)
+    load = AsyncMock(side_effect=[
+        make_blueprint("eva-01", datetime(2025, 1, 1), doc_id="doc-1"),
+        make_blueprint("eva-02", datetime(2025, 1, 1), doc_id="doc-2"),
+    ])
+    await cache.get_or_load("eva-01", load, AsyncMock())
+    await cache.get_or_load("eva-02", load, AsyncMock())
+
+    cache.apply_change({"operationType": "update", "fullDocument": {"agent_id": "eva-01"}})
+    cache.apply_change({"operationType": "delete", "documentKey": {"_id": "doc-2"}})
+
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_cache_is_bounded(fake_clock):
+    """The least recently used blueprint is evicted once the cache is full."""
+    cache = make_cache(fake_clock)
+    load = AsyncMock(side_effect=lambda agent_id: make_blueprint(agent_id, datetime(2025, 1, 1), doc_id=agent_id))
+
+    for agent_id in ("eva-00", "eva-01", "eva-02"):
+        await cache.get_or_load(agent_id, load, AsyncMock())
+
+    assert len(cache) == 2
+    assert cache._entries.peek_stale("eva-00") is None
@@ -0,0 +1,180 @@
+import asyncio
+import json
+from types import SimpleNamespace
+import pytest
+from src.base.infrastructure.ai import llm_scheduler
+from src.domains.agentverse.agents.utils.chat_memory import ChatMemory
+from src.domains.agentverse.agents.utils.conversation_summarizer import ConversationSummarizer
+
+
+class InMemoryRedis:
+    """The subset of RedisRepository used by ChatMemory and the summarizer, with Redis index semantics."""
+
+    def __init__(self):
+        self.values = {}
+        self.lists = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, expiration=None):
+        self.values[key] = value
+        return True
+
+    async def setnx(self, key, value, expiration=None):
+        if key in self.values:
+            return False
+        self.values[key] = value
+        return True
+
+    async def delete(self, key):
+        existed = key in self.values or key in self.lists
+        self.values.pop(key, None)
+        self.lists.pop(key, None)
+        return existed
+
+    async def rpush(self, key, values, max_length=None, expiration=None):
+        items = self.lists.setdefault(key, [])
+        items.extend(values)
+        length = len(items)
+        if max_length:
+            del items[:-max_length]
+        return length
+
+    async def compact_list(self, key, head, start, set_key, set_value, expiration=None):
+        items = self.lists.get(key, [])
+        if not items or items[0] != head:
+            return False
+        self.values[set_key] = set_value
+        self.lists[key] = items[start:]
+        return True
+
+    async def ltrim(self, key, start, end):
+        self.lists[key] = await self.lrange(key, start, end)
+        return True
+
+    async def lrange(self, key, start, end):
+        items = self.lists.get(key, [])
+        start = max(len(items) + start, 0) if start < 0 else start
+        end = len(items) + end if end < 0 else end
+        return items[start:end + 1]
+
+
+@pytest.mark.asyncio
+async def test_turns_are_appended_and_capped():
+    """Every exchange is appended; only the newest max_entries are kept."""
+    redis = InMemoryRedis()
+    memory = ChatMemory(redis, "eva-01", max_entries=4, recent_entries=3)
+
+    for i in range(3):
+        await memory.append({"user": f"q{i}"}, {"agent": f"a{i}"})
+
+    assert len(redis.lists["agent:eva-01:turns"]) == 4
+    assert await memory.recent() == [{"agent": "a1"}, {"user": "q2"}, {"agent": "a2"}]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_appends_keep_every_turn():
+    """Unlike rewriting a blob, concurrent messages cannot drop each other's turns."""
+    redis = InMemoryRedis()
+    memory = ChatMemory(redis, "eva-01")
+
+    await asyncio.gather(*(memory.append({"user": f"q{i}"}, {"agent": f"a{i}"}) for i in range(10)))
+
+    assert len(await memory.recent(count=100)) == 20
+
+
+@pytest.mark.asyncio
+async def test_legacy_blob_is_migrated_once():
+    """A conversation stored as one JSON blob is moved into the list on first read."""
+    redis = InMemoryRedis()
+    legacy = [{"user": "hello"}, {"agent": "hi"}]
+    redis.values["eva-01_memory"] = json.dumps(legacy)
+    memory = ChatMemory(redis, "eva-01")
+
+    assert await memory.recent() == legacy
+    assert "eva-01_memory" not in redis.values
+
+    await memory.append({"user": "again"}, {"agent": "hi again"})
+    assert await memory.recent() == legacy + [{"user": "again"}, {"agent": "hi again"}]
+
+
+class SummarizingLLM:
+    """Records the priority each summarization call was scheduled at."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def generate_async(self, prompt, user_input, history, max_tokens=150, cache=None, **kwargs):
+        self.calls.append((llm_scheduler._priority.get(), user_input))
+        return "The user is furnishing a flat."
+
+
+def summarizing_agent(redis, llm):
+    memory = ChatMemory(redis, "eva-01", recent_entries=4)
+    return SimpleNamespace(id="eva-01", type="chat", llm=llm, memory=memory)
+
+
+@pytest.mark.asyncio
+async def test_oldest_turns_are_folded_into_the_summary():
+    """Past the token threshold, all but the newest turns become a summary returned ahead of them."""
+    redis, llm = InMemoryRedis(), SummarizingLLM()
+    agent = summarizing_agent(redis, llm)
+    summarizer = ConversationSummarizer(token_threshold=10, keep_entries=2)
+    for i in range(3):
+        await agent.memory.append({"user": f"question {i}"}, {"agent": f"answer {i}"})
+
+    assert await summarizer.summarize(agent)
+
+    assert llm.calls[0][0] == "background"
+    assert "question 0" in llm.calls[0][1] and "question 2" not in llm.calls[0][1]
+    assert await agent.memory.recent() == [
+        {"summary": "The user is furnishing a flat."}, {"user": "question 2"}, {"agent": "answer 2"}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_short_conversations_and_concurrent_changes_are_left_alone():
+    """Nothing is summarized under the threshold, and turns are kept if the list moved meanwhile."""
+    redis, llm = InMemoryRedis(), SummarizingLLM()
+    agent = summarizing_agent(redis, llm)
+    await agent.memory.append({"user": "hi"}, {"agent": "hello"}, {"user": "bye"})
+
+    assert not await ConversationSummarizer(token_threshold=1000, keep_entries=1).summarize(agent)
+    assert llm.calls == []
+
+    assert not await agent.memory.compact("stale", 2, {"user": "not the head"})
+    assert len(await agent.memory.turns()) == 3
+
+    # An append capping the list after the turns were read shifts its head
+    capped = ChatMemory(redis, "eva-01", max_entries=3)
+    older = await capped.turns()
+    await capped.append({"agent": "see you"})
+    assert not await capped.compact("stale", 2, older[0])
+    assert await capped.turns() == [{"agent": "hello"}, {"user": "bye"}, {"agent": "see you"}]
+
+
+@pytest.mark.asyncio
+async def test_submissions_are_rate_limited_per_agent(fake_clock):
+    """An agent is queued at most once per interval, and only while the worker runs."""
+    redis, llm = InMemoryRedis(), SummarizingLLM()
+    agent = summarizing_agent(redis, llm)
+    summarizer = ConversationSummarizer(token_threshold=1, keep_entries=2, min_interval_seconds=60, clock=fake_clock)
+    await agent.memory.append({"user": "q"}, {"agent": "a"}, {"user": "q"}, {"agent": "a"})
+
+    assert not summarizer.submit(agent, 4)
+    worker = asyncio.create_task(summarizer.run())
+    await asyncio.sleep(0)
+    try:
+        assert not summarizer.submit(agent, 2)
+        assert summarizer.submit(agent, 4)
+        assert not summarizer.submit(agent, 4)
+        await summarizer._queue.join()
+        assert len(llm.calls) == 1
+
+        fake_clock.now = 30.0
+        assert not summarizer.submit(agent, 6)
+        fake_clock.now = 61.0
+        assert summarizer.submit(agent, 6)
+    finally:
+        worker.cancel()
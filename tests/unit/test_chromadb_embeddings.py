@@ -0,0 +1,29 @@
+from dependency_injector import providers
+from langchain.schema.document import Document
+from src.base.dependencies.containers.chromadb_container import ChromaDBContainer
+from src.base.infrastructure.db.chromaDB.chromadb_client import ChromaDBClient
+
+
+class FakeOpenAIClient:
+    def __init__(self):
+        self.batches = []
+
+    def get_embeddings(self, text):
+        return [float(len(text)), 1.0]
+
+    def get_embeddings_batch(self, texts):
+        self.batches.append(list(texts))
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+def test_ingested_chunks_are_embedded_in_batches_by_the_app_client(tmp_path):
+    openai_client = FakeOpenAIClient()
+    container = ChromaDBContainer(openai=providers.DependenciesContainer(openai_client=providers.Object(openai_client)))
+    container.chromadb_client.add_kwargs(chroma_path=str(tmp_path))
+    chunks = [Document(page_content="chunk " + "x" * i) for i in range(5)]
+
+    container.chromadb_client().add_documents(chunks, ids=[str(i) for i in range(5)])
+
+    assert isinstance(container.chromadb_client(), ChromaDBClient)
+    assert container.embedding_function().openai_client is openai_client
+    assert [text for batch in openai_client.batches for text in batch] == [chunk.page_content for chunk in chunks]
@@ -0,0 +1,92 @@
+import logging
+from types import SimpleNamespace
+from prometheus_client import REGISTRY
+from src.base.infrastructure.db.mongoDB.command_monitor import (
+    MongoCommandMonitor,
+    redact_shape
+)
+
+
+def started(command_name, command, request_id=1):
+    return SimpleNamespace(
+        command_name=command_name,
+        command=command,
+        database_name="mydb",
+        connection_id=("localhost", 27017),
+        request_id=request_id
+    )
+
+
+def finished(command_name, duration_ms, request_id=1):
+    return SimpleNamespace(
+        command_name=command_name,
+        duration_micros=int(duration_ms * 1000),
+        connection_id=("localhost", 27017),
+        request_id=request_id
+    )
+
+
+def observed(command, collection, outcome):
+    return REGISTRY.get_sample_value(
+        "mongodb_command_duration_seconds_count",
+        {"command": command, "collection": collection, "outcome": outcome}
+    ) or 0
+
+
+def test_redact_shape_keeps_keys_and_operators():
+    """Values are replaced, field names and operators survive."""
+    query = {"agent_id": "eva-01", "age": {"$gt": 14}, "$or": [{"a": 1}, {"b": "x"}], "tags": {"$in": [1, 2, 3]}}
+
+    assert redact_shape(query) == {
+        "agent_id": "?",
+        "age": {"$gt": "?"},
+        "$or": [{"a": "?"}, {"b": "?"}],
+        "tags": {"$in": ["?"]},
+    }
+
+
+def test_command_duration_is_recorded_per_collection_and_outcome():
+    monitor = MongoCommandMonitor(slow_query_threshold_ms=1000)
+    before_ok = observed("find", "coll_agents", "success")
+    before_err = observed("insert", "coll_agents", "failure")
+
+    monitor.started(started("find", {"find": "coll_agents", "filter": {}}, request_id=1))
+    monitor.succeeded(finished("find", 3, request_id=1))
+    monitor.started(started("insert", {"insert": "coll_agents"}, request_id=2))
+    monitor.failed(finished("insert", 3, request_id=2))
+
+    assert observed("find", "coll_agents", "success") == before_ok + 1
+    assert observed("insert", "coll_agents", "failure") == before_err + 1
+    assert monitor._pending == {}
+
+
+def test_slow_command_is_logged_with_redacted_filter():
+    monitor = MongoCommandMonitor(slow_query_threshold_ms=50)
+    command = {"find": "coll_agents", "filter": {"agent_id": "eva-01"}}
+
+    # Listen on the logger itself: the app's logging config stops "database" from propagating
+    records = []
+    handler = logging.Handler(logging.WARNING)
+    handler.emit = records.append
+    database_logger = logging.getLogger("database")
+    database_logger.addHandler(handler)
+    try:
+        monitor.started(started("find", command))
+        monitor.succeeded(finished("find", 120))
+    finally:
+        database_logger.removeHandler(handler)
+
+    assert len(records) == 1
+    record = records[0]
+    assert record.filter_shape == {"agent_id": "?"}
+    assert "eva-01" not in record.getMessage()
+
+
+def test_disabled_monitor_and_handshakes_are_ignored():
+    disabled = MongoCommandMonitor(enabled=False)
+    disabled.started(started("find", {"find": "coll_agents"}))
+    assert disabled._pending == {}
+
+    monitor = MongoCommandMonitor()
+    monitor.started(started("hello", {"hello": 1}))
+    assert monitor._pending == {}
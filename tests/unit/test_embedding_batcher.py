@@ -0,0 +1,58 @@
+import asyncio
+import pytest
+from src.base.infrastructure.ai.embedding_batcher import EmbeddingBatcher
+
+
+class FakeEmbeddings:
+    def __init__(self, fail=False):
+        self.calls = []
+        self.fail = fail
+
+    async def __call__(self, texts):
+        self.calls.append(list(texts))
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise RuntimeError("upstream down")
+        return [[float(len(text))] for text in texts]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_request_and_get_their_own_vector():
+    backend = FakeEmbeddings()
+    batcher = EmbeddingBatcher(backend, max_batch_size=64, max_wait_ms=5)
+
+    vectors = await asyncio.gather(*(batcher.embed("x" * i) for i in range(1, 11)))
+
+    assert vectors == [[float(i)] for i in range(1, 11)]
+    assert len(backend.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_sent_without_waiting():
+    backend = FakeEmbeddings()
+    batcher = EmbeddingBatcher(backend, max_batch_size=4, max_wait_ms=10_000)
+
+    vectors = await asyncio.wait_for(asyncio.gather(*(batcher.embed(str(i)) for i in range(8))), timeout=1)
+
+    assert len(vectors) == 8
+    assert [len(call) for call in backend.calls] == [4, 4]
+
+
+@pytest.mark.asyncio
+async def test_duplicate_texts_are_embedded_once():
+    backend = FakeEmbeddings()
+    batcher = EmbeddingBatcher(backend)
+
+    first, second = await asyncio.gather(batcher.embed("same"), batcher.embed("same"))
+
+    assert first == second
+    assert backend.calls == [["same"]]
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_reaches_every_caller():
+    batcher = EmbeddingBatcher(FakeEmbeddings(fail=True))
+
+    results = await asyncio.gather(batcher.embed("a"), batcher.embed("b"), return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
@@ -0,0 +1,85 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from src.base.infrastructure.ai.embedding_cache import EmbeddingCache
+
+MODEL = "text-embedding-ada-002"
+
+
+def fake_embeddings() -> AsyncMock:
+    return AsyncMock(side_effect=lambda texts, model=None, timeout=None: [[float(len(t)), 0.5] for t in texts])
+
+
+@pytest.mark.asyncio
+async def test_batch_path_only_embeds_uncached_texts(openai_client):
+    client = openai_client(embedding_model=MODEL, embedding_cache=EmbeddingCache())
+    client._create_embeddings_async = fake_embeddings()
+
+    first = await client.get_embeddings_batch_async(["chunk a", "chunk bb"])
+    second = await client.get_embeddings_batch_async(["chunk bb", "chunk ccc"])
+
+    assert first == [[7.0, 0.5], [8.0, 0.5]]
+    assert second == [[8.0, 0.5], [9.0, 0.5]]
+    assert client._create_embeddings_async.await_args_list[1].args[0] == ["chunk ccc"]
+
+
+@pytest.mark.asyncio
+async def test_single_path_shares_the_cache_with_batch_path(openai_client):
+    client = openai_client(embedding_model=MODEL, embedding_cache=EmbeddingCache())
+    client._create_embeddings_async = fake_embeddings()
+
+    await client.get_embeddings_batch_async(["what is a sofa?"])
+    vector = await client.get_embeddings_async("what is a sofa?")
+
+    assert vector == [15.0, 0.5]
+    assert client._create_embeddings_async.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_vectors_are_stored_compactly_and_shared_through_redis():
+    store = {}
+    redis_repository = MagicMock()
+    redis_repository.mget = AsyncMock(side_effect=lambda keys: [store.get(k) for k in keys])
+    redis_repository.mset = AsyncMock(side_effect=lambda mapping, expiration=None: store.update(mapping))
+    vector = [0.1] * 1536
+
+    writer = EmbeddingCache(dtype="float16", redis_repository=redis_repository)
+    await writer.set_many(MODEL, ["hello"], [vector])
+    reader = EmbeddingCache(dtype="float16", redis_repository=redis_repository)
+    [cached] = await reader.get_many(MODEL, ["hello"])
+
+    assert len(writer.encode(vector)) == 1536 * 2
+    assert cached == pytest.approx(vector, abs=1e-3)
+    # Keys are content addressed: another model is another entry
+    assert await reader.get_many("text-embedding-3-small", ["hello"]) == [None]
+
+
+def test_disk_tier_survives_restarts(tmp_path):
+    EmbeddingCache(disk_path=str(tmp_path)).set_many_sync(MODEL, ["page 1"], [[1.0, 2.0]])
+
+    assert EmbeddingCache(disk_path=str(tmp_path)).get_many_sync(MODEL, ["page 1", "page 2"]) == [[1.0, 2.0], None]
+
+
+def test_sync_ingestion_path_shares_vectors_through_redis():
+    store = {}
+    redis_client = MagicMock()
+    redis_client.mget = MagicMock(side_effect=lambda keys: [store.get(k) for k in keys])
+    pipe = redis_client.pipeline.return_value.__enter__.return_value
+    pipe.set = MagicMock(side_effect=lambda key, value, ex=None: store.update({key: value}))
+
+    writer = EmbeddingCache()
+    writer.attach_redis(MagicMock(), redis_client)
+    writer.set_many_sync(MODEL, ["chunk 1"], [[1.0, 2.0]])
+    reader = EmbeddingCache()
+    reader.attach_redis(MagicMock(), redis_client)
+
+    assert reader.get_many_sync(MODEL, ["chunk 1", "chunk 2"]) == [[1.0, 2.0], None]
+    pipe.execute.assert_called_once()
+
+
+def test_bytes_held_are_reported_per_tier(tmp_path):
+    cache = EmbeddingCache(dtype="float16", local_max_size=2, disk_path=str(tmp_path))
+    cache.set_many_sync(MODEL, ["a", "b", "c"], [[1.0, 2.0]] * 3)
+
+    assert cache.local_bytes_held() == 2 * 4
+    assert cache.disk.bytes_held() == 3 * 4
+    assert EmbeddingCache(disk_path=str(tmp_path)).disk.bytes_held() == 3 * 4
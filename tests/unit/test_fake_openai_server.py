@@ -0,0 +1,69 @@
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from src.base.infrastructure.ai.resilience import LLMResilience
+from src.base.scripts.fake_openai_server import FakeOpenAIConfig, LatencyDistribution, create_app
+
+
+async def serve(config: FakeOpenAIConfig):
+    runner = web.AppRunner(create_app(config))
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    return runner, f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/v1"
+
+
+@pytest_asyncio.fixture
+async def client(openai_client):
+    runner, url = await serve(FakeOpenAIConfig(embedding_dimensions=8))
+    yield openai_client(url=url, api_key="sk-fake", embedding_batch_size=1)
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_chat_is_deterministic_and_reports_usage(client):
+    messages = [{"role": "user", "content": "Which sofa fits a small room?"}]
+
+    first = await client.create_chat_completion_async(messages, max_tokens=20)
+    second = await client.create_chat_completion_async(messages, max_tokens=20)
+
+    assert first.choices[0].message.content == second.choices[0].message.content
+    assert first.usage.prompt_tokens > 0 and first.usage.completion_tokens > 0
+
+
+@pytest.mark.asyncio
+async def test_stream_matches_non_streaming_content(client):
+    messages = [{"role": "user", "content": "Describe a cosy kitchen"}]
+
+    whole = await client.get_chat_completion_async(messages)
+    streamed = "".join([delta async for delta in client.stream_chat_completion_async(messages)])
+
+    assert streamed == whole
+
+
+@pytest.mark.asyncio
+async def test_embeddings_transcriptions_and_images(client, tmp_path):
+    vectors = await client.get_embeddings_batch_async(["oak table", "birch shelf", "oak table"])
+    audio = tmp_path / "note.wav"
+    audio.write_bytes(b"RIFF fake audio")
+
+    assert len(vectors[0]) == 8 and vectors[0] == vectors[2] != vectors[1]
+    assert await client.transcribe_audio_async(str(audio))
+    assert len(await client.generate_image_async("a bright living room", n=2)) == 2
+
+
+@pytest.mark.asyncio
+async def test_injected_errors_are_absorbed_by_retries(openai_client):
+    runner, url = await serve(FakeOpenAIConfig(
+        latency=LatencyDistribution.parse("fixed:0.001"),
+        error_rate=0.5,
+        error_statuses=(429,),
+        retry_after_seconds=0.01,
+        seed=7
+    ))
+    client = openai_client(url=url, resilience=LLMResilience(max_retries=10, base_delay_seconds=0.01))
+
+    results = [await client.get_chat_completion_async([{"role": "user", "content": str(i)}]) for i in range(5)]
+    await runner.cleanup()
+
+    assert all(results)
@@ -0,0 +1,69 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from src.base.infrastructure.ai import tokenizer as tokenizer_module
+from src.base.infrastructure.ai.history_packer import HistoryPacker, SUMMARY_PREFIX
+from src.base.infrastructure.ai.tokenizer import Tokenizer
+from src.base.repositories.openai_repository import OpenAIRepository
+
+
+def conversation(turns):
+    history = []
+    for i in range(turns):
+        history.append({"user": f"question number {i} about the kitchen planner"})
+        history.append({"agent": f"answer number {i} with a few more words of detail"})
+    return history
+
+
+def test_unloadable_encoding_falls_back_to_heuristic_counts(monkeypatch):
+    """tiktoken downloads its encodings on first use; offline, counting must still work."""
+    def offline(name):
+        raise ConnectionError("no network")
+
+    monkeypatch.setattr(tokenizer_module, "tiktoken", SimpleNamespace(encoding_for_model=offline, get_encoding=offline))
+
+    tokenizer = Tokenizer("gpt-4o")
+
+    assert not tokenizer.exact
+    assert tokenizer.count("hello world") > 0
+
+
+def test_short_history_is_sent_whole():
+    packer = HistoryPacker(Tokenizer(), max_prompt_tokens=1000)
+
+    packed = packer.pack("You are EVA.", "hi", conversation(2))
+
+    assert packed.dropped_turns == 0
+    assert [m["role"] for m in packed.messages] == ["system", "user", "assistant", "user", "assistant", "user"]
+
+
+def test_long_history_keeps_system_prompt_and_most_recent_turns_within_budget():
+    tokenizer = Tokenizer()
+    packer = HistoryPacker(tokenizer, max_prompt_tokens=200)
+
+    packed = packer.pack("You are EVA.", "latest question", conversation(100))
+
+    assert packed.prompt_tokens <= 200
+    assert tokenizer.count_messages(packed.messages) == packed.prompt_tokens
+    assert packed.messages[0] == {"role": "system", "content": "You are EVA."}
+    assert packed.messages[-1] == {"role": "user", "content": "latest question"}
+    assert packed.messages[-2]["content"] == "answer number 99 with a few more words of detail"
+    assert packed.dropped_turns > 0
+
+
+def test_dropped_turns_are_replaced_by_summary():
+    packer = HistoryPacker(Tokenizer(), max_prompt_tokens=200)
+
+    packed = packer.pack("You are EVA.", "latest question", conversation(100), summary="The user plans a kitchen.")
+
+    assert packed.summarized
+    assert packed.messages[1] == {"role": "system", "content": SUMMARY_PREFIX + "The user plans a kitchen."}
+    assert packed.prompt_tokens <= 200
+
+
+def test_repository_does_not_send_the_current_input_twice():
+    repository = OpenAIRepository(MagicMock(), history_packer=HistoryPacker(Tokenizer()))
+    history = [{"user": "hello"}, {"agent": "hi!"}, {"user": "how are you?"}]
+
+    messages = repository.pack_messages("You are EVA.", "how are you?", history)
+
+    assert [m["content"] for m in messages] == ["You are EVA.", "hello", "hi!", "how are you?"]
@@ -0,0 +1,84 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from prometheus_client import CollectorRegistry
+from src.base.infrastructure.ai.llm_metrics import LLMMetrics, llm_call_labels
+from src.base.repositories.openai_repository import OpenAIRepository
+
+
+def scrape(metrics: LLMMetrics):
+    registry = CollectorRegistry()
+    registry.register(metrics)
+    return registry
+
+
+def fake_client():
+    async def create(messages, **kwargs):
+        return SimpleNamespace(
+            model="gpt-4o-2024-08-06",
+            choices=[SimpleNamespace(message=SimpleNamespace(content="pong"), finish_reason="stop")],
+            usage=SimpleNamespace(prompt_tokens=1000, completion_tokens=200)
+        )
+
+    async def stream(messages, **kwargs):
+        for delta in ("Hello", " there", "!"):
+            yield delta
+
+    client = MagicMock()
+    client.model = "gpt-4o"
+    client.create_chat_completion_async = create
+    client.stream_chat_completion_async = stream
+    return client
+
+
+def test_calls_are_aggregated_per_label_set():
+    metrics = LLMMetrics(pricing={"house-model": [1.0, 2.0]})
+    registry = scrape(metrics)
+    labels = {"model": "house-model", "agent_type": "eva", "caller": "agent_chat"}
+
+    for _ in range(3):
+        metrics.record("house-model", 100, 50, 0.4, labels=("eva", "agent_chat"))
+
+    assert registry.get_sample_value("llm_requests_total", labels) == 3
+    assert registry.get_sample_value("llm_tokens_total", {**labels, "kind": "prompt"}) == 300
+    assert registry.get_sample_value("llm_tokens_total", {**labels, "kind": "completion"}) == 150
+    assert registry.get_sample_value("llm_cost_usd_total", labels) == pytest.approx(3 * (100 * 1.0 + 50 * 2.0) / 1e6)
+    assert registry.get_sample_value("llm_request_latency_seconds_bucket", {**labels, "le": "0.5"}) == 3
+    assert registry.get_sample_value("llm_request_latency_seconds_bucket", {**labels, "le": "0.25"}) == 0
+
+
+def test_dated_model_snapshots_use_the_base_model_price():
+    metrics = LLMMetrics()
+
+    assert metrics.price("gpt-4o-mini-2024-07-18") == metrics.price("gpt-4o-mini")
+    assert metrics.price("gpt-4o-2024-08-06") == metrics.price("gpt-4o") != metrics.price("gpt-4o-mini")
+
+
+@pytest.mark.asyncio
+async def test_repository_records_reported_usage_with_context_labels():
+    metrics = LLMMetrics()
+    registry = scrape(metrics)
+    repository = OpenAIRepository(fake_client(), metrics=metrics)
+
+    with llm_call_labels(agent_type="ingvar", caller="agent_chat"):
+        await repository.generate_response("ping", temperature=0.7)
+
+    labels = {"model": "gpt-4o", "agent_type": "ingvar", "caller": "agent_chat"}
+    assert registry.get_sample_value("llm_tokens_total", {**labels, "kind": "prompt"}) == 1000
+    assert registry.get_sample_value("llm_cost_usd_total", labels) == pytest.approx((1000 * 2.5 + 200 * 10.0) / 1e6)
+
+
+@pytest.mark.asyncio
+async def test_streams_record_ttft_and_locally_counted_tokens():
+    metrics = LLMMetrics()
+    registry = scrape(metrics)
+    repository = OpenAIRepository(fake_client(), metrics=metrics)
+
+    with llm_call_labels(caller="writer_assistant"):
+        stream = repository.stream_chat_completion_async([{"role": "user", "content": "hi"}])
+    # Consumed outside the block, still attributed to the caller that started it
+    assert "".join([delta async for delta in stream]) == "Hello there!"
+
+    labels = {"model": "gpt-4o", "agent_type": "none", "caller": "writer_assistant"}
+    assert registry.get_sample_value("llm_tokens_total", {**labels, "kind": "completion"}) > 0
+    assert registry.get_sample_value("llm_time_to_first_token_seconds_count", labels) == 1
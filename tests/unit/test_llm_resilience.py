@@ -0,0 +1,174 @@
+"""Fault-injection tests of the LLM resilience policy against a local fake provider."""
+import asyncio
+import time
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from src.base.infrastructure.ai.llm_scheduler import LLMScheduler
+from src.base.infrastructure.ai.openai_client import OpenAIClient
+from src.base.infrastructure.ai.resilience import CircuitBreaker, LLMResilience
+from src.base.infrastructure.exceptions import LLMCircuitOpenError
+
+
+class FaultyProvider:
+    """Answers chat completions following a script of faults, then succeeds."""
+
+    def __init__(self):
+        self.script = []
+        self.requests = 0
+
+    async def chat_completions(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        body = await request.json()
+        fault = self.script.pop(0) if self.script else {}
+        await asyncio.sleep(fault.get("delay", 0))
+        if "status" in fault:
+            return web.json_response(
+                {"error": {"message": "injected fault", "type": "server_error"}},
+                status=fault["status"],
+                headers=fault.get("headers", {})
+            )
+        return web.json_response({
+            "id": "chatcmpl-test",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body["model"],
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": "ok"}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": 5, "completion_tokens": 1, "total_tokens": 6}
+        })
+
+
+@pytest_asyncio.fixture
+async def provider():
+    fake = FaultyProvider()
+    app = web.Application()
+    app.router.add_post("/v1/chat/completions", fake.chat_completions)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    fake.url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/v1"
+    yield fake
+    await runner.cleanup()
+
+
+def policy(**kwargs) -> LLMResilience:
+    kwargs.setdefault("base_delay_seconds", 0.01)
+    kwargs.setdefault("max_delay_seconds", 1.0)
+    return LLMResilience(**kwargs)
+
+
+async def chat(client: OpenAIClient) -> str:
+    return await client.get_chat_completion_async([{"role": "user", "content": "hello"}])
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_is_retried_after_the_requested_delay(provider, openai_client):
+    provider.script = [{"status": 429, "headers": {"Retry-After": "0.3"}}]
+    client = openai_client(url=provider.url, resilience=policy(max_retries=2))
+
+    start = time.perf_counter()
+    assert await chat(client) == "ok"
+    elapsed = time.perf_counter() - start
+
+    assert provider.requests == 2
+    assert elapsed >= 0.3
+
+
+@pytest.mark.asyncio
+async def test_retry_after_beyond_the_max_delay_is_not_waited_for(provider, openai_client):
+    provider.script = [{"status": 429, "headers": {"Retry-After": "120"}}]
+    client = openai_client(url=provider.url, resilience=policy(max_retries=2))
+
+    with pytest.raises(Exception) as error:
+        await chat(client)
+
+    assert getattr(error.value, "status_code", None) == 429
+    assert provider.requests == 1
+
+
+@pytest.mark.asyncio
+async def test_server_errors_are_retried_then_surface(provider, openai_client):
+    provider.script = [{"status": 503}] * 3
+    client = openai_client(url=provider.url, resilience=policy(max_retries=2))
+
+    with pytest.raises(Exception) as error:
+        await chat(client)
+
+    assert getattr(error.value, "status_code", None) == 503
+    assert provider.requests == 3
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_not_retried(provider, openai_client):
+    provider.script = [{"status": 400}]
+    client = openai_client(url=provider.url, resilience=policy(max_retries=2))
+
+    with pytest.raises(Exception):
+        await chat(client)
+
+    assert provider.requests == 1
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_after_consecutive_failures_and_fails_fast(provider, openai_client):
+    provider.script = [{"status": 500}] * 2
+    client = openai_client(url=provider.url, resilience=policy(max_retries=0, failure_threshold=2, recovery_seconds=0.2))
+
+    for _ in range(2):
+        with pytest.raises(Exception):
+            await chat(client)
+    with pytest.raises(LLMCircuitOpenError):
+        await chat(client)
+    assert provider.requests == 2
+
+    # After the recovery time a probe goes through and closes the circuit
+    await asyncio.sleep(0.25)
+    assert await chat(client) == "ok"
+    assert client.resilience.breaker("gpt-4o").state == "closed"
+
+
+def test_failures_in_flight_do_not_extend_the_open_window(fake_clock):
+    breaker = CircuitBreaker("gpt-4o", failure_threshold=2, recovery_seconds=10, clock=fake_clock)
+    breaker.record_failure()
+    breaker.record_failure()
+
+    fake_clock.now = 9.0
+    breaker.record_failure()  # sent before the circuit opened
+    fake_clock.now = 10.0
+    assert breaker.state == "half_open"
+
+    breaker.before_call()
+    breaker.record_failure()  # the probe failed: open for another recovery period
+    fake_clock.now = 19.0
+    assert breaker.state == "open"
+
+
+@pytest.mark.asyncio
+async def test_slow_request_is_hedged_after_p95_latency(provider, openai_client):
+    client = openai_client(url=provider.url, resilience=policy(max_retries=0, hedging_enabled=True, hedging_min_samples=5))
+    for _ in range(5):
+        await chat(client)
+    provider.script = [{"delay": 1.0}]
+
+    start = time.perf_counter()
+    assert await chat(client) == "ok"
+    elapsed = time.perf_counter() - start
+
+    assert provider.requests == 7
+    assert elapsed < 0.5
+
+
+@pytest.mark.asyncio
+async def test_hedge_is_skipped_without_spare_capacity(provider, openai_client):
+    scheduler = LLMScheduler(max_concurrency=1)
+    client = openai_client(url=provider.url, scheduler=scheduler, resilience=policy(max_retries=0, hedging_enabled=True, hedging_min_samples=5))
+    for _ in range(5):
+        await chat(client)
+    provider.script = [{"delay": 0.3}]
+
+    assert await chat(client) == "ok"
+
+    # The only slot is held by the slow request, so no second request is sent
+    assert provider.requests == 6
+    assert scheduler.stats()["active"] == 0
@@ -0,0 +1,114 @@
+import asyncio
+import pytest
+from src.base.infrastructure.ai.llm_scheduler import LLMScheduler, llm_scheduling
+from src.base.infrastructure.exceptions import LLMCapacityExceededError
+
+
+async def run_in_order(scheduler, requests):
+    """Queue all requests behind a blocker and return the order they are admitted in."""
+    order = []
+    blocker = await scheduler.acquire(1)
+
+    async def call(name, **kwargs):
+        async with scheduler.slot(kwargs.pop("tokens", 10), **kwargs):
+            order.append(name)
+
+    tasks = [asyncio.ensure_future(call(name, **kwargs)) for name, kwargs in requests]
+    await asyncio.sleep(0)
+    scheduler.release(blocker)
+    await asyncio.gather(*tasks)
+    return order
+
+
+@pytest.mark.asyncio
+async def test_interactive_requests_go_before_background_ones():
+    scheduler = LLMScheduler(max_concurrency=1)
+
+    order = await run_in_order(scheduler, [
+        ("bg1", {"priority": "background"}),
+        ("bg2", {"priority": "background"}),
+        ("chat", {"priority": "interactive"}),
+    ])
+
+    assert order == ["chat", "bg1", "bg2"]
+
+
+@pytest.mark.asyncio
+async def test_tenants_share_capacity_by_weight():
+    scheduler = LLMScheduler(max_concurrency=1, tenant_weights={"gold": 2.0})
+
+    order = await run_in_order(
+        scheduler,
+        [(f"busy{i}", {"tenant": "busy"}) for i in range(4)] + [(f"gold{i}", {"tenant": "gold"}) for i in range(4)]
+    )
+
+    # The tenant that queued first does not monopolise the slot; the heavier one gets twice the share
+    assert order[:6] == ["busy0", "gold0", "gold1", "busy1", "gold2", "gold3"]
+
+
+@pytest.mark.asyncio
+async def test_fair_queuing_state_stays_bounded_across_tenants():
+    """One request each from many tenants does not grow the scheduler without bound."""
+    scheduler = LLMScheduler(max_concurrency=1, max_tenants=100)
+
+    for i in range(1000):
+        async with scheduler.slot(10, tenant=f"ip:10.0.{i // 256}.{i % 256}"):
+            pass
+
+    assert len(scheduler._finish_tags) <= 100
+
+
+@pytest.mark.asyncio
+async def test_try_acquire_never_queues():
+    scheduler = LLMScheduler(max_concurrency=1)
+
+    ticket = scheduler.try_acquire(10)
+    assert ticket is not None and scheduler.try_acquire(10) is None
+    scheduler.release(ticket)
+    assert scheduler.stats()["active"] == 0
+
+
+@pytest.mark.asyncio
+async def test_priority_and_tenant_come_from_the_context():
+    scheduler = LLMScheduler(max_concurrency=4)
+
+    with llm_scheduling(priority="background", tenant="acme"):
+        ticket = await scheduler.acquire(10)
+
+    assert (ticket.priority, ticket.tenant) == ("background", "acme")
+    scheduler.release(ticket)
+
+
+@pytest.mark.asyncio
+async def test_request_beyond_the_token_budget_is_rejected_up_front():
+    scheduler = LLMScheduler(tokens_per_minute=600, default_deadline_seconds=1.0)
+    first = await scheduler.acquire(590)
+
+    with pytest.raises(LLMCapacityExceededError) as error:
+        await scheduler.acquire(200)
+
+    assert error.value.reason == "deadline"
+    assert error.value.data["retry_after"] > 1.0
+    scheduler.release(first)
+
+
+@pytest.mark.asyncio
+async def test_queued_request_is_rejected_at_its_deadline():
+    scheduler = LLMScheduler(max_concurrency=1)
+    blocker = await scheduler.acquire(1)
+
+    with pytest.raises(LLMCapacityExceededError):
+        await scheduler.acquire(1, deadline_seconds=0.05)
+
+    scheduler.release(blocker)
+    assert scheduler.stats()["queued"] == {"interactive": 0, "normal": 0, "background": 0}
+
+
+@pytest.mark.asyncio
+async def test_unused_tokens_are_refunded():
+    scheduler = LLMScheduler(tokens_per_minute=600)
+
+    async with scheduler.slot(500) as ticket:
+        ticket.used_tokens = 100
+
+    assert scheduler.stats()["budget_tokens"] >= 500
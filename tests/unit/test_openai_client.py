@@ -0,0 +1,139 @@
+import asyncio
+import json
+import time
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from src.base.repositories.openai_repository import OpenAIRepository
+
+LATENCY_SECONDS = 0.3
+
+
+STREAM_CHUNKS = ["Hel", "lo", " wor", "ld"]
+stream_state = {"sent": 0, "disconnected": False}
+
+
+async def stream_chat_completion(request: web.Request, body: dict) -> web.StreamResponse:
+    response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+    await response.prepare(request)
+    try:
+        for text in STREAM_CHUNKS:
+            chunk = {
+                "id": "chatcmpl-test",
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": body["model"],
+                "choices": [{"index": 0, "delta": {"content": text}, "finish_reason": None}]
+            }
+            await response.write(f"data: {json.dumps(chunk)}\n\n".encode())
+            stream_state["sent"] += 1
+            await asyncio.sleep(0.05)
+        await response.write(b"data: [DONE]\n\n")
+    except (ConnectionResetError, asyncio.CancelledError):
+        stream_state["disconnected"] = True
+        raise
+    return response
+
+
+async def chat_completions(request: web.Request) -> web.StreamResponse:
+    body = await request.json()
+    if body.get("stream"):
+        return await stream_chat_completion(request, body)
+    await asyncio.sleep(LATENCY_SECONDS)
+    return web.json_response({
+        "id": "chatcmpl-test",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body["model"],
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": f"echo: {body['messages'][-1]['content']}"},
+            "finish_reason": "stop"
+        }],
+        "usage": {"prompt_tokens": 5, "completion_tokens": 3, "total_tokens": 8}
+    })
+
+
+@pytest_asyncio.fixture
+async def fake_openai_url():
+    app = web.Application()
+    app.router.add_post("/v1/chat/completions", chat_completions)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}/v1"
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_chats_take_about_as_long_as_one(fake_openai_url, openai_client):
+    """N chats in flight together complete in roughly one round trip, not N."""
+    client = openai_client(url=fake_openai_url)
+    messages = [[{"role": "user", "content": f"hello {i}"}] for i in range(10)]
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(client.get_chat_completion_async(m) for m in messages))
+    elapsed = time.perf_counter() - start
+
+    assert results == [f"echo: hello {i}" for i in range(10)]
+    assert elapsed < LATENCY_SECONDS * 3
+
+
+@pytest.mark.asyncio
+async def test_semaphore_bounds_in_flight_requests(fake_openai_url, openai_client):
+    client = openai_client(url=fake_openai_url, max_concurrency=2)
+    messages = [{"role": "user", "content": "hello"}]
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client.get_chat_completion_async(messages) for _ in range(4)))
+    elapsed = time.perf_counter() - start
+
+    # Two waves of two requests each
+    assert elapsed >= LATENCY_SECONDS * 2
+
+
+@pytest.mark.asyncio
+async def test_per_call_timeout(fake_openai_url, openai_client):
+    client = openai_client(url=fake_openai_url)
+
+    with pytest.raises(Exception) as exc_info:
+        await client.get_chat_completion_async([{"role": "user", "content": "hello"}], timeout=0.05)
+
+    assert "timed out" in str(exc_info.value).lower()
+
+
+@pytest.mark.asyncio
+async def test_repository_generate_response_reports_usage(fake_openai_url, openai_client):
+    client = openai_client(url=fake_openai_url)
+    repository = OpenAIRepository(client)
+
+    response = await repository.generate_response(prompt="summarize this", temperature=0)
+
+    assert response.content == "echo: summarize this"
+    assert (response.prompt_tokens, response.completion_tokens) == (5, 3)
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_deltas_in_order(fake_openai_url, openai_client):
+    client = openai_client(url=fake_openai_url)
+
+    deltas = [delta async for delta in client.stream_chat_completion_async([{"role": "user", "content": "hi"}])]
+
+    assert deltas == STREAM_CHUNKS
+
+
+@pytest.mark.asyncio
+async def test_closing_stream_early_aborts_upstream(fake_openai_url, openai_client):
+    """A consumer that goes away after the first delta stops the generation."""
+    stream_state.update(sent=0, disconnected=False)
+    client = openai_client(url=fake_openai_url)
+
+    stream = client.stream_chat_completion_async([{"role": "user", "content": "hi"}])
+    assert await stream.__anext__() == STREAM_CHUNKS[0]
+    await stream.aclose()
+    await asyncio.sleep(0.2)
+
+    assert stream_state["disconnected"]
+    assert stream_state["sent"] < len(STREAM_CHUNKS)
@@ -0,0 +1,50 @@
+from unittest.mock import patch
+from src.domains.agentverse.agents.personalities.utils.generate_personality_context import (
+    generate_personality_context
+)
+from src.domains.agentverse.caches import personality_context_cache as module
+from src.domains.agentverse.caches.personality_context_cache import (
+    PersonalityContextCache,
+    personality_fingerprint
+)
+from src.domains.agentverse.entities.agent_soul_protocol import AgentSoulProtocol
+
+
+def make_personality(**traits) -> AgentSoulProtocol:
+    return AgentSoulProtocol(name="unit_01", description="Test type", **traits)
+
+
+def test_context_is_generated_once_per_dna_and_personality():
+    """Rebuilding an agent with the same DNA and personality reuses the text."""
+    cache = PersonalityContextCache()
+    personality = make_personality()
+
+    with patch.object(module, "generate_personality_context", wraps=generate_personality_context) as generate:
+        first = cache.get(personality, "dna-1")
+        second = cache.get(personality.model_copy(), "dna-1")
+
+    assert first == second == generate_personality_context(personality)
+    generate.assert_called_once()
+
+
+def test_edited_personality_is_regenerated():
+    """The DNA does not cover personality traits, so an edit changes the key."""
+    cache = PersonalityContextCache()
+    personality = make_personality()
+    cache.get(personality, "dna-1")
+
+    edited = personality.model_copy(update={"description": "Edited"})
+
+    assert personality_fingerprint(edited) != personality_fingerprint(personality)
+    assert "Edited" in cache.get(edited, "dna-1")
+    assert len(cache) == 2
+
+
+def test_persisted_context_is_seeded_only_when_fingerprint_matches():
+    """A context stored with the blueprint is reused unless the personality changed since."""
+    cache = PersonalityContextCache()
+    personality = make_personality()
+
+    assert not cache.seed(personality, "dna-1", "stale context", "other-fingerprint")
+    assert cache.seed(personality, "dna-1", "stored context", personality_fingerprint(personality))
+    assert cache.get(personality, "dna-1") == "stored context"
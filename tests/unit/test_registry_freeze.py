@@ -0,0 +1,43 @@
+import pytest
+from src.domains.agentverse.exceptions import RegistrationError
+from src.domains.agentverse.registries.base import Registry
+
+
+class Unit01:
+    pass
+
+
+class Unit02:
+    pass
+
+
+def make_registry() -> Registry:
+    registry = Registry(name="test")
+    registry.register(name="unit_01", version="1.0.0", component=Unit01)
+    return registry
+
+
+def test_frozen_lookups_return_registered_components():
+    registry = make_registry()
+    registry.freeze()
+
+    assert registry.frozen
+    assert registry.get("unit_01") is Unit01
+    assert registry.get("unit_01", version="1.0.0") is Unit01
+    with pytest.raises(KeyError):
+        registry.get("unit_02")
+
+
+def test_frozen_registry_rejects_changes_until_reset():
+    registry = make_registry()
+    registry.freeze()
+
+    with pytest.raises(RegistrationError):
+        registry.register(name="unit_02", component=Unit02)
+    with pytest.raises(RegistrationError):
+        registry.unregister("unit_01")
+    assert "unit_02" not in registry
+
+    registry.reset()
+    registry.register(name="unit_02", component=Unit02)
+    assert registry.get("unit_02") is Unit02
@@ -0,0 +1,82 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from prometheus_client import REGISTRY
+from src.base.entities.ai.llm_response import LLMResponse
+from src.base.infrastructure.ai.response_cache import LLMResponseCache, cached_responses, request_key
+from src.base.repositories.openai_repository import OpenAIRepository
+
+
+def completion(content="4"):
+    return SimpleNamespace(
+        model="gpt-4o",
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content), finish_reason="stop")],
+        usage=SimpleNamespace(prompt_tokens=10, completion_tokens=2)
+    )
+
+
+def make_repository(redis_repository=None):
+    client = MagicMock()
+    client.model = "gpt-4o"
+    client.create_chat_completion_async = AsyncMock(return_value=completion())
+    cache = LLMResponseCache(redis_repository=redis_repository)
+    return OpenAIRepository(client, response_cache=cache), client, cache
+
+
+def tokens_saved():
+    return REGISTRY.get_sample_value("llm_response_cache_tokens_saved_total", {"model": "gpt-4o"}) or 0
+
+
+@pytest.mark.asyncio
+async def test_deterministic_requests_are_answered_from_cache():
+    repository, client, _ = make_repository()
+    before = tokens_saved()
+
+    first = await repository.generate_response("What is 2 + 2?", temperature=0)
+    # Formatting-only differences share the entry
+    second = await repository.generate_response("  What is   2 + 2?\n", temperature=0)
+
+    assert first == second
+    assert client.create_chat_completion_async.await_count == 1
+    assert tokens_saved() == before + 12
+
+
+@pytest.mark.asyncio
+async def test_sampled_requests_bypass_cache_unless_opted_in():
+    repository, client, _ = make_repository()
+
+    await repository.generate_response("Tell me a story", temperature=0.7)
+    await repository.generate_response("Tell me a story", temperature=0.7)
+    assert client.create_chat_completion_async.await_count == 2
+
+    with cached_responses():
+        await repository.generate_async("You are EVA", "Can you hear me?", [])
+        await repository.generate_async("You are EVA", "Can you hear me?", [])
+    assert client.create_chat_completion_async.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_redis_tier_is_shared_between_processes():
+    store = {}
+    redis_repository = MagicMock()
+    redis_repository.get = AsyncMock(side_effect=lambda key: store.get(key))
+    redis_repository.set = AsyncMock(side_effect=lambda key, value, expiration=None: store.__setitem__(key, value))
+
+    worker_a, client_a, _ = make_repository(redis_repository)
+    worker_b, client_b, _ = make_repository(redis_repository)
+
+    await worker_a.generate_response("Summarize: hello", temperature=0)
+    response = await worker_b.generate_response("Summarize: hello", temperature=0)
+
+    assert response.content == "4"
+    client_b.create_chat_completion_async.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_truncated_responses_are_not_cached():
+    cache = LLMResponseCache()
+    key = request_key([{"role": "user", "content": "hi"}], model="gpt-4o", temperature=0, max_tokens=5)
+
+    await cache.set(key, LLMResponse(content="Hel", finish_reason="length"))
+
+    assert await cache.get(key) is None
@@ -0,0 +1,90 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+from pymongo.errors import AutoReconnect
+from src.base.monitors.security_event_store import SecurityEventStore, utc_naive
+
+
+def make_store(aggregate_result=None, batch_size=100):
+    collection = MagicMock()
+    collection.insert_many = AsyncMock()
+    cursor = MagicMock()
+    cursor.to_list = AsyncMock(return_value=aggregate_result or [])
+    collection.aggregate = MagicMock(return_value=cursor)
+
+    client = MagicMock()
+    client.db.list_collection_names = AsyncMock(return_value=["coll_security_events"])
+    client.get_collection = MagicMock(return_value=collection)
+
+    return SecurityEventStore(client, batch_size=batch_size), collection
+
+
+def unauthorized(ip="10.0.0.1", path="/api/v1/users"):
+    return {"event_type": "unauthorized_access", "log_type": "security", "client_ip": ip, "path": path}
+
+
+@pytest.mark.asyncio
+async def test_events_are_written_in_batches():
+    store, collection = make_store()
+    for _ in range(3):
+        store.record(unauthorized())
+
+    collection.insert_many.assert_not_awaited()
+    assert await store.flush() == 3
+
+    collection.insert_many.assert_awaited_once()
+    batch = collection.insert_many.await_args.args[0]
+    assert batch[0]["meta"] == {"event_type": "unauthorized_access", "log_type": "security",
+                                "client_ip": "10.0.0.1", "path": "/api/v1/users"}
+    assert len(store) == 0
+
+
+@pytest.mark.asyncio
+async def test_full_batch_flushes_in_a_tracked_task():
+    store, collection = make_store(batch_size=2)
+    for _ in range(3):
+        store.record(unauthorized())
+
+    assert store._batch_flush is not None
+    await store.stop()
+
+    assert store._batch_flush is None and len(store) == 0
+    assert sum(len(call.args[0]) for call in collection.insert_many.await_args_list) == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_events_buffered():
+    store, collection = make_store()
+    collection.insert_many.side_effect = AutoReconnect("down")
+    store.record(unauthorized())
+
+    assert await store.flush() == 0
+    assert len(store) == 1
+
+
+@pytest.mark.asyncio
+async def test_window_counts_are_pushed_down_and_include_buffer():
+    """Persisted counts come from a single $facet aggregation; buffered events are added."""
+    store, collection = make_store(aggregate_result=[{"ip_failures": [{"count": 4}], "recent_errors": []}])
+    since = datetime.utcnow() - timedelta(minutes=5)
+    store.record(unauthorized(ip="10.0.0.1"))
+    store.record(unauthorized(ip="10.0.0.2"))
+
+    counts = await store.count_windows({
+        "ip_failures": (since, {"event_type": "unauthorized_access", "client_ip": "10.0.0.1"}),
+        "recent_errors": (since, {"log_type": "error"}),
+    })
+
+    assert counts == {"ip_failures": 5, "recent_errors": 0}
+    pipeline = collection.aggregate.call_args.args[0]
+    assert pipeline[0] == {"$match": {"timestamp": {"$gte": since}}}
+    assert pipeline[1]["$facet"]["ip_failures"][0]["$match"]["meta.client_ip"] == "10.0.0.1"
+
+
+def test_event_times_are_stored_as_naive_utc():
+    store, _ = make_store()
+    store.record(unauthorized())
+
+    assert abs(store._buffer[0]["timestamp"] - datetime.utcnow()) < timedelta(seconds=5)
+    aware = datetime(2024, 3, 1, 12, 0, tzinfo=timezone(timedelta(hours=2)))
+    assert utc_naive(aware) == datetime(2024, 3, 1, 10, 0)
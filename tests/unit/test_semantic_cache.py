@@ -0,0 +1,98 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from src.base.entities.ai.llm_response import LLMResponse
+from src.base.infrastructure.ai.semantic_cache import HashingEmbedder, SemanticCache
+from src.base.repositories.openai_repository import OpenAIRepository
+from src.domains.writer_assistant.handlers.chat_handler import ChatHandler
+
+
+def answer(content):
+    return LLMResponse(content=content, model="gpt-4o", finish_reason="stop", prompt_tokens=40, completion_tokens=20)
+
+
+def make_cache(**kwargs):
+    kwargs.setdefault("similarity_threshold", 0.75)
+    return SemanticCache(HashingEmbedder(), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_paraphrase_hits_and_unrelated_query_misses():
+    cache = make_cache()
+    await cache.store("how do I reset my password in the app", answer("Go to settings."))
+
+    hit = await cache.lookup("how do I reset my password in the app please")
+    miss = await cache.lookup("what are the opening hours of the store")
+
+    assert hit.content == "Go to settings."
+    assert miss is None
+
+
+@pytest.mark.asyncio
+async def test_entries_are_isolated_by_scope():
+    cache = make_cache()
+    await cache.store("what is the return policy", answer("365 days."), scope="rag:policies")
+
+    assert await cache.lookup("what is the return policy", scope="rag:recipes") is None
+    assert (await cache.lookup("what is the return policy", scope="rag:policies")).content == "365 days."
+
+
+@pytest.mark.asyncio
+async def test_index_is_bounded_with_lru_eviction():
+    cache = make_cache(max_entries=2, similarity_threshold=0.99)
+    await cache.store("first question about sofas", answer("a"))
+    await cache.store("second question about lamps", answer("b"))
+    # Touch the first entry so the second one is the least recently used
+    assert await cache.lookup("first question about sofas") is not None
+
+    await cache.store("third question about beds", answer("c"))
+
+    assert len(cache) == 2
+    assert await cache.lookup("second question about lamps") is None
+    assert await cache.lookup("first question about sofas") is not None
+
+
+@pytest.mark.asyncio
+async def test_entries_expire(fake_clock):
+    cache = make_cache(ttl_seconds=10, clock=fake_clock)
+    await cache.store("question", answer("a"))
+
+    fake_clock.now = 11.0
+
+    assert await cache.lookup("question") is None
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_repository_uses_semantic_cache_only_when_opted_in():
+    client = MagicMock()
+    client.model = "gpt-4o"
+    client.create_chat_completion_async = AsyncMock(return_value=SimpleNamespace(
+        model="gpt-4o",
+        choices=[SimpleNamespace(message=SimpleNamespace(content="Use the reset link."), finish_reason="stop")],
+        usage=SimpleNamespace(prompt_tokens=40, completion_tokens=20)
+    ))
+    repository = OpenAIRepository(client, semantic_cache=make_cache())
+
+    await repository.generate_response("how can I reset my password", temperature=0.5, semantic_cache=True)
+    response = await repository.generate_response("how can I reset my password now", temperature=0.5, semantic_cache=True)
+    assert response.content == "Use the reset link."
+    assert client.create_chat_completion_async.await_count == 1
+
+    await repository.generate_response("how can I reset my password now", temperature=0.5)
+    assert client.create_chat_completion_async.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_writer_assistant_compares_only_the_prompt_within_its_history():
+    repository = SimpleNamespace(get_chat_response_async=AsyncMock(return_value=answer("A headline.")))
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(openai_repository=repository)))
+    handler = ChatHandler()
+    history = [{"prompt": "write a tagline", "generated_text": "Affordable design."}]
+
+    for chat_history in ([], history):
+        await handler.send_prompt_to_llm(request, "You write copy.", "make it shorter", 50, chat_history, "gpt-4o")
+
+    first, second = (call.kwargs for call in repository.get_chat_response_async.await_args_list)
+    assert first["semantic_query"] == second["semantic_query"] == "make it shorter"
+    assert first["semantic_scope"] != second["semantic_scope"]
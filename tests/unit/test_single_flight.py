@@ -0,0 +1,88 @@
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from prometheus_client import REGISTRY
+from src.base.repositories.openai_repository import OpenAIRepository
+from src.base.utils.single_flight import SingleFlight
+
+
+def coalesced(name):
+    return REGISTRY.get_sample_value("single_flight_coalesced_total", {"name": name}) or 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight("test_share")
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    results = await asyncio.gather(*(flight.do("key", work) for _ in range(5)))
+
+    assert results == ["result"] * 5
+    assert len(calls) == 1
+    assert coalesced("test_share") == 4
+    assert flight.in_flight() == 0
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_waiter_and_key_is_released():
+    flight = SingleFlight("test_errors")
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(flight.do("key", fail), flight.do("key", fail), return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert flight.in_flight() == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_the_others():
+    flight = SingleFlight("test_cancel")
+    started = asyncio.Event()
+
+    async def work():
+        started.set()
+        await asyncio.sleep(0.05)
+        return "done"
+
+    first = asyncio.create_task(flight.do("key", work))
+    second = asyncio.create_task(flight.do("key", work))
+    await started.wait()
+    first.cancel()
+
+    assert await second == "done"
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+@pytest.mark.asyncio
+async def test_only_deterministic_repository_calls_are_coalesced():
+    requests = []
+
+    async def create(messages, **kwargs):
+        requests.append(kwargs["temperature"])
+        await asyncio.sleep(0.05)
+        return SimpleNamespace(
+            model="gpt-4o",
+            choices=[SimpleNamespace(message=SimpleNamespace(content="pong"), finish_reason="stop")],
+            usage=SimpleNamespace(prompt_tokens=3, completion_tokens=1)
+        )
+
+    client = MagicMock()
+    client.model = "gpt-4o"
+    client.create_chat_completion_async = create
+    repository = OpenAIRepository(client)
+
+    await asyncio.gather(*(repository.generate_response("ping", temperature=0) for _ in range(10)))
+    assert requests == [0]
+
+    await asyncio.gather(*(repository.generate_response("ping", temperature=0.8) for _ in range(3)))
+    assert requests == [0, 0.8, 0.8, 0.8]
@@ -0,0 +1,92 @@
+import asyncio
+from typing import ClassVar
+import pytest
+from prometheus_client import REGISTRY
+from src.domains.agentverse.tools.base import (
+    BaseTool,
+    ToolConfig,
+    ToolExecutionError,
+    ToolValidationError,
+    clear_tool_caches,
+)
+
+
+class FlakyTool(BaseTool):
+    """Fails with the queued errors first, then echoes its parameters."""
+    name: ClassVar[str] = "flaky"
+
+    def __init__(self, config: ToolConfig, errors=()):
+        super().__init__(config=config)
+        self.errors = list(errors)
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+
+    async def _run(self, **params):
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            if self.errors:
+                raise self.errors.pop(0)
+            return params
+        finally:
+            self.active -= 1
+
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    clear_tool_caches()
+
+
+def sample(outcome):
+    value = REGISTRY.get_sample_value("agentverse_tool_execution_seconds_count", {"tool": "flaky", "outcome": outcome})
+    return value or 0
+
+
+@pytest.mark.asyncio
+async def test_transient_failures_are_retried_with_backoff():
+    """Timeouts and connection errors are retried; validation errors are not."""
+    config = ToolConfig(retries=2, retry_backoff=0.001, timeout=1)
+    tool = FlakyTool(config, errors=[ConnectionError("reset"), ToolExecutionError("upstream 503")])
+    successes = sample("success")
+
+    result = await tool.execute(query="billy")
+
+    assert result.success and result.result == {"query": "billy"}
+    assert tool.calls == 3
+    assert sample("success") == successes + 1
+
+    tool = FlakyTool(config, errors=[ToolValidationError("bad query")])
+    result = await tool.execute(query="")
+    assert not result.success and tool.calls == 1
+
+    tool = FlakyTool(ToolConfig(retries=1, retry_backoff=0.001), errors=[ConnectionError("a"), ConnectionError("b")])
+    with pytest.raises(ToolExecutionError):
+        await tool.execute()
+    assert tool.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_results_are_cached_by_normalized_arguments():
+    """Identical arguments, in any order, reuse the result until the TTL expires."""
+    tool = FlakyTool(ToolConfig(cache_ttl=60))
+
+    first = await tool.execute(text="alcove", style="bullets")
+    second = await tool.execute(style="bullets", text="alcove")
+    other = await tool.execute(text="alcove", style="paragraph")
+
+    assert tool.calls == 2
+    assert second.result == first.result and second.metadata["cached"] is True
+    assert other.result["style"] == "paragraph"
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_limited_per_tool():
+    tool = FlakyTool(ToolConfig(max_concurrency=2))
+
+    await asyncio.gather(*(tool.execute(i=i) for i in range(6)))
+
+    assert tool.calls == 6
+    assert tool.peak == 2
@@ -0,0 +1,110 @@
+import asyncio
+import time
+import pytest
+from src.domains.agentverse.tools.base import BaseTool, ToolResult, ToolValidationError
+from src.domains.agentverse.tools.executor import ToolCall, ToolExecutor
+
+
+class SleepyTool(BaseTool):
+    """Sleeps for ``delay`` and echoes its parameters, tracking how many run at once."""
+    active = 0
+    peak = 0
+
+    def __init__(self, delay: float):
+        super().__init__()
+        self.delay = delay
+
+    async def execute(self, **params) -> ToolResult:
+        SleepyTool.active += 1
+        SleepyTool.peak = max(SleepyTool.peak, SleepyTool.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            SleepyTool.active -= 1
+        return ToolResult(success=True, result=params)
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    SleepyTool.active = SleepyTool.peak = 0
+
+
+@pytest.mark.asyncio
+async def test_independent_calls_run_concurrently_under_the_cap():
+    """Independent tools overlap, but never more than max_concurrency at once."""
+    tools = {f"tool_{i}": SleepyTool(0.05) for i in range(4)}
+    executor = ToolExecutor(tools, max_concurrency=2)
+
+    start = time.perf_counter()
+    results = await executor.run([ToolCall(tool=name) for name in tools])
+    elapsed = time.perf_counter() - start
+
+    assert all(result.success for result in results.values())
+    assert SleepyTool.peak == 2
+    assert elapsed < 0.15
+
+
+@pytest.mark.asyncio
+async def test_dependencies_feed_later_calls_and_failures_skip_dependents():
+    """A call starts after its dependencies and sees their results; failed ones skip dependents."""
+    executor = ToolExecutor({"retrieve": SleepyTool(0.01), "answer": SleepyTool(0)})
+
+    results = await executor.run([
+        ToolCall(
+            tool="answer",
+            depends_on=("retrieve",),
+            resolve=lambda deps: {"context": deps["retrieve"].result["query"]}
+        ),
+        ToolCall(tool="retrieve", params={"query": "billy"}),
+        ToolCall(tool="missing", id="lookup"),
+        ToolCall(tool="answer", id="dependent", depends_on=("lookup",)),
+    ])
+
+    assert list(results) == ["answer", "retrieve", "lookup", "dependent"]
+    assert results["answer"].result == {"context": "billy"}
+    assert results["lookup"].error == "Unknown tool 'missing'"
+    assert results["dependent"].metadata["skipped"] is True
+
+
+@pytest.mark.asyncio
+async def test_run_timeout_returns_partial_results():
+    """Calls still running when the run times out are reported, the finished ones kept."""
+    executor = ToolExecutor({"fast": SleepyTool(0), "slow": SleepyTool(5)})
+
+    results = await executor.run([ToolCall(tool="fast"), ToolCall(tool="slow")], timeout=0.05)
+
+    assert results["fast"].success
+    assert results["slow"].error == "Execution timed out"
+
+
+@pytest.mark.asyncio
+async def test_cycles_are_rejected():
+    executor = ToolExecutor({"a": SleepyTool(0)})
+
+    with pytest.raises(ToolValidationError):
+        await executor.run([
+            ToolCall(tool="a", id="x", depends_on=("y",)),
+            ToolCall(tool="a", id="y", depends_on=("x",)),
+        ])
+
+
+@pytest.mark.asyncio
+async def test_cancelled_runs_cancel_their_calls_and_results_are_not_mutated():
+    """Cancelling the caller stops every call; a shared (cached) result is annotated on a copy."""
+    executor = ToolExecutor({"slow": SleepyTool(1.0)})
+    run = asyncio.ensure_future(executor.run([ToolCall(tool="slow", id=f"call_{i}") for i in range(3)]))
+    await asyncio.sleep(0.01)
+    run.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await run
+    assert SleepyTool.active == 0
+
+    cached = ToolResult(success=True, result="from cache")
+
+    class CachedTool(BaseTool):
+        async def execute(self, **params) -> ToolResult:
+            return cached
+
+    results = await ToolExecutor({"cached": CachedTool()}).run([ToolCall(tool="cached")])
+    assert "elapsed_seconds" in results["cached"].metadata
+    assert cached.metadata == {}
@@ -0,0 +1,73 @@
+import pytest
+from types import SimpleNamespace
+from typing import Any, ClassVar, Dict, Optional
+from unittest.mock import patch
+from src.domains.agentverse.agents import factory as factory_module
+from src.domains.agentverse.agents.factory import AgentFactory
+from src.domains.agentverse.entities.tools.tool_spec import ToolSpec
+from src.domains.agentverse.registries.tool_registry import ToolRegistry
+from src.domains.agentverse.tools.base import BaseTool, ToolConfig
+from src.domains.agentverse.utils.to_system_name import to_system_name
+
+
+class LookupToolConfig(ToolConfig):
+    top_k: int = 3
+
+
+class LookupTool(BaseTool):
+    name: ClassVar[str] = "lookup"
+    version: ClassVar[str] = "1.0.0"
+    parameters: ClassVar[Dict[str, Any]] = {}
+
+    def __init__(self, config: Optional[LookupToolConfig] = None, llm: Any = None, vectordb: Any = None):
+        super().__init__(config=config or LookupToolConfig(), llm=llm, vectordb=vectordb)
+
+
+class ClockTool(BaseTool):
+    name: ClassVar[str] = "clock"
+    version: ClassVar[str] = "1.0.0"
+    parameters: ClassVar[Dict[str, Any]] = {}
+
+    def __init__(self, config: ToolConfig = None):
+        super().__init__(config=config or ToolConfig())
+
+
+def make_registry() -> ToolRegistry:
+    registry = ToolRegistry()
+    registry.register(name="lookup", component=LookupTool)
+    registry.register(name="clock", component=ClockTool)
+    return registry
+
+
+def test_plan_is_compiled_at_registration():
+    """Dependencies and config class are resolved once, from the constructor."""
+    registry = make_registry()
+    plan = registry.plan("lookup")
+
+    assert plan.dependencies == ("llm", "vectordb")
+    assert plan.config_cls is LookupToolConfig
+    assert registry.plan("clock").dependencies == ()
+
+    registry.unregister("lookup")
+    with pytest.raises(KeyError):
+        registry.plan("lookup")
+
+
+def test_attach_tools_builds_from_plans():
+    """Agents get each tool with only the deps it takes and its merged config."""
+    registry = make_registry()
+    agent = SimpleNamespace(llm="llm", vectordb="vectordb", cache="cache", db=None, commbridge=None, messaging=None, tools={})
+    specs = [ToolSpec(name="lookup", config={"top_k": 7}), ToolSpec(name="clock")]
+    factory = AgentFactory(None, None, None, None)
+
+    with patch.object(factory_module, "tool_registry", registry):
+        factory._attach_tools(agent, specs)
+
+    lookup = agent.tools["lookup"]
+    assert (lookup.llm, lookup.vectordb, lookup.config.top_k) == ("llm", "vectordb", 7)
+    assert not hasattr(agent.tools["clock"], "cache")
+
+
+def test_to_system_name():
+    assert to_system_name("Ingvar Kamprád!") == "ingvar_kamprad"
+    assert to_system_name("  Customized EVA  ") == "customized_eva"